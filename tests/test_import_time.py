@@ -0,0 +1,129 @@
+"""
+Trading-Technical-Indicators (tti) python library
+
+File name: test_import_time.py
+    Import time unit tests, the plotting packages are imported only when a
+    graph is created, and the indicators modules only when used.
+"""
+
+import os
+import unittest
+import subprocess
+import sys
+
+
+class TestImportTime(unittest.TestCase):
+    plotting_packages = ["matplotlib", "statsmodels"]
+
+    # Upper limit (seconds) of the tti import time, well above the expected one
+    max_import_time = 10.0
+
+    @staticmethod
+    def run_python(code):
+        return subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", code],
+            capture_output=True,
+            text=True,
+            check=True,
+            env={**os.environ, "MPLBACKEND": "Agg"},
+        )
+
+    def import_times(self, code):
+        # Cumulative import time (microseconds) of each module, from -X importtime
+        times = {}
+
+        for line in self.run_python(code).stderr.splitlines():
+            if line.startswith("import time:") and "|" in line:
+                _, cumulative, module = line[len("import time:") :].split("|")
+
+                if cumulative.strip().isdigit():
+                    times[module.strip()] = int(cumulative)
+
+        return times
+
+    def imported_packages(self, code):
+        return {module.split(".")[0] for module in self.import_times(code)}
+
+    def test_import_tti(self):
+        times = self.import_times("import tti, tti.indicators, tti.utils, tti.kernels")
+        packages = {module.split(".")[0] for module in times}
+
+        self.assertIn("tti", packages)
+        self.assertLess(times["tti"] / 1e6, self.max_import_time)
+
+        for package in self.plotting_packages:
+            with self.subTest(package=package):
+                self.assertNotIn(package, packages)
+
+    def test_indicator_calculation(self):
+        packages = self.imported_packages(
+            "import pandas as pd\n"
+            "from tti.indicators import RelativeStrengthIndex\n"
+            "df = pd.read_csv('./data/sample_data.csv', parse_dates=True, index_col=0)\n"
+            "ti = RelativeStrengthIndex(df.sort_index())\n"
+            "ti.getTiData(); ti.getTiSignal(); ti.getTiValue()\n"
+        )
+
+        for package in self.plotting_packages:
+            with self.subTest(package=package):
+                self.assertNotIn(package, packages)
+
+    def test_import_indicator(self):
+        # Checked with sys.modules, -X importtime does not report the modules
+        # imported by importlib
+        result = self.run_python(
+            "import sys, pandas as pd\n"
+            "from tti.indicators import RelativeStrengthIndex\n"
+            "modules = lambda: [m for m in sys.modules if m.startswith(('tti.indicators._', "
+            "'tti.kernels._'))]\n"
+            "print(*sorted(modules()))\n"
+            "df = pd.read_csv('./data/sample_data.csv', parse_dates=True, index_col=0)\n"
+            "RelativeStrengthIndex(df.sort_index())\n"
+            "print(*sorted(modules()))\n"
+        )
+
+        imported, calculated = [line.split() for line in result.stdout.splitlines()]
+
+        # The kernels are imported when the indicator is calculated
+        self.assertEqual(
+            imported,
+            ["tti.indicators._relative_strength_index", "tti.indicators._technical_indicator"],
+        )
+
+        self.assertEqual(
+            calculated,
+            imported + ["tti.kernels._indicators", "tti.kernels._primitives"],
+        )
+
+    def test_import_all_indicators(self):
+        # Checked in a new process, the indicators are imported on first access
+        self.run_python(
+            "import inspect, tti.indicators\n"
+            "from tti.indicators import *\n"
+            "from tti.indicators._technical_indicator import TechnicalIndicator\n"
+            "names = tti.indicators.__all__\n"
+            "assert len(names) == 57\n"
+            "assert all(issubclass(globals()[name], TechnicalIndicator) for name in names)\n"
+            "other_names = ['batch', 'executeSuite', 'TaskResult']\n"
+            "assert set(names + other_names) <= set(dir(tti.indicators))\n"
+            "assert inspect.isfunction(tti.indicators.batch)\n"
+            "assert not hasattr(tti.indicators, 'NoIndicator')\n"
+            "import tti.kernels\n"
+            "assert set(tti.kernels.__all__) <= set(dir(tti.kernels))\n"
+            "assert all(inspect.isfunction(getattr(tti.kernels, k)) for k in tti.kernels.__all__)\n"
+            "assert not hasattr(tti.kernels, 'noKernel')\n"
+        )
+
+    def test_graph_imports_matplotlib(self):
+        packages = self.imported_packages(
+            "import pandas as pd\n"
+            "from tti.indicators import RelativeStrengthIndex\n"
+            "df = pd.read_csv('./data/sample_data.csv', parse_dates=True, index_col=0)\n"
+            "RelativeStrengthIndex(df.sort_index()).getTiGraph()\n"
+        )
+
+        self.assertIn("matplotlib", packages)
+
+
+if __name__ == "__main__":
+    unittest.main()
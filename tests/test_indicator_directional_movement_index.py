@@ -22,11 +22,21 @@ class TestDirectionalMovementIndex(unittest.TestCase, TestIndicatorsCommon):
         "./data/sample_data.csv", parse_dates=True, date_format="%Y-%m-%d", index_col=0
     )
 
-    indicator_input_arguments = {}
-
-    indicator_other_input_arguments = []
+    indicator_input_arguments = {"period": 14, "adx_period": 14}
+
+    indicator_other_input_arguments = [
+        {"period": 1, "adx_period": 1},
+        {"period": 1, "adx_period": 20},
+        {"period": 20, "adx_period": 1},
+        {"period": 7, "adx_period": 7},
+        {"period": 28, "adx_period": 14},
+        {"period": 1, "adx_period": 3167},
+        {"period": 3167, "adx_period": 1},
+    ]
 
-    indicator_minimum_required_data = 28
+    indicator_minimum_required_data = (
+        indicator_input_arguments["period"] + indicator_input_arguments["adx_period"]
+    )
 
     mandatory_arguments_missing_cases = []
 
@@ -34,10 +44,17 @@ class TestDirectionalMovementIndex(unittest.TestCase, TestIndicatorsCommon):
 
     arguments_wrong_type = [
         {"input_data": "No_DataFrame"},
+        {"input_data": df, "period": "no_numeric"},
+        {"input_data": df, "adx_period": "no_numeric"},
         {"input_data": df, "fill_missing_values": "no_boolean"},
     ]
 
-    arguments_wrong_value = []
+    arguments_wrong_value = [
+        {"input_data": df, "period": -1},
+        {"input_data": df, "period": 0},
+        {"input_data": df, "adx_period": -1},
+        {"input_data": df, "adx_period": 0},
+    ]
 
     graph_file_name = "_".join(
         x.lower() for x in re.findall("[A-Z][^A-Z]*", str(indicator).split(".")[-1][:-2])
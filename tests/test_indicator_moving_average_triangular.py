@@ -36,6 +36,9 @@ class TestSimpleMovingAverage(unittest.TestCase, TestIndicatorsCommon):
 
     required_input_data_columns = ["close"]
 
+    # The rolling means of the updated rows start from the last rows
+    update_last_decimal_differs = True
+
     # Tested already with the Simple Moving Average
     arguments_wrong_type = []
 
@@ -0,0 +1,133 @@
+"""
+Trading-Technical-Indicators (tti) python library
+
+File name: test_indicators_batch.py
+    tti.indicators package, _batch.py module unit tests.
+"""
+
+import unittest
+from unittest import mock
+import pandas as pd
+
+from tti.indicators import (
+    batch,
+    BollingerBands,
+    MovingAverage,
+    MovingAverageConvergenceDivergence,
+    RelativeStrengthIndex,
+)
+from tti.utils.exceptions import WrongTypeForInputParameter, WrongValueForInputParameter
+
+
+class TestBatch(unittest.TestCase):
+    df = pd.read_csv("./data/sample_data.csv", parse_dates=True, index_col=0)
+
+    # Three symbols sharing the same index
+    symbols = {
+        "AAA": df,
+        "BBB": df * 2.0,
+        "CCC": df.iloc[::-1] + 1.0,
+    }
+
+    multiindex_panel = pd.concat(symbols, axis=1)
+
+    long_panel = pd.concat([data.assign(symbol=symbol) for symbol, data in symbols.items()], axis=0)
+
+    def assertBatchResult(self, indicator, panel, symbols, symbol_column="symbol", **kwargs):
+        result = batch(indicator, panel, symbol_column=symbol_column, **kwargs)
+
+        self.assertIsInstance(result, pd.DataFrame)
+        self.assertEqual(list(result.columns.get_level_values(0).unique()), list(symbols.keys()))
+
+        for symbol, data in symbols.items():
+            ti_data = indicator(data, **kwargs).getTiData()
+
+            pd.testing.assert_frame_equal(
+                result[symbol].loc[ti_data.index], ti_data, check_names=False
+            )
+
+    def test_multiindex_panel(self):
+        for indicator, kwargs in [
+            (MovingAverage, {}),
+            (MovingAverage, {"period": 5, "ma_type": "exponential"}),
+            (MovingAverage, {"period": 5, "ma_type": "triangular"}),
+            (MovingAverage, {"period": 5, "ma_type": "variable"}),
+            (BollingerBands, {"period": 10, "std_number": 3}),
+            (MovingAverageConvergenceDivergence, {}),
+            (RelativeStrengthIndex, {}),
+        ]:
+            with self.subTest(indicator=indicator.__name__, kwargs=kwargs):
+                self.assertBatchResult(indicator, self.multiindex_panel, self.symbols, **kwargs)
+
+    def test_first_symbol_calculated_once(self):
+        calculate_ti_panel = MovingAverage._calculateTiPanel
+
+        with mock.patch.object(
+            MovingAverage, "_calculateTiPanel", autospec=True, side_effect=calculate_ti_panel
+        ) as patched:
+            self.assertBatchResult(MovingAverage, self.multiindex_panel, self.symbols)
+
+        # The first symbol is taken from the instance which validated the input
+        panel_data = patched.call_args.kwargs["panel_data"]
+
+        self.assertEqual(list(panel_data["close"].columns), ["BBB", "CCC"])
+
+    def test_single_symbol_panel(self):
+        symbols = {"AAA": self.df}
+
+        self.assertBatchResult(MovingAverage, pd.concat(symbols, axis=1), symbols)
+
+    def test_long_panel(self):
+        for indicator in [MovingAverage, BollingerBands, RelativeStrengthIndex]:
+            with self.subTest(indicator=indicator.__name__):
+                self.assertBatchResult(indicator, self.long_panel, self.symbols)
+
+    def test_long_panel_different_index(self):
+        symbols = {"AAA": self.df, "BBB": self.df.iloc[:100]}
+
+        panel = pd.concat([data.assign(symbol=symbol) for symbol, data in symbols.items()])
+
+        self.assertBatchResult(BollingerBands, panel, symbols)
+
+    def test_long_panel_symbol_column(self):
+        panel = self.long_panel.rename(columns={"symbol": "ticker"})
+
+        self.assertBatchResult(MovingAverage, panel, self.symbols, symbol_column="ticker")
+
+    def test_fill_missing_values(self):
+        symbols = {symbol: data.copy() for symbol, data in self.symbols.items()}
+        symbols["BBB"].iloc[10:20, :] = None
+
+        for fill_missing_values in [True, False]:
+            with self.subTest(fill_missing_values=fill_missing_values):
+                self.assertBatchResult(
+                    MovingAverage,
+                    pd.concat(symbols, axis=1),
+                    symbols,
+                    fill_missing_values=fill_missing_values,
+                )
+
+    def test_wrong_indicator(self):
+        with self.assertRaises(WrongTypeForInputParameter):
+            batch("MovingAverage", self.multiindex_panel)
+
+        with self.assertRaises(WrongTypeForInputParameter):
+            batch(MovingAverage(self.df), self.multiindex_panel)
+
+    def test_wrong_panel(self):
+        with self.assertRaises(WrongTypeForInputParameter):
+            batch(MovingAverage, self.symbols)
+
+        with self.assertRaises(ValueError):
+            batch(MovingAverage, pd.DataFrame())
+
+        with self.assertRaises(ValueError):
+            batch(MovingAverage, self.df)
+
+    def test_wrong_indicator_argument(self):
+        with self.assertRaises(WrongValueForInputParameter):
+            batch(MovingAverage, self.multiindex_panel, ma_type="unknown")
+
+
+if __name__ == "__main__":
+    unittest.main()
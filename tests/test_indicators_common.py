@@ -12,7 +12,10 @@ import pandas as pd
 import matplotlib.pyplot as plt
 import copy
 import numpy as np
+from unittest import mock
 
+from tti.indicators._technical_indicator import TechnicalIndicator
+from tti.utils import PreparedInput, ResultCache, setResultCache, setFloatDtype
 from tti.utils.exceptions import (
     NotEnoughInputData,
     WrongTypeForInputParameter,
@@ -101,6 +104,10 @@ class TestIndicatorsCommon(ABC):
 
     precision = 4
 
+    # The updated rows can differ in the last decimal from a calculation of
+    # all the rows
+    update_last_decimal_differs = False
+
     # Unit Tests
 
     # Validate indicators input arguments
@@ -218,6 +225,78 @@ class TestIndicatorsCommon(ABC):
 
         pd.testing.assert_frame_equal(df_result, df_expected_result)
 
+    # Validate input argument: precision
+
+    def test_argument_precision_wrong_type(self):
+        df = pd.read_csv(
+            "./data/sample_data.csv", parse_dates=True, date_format="%Y-%m-%d", index_col=0
+        )
+
+        for precision in ["4", 4.0, True]:
+            with self.subTest(precision=precision):
+                with self.assertRaises(WrongTypeForInputParameter):
+                    self.indicator(df, precision=precision, **self.indicator_input_arguments)
+
+    def test_argument_precision_wrong_value(self):
+        df = pd.read_csv(
+            "./data/sample_data.csv", parse_dates=True, date_format="%Y-%m-%d", index_col=0
+        )
+
+        with self.assertRaises(WrongValueForInputParameter):
+            self.indicator(df, precision=-1, **self.indicator_input_arguments)
+
+    def test_argument_precision(self):
+        df = pd.read_csv(
+            "./data/sample_data.csv", parse_dates=True, date_format="%Y-%m-%d", index_col=0
+        )
+
+        ti_data = self.indicator(df, **self.indicator_input_arguments).getTiData()
+
+        ti_data_rounded = self.indicator(df, precision=2, **self.indicator_input_arguments)
+        ti_data_rounded = ti_data_rounded.getTiData()
+
+        pd.testing.assert_frame_equal(ti_data_rounded, ti_data_rounded.round(2))
+
+        # Not rounded values differ only in their decimals, more for the
+        # indicators which round each step of a recursion by default
+        ti_data_raw = self.indicator(df, precision=None, **self.indicator_input_arguments)
+        ti_data_raw = ti_data_raw.getTiData()
+
+        np.testing.assert_allclose(
+            ti_data_raw.to_numpy(dtype=np.float64),
+            ti_data.to_numpy(dtype=np.float64),
+            rtol=0,
+            atol=0.1,
+        )
+
+    # Validate input argument: input_data given as PreparedInput
+
+    def test_argument_input_data_is_prepared_input(self):
+        df = pd.read_csv(
+            "./data/missing_values_data.csv", parse_dates=True, date_format="%Y-%m-%d", index_col=0
+        )
+
+        prepared_input = PreparedInput(df)
+
+        for fill_missing_values in [True, False]:
+            with self.subTest(fill_missing_values=fill_missing_values):
+                ti_expected = self.indicator(
+                    df.copy(),
+                    fill_missing_values=fill_missing_values,
+                    **self.indicator_input_arguments,
+                )
+
+                # Twice, the second time the already prepared input data are used
+                for _ in range(2):
+                    ti = self.indicator(
+                        prepared_input,
+                        fill_missing_values=fill_missing_values,
+                        **self.indicator_input_arguments,
+                    )
+
+                    pd.testing.assert_frame_equal(ti._input_data, ti_expected._input_data)
+                    pd.testing.assert_frame_equal(ti._ti_data, ti_expected._ti_data)
+
     # Validate indicator creation
 
     def test_validate_indicator_input_data_one_row(self):
@@ -380,6 +459,182 @@ class TestIndicatorsCommon(ABC):
             [("buy", -1), ("hold", 0), ("sell", 1)],
         )
 
+    def test_getTiSignalSeries(self):
+        df = pd.read_csv(
+            "./data/sample_data.csv", parse_dates=True, date_format="%Y-%m-%d", index_col=0
+        )
+
+        ti = self.indicator(df, **self.indicator_input_arguments)
+
+        signals = ti.getTiSignalSeries()
+
+        pd.testing.assert_index_equal(signals.index, ti._ti_data.index)
+        self.assertEqual(list(signals.columns), ["signal"])
+
+        # Signal of each row as calculated when only data up to that row exist
+        full_input_data = ti._input_data
+        full_ti_data = ti._ti_data
+        expected_signals = []
+
+        for i in range(len(full_ti_data.index)):
+            ti._input_data = full_input_data.iloc[: i + 1]
+            ti._ti_data = full_ti_data.iloc[: i + 1]
+            expected_signals.append(ti.getTiSignal()[1])
+
+        ti._input_data = full_input_data
+        ti._ti_data = full_ti_data
+
+        self.assertEqual(signals["signal"].to_list(), expected_signals)
+
+    def test_update(self):
+        df = pd.read_csv(
+            "./data/sample_data.csv", parse_dates=True, date_format="%Y-%m-%d", index_col=0
+        ).sort_index()
+
+        ti_full = self.indicator(df, **self.indicator_input_arguments)
+
+        ti = self.indicator(df.iloc[:-8], **self.indicator_input_arguments)
+
+        # Rows one by one and then a batch of rows
+        for i in range(8, 5, -1):
+            new_ti_data = ti.update(df.iloc[-i : -i + 1])
+
+            pd.testing.assert_frame_equal(new_ti_data, ti._ti_data.iloc[-1:])
+
+        ti.update(df.iloc[-5:])
+
+        pd.testing.assert_frame_equal(ti._input_data, ti_full._input_data)
+        pd.testing.assert_frame_equal(ti._ti_data, ti_full._ti_data)
+
+    def test_update_missing_values(self):
+        df = pd.read_csv(
+            "./data/missing_values_data.csv", parse_dates=True, date_format="%Y-%m-%d", index_col=0
+        ).sort_index()
+
+        # One unit of the last decimal, with a margin for its representation
+        tolerance = 1.5 * 10**-self.precision if self.update_last_decimal_differs else 0.0
+
+        for fill_missing_values in [False, True]:
+            ti_full = self.indicator(
+                df, fill_missing_values=fill_missing_values, **self.indicator_input_arguments
+            )
+
+            # Rows one by one and all the rows at once, including missing values
+            for rows in [1, 40]:
+                with self.subTest(fill_missing_values=fill_missing_values, rows=rows):
+                    ti = self.indicator(
+                        df.iloc[:-40],
+                        fill_missing_values=fill_missing_values,
+                        **self.indicator_input_arguments,
+                    )
+
+                    for i in range(40, 0, -rows):
+                        ti.update(df.iloc[-i : len(df.index) - i + rows])
+
+                    pd.testing.assert_frame_equal(
+                        ti._ti_data,
+                        ti_full._ti_data,
+                        check_exact=not tolerance,
+                        rtol=0.0,
+                        atol=tolerance,
+                    )
+
+    def test_update_calculated_rows(self):
+        df = pd.read_csv(
+            "./data/sample_data.csv", parse_dates=True, date_format="%Y-%m-%d", index_col=0
+        ).sort_index()
+
+        ti = self.indicator(df.iloc[:-1], **self.indicator_input_arguments)
+
+        with (
+            mock.patch.object(ti, "_calculateTi", wraps=ti._calculateTi) as calculate_ti,
+            mock.patch.object(
+                TechnicalIndicator,
+                "_updateTi",
+                autospec=True,
+                side_effect=TechnicalIndicator._updateTi,
+            ) as default_update_ti,
+        ):
+            ti.update(df.iloc[-1:])
+
+        # Only the default update calculates the indicator for all the rows
+        self.assertEqual(calculate_ti.call_count, default_update_ti.call_count)
+
+    def test_update_not_later_rows(self):
+        df = pd.read_csv(
+            "./data/sample_data.csv", parse_dates=True, date_format="%Y-%m-%d", index_col=0
+        ).sort_index()
+
+        ti = self.indicator(df, **self.indicator_input_arguments)
+
+        with self.assertRaises(WrongValueForInputParameter):
+            ti.update(df.iloc[-1:])
+
+    def test_result_cache(self):
+        df = pd.read_csv(
+            "./data/sample_data.csv", parse_dates=True, date_format="%Y-%m-%d", index_col=0
+        ).sort_index()
+
+        ti_expected = self.indicator(df.iloc[:-1], **self.indicator_input_arguments)
+        expected_signal = ti_expected.getTiSignal()
+        ti_expected.update(df.iloc[-1:])
+
+        result_cache = ResultCache()
+        setResultCache(result_cache)
+
+        try:
+            for input_data in [df.iloc[:-1], PreparedInput(df.iloc[:-1])]:
+                # The second time the indicator is taken from the cache
+                for hits in [0, 1]:
+                    statistics = result_cache.getStatistics()
+
+                    ti = self.indicator(input_data, **self.indicator_input_arguments)
+
+                    self.assertEqual(
+                        result_cache.getStatistics()["hits"] - statistics["hits"], hits
+                    )
+
+                    self.assertEqual(ti.getTiSignal(), expected_signal)
+
+                    ti.update(df.iloc[-1:])
+
+                    pd.testing.assert_frame_equal(ti.getTiData(), ti_expected.getTiData())
+
+                result_cache.invalidate()
+        finally:
+            setResultCache(None)
+
+    def test_float_dtype(self):
+        df = pd.read_csv(
+            "./data/sample_data.csv", parse_dates=True, date_format="%Y-%m-%d", index_col=0
+        )
+
+        setFloatDtype("float32")
+
+        try:
+            ti = self.indicator(df, **self.indicator_input_arguments)
+        finally:
+            setFloatDtype("float64")
+
+        ti.getTiSignalSeries()
+
+        # Integer indicators (for example volume based) keep their data type
+        for column, dtype in ti.getTiData().dtypes.items():
+            with self.subTest(column=column):
+                self.assertIn(dtype, [np.float32, np.int64])
+
+    def test_input_data_not_modified(self):
+        df = pd.read_csv(
+            "./data/sample_data.csv", parse_dates=True, date_format="%Y-%m-%d", index_col=0
+        )
+
+        ti = self.indicator(df, **self.indicator_input_arguments)
+
+        ti.getTiSignal()
+        ti.getTiSignalSeries()
+
+        self.assertEqual(sorted(ti._input_data.columns), sorted(self.required_input_data_columns))
+
     def test_getTiSimulation(self):
         df = pd.read_csv(
             "./data/sample_data.csv", parse_dates=True, date_format="%Y-%m-%d", index_col=0
@@ -426,6 +681,7 @@ class TestIndicatorsCommon(ABC):
                 ti._ti_data = ti._ti_data.iloc[:rows]
 
                 ti.getTiSignal()
+                ti.getTiSignalSeries()
                 ti.getTiValue()
                 ti.getTiData()
                 ti.getTiGraph()
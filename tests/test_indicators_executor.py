@@ -0,0 +1,147 @@
+"""
+Trading-Technical-Indicators (tti) python library
+
+File name: test_indicators_executor.py
+    tti.indicators package, _executor.py module unit tests.
+"""
+
+import unittest
+import pickle
+import numpy as np
+import pandas as pd
+from multiprocessing import shared_memory
+
+from tti.indicators import (
+    executeSuite,
+    MovingAverage,
+    OnBalanceVolume,
+    RelativeStrengthIndex,
+)
+from tti.indicators import _executor
+from tti.utils.exceptions import (
+    NotEnoughInputData,
+    WrongTypeForInputParameter,
+    WrongValueForInputParameter,
+)
+
+
+class TestExecuteSuite(unittest.TestCase):
+    df = pd.read_csv("./data/sample_data.csv", parse_dates=True, index_col=0)
+
+    symbols = {"AAA": df, "BBB": df.iloc[:500] * 2.0, "CCC": df.iloc[::-1].iloc[:50]}
+
+    indicators = [
+        MovingAverage,
+        (MovingAverage, {"period": 100, "ma_type": "exponential"}),
+        OnBalanceVolume,
+        RelativeStrengthIndex,
+    ]
+
+    def test_results(self):
+        results = executeSuite(self.symbols, self.indicators, max_workers=2)
+
+        self.assertEqual(len(results), len(self.symbols) * len(self.indicators))
+
+        # Results are ordered by symbol and then by indicator
+        expected_order = [
+            (symbol, indicator if isinstance(indicator, tuple) else (indicator, {}))
+            for symbol in self.symbols.keys()
+            for indicator in self.indicators
+        ]
+
+        for result, (symbol, (indicator, params)) in zip(results, expected_order):
+            with self.subTest(symbol=symbol, indicator=indicator.__name__, params=params):
+                self.assertEqual(result.symbol, symbol)
+                self.assertIs(result.indicator, indicator)
+                self.assertEqual(result.params, params)
+
+                try:
+                    ti_data = indicator(self.symbols[symbol].copy(), **params).getTiData()
+                except NotEnoughInputData:
+                    self.assertIsNone(result.ti_data)
+                    self.assertIsInstance(result.error, NotEnoughInputData)
+                    continue
+
+                self.assertIsNone(result.error)
+                pd.testing.assert_frame_equal(result.ti_data, ti_data)
+
+    def test_results_list_of_symbols(self):
+        results = executeSuite(list(self.symbols.values()), [MovingAverage], max_workers=1)
+
+        self.assertEqual([r.symbol for r in results], [0, 1, 2])
+
+    def test_error_capture(self):
+        results = executeSuite(
+            self.symbols, [(MovingAverage, {"ma_type": "unknown"})], max_workers=2
+        )
+
+        for result in results:
+            self.assertIsNone(result.ti_data)
+            self.assertIsInstance(result.error, WrongValueForInputParameter)
+
+    def test_exception_pickle(self):
+        error = NotEnoughInputData("Moving Average", 20, 10)
+
+        unpickled_error = pickle.loads(pickle.dumps(error))
+
+        self.assertIsInstance(unpickled_error, NotEnoughInputData)
+        self.assertEqual(str(unpickled_error), str(error))
+
+    def test_no_tasks(self):
+        self.assertEqual(executeSuite({}, self.indicators), [])
+
+    def test_wrong_symbols(self):
+        with self.assertRaises(WrongTypeForInputParameter):
+            executeSuite(self.df, self.indicators)
+
+        with self.assertRaises(WrongTypeForInputParameter):
+            executeSuite({"AAA": "data"}, self.indicators)
+
+        with self.assertRaises(TypeError):
+            executeSuite({"AAA": self.df.reset_index()}, self.indicators)
+
+    def test_wrong_indicators(self):
+        with self.assertRaises(WrongTypeForInputParameter):
+            executeSuite(self.symbols, MovingAverage)
+
+        with self.assertRaises(WrongTypeForInputParameter):
+            executeSuite(self.symbols, ["MovingAverage"])
+
+        with self.assertRaises(WrongTypeForInputParameter):
+            executeSuite(self.symbols, [(MovingAverage, 20)])
+
+    def test_wrong_max_workers(self):
+        with self.assertRaises(WrongTypeForInputParameter):
+            executeSuite(self.symbols, self.indicators, max_workers=2.0)
+
+        with self.assertRaises(WrongValueForInputParameter):
+            executeSuite(self.symbols, self.indicators, max_workers=0)
+
+    def test_worker_shared_memory_closed(self):
+        symbols_layout, size = _executor._symbolsLayout([self.df])
+
+        memory = shared_memory.SharedMemory(create=True, size=size)
+
+        try:
+            index, values = _executor._symbolArrays(memory.buf, symbols_layout[0])
+            index[:] = self.df.index.asi8
+            values[:] = self.df[symbols_layout[0]["columns"]].to_numpy(dtype=np.float64)
+            del index, values
+
+            # Worker initialization and exit, in this process
+            _executor._initWorker(memory.name, symbols_layout)
+
+            pd.testing.assert_frame_equal(_executor._readSymbol(0), self.df, check_freq=False)
+
+            _executor._closeWorker()
+
+            self.assertIsNone(_executor._worker_shared_memory)
+            self.assertEqual(_executor._worker_input_data, {})
+
+        finally:
+            memory.close()
+            memory.unlink()
+
+
+if __name__ == "__main__":
+    unittest.main()
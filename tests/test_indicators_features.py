@@ -0,0 +1,139 @@
+"""
+Trading-Technical-Indicators (tti) python library
+
+File name: test_indicators_features.py
+    tti.indicators package, features shared among the indicators created
+    from the same prepared input, unit tests.
+"""
+
+import unittest
+import numpy as np
+import pandas as pd
+
+from tti.indicators import (
+    AverageTrueRange,
+    CommodityChannelIndex,
+    ForecastOscillator,
+    StochasticMomentumIndex,
+    TypicalPrice,
+    WilliamsR,
+)
+from tti.utils import PreparedInput
+
+
+class TestFeatures(unittest.TestCase):
+    df = pd.read_csv(
+        "./data/sample_data.csv", parse_dates=True, date_format="%Y-%m-%d", index_col=0
+    )
+
+    def test_features_shared(self):
+        prepared_input = PreparedInput(self.df)
+
+        wr = WilliamsR(prepared_input, period=10)
+        smi = StochasticMomentumIndex(prepared_input, period=10)
+
+        self.assertIs(wr._features, smi._features)
+        self.assertIs(wr._highestHigh(10), smi._highestHigh(10))
+        self.assertIn(("lowest_low", 10, 10), prepared_input.getFeatures())
+
+        tp = TypicalPrice(prepared_input)
+        cci = CommodityChannelIndex(prepared_input)
+
+        self.assertIs(tp._typicalPrice(), cci._typicalPrice())
+
+    def test_features_per_fill_missing_values(self):
+        prepared_input = PreparedInput(self.df)
+
+        atr = AverageTrueRange(prepared_input, fill_missing_values=True)
+        atr_not_filled = AverageTrueRange(prepared_input, fill_missing_values=False)
+
+        self.assertIsNot(atr._features, atr_not_filled._features)
+
+    def test_features_not_shared_without_prepared_input(self):
+        wr = WilliamsR(self.df.copy(), period=10)
+        smi = StochasticMomentumIndex(self.df.copy(), period=10)
+
+        self.assertIsNot(wr._features, smi._features)
+
+    def test_composite_indicator(self):
+        prepared_input = PreparedInput(self.df)
+
+        fosc = ForecastOscillator(prepared_input, period=10)
+
+        features = prepared_input.getFeatures()
+
+        self.assertIn(("TimeSeriesForecast", ("period", 10), ("precision", 4)), features)
+        self.assertIn(("LinearRegressionSlope", ("period", 10), ("precision", 4)), features)
+
+        pd.testing.assert_frame_equal(
+            fosc.getTiData(), ForecastOscillator(self.df.copy(), period=10).getTiData()
+        )
+
+    def test_composite_indicator_precision(self):
+        prepared_input = PreparedInput(self.df)
+
+        ForecastOscillator(prepared_input, period=10)
+        ForecastOscillator(prepared_input, period=10, precision=None)
+
+        features = prepared_input.getFeatures()
+
+        self.assertIn(("TimeSeriesForecast", ("period", 10), ("precision", None)), features)
+
+        # Not rounded, as the composite indicator
+        tsf = features[("TimeSeriesForecast", ("period", 10), ("precision", None))]["tsf"]
+
+        self.assertFalse(np.array_equal(tsf, tsf.round(4), equal_nan=True))
+
+    def test_true_range_missing_values(self):
+        df = self.df.sort_index().copy()
+        df.iloc[[20, 30, 31, len(df) - 5], df.columns.get_loc("close")] = np.nan
+        df.iloc[[40, len(df) - 3], df.columns.get_loc("high")] = np.nan
+
+        # Average True Range skips the missing parts of the True Range
+        previous_close = df["close"].shift(1)
+        true_range = pd.concat(
+            [df["high"] - df["low"], df["high"] - previous_close, previous_close - df["low"]],
+            axis=1,
+        ).max(axis=1)
+
+        atr = (
+            pd.concat([pd.Series([true_range.iloc[:14].mean()]), true_range.iloc[14:]])
+            .ewm(alpha=1 / 14, adjust=False)
+            .mean()
+            .round(4)
+            .to_numpy()
+        )
+
+        prepared_input = PreparedInput(df)
+
+        # The shared True Range does not skip them
+        self.assertTrue(
+            np.isnan(AverageTrueRange(prepared_input, fill_missing_values=False)._trueRange()[21])
+        )
+
+        updated_atr = AverageTrueRange(df.iloc[:-10], fill_missing_values=False)
+        updated_atr.update(df.iloc[-10:])
+
+        for ti in [
+            AverageTrueRange(df, fill_missing_values=False),
+            AverageTrueRange(prepared_input, fill_missing_values=False),
+            updated_atr,
+        ]:
+            np.testing.assert_array_equal(ti.getTiData()["atr"].to_numpy()[13:], atr)
+
+    def test_features_reset_on_update(self):
+        df = self.df.sort_index()
+
+        prepared_input = PreparedInput(df.iloc[:-1])
+
+        wr = WilliamsR(prepared_input, period=10)
+        wr.update(df.iloc[-1:])
+
+        self.assertIsNone(wr._prepared_input)
+        self.assertIsNot(wr._features, prepared_input.getFeatures())
+
+        pd.testing.assert_frame_equal(wr.getTiData(), WilliamsR(df, period=10).getTiData())
+
+
+if __name__ == "__main__":
+    unittest.main()
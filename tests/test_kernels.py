@@ -0,0 +1,270 @@
+"""
+Trading-Technical-Indicators (tti) python library
+
+File name: test_kernels.py
+    tti.kernels package unit tests.
+"""
+
+import unittest
+import warnings
+from unittest import mock
+import numpy as np
+import pandas as pd
+
+from tti import kernels
+from tti.kernels import _primitives
+from tti.indicators import (
+    AverageTrueRange,
+    BollingerBands,
+    CommodityChannelIndex,
+    DirectionalMovementIndex,
+    KlingerOscillator,
+    MovingAverage,
+    MovingAverageConvergenceDivergence,
+    ParabolicSAR,
+    RelativeStrengthIndex,
+    StochasticOscillator,
+    WilliamsR,
+)
+from tti.utils.exceptions import NotEnoughInputData, WrongValueForInputParameter
+
+
+class TestKernels(unittest.TestCase):
+    df = pd.read_csv(
+        "./data/sample_data.csv", parse_dates=True, date_format="%Y-%m-%d", index_col=0
+    ).sort_index()
+
+    def columns(self, *columns):
+        return [self.df[column].to_numpy(dtype=np.float64) for column in columns]
+
+    def test_kernels_equal_indicators(self):
+        for kernel, columns, arguments, indicator in [
+            (kernels.averageTrueRange, ["high", "low", "close"], {}, AverageTrueRange),
+            (kernels.bollingerBands, ["close"], {"period": 10}, BollingerBands),
+            (kernels.commodityChannelIndex, ["high", "low", "close"], {}, CommodityChannelIndex),
+            (
+                kernels.directionalMovementIndex,
+                ["high", "low", "close"],
+                {},
+                DirectionalMovementIndex,
+            ),
+            (
+                kernels.directionalMovementIndex,
+                ["high", "low", "close"],
+                {"period": 7, "adx_period": 10},
+                DirectionalMovementIndex,
+            ),
+            (kernels.klingerOscillator, ["high", "low", "close", "volume"], {}, KlingerOscillator),
+            (kernels.movingAverage, ["close"], {"ma_type": "variable"}, MovingAverage),
+            (kernels.parabolicSar, ["high", "low"], {}, ParabolicSAR),
+            (kernels.relativeStrengthIndex, ["close"], {}, RelativeStrengthIndex),
+            (kernels.stochasticOscillator, ["high", "low", "close"], {}, StochasticOscillator),
+            (kernels.williamsR, ["high", "low", "close"], {"period": 10}, WilliamsR),
+        ]:
+            with self.subTest(kernel=kernel.__name__, arguments=arguments):
+                values = kernel(*self.columns(*columns), **arguments)
+
+                if isinstance(values, np.ndarray):
+                    values = (values,)
+
+                ti_data = indicator(self.df, **arguments).getTiData()
+
+                for column, column_values in zip(ti_data.columns, values):
+                    np.testing.assert_array_equal(
+                        np.round(column_values, 4), ti_data[column].to_numpy()
+                    )
+
+    def test_kernels_not_rounded_intermediates(self):
+        for kernel, columns, indicator in [
+            (kernels.bollingerBands, ["close"], BollingerBands),
+            (
+                kernels.movingAverageConvergenceDivergence,
+                ["close"],
+                MovingAverageConvergenceDivergence,
+            ),
+            (kernels.relativeStrengthIndex, ["close"], RelativeStrengthIndex),
+            (kernels.stochasticOscillator, ["high", "low", "close"], StochasticOscillator),
+        ]:
+            with self.subTest(kernel=kernel.__name__):
+                values = kernel(*self.columns(*columns), decimals=None)
+
+                if isinstance(values, np.ndarray):
+                    values = (values,)
+
+                ti_data = indicator(self.df, precision=None).getTiData()
+
+                for column, column_values in zip(ti_data.columns, values):
+                    np.testing.assert_array_equal(column_values, ti_data[column].to_numpy())
+
+    def test_kernels_state(self):
+        for kernel, columns, arguments in [
+            (kernels.averageTrueRange, ["high", "low", "close"], {}),
+            (kernels.directionalMovementIndex, ["high", "low", "close"], {}),
+            (kernels.doubleExponentialMovingAverage, ["close"], {}),
+            (kernels.movingAverage, ["close"], {"ma_type": "exponential"}),
+            (kernels.movingAverageConvergenceDivergence, ["close"], {}),
+            (kernels.onBalanceVolume, ["close", "volume"], {}),
+            (kernels.parabolicSar, ["high", "low"], {}),
+            (kernels.relativeStrengthIndex, ["close"], {}),
+            (kernels.relativeStrengthIndex, ["close"], {"decimals": None}),
+            (kernels.tripleExponentialMovingAverage, ["close"], {}),
+            (kernels.wildersSmoothing, ["close"], {}),
+        ]:
+            # Missing rows are in the first part, at the end of the first and
+            # second parts and in the last part
+            for missing_rows in [[], [50, 99, 100, 150, 151]]:
+                with self.subTest(
+                    kernel=kernel.__name__, arguments=arguments, missing_rows=missing_rows
+                ):
+                    values = self.columns(*columns)
+
+                    for column_values in values:
+                        column_values[missing_rows] = np.nan
+
+                    expected = kernel(*values, **arguments)
+
+                    # Calculated in three parts, continuing from the state
+                    state = {}
+                    parts = [
+                        kernel(*[v[rows] for v in values], state=state, **arguments)
+                        for rows in [slice(None, 100), slice(100, 101), slice(101, None)]
+                    ]
+
+                    # Kernels returning more than one array
+                    if isinstance(expected, tuple):
+                        calculated = [np.concatenate(arrays) for arrays in zip(*parts)]
+                    else:
+                        calculated, expected = [np.concatenate(parts)], [expected]
+
+                    for calculated_values, expected_values in zip(calculated, expected):
+                        np.testing.assert_allclose(
+                            calculated_values, expected_values, rtol=1e-12, equal_nan=True
+                        )
+
+    def test_kernels_panel(self):
+        close = np.column_stack(self.columns("close", "open", "high"))
+
+        for kernel, arguments in [
+            (kernels.bollingerBands, {}),
+            (kernels.movingAverage, {"ma_type": "triangular"}),
+            (kernels.movingAverageConvergenceDivergence, {}),
+        ]:
+            with self.subTest(kernel=kernel.__name__):
+                panel = kernel(close, **arguments)
+
+                if isinstance(panel, np.ndarray):
+                    panel = (panel,)
+
+                for symbol in range(close.shape[1]):
+                    values = kernel(close[:, symbol], **arguments)
+
+                    if isinstance(values, np.ndarray):
+                        values = (values,)
+
+                    for panel_values, symbol_values in zip(panel, values):
+                        np.testing.assert_array_equal(panel_values[:, symbol], symbol_values)
+
+    def test_kernels_not_enough_input_data(self):
+        with self.assertRaises(NotEnoughInputData):
+            kernels.relativeStrengthIndex(self.columns("close")[0][:14])
+
+        with self.assertRaises(NotEnoughInputData):
+            kernels.directionalMovementIndex(
+                *[v[:27] for v in self.columns("high", "low", "close")]
+            )
+
+    def test_kernels_wrong_value(self):
+        with self.assertRaises(WrongValueForInputParameter):
+            kernels.movingAverage(self.columns("close")[0], ma_type="weighted")
+
+    def test_kernels_not_rounded(self):
+        sd = kernels.standardDeviation(*self.columns("close"))
+
+        self.assertIsInstance(sd, np.ndarray)
+        self.assertEqual(sd.dtype, np.float64)
+        self.assertFalse(np.array_equal(sd, np.round(sd, 4), equal_nan=True))
+
+    def test_kernels_period_one_no_warning(self):
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+
+            lrs = kernels.linearRegressionSlope(*self.columns("close"), period=1)
+
+        self.assertTrue(np.isnan(lrs).all())
+
+    def test_kernels_sliding_windows_blocks(self):
+        high, low, close = self.columns("high", "low", "close")
+
+        for kernel, arguments in [
+            (kernels.commodityChannelIndex, (high, low, close, 20)),
+            (kernels.projectionBands, (high, low, 14)),
+        ]:
+            with self.subTest(kernel=kernel.__name__):
+                expected = kernel(*arguments)
+
+                # Blocks of a few windows each, the last one partial
+                with mock.patch.object(_primitives, "_BLOCK_SIZE", 100):
+                    calculated = kernel(*arguments)
+
+                np.testing.assert_array_equal(calculated, expected)
+
+    def test_kernels_linear_recurrence(self):
+        multipliers = np.abs(np.sin(np.arange(1000.0)))
+        multipliers[[10, 11]] = 0.0
+
+        values = self.columns("close")[0][:1000].copy()
+        values[900] = np.nan
+
+        expected = []
+        result = 2.0
+
+        for multiplier, value in zip(multipliers, values):
+            result = value + multiplier * result
+            expected.append(result)
+
+        for rows in [0, 1, 5, 1000]:
+            with self.subTest(rows=rows):
+                np.testing.assert_allclose(
+                    _primitives.linearRecurrence(multipliers[:rows], values[:rows], 2.0),
+                    expected[:rows],
+                    rtol=1e-12,
+                    equal_nan=True,
+                )
+
+    def test_kernels_projection_bands_missing_values(self):
+        high, low = self.columns("high", "low")
+        high[[30, 31]] = np.nan
+        low[[30, 31, 60]] = np.nan
+
+        upper_band, lower_band = kernels.projectionBands(high, low, 14)
+
+        # Missing for the windows with missing values
+        for band, values in [(upper_band, high), (lower_band, low)]:
+            complete = pd.Series(values).rolling(14).count().to_numpy() == 14
+
+            np.testing.assert_array_equal(np.isnan(band), ~complete)
+
+    def test_kernels_exponential_moving_average_state(self):
+        values = self.columns("close")[0][:300].copy()
+        values[[0, 1, 7, 150, 151, 152, 299]] = np.nan
+        values[200:210] = values[199]
+
+        for span in [1, 5, 12, 26]:
+            expected = _primitives.exponentialMovingAverage(values, span)
+
+            # Split at missing values too, continuing from the state
+            for splits in [[3], [8, 9], [151, 153, 205, 299]]:
+                with self.subTest(span=span, splits=splits):
+                    state = {}
+                    calculated = np.concatenate(
+                        [
+                            _primitives.exponentialMovingAverage(part, span, state=state)
+                            for part in np.split(values, splits)
+                        ]
+                    )
+
+                    np.testing.assert_array_equal(calculated, expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,98 @@
+"""
+Trading-Technical-Indicators (tti) python library
+
+File name: test_utils_float_dtype.py
+    tti.utils package, float_dtype.py module unit tests.
+"""
+
+import unittest
+import numpy as np
+import pandas as pd
+
+from tti import kernels
+from tti.indicators import AverageTrueRange, MovingAverage, WilliamsR
+from tti.utils import PreparedInput, ResultCache, setResultCache, setFloatDtype, getFloatDtype
+from tti.utils.exceptions import WrongTypeForInputParameter, WrongValueForInputParameter
+
+
+class TestFloatDtype(unittest.TestCase):
+    df = pd.read_csv(
+        "./data/sample_data.csv", parse_dates=True, date_format="%Y-%m-%d", index_col=0
+    ).sort_index()
+
+    def tearDown(self):
+        setFloatDtype("float64")
+        setResultCache(None)
+
+    def test_float64_by_default(self):
+        self.assertEqual(getFloatDtype(), np.float64)
+
+    def test_set_float_dtype(self):
+        for float_dtype in ["float32", np.float32, np.dtype("float32")]:
+            with self.subTest(float_dtype=float_dtype):
+                setFloatDtype(float_dtype)
+
+                self.assertEqual(getFloatDtype(), np.float32)
+
+    def test_set_float_dtype_wrong_type(self):
+        with self.assertRaises(WrongTypeForInputParameter):
+            setFloatDtype(32)
+
+    def test_set_float_dtype_wrong_value(self):
+        for float_dtype in ["float16", "int64", "no_dtype"]:
+            with self.subTest(float_dtype=float_dtype):
+                with self.assertRaises(WrongValueForInputParameter):
+                    setFloatDtype(float_dtype)
+
+    def test_indicator_float32(self):
+        expected = MovingAverage(self.df, period=10).getTiData()
+
+        setFloatDtype("float32")
+
+        ti = MovingAverage(self.df.iloc[:-5], period=10)
+
+        self.assertEqual(ti.getTiData()["ma-simple"].dtype, np.float32)
+
+        np.testing.assert_allclose(ti.getTiData(), expected.iloc[:-5], rtol=1e-6)
+
+        # The data type of the indicator is kept when updating it
+        setFloatDtype("float64")
+
+        ti.update(self.df.iloc[-5:])
+
+        self.assertEqual(ti.getTiData()["ma-simple"].dtype, np.float32)
+
+    def test_prepared_input_features(self):
+        prepared_input = PreparedInput(self.df)
+
+        wr = WilliamsR(prepared_input)
+
+        setFloatDtype("float32")
+
+        wr_float32 = WilliamsR(prepared_input)
+
+        self.assertIsNot(wr._features, wr_float32._features)
+        self.assertIs(prepared_input.getFeatures(float_dtype="float32"), wr_float32._features)
+
+    def test_result_cache(self):
+        result_cache = ResultCache()
+        setResultCache(result_cache)
+
+        AverageTrueRange(self.df)
+
+        setFloatDtype("float32")
+
+        atr = AverageTrueRange(self.df)
+
+        self.assertEqual(result_cache.getStatistics()["hits"], 0)
+        self.assertEqual(atr.getTiData()["atr"].dtype, np.float32)
+
+    def test_kernels_keep_float32(self):
+        close = self.df["close"].to_numpy(dtype=np.float32)
+
+        self.assertEqual(kernels.momentum(close).dtype, np.float32)
+        self.assertEqual(kernels.momentum(close.astype(np.int64)).dtype, np.float64)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,259 @@
+"""
+Trading-Technical-Indicators (tti) python library
+
+File name: test_utils_indicator_store.py
+    tti.utils package, indicator_store.py module unit tests.
+"""
+
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+import numpy as np
+import pandas as pd
+
+from tti.indicators import (
+    AverageTrueRange,
+    MassIndex,
+    MovingAverage,
+    OnBalanceVolume,
+    ParabolicSAR,
+    RelativeStrengthIndex,
+)
+from tti.utils import IndicatorStore, setFloatDtype
+from tti.utils.exceptions import WrongTypeForInputParameter, WrongValueForInputParameter
+
+
+class TestIndicatorStore(unittest.TestCase):
+    df = pd.read_csv(
+        "./data/sample_data.csv", parse_dates=True, date_format="%Y-%m-%d", index_col=0
+    ).sort_index()
+
+    def setUp(self):
+        self._directory = tempfile.TemporaryDirectory()
+        self.store = IndicatorStore(self._directory.name)
+
+    def tearDown(self):
+        self._directory.cleanup()
+
+    def test_directory_wrong_type(self):
+        with self.assertRaises(WrongTypeForInputParameter):
+            IndicatorStore(1)
+
+    def test_symbol_wrong_type(self):
+        with self.assertRaises(WrongTypeForInputParameter):
+            self.store.getIndicator(1, MovingAverage, self.df)
+
+    def test_indicator_wrong_type(self):
+        with self.assertRaises(WrongTypeForInputParameter):
+            self.store.getIndicator("SCMN", "MovingAverage", self.df)
+
+    def test_input_data_wrong_type(self):
+        with self.assertRaises(WrongTypeForInputParameter):
+            self.store.getIndicator("SCMN", MovingAverage, self.df.to_numpy())
+
+    def stored_path(self, symbol="SCMN"):
+        (path,) = os.listdir(os.path.join(self._directory.name, symbol))
+
+        return os.path.join(self._directory.name, symbol, path)
+
+    def stored_files(self):
+        return sorted(os.listdir(self.stored_path()))
+
+    def test_files_stored(self):
+        self.store.getIndicator("SCMN", MovingAverage, self.df, period=10)
+
+        rows = len(self.df.index)
+
+        self.assertEqual(
+            self.stored_files(),
+            [
+                "index_0_{}.npy".format(rows),
+                "input_0_{}.npy".format(rows),
+                "metadata.json",
+                "state_{}.npz".format(rows),
+                "ti_0_{}.npy".format(rows),
+            ],
+        )
+
+    def test_stored_indicator_not_calculated(self):
+        ti_data = self.store.getIndicator("SCMN", MovingAverage, self.df, period=10).getTiData()
+
+        with mock.patch.object(MovingAverage, "_calculateTi") as calculate:
+            ti = self.store.getIndicator("SCMN", MovingAverage, self.df, period=10)
+
+        calculate.assert_not_called()
+
+        pd.testing.assert_frame_equal(ti.getTiData(), ti_data)
+
+    def test_extended_with_new_rows(self):
+        for indicator, kwargs in [
+            (MovingAverage, {"period": 10, "ma_type": "exponential"}),
+            (RelativeStrengthIndex, {}),
+            (AverageTrueRange, {}),
+            (MassIndex, {}),
+            (OnBalanceVolume, {}),
+            (ParabolicSAR, {}),
+        ]:
+            with self.subTest(indicator=indicator.__name__):
+                self.store.getIndicator("SCMN", indicator, self.df.iloc[:-5], **kwargs)
+
+                ti = self.store.getIndicator("SCMN", indicator, self.df, **kwargs)
+
+                pd.testing.assert_frame_equal(
+                    ti.getTiData(), indicator(self.df, **kwargs).getTiData()
+                )
+
+                # The extended indicator is stored
+                with mock.patch.object(indicator, "update") as update:
+                    self.store.getIndicator("SCMN", indicator, self.df, **kwargs)
+
+                update.assert_not_called()
+
+    def test_new_rows_stored_in_segment(self):
+        rows = len(self.df.index)
+
+        self.store.getIndicator("SCMN", ParabolicSAR, self.df.iloc[:-5])
+
+        with mock.patch("numpy.save", wraps=np.save) as save:
+            self.store.getIndicator("SCMN", ParabolicSAR, self.df)
+
+        # Only the new rows are written, the stored ones are kept
+        self.assertEqual([len(call.args[1]) for call in save.call_args_list], [5, 5, 5])
+
+        self.assertEqual(
+            self.stored_files(),
+            [
+                "index_0_{}.npy".format(rows - 5),
+                "index_{}_{}.npy".format(rows - 5, rows),
+                "input_0_{}.npy".format(rows - 5),
+                "input_{}_{}.npy".format(rows - 5, rows),
+                "metadata.json",
+                "state_{}.npz".format(rows),
+                "ti_0_{}.npy".format(rows - 5),
+                "ti_{}_{}.npy".format(rows - 5, rows),
+            ],
+        )
+
+    def test_segments_merged(self):
+        rows = len(self.df.index)
+
+        self.store.getIndicator("SCMN", RelativeStrengthIndex, self.df.iloc[: rows - 100])
+
+        for row in range(rows - 100, rows):
+            ti = self.store.getIndicator("SCMN", RelativeStrengthIndex, self.df.iloc[row : row + 1])
+
+        pd.testing.assert_frame_equal(ti.getTiData(), RelativeStrengthIndex(self.df).getTiData())
+
+        with open(os.path.join(self.stored_path(), "metadata.json")) as metadata_file:
+            segments = json.load(metadata_file)["segments"]
+
+        # The 100 new rows (one row each time) are merged in segments of
+        # decreasing size
+        self.assertEqual([segment["input_rows"] for segment in segments], [rows - 100, 64, 32, 4])
+
+    def test_only_new_rows(self):
+        self.store.getIndicator("SCMN", AverageTrueRange, self.df.iloc[:-5])
+
+        with mock.patch.object(AverageTrueRange, "_calculateTi") as calculate:
+            ti = self.store.getIndicator("SCMN", AverageTrueRange, self.df.iloc[-5:])
+
+        calculate.assert_not_called()
+
+        pd.testing.assert_frame_equal(ti.getTiData(), AverageTrueRange(self.df).getTiData())
+
+    def test_float_dtype_stored_separately(self):
+        ti_data = self.store.getIndicator("SCMN", MovingAverage, self.df).getTiData()
+
+        setFloatDtype("float32")
+
+        try:
+            ti = self.store.getIndicator("SCMN", MovingAverage, self.df)
+            self.assertEqual(ti._float_dtype, np.float32)
+            pd.testing.assert_frame_equal(ti.getTiData(), MovingAverage(self.df).getTiData())
+        finally:
+            setFloatDtype("float64")
+
+        self.assertEqual(len(os.listdir(os.path.join(self._directory.name, "SCMN"))), 2)
+
+        pd.testing.assert_frame_equal(
+            self.store.getIndicator("SCMN", MovingAverage, self.df).getTiData(), ti_data
+        )
+
+    def test_changed_input_data_calculated(self):
+        self.store.getIndicator("SCMN", MovingAverage, self.df, period=10)
+
+        df = self.df.copy()
+        df.iloc[10, df.columns.get_loc("close")] += 1.0
+
+        ti = self.store.getIndicator("SCMN", MovingAverage, df, period=10)
+
+        pd.testing.assert_frame_equal(ti.getTiData(), MovingAverage(df, period=10).getTiData())
+
+    def test_removed_rows_calculated(self):
+        self.store.getIndicator("SCMN", MovingAverage, self.df, period=10)
+
+        df = self.df.drop(self.df.index[10])
+
+        ti = self.store.getIndicator("SCMN", MovingAverage, df, period=10)
+
+        pd.testing.assert_frame_equal(ti.getTiData(), MovingAverage(df, period=10).getTiData())
+
+    def test_part_of_stored_rows(self):
+        df = self.df.iloc[:-1]
+
+        ti_data = self.store.getIndicator("SCMN", MovingAverage, df, period=10).getTiData()
+
+        # The last stored rows and a new one
+        with self.assertRaises(WrongValueForInputParameter):
+            self.store.getIndicator("SCMN", MovingAverage, self.df.iloc[-40:], period=10)
+
+        # The stored indicator is not replaced
+        with mock.patch.object(MovingAverage, "_calculateTi") as calculate:
+            ti = self.store.getIndicator("SCMN", MovingAverage, df, period=10)
+
+        calculate.assert_not_called()
+
+        pd.testing.assert_frame_equal(ti.getTiData(), ti_data)
+
+    def test_upper_case_columns(self):
+        df = self.df.rename(columns=str.capitalize)
+
+        self.store.getIndicator("SCMN", MovingAverage, df.iloc[:-5], period=10)
+
+        with mock.patch.object(MovingAverage, "_calculateTi") as calculate:
+            ti = self.store.getIndicator("SCMN", MovingAverage, df, period=10)
+
+        calculate.assert_not_called()
+
+        pd.testing.assert_frame_equal(ti.getTiData(), MovingAverage(self.df, period=10).getTiData())
+
+    def test_symbol_directory(self):
+        for symbol, directory in [
+            ("BRK/B", "BRK%2FB"),
+            ("BRK.B", "BRK.B"),
+            ("..", "%2E."),
+            ("../SCMN", "%2E.%2FSCMN"),
+            (".", "%2E"),
+        ]:
+            with self.subTest(symbol=symbol):
+                self.store.getIndicator(symbol, MovingAverage, self.df.iloc[:50])
+
+                self.assertIn(directory, os.listdir(self._directory.name))
+
+        self.assertEqual(len(os.listdir(self._directory.name)), 5)
+
+    def test_symbol_wrong_value(self):
+        with self.assertRaises(WrongValueForInputParameter):
+            self.store.getIndicator("", MovingAverage, self.df)
+
+    def test_different_arguments_stored_separately(self):
+        self.store.getIndicator("SCMN", MovingAverage, self.df, period=10)
+        ti = self.store.getIndicator("SCMN", MovingAverage, self.df, period=20)
+
+        pd.testing.assert_frame_equal(ti.getTiData(), MovingAverage(self.df, period=20).getTiData())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,77 @@
+"""
+Trading-Technical-Indicators (tti) python library
+
+File name: test_utils_prepared_input.py
+    tti.utils package, prepared_input.py module unit tests.
+"""
+
+import unittest
+import pandas as pd
+
+from tti.utils import PreparedInput
+from tti.utils.data_validation import validateInputData
+from tti.utils.exceptions import WrongTypeForInputParameter
+
+
+class TestPreparedInput(unittest.TestCase):
+    df = pd.read_csv(
+        "./data/missing_values_data.csv", parse_dates=True, date_format="%Y-%m-%d", index_col=0
+    )
+
+    def test_input_data_is_not_dataframe(self):
+        with self.assertRaises(WrongTypeForInputParameter):
+            PreparedInput("No_DF")
+
+    def test_input_data_index_is_not_date(self):
+        with self.assertRaises(TypeError):
+            PreparedInput(self.df.reset_index())
+
+    def test_input_data_dataframe_is_empty(self):
+        with self.assertRaises(ValueError):
+            PreparedInput(self.df[self.df.index >= "2032-01-01"])
+
+    def test_input_data_not_modified(self):
+        df = self.df.rename(columns=str.upper)
+        df_copy = df.copy()
+
+        PreparedInput(df).getInputData(["close"], "I")
+
+        pd.testing.assert_frame_equal(df, df_copy)
+
+    def test_required_column_missing(self):
+        with self.assertRaises(ValueError):
+            PreparedInput(self.df).getInputData(["no_column"], "I")
+
+    def test_required_column_not_numeric(self):
+        with self.assertRaises(ValueError):
+            PreparedInput(self.df.astype({"close": str})).getInputData(["close"], "I")
+
+    def test_get_input_data(self):
+        prepared_input = PreparedInput(self.df.rename(columns=str.upper))
+
+        for required_columns in [["close"], ["low", "high"], ["high", "low", "close", "volume"]]:
+            for fill_missing_values in [True, False]:
+                with self.subTest(
+                    required_columns=required_columns, fill_missing_values=fill_missing_values
+                ):
+                    pd.testing.assert_frame_equal(
+                        prepared_input.getInputData(required_columns, "I", fill_missing_values),
+                        validateInputData(
+                            self.df.copy(), required_columns, "I", fill_missing_values
+                        ),
+                    )
+
+    def test_get_input_data_prepared_once(self):
+        prepared_input = PreparedInput(self.df)
+
+        input_data = prepared_input.getInputData(["high", "low"], "I")
+        input_data["scratch"] = 0.0
+
+        self.assertEqual(len(prepared_input._prepared_data), 1)
+        self.assertListEqual(
+            list(prepared_input.getInputData(["high", "low"], "I").columns), ["high", "low"]
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,134 @@
+"""
+Trading-Technical-Indicators (tti) python library
+
+File name: test_utils_result_cache.py
+    tti.utils package, result_cache.py module unit tests.
+"""
+
+import unittest
+import pandas as pd
+
+from tti.indicators import MovingAverage, RelativeStrengthIndex
+from tti.utils import ResultCache, setResultCache, getResultCache
+from tti.utils.exceptions import WrongTypeForInputParameter, WrongValueForInputParameter
+
+
+class TestResultCache(unittest.TestCase):
+    df = pd.read_csv(
+        "./data/sample_data.csv", parse_dates=True, date_format="%Y-%m-%d", index_col=0
+    )
+
+    def tearDown(self):
+        setResultCache(None)
+
+    def test_max_memory_wrong_type(self):
+        with self.assertRaises(WrongTypeForInputParameter):
+            ResultCache(max_memory="1")
+
+    def test_max_memory_wrong_value(self):
+        with self.assertRaises(WrongValueForInputParameter):
+            ResultCache(max_memory=0)
+
+    def test_set_result_cache_wrong_type(self):
+        with self.assertRaises(WrongTypeForInputParameter):
+            setResultCache({})
+
+    def test_disabled_by_default(self):
+        self.assertIsNone(getResultCache())
+
+    def test_fingerprint(self):
+        self.assertEqual(ResultCache.fingerprint(self.df), ResultCache.fingerprint(self.df.copy()))
+
+        df = self.df.copy()
+        df.iloc[0, 0] += 1
+
+        self.assertNotEqual(ResultCache.fingerprint(self.df), ResultCache.fingerprint(df))
+
+    def test_hits_and_misses(self):
+        result_cache = ResultCache()
+        setResultCache(result_cache)
+
+        ti_data = MovingAverage(self.df.copy(), period=10).getTiData()
+
+        self.assertDictEqual(
+            {k: v for k, v in result_cache.getStatistics().items() if k != "memory"},
+            {"hits": 0, "misses": 1, "results": 1},
+        )
+
+        pd.testing.assert_frame_equal(MovingAverage(self.df.copy(), period=10).getTiData(), ti_data)
+
+        # Different arguments, fill missing values option and input data
+        MovingAverage(self.df.copy(), period=11)
+        MovingAverage(self.df.copy(), period=10, fill_missing_values=False)
+        MovingAverage(self.df.iloc[1:], period=10)
+
+        self.assertDictEqual(
+            {k: v for k, v in result_cache.getStatistics().items() if k != "memory"},
+            {"hits": 1, "misses": 4, "results": 4},
+        )
+
+    def test_cached_result_not_modified(self):
+        setResultCache(ResultCache())
+
+        ti_data = MovingAverage(self.df.copy(), period=10).getTiData()
+        expected_ti_data = ti_data.copy()
+
+        ti_data.iloc[:, 0] = 0.0
+
+        pd.testing.assert_frame_equal(
+            MovingAverage(self.df.copy(), period=10).getTiData(), expected_ti_data
+        )
+
+    def test_memory_eviction(self):
+        setResultCache(ResultCache())
+
+        MovingAverage(self.df.copy(), period=10)
+
+        result_memory = getResultCache().getStatistics()["memory"]
+
+        # Room for two results only
+        result_cache = ResultCache(max_memory=2 * result_memory + result_memory // 2)
+        setResultCache(result_cache)
+
+        for period in [10, 11, 12]:
+            MovingAverage(self.df.copy(), period=period)
+
+        self.assertEqual(result_cache.getStatistics()["results"], 2)
+
+        # The least recently used result is evicted
+        MovingAverage(self.df.copy(), period=10)
+
+        self.assertEqual(result_cache.getStatistics()["hits"], 0)
+
+        MovingAverage(self.df.copy(), period=12)
+
+        self.assertEqual(result_cache.getStatistics()["hits"], 1)
+        self.assertLessEqual(result_cache.getStatistics()["memory"], 2.5 * result_memory)
+
+    def test_result_larger_than_max_memory(self):
+        result_cache = ResultCache(max_memory=1)
+        setResultCache(result_cache)
+
+        MovingAverage(self.df.copy(), period=10)
+
+        self.assertEqual(result_cache.getStatistics()["results"], 0)
+        self.assertEqual(result_cache.getStatistics()["memory"], 0)
+
+    def test_invalidate(self):
+        result_cache = ResultCache()
+        setResultCache(result_cache)
+
+        MovingAverage(self.df.copy(), period=10)
+        MovingAverage(self.df.copy(), period=11)
+        RelativeStrengthIndex(self.df.copy())
+
+        self.assertEqual(result_cache.invalidate("MovingAverage"), 2)
+        self.assertEqual(result_cache.getStatistics()["results"], 1)
+
+        self.assertEqual(result_cache.invalidate(), 1)
+        self.assertEqual(result_cache.getStatistics()["results"], 0)
+        self.assertEqual(result_cache.getStatistics()["memory"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,121 @@
+"""
+Trading-Technical-Indicators (tti) python library
+
+File name: test_utils_rolling_extrema.py
+    tti.utils package, rolling_extrema.py module unit tests.
+"""
+
+import unittest
+import numpy as np
+import pandas as pd
+
+from tti.utils import rollingExtrema, RollingExtrema
+from tti.utils.exceptions import WrongTypeForInputParameter, WrongValueForInputParameter
+
+
+class TestRollingExtrema(unittest.TestCase):
+    df = pd.read_csv(
+        "./data/missing_values_data.csv", parse_dates=True, date_format="%Y-%m-%d", index_col=0
+    ).sort_index()
+
+    periods = [1, 2, 3, 9, 26, 52, 64, 100]
+
+    def test_periods_wrong_type(self):
+        for periods in [9, [], [9.0], [True]]:
+            with self.subTest(periods=periods):
+                with self.assertRaises(WrongTypeForInputParameter):
+                    rollingExtrema(self.df["low"], self.df["high"], periods)
+
+                with self.assertRaises(WrongTypeForInputParameter):
+                    RollingExtrema(periods)
+
+    def test_periods_wrong_value(self):
+        with self.assertRaises(WrongValueForInputParameter):
+            rollingExtrema(self.df["low"], self.df["high"], [9, 0])
+
+        with self.assertRaises(WrongValueForInputParameter):
+            RollingExtrema([9], min_periods=0)
+
+    def test_rolling_extrema(self):
+        for min_periods in [None, 1, 5]:
+            periods = [p for p in self.periods if min_periods is None or p >= min_periods]
+
+            extrema = rollingExtrema(self.df["low"], self.df["high"], periods, min_periods)
+
+            for period in periods:
+                with self.subTest(min_periods=min_periods, period=period):
+                    rolling = self.df.rolling(
+                        window=period, min_periods=period if min_periods is None else min_periods
+                    )
+
+                    np.testing.assert_array_equal(extrema[period][0], rolling["low"].min())
+
+                    np.testing.assert_array_equal(extrema[period][1], rolling["high"].max())
+
+    def test_rolling_extrema_short_input(self):
+        # Less rows than the periods, and than the windows combined for them
+        for rows in [0, 1, 5, 20, 40]:
+            df = self.df.iloc[:rows]
+
+            extrema = rollingExtrema(df["low"], df["high"], self.periods, min_periods=1)
+
+            for period in self.periods:
+                with self.subTest(rows=rows, period=period):
+                    rolling = df.rolling(window=period, min_periods=1)
+
+                    np.testing.assert_array_equal(extrema[period][0], rolling["low"].min())
+
+                    np.testing.assert_array_equal(extrema[period][1], rolling["high"].max())
+
+    def test_streaming(self):
+        for min_periods in [None, 1, 5]:
+            periods = [p for p in self.periods if min_periods is None or p >= min_periods]
+
+            rolling_extrema = RollingExtrema(periods, min_periods)
+
+            streamed = [
+                rolling_extrema.append(low, high)
+                for low, high in zip(self.df["low"], self.df["high"])
+            ]
+
+            for period in periods:
+                with self.subTest(min_periods=min_periods, period=period):
+                    rolling = self.df.rolling(
+                        window=period, min_periods=period if min_periods is None else min_periods
+                    )
+
+                    np.testing.assert_array_equal(
+                        [extrema[period][0] for extrema in streamed], rolling["low"].min()
+                    )
+
+                    np.testing.assert_array_equal(
+                        [extrema[period][1] for extrema in streamed], rolling["high"].max()
+                    )
+
+    def test_streaming_equal_rolling_extrema(self):
+        values = [1.0, np.nan, 3.0]
+
+        rolling_extrema = RollingExtrema([2], min_periods=2)
+        streamed = [rolling_extrema.append(value, value)[2] for value in values]
+
+        lowest, highest = rollingExtrema(values, values, [2], min_periods=2)[2]
+
+        np.testing.assert_array_equal([extrema[0] for extrema in streamed], lowest)
+        np.testing.assert_array_equal([extrema[1] for extrema in streamed], highest)
+        np.testing.assert_array_equal(lowest, [np.nan, np.nan, np.nan])
+
+    def test_streaming_missing_values_ignored(self):
+        rolling_extrema = RollingExtrema([3], min_periods=2)
+
+        for low, high in [(1.0, 5.0), (np.nan, np.nan), (2.0, 4.0)]:
+            extrema = rolling_extrema.append(low, high)
+
+        self.assertEqual(extrema[3], (1.0, 5.0))
+
+        extrema = rolling_extrema.append(3.0, 3.0)
+
+        self.assertEqual(extrema[3], (2.0, 4.0))
+
+
+if __name__ == "__main__":
+    unittest.main()
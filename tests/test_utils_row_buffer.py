@@ -0,0 +1,102 @@
+"""
+Trading-Technical-Indicators (tti) python library
+
+File name: test_utils_row_buffer.py
+    tti.utils package, row_buffer.py module unit tests.
+"""
+
+import unittest
+import numpy as np
+import pandas as pd
+
+from tti.utils.row_buffer import RowBuffer
+
+
+class TestRowBuffer(unittest.TestCase):
+    df = pd.read_csv(
+        "./data/sample_data.csv", parse_dates=True, date_format="%Y-%m-%d", index_col=0
+    ).sort_index()
+
+    def append(self, data, rows_per_append):
+        # Appends the rows of data, starting from its first rows
+        row_buffer = RowBuffer()
+        appended = data.iloc[:rows_per_append]
+
+        for i in range(rows_per_append, len(data.index), rows_per_append):
+            appended = row_buffer.append(appended, data.iloc[i : i + rows_per_append])
+
+        return row_buffer, appended
+
+    def test_append(self):
+        for rows_per_append in [1, 7, 3000]:
+            with self.subTest(rows_per_append=rows_per_append):
+                _, appended = self.append(self.df, rows_per_append)
+
+                pd.testing.assert_frame_equal(appended, self.df)
+
+    def test_rows_not_copied(self):
+        row_buffer = RowBuffer()
+
+        data = row_buffer.append(self.df.iloc[:100], self.df.iloc[100:101])
+
+        # The arrays have space for the next rows
+        for i in range(101, 110):
+            appended = row_buffer.append(data, self.df.iloc[i : i + 1])
+
+            self.assertTrue(np.shares_memory(appended.to_numpy(), data.to_numpy()))
+
+            data = appended
+
+        pd.testing.assert_frame_equal(data, self.df.iloc[:110])
+
+    def test_growth(self):
+        row_buffer, appended = self.append(self.df, 1)
+
+        rows = len(self.df.index)
+
+        self.assertGreaterEqual(len(row_buffer._values), rows)
+        self.assertLessEqual(len(row_buffer._values), rows + max(rows // 2, 1024))
+
+        pd.testing.assert_frame_equal(appended, self.df)
+
+    def test_not_stored_data(self):
+        row_buffer = RowBuffer()
+
+        first = row_buffer.append(self.df.iloc[:100], self.df.iloc[100:101])
+
+        # A data frame not returned by the buffer, its rows are stored again
+        appended = row_buffer.append(self.df.iloc[:50], self.df.iloc[50:52])
+
+        pd.testing.assert_frame_equal(appended, self.df.iloc[:52])
+        pd.testing.assert_frame_equal(first, self.df.iloc[:101])
+
+    def test_concatenated(self):
+        mixed_dtypes = self.df.astype({"volume": np.int64})
+
+        integer_rows = self.df.iloc[:, :1].astype(np.int64)
+        float_rows = self.df.iloc[:, :1].astype(np.float64)
+
+        for data, rows in [
+            (mixed_dtypes.iloc[:100], mixed_dtypes.iloc[100:110]),
+            (integer_rows.iloc[:100], float_rows.iloc[100:110]),
+            (
+                self.df.reset_index(drop=True).iloc[:100],
+                self.df.reset_index(drop=True).iloc[100:110],
+            ),
+            (self.df.iloc[:100], self.df.iloc[100:110, ::-1]),
+        ]:
+            with self.subTest(data_dtypes=list(data.dtypes), rows_dtypes=list(rows.dtypes)):
+                appended = RowBuffer().append(data, rows)
+
+                pd.testing.assert_frame_equal(appended, pd.concat([data, rows]))
+
+    def test_time_zone(self):
+        data = self.df.tz_localize("Europe/Athens")
+
+        _, appended = self.append(data, 10)
+
+        pd.testing.assert_frame_equal(appended, data)
+
+
+if __name__ == "__main__":
+    unittest.main()
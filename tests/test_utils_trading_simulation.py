@@ -6,6 +6,7 @@ File name: test_utils_trading_simulation.py
 """
 
 import unittest
+import heapq
 import pandas as pd
 import numpy as np
 
@@ -18,6 +19,58 @@ from tti.utils.exceptions import (
 from tti.utils.constants import TRADE_SIGNALS
 
 
+def readSimulationData(file_name):
+    """
+    Reads simulation data from a csv file, in the array format used by the
+    TradingSimulation class.
+    """
+
+    simulation_data = pd.read_csv(file_name, parse_dates=True, date_format="%Y-%m-%d", index_col=0)
+
+    simulation_data["signal"] = simulation_data["signal"].map(
+        {"buy": -1.0, "hold": 0.0, "sell": 1.0}
+    )
+
+    simulation_data["open_trading_action"] = simulation_data["open_trading_action"].map(
+        {"none": 0.0, "short": 1.0, "long": 2.0}
+    )
+
+    return simulation_data.to_numpy(dtype=np.float64, copy=True)
+
+
+def indexOpenPositions(ts):
+    """
+    Builds the index of the opened positions (heaps sorted by exposure) of the
+    TradingSimulation instance, from its portfolio.
+    """
+
+    opened = ts._portfolio[:, 1] == 1.0
+
+    ts._open_long_positions = [
+        (ts._portfolio[i, 2], i) for i in np.flatnonzero(opened & (ts._portfolio[:, 0] == 2.0))
+    ]
+
+    ts._open_short_positions = [
+        (-ts._portfolio[i, 2], i) for i in np.flatnonzero(opened & (ts._portfolio[:, 0] == 1.0))
+    ]
+
+    heapq.heapify(ts._open_long_positions)
+    heapq.heapify(ts._open_short_positions)
+
+
+def setPortfolio(ts, file_name):
+    """
+    Reads a portfolio from a csv file and sets it to the TradingSimulation
+    instance, together with the index of the opened positions.
+    """
+
+    ts._portfolio = pd.read_csv(
+        file_name, parse_dates=True, date_format="%Y-%m-%d", index_col=0
+    ).to_numpy(dtype=np.float64, copy=True)
+
+    indexOpenPositions(ts)
+
+
 class TestTradingSimulation(unittest.TestCase):
     # Missing input argument test cases
 
@@ -359,19 +412,9 @@ class TestTradingSimulation(unittest.TestCase):
             "final_balance": 0.0,
         }
 
-        ts._simulation_data = pd.read_csv(
-            "./data/simulation_data_empty.csv",
-            parse_dates=True,
-            date_format="%Y-%m-%d",
-            index_col=0,
-        )
+        ts._simulation_data = readSimulationData("./data/simulation_data_empty.csv")
 
-        ts._portfolio = pd.read_csv(
-            "./data/portfolio_simulation_data_empty.csv",
-            parse_dates=True,
-            date_format="%Y-%m-%d",
-            index_col=0,
-        ).to_numpy(dtype=np.float64, copy=True)
+        setPortfolio(ts, "./data/portfolio_simulation_data_empty.csv")
 
         ts._calculateSimulationStatistics()
 
@@ -410,19 +453,11 @@ class TestTradingSimulation(unittest.TestCase):
             "final_balance": 409.0,
         }
 
-        ts._simulation_data = pd.read_csv(
-            "./data/simulation_data_with_actions_ten_rounds.csv",
-            parse_dates=True,
-            date_format="%Y-%m-%d",
-            index_col=0,
+        ts._simulation_data = readSimulationData(
+            "./data/simulation_data_with_actions_ten_rounds.csv"
         )
 
-        ts._portfolio = pd.read_csv(
-            "./data/portfolio_simulation_data_ten_rounds.csv",
-            parse_dates=True,
-            date_format="%Y-%m-%d",
-            index_col=0,
-        ).to_numpy(dtype=np.float64, copy=True)
+        setPortfolio(ts, "./data/portfolio_simulation_data_ten_rounds.csv")
 
         ts._calculateSimulationStatistics()
 
@@ -463,19 +498,9 @@ class TestTradingSimulation(unittest.TestCase):
             "final_balance": 3568.0,
         }
 
-        ts._simulation_data = pd.read_csv(
-            "./data/simulation_data_full_with_actions.csv",
-            parse_dates=True,
-            date_format="%Y-%m-%d",
-            index_col=0,
-        )
+        ts._simulation_data = readSimulationData("./data/simulation_data_full_with_actions.csv")
 
-        ts._portfolio = pd.read_csv(
-            "./data/portfolio_simulation_data_full.csv",
-            parse_dates=True,
-            date_format="%Y-%m-%d",
-            index_col=0,
-        ).to_numpy(dtype=np.float64, copy=True)
+        setPortfolio(ts, "./data/portfolio_simulation_data_full.csv")
 
         ts._calculateSimulationStatistics()
 
@@ -516,19 +541,9 @@ class TestTradingSimulation(unittest.TestCase):
             "final_balance": 0.0,
         }
 
-        ts._simulation_data = pd.read_csv(
-            "./data/simulation_data_full_without_actions.csv",
-            parse_dates=True,
-            date_format="%Y-%m-%d",
-            index_col=0,
-        )
+        ts._simulation_data = readSimulationData("./data/simulation_data_full_without_actions.csv")
 
-        ts._portfolio = pd.read_csv(
-            "./data/portfolio_simulation_data_full_no_positions.csv",
-            parse_dates=True,
-            date_format="%Y-%m-%d",
-            index_col=0,
-        ).to_numpy(dtype=np.float64, copy=True)
+        setPortfolio(ts, "./data/portfolio_simulation_data_full_no_positions.csv")
 
         ts._calculateSimulationStatistics()
 
@@ -554,12 +569,7 @@ class TestTradingSimulation(unittest.TestCase):
             short_exposure_factor=1.5,
         )
 
-        ts._portfolio = pd.read_csv(
-            "./data/portfolio_simulation_data_ten_rounds.csv",
-            parse_dates=True,
-            date_format="%Y-%m-%d",
-            index_col=0,
-        ).to_numpy(dtype=np.float64, copy=True)
+        setPortfolio(ts, "./data/portfolio_simulation_data_ten_rounds.csv")
 
         value = ts._calculatePortfolioValue(i_index=9)
 
@@ -585,12 +595,7 @@ class TestTradingSimulation(unittest.TestCase):
             short_exposure_factor=1.5,
         )
 
-        ts._portfolio = pd.read_csv(
-            "./data/portfolio_simulation_data_none_open_ten_rounds.csv",
-            parse_dates=True,
-            date_format="%Y-%m-%d",
-            index_col=0,
-        ).to_numpy(dtype=np.float64, copy=True)
+        setPortfolio(ts, "./data/portfolio_simulation_data_none_open_ten_rounds.csv")
 
         portfolio_expected_result = pd.read_csv(
             "./data/portfolio_simulation_data_none_open_ten_rounds.csv",
@@ -599,8 +604,8 @@ class TestTradingSimulation(unittest.TestCase):
             index_col=0,
         ).to_numpy(dtype=np.float64, copy=True)
 
-        ts._simulation_data.at[ts._simulation_data.index[8], "exposure"] = 100.0
-        ts._simulation_data.at[ts._simulation_data.index[8], "earnings"] = 200.0
+        ts._simulation_data[8, 3] = 100.0
+        ts._simulation_data[8, 5] = 200.0
 
         earnings, closed_exposure = ts._closeOpenPositions(i_index=9)
 
@@ -608,9 +613,9 @@ class TestTradingSimulation(unittest.TestCase):
 
         self.assertEqual(closed_exposure, 0.0)
 
-        np.testing.assert_equal(ts._simulation_data["exposure"].iat[9], 100.0)
+        np.testing.assert_equal(ts._simulation_data[9, 3], 100.0)
 
-        np.testing.assert_equal(ts._simulation_data["earnings"].iat[9], 200.0)
+        np.testing.assert_equal(ts._simulation_data[9, 5], 200.0)
 
         np.testing.assert_equal(ts._portfolio, portfolio_expected_result)
 
@@ -632,12 +637,7 @@ class TestTradingSimulation(unittest.TestCase):
             short_exposure_factor=1.5,
         )
 
-        ts._portfolio = pd.read_csv(
-            "./data/portfolio_simulation_data_all_open_ten_rounds.csv",
-            parse_dates=True,
-            date_format="%Y-%m-%d",
-            index_col=0,
-        ).to_numpy(dtype=np.float64, copy=True)
+        setPortfolio(ts, "./data/portfolio_simulation_data_all_open_ten_rounds.csv")
 
         portfolio_expected_result = pd.read_csv(
             "./data/portfolio_simulation_data_all_open_ten_rounds.csv",
@@ -652,9 +652,10 @@ class TestTradingSimulation(unittest.TestCase):
 
         portfolio_expected_result[5, 2] = 40.00
 
-        ts._simulation_data.at[ts._simulation_data.index[8], "exposure"] = 100.0
-        ts._simulation_data.at[ts._simulation_data.index[8], "earnings"] = 200.0
+        ts._simulation_data[8, 3] = 100.0
+        ts._simulation_data[8, 5] = 200.0
         ts._portfolio[5, 2] = 40.00
+        indexOpenPositions(ts)
 
         ts._close_values[9, 0] = 24.0
 
@@ -669,13 +670,13 @@ class TestTradingSimulation(unittest.TestCase):
         self.assertEqual(closed_exposure, exposure_expected)
 
         np.testing.assert_equal(
-            ts._simulation_data["exposure"].iat[9],
-            ts._simulation_data["exposure"].iat[8] - exposure_expected,
+            ts._simulation_data[9, 3],
+            ts._simulation_data[8, 3] - exposure_expected,
         )
 
         np.testing.assert_equal(
-            ts._simulation_data["earnings"].iat[9],
-            ts._simulation_data["earnings"].iat[8] + earnings_expected,
+            ts._simulation_data[9, 5],
+            ts._simulation_data[8, 5] + earnings_expected,
         )
 
         np.testing.assert_equal(ts._portfolio, portfolio_expected_result)
@@ -705,8 +706,8 @@ class TestTradingSimulation(unittest.TestCase):
         self.assertListEqual(list(ts._portfolio[0, :]), [0.0, 0.0, 0.0])
 
         self.assertListEqual(
-            ts._simulation_data.iloc[0, :].to_list(),
-            ["hold", "none", ts._close_values[0, 0], 0.0, 0.0, 0.0, 0.0],
+            ts._simulation_data[0, :].tolist(),
+            [TRADE_SIGNALS["hold"][1], 0.0, ts._close_values[0, 0], 0.0, 0.0, 0.0, 0.0],
         )
 
     def test_run_simulation_round_first_round_buy(self):
@@ -732,8 +733,8 @@ class TestTradingSimulation(unittest.TestCase):
         self.assertListEqual(list(ts._portfolio[0, :]), [0.0, 0.0, 0.0])
 
         self.assertListEqual(
-            ts._simulation_data.iloc[0, :].to_list(),
-            ["buy", "none", ts._close_values[0, 0], 0.0, 0.0, 0.0, 0.0],
+            ts._simulation_data[0, :].tolist(),
+            [TRADE_SIGNALS["buy"][1], 0.0, ts._close_values[0, 0], 0.0, 0.0, 0.0, 0.0],
         )
 
     def test_run_simulation_round_first_round_sell(self):
@@ -759,8 +760,8 @@ class TestTradingSimulation(unittest.TestCase):
         self.assertListEqual(list(ts._portfolio[0, :]), [0.0, 0.0, 0.0])
 
         self.assertListEqual(
-            ts._simulation_data.iloc[0, :].to_list(),
-            ["sell", "none", ts._close_values[0, 0], 0.0, 0.0, 0.0, 0.0],
+            ts._simulation_data[0, :].tolist(),
+            [TRADE_SIGNALS["sell"][1], 0.0, ts._close_values[0, 0], 0.0, 0.0, 0.0, 0.0],
         )
 
     def test_run_simulation_round_hold(self):
@@ -787,14 +788,14 @@ class TestTradingSimulation(unittest.TestCase):
         self.assertListEqual(list(ts._portfolio[1, :]), [0.0, 0.0, 0.0])
 
         self.assertListEqual(
-            ts._simulation_data.iloc[1, :].to_list(),
+            ts._simulation_data[1, :].tolist(),
             [
-                "hold",
-                "none",
+                TRADE_SIGNALS["hold"][1],
+                0.0,
                 ts._close_values[1, 0],
-                ts._simulation_data["exposure"].iat[0],
-                ts._simulation_data["portfolio_value"].iat[0],
-                ts._simulation_data["earnings"].iat[0],
+                ts._simulation_data[0, 3],
+                ts._simulation_data[0, 4],
+                ts._simulation_data[0, 5],
                 0.0,
             ],
         )
@@ -824,14 +825,12 @@ class TestTradingSimulation(unittest.TestCase):
         self.assertListEqual(list(ts._portfolio[2, :]), [2.0, 1.0, ts._close_values[2, 0]])
 
         self.assertListEqual(
-            ts._simulation_data.iloc[2, :].to_list(),
+            ts._simulation_data[2, :].tolist(),
             [
-                "buy",
-                "long",
+                TRADE_SIGNALS["buy"][1],
+                2.0,
                 ts._close_values[2, 0],
-                ts._simulation_data["exposure"].iat[0]
-                + ts._simulation_data["exposure"].iat[1]
-                + ts._close_values[2, 0],
+                ts._simulation_data[0, 3] + ts._simulation_data[1, 3] + ts._close_values[2, 0],
                 2 * ts._close_values[2, 0],
                 0.0,
                 2 * ts._close_values[2, 0],
@@ -862,12 +861,12 @@ class TestTradingSimulation(unittest.TestCase):
         self.assertListEqual(list(ts._portfolio[1, :]), [1.0, 1.0, 1.5 * ts._close_values[1, 0]])
 
         self.assertListEqual(
-            ts._simulation_data.iloc[1, :].to_list(),
+            ts._simulation_data[1, :].tolist(),
             [
-                "sell",
-                "short",
+                TRADE_SIGNALS["sell"][1],
+                1.0,
                 ts._close_values[1, 0],
-                ts._simulation_data["exposure"].iat[0] + 1.5 * ts._close_values[1, 0],
+                ts._simulation_data[0, 3] + 1.5 * ts._close_values[1, 0],
                 -ts._close_values[1, 0],
                 0.0,
                 -ts._close_values[1, 0],
@@ -899,8 +898,8 @@ class TestTradingSimulation(unittest.TestCase):
         self.assertListEqual(list(ts._portfolio[2, :]), [0.0, 0.0, 0.0])
 
         self.assertListEqual(
-            ts._simulation_data.iloc[2, :].to_list(),
-            ["buy", "none", ts._close_values[2, 0], 0.0, 0.0, 0.0, 0.0],
+            ts._simulation_data[2, :].tolist(),
+            [TRADE_SIGNALS["buy"][1], 0.0, ts._close_values[2, 0], 0.0, 0.0, 0.0, 0.0],
         )
 
     def test_run_simulation_round_sell_max_exposure(self):
@@ -927,8 +926,109 @@ class TestTradingSimulation(unittest.TestCase):
         self.assertListEqual(list(ts._portfolio[1, :]), [0.0, 0.0, 0.0])
 
         self.assertListEqual(
-            ts._simulation_data.iloc[1, :].to_list(),
-            ["sell", "none", ts._close_values[1, 0], 0.0, 0.0, 0.0, 0.0],
+            ts._simulation_data[1, :].tolist(),
+            [TRADE_SIGNALS["sell"][1], 0.0, ts._close_values[1, 0], 0.0, 0.0, 0.0, 0.0],
+        )
+
+    # Tests for runSimulationRounds
+
+    def test_run_simulation_rounds(self):
+        # close values DataFrame
+        cv_df = pd.read_csv(
+            "./data/sample_data.csv", parse_dates=True, date_format="%Y-%m-%d", index_col=0
+        )[["close"]]
+
+        # input_data DataFrame
+        id_df = pd.read_csv(
+            "./data/sample_data.csv", parse_dates=True, date_format="%Y-%m-%d", index_col=0
+        )
+
+        signals = [TRADE_SIGNALS[s] for s in ["hold", "buy", "sell", "buy", "hold", "sell"] * 5]
+
+        ts_rounds = TradingSimulation(
+            input_data_index=id_df.index,
+            close_values=cv_df,
+            max_exposure=500,
+            short_exposure_factor=1.5,
+        )
+
+        for i, signal in enumerate(signals):
+            ts_rounds.runSimulationRound(i_index=i, signal=signal)
+
+        ts = TradingSimulation(
+            input_data_index=id_df.index,
+            close_values=cv_df,
+            max_exposure=500,
+            short_exposure_factor=1.5,
+        )
+
+        ts.runSimulationRounds(signals=np.array([s[1] for s in signals], dtype=np.int64))
+
+        np.testing.assert_array_equal(ts._simulation_data, ts_rounds._simulation_data)
+        np.testing.assert_array_equal(ts._portfolio, ts_rounds._portfolio)
+
+    def test_run_simulation_rounds_wrong_signal_value(self):
+        # close values DataFrame
+        cv_df = pd.read_csv(
+            "./data/sample_data.csv", parse_dates=True, date_format="%Y-%m-%d", index_col=0
+        )[["close"]]
+
+        # input_data DataFrame
+        id_df = pd.read_csv(
+            "./data/sample_data.csv", parse_dates=True, date_format="%Y-%m-%d", index_col=0
+        )
+
+        ts = TradingSimulation(input_data_index=id_df.index, close_values=cv_df)
+
+        with self.assertRaises(WrongValueForInputParameter):
+            ts.runSimulationRounds(signals=[0, -1, 2])
+
+    def test_run_simulation_rounds_too_many_signals(self):
+        # close values DataFrame
+        cv_df = pd.read_csv(
+            "./data/sample_data.csv", parse_dates=True, date_format="%Y-%m-%d", index_col=0
+        )[["close"]]
+
+        # input_data DataFrame
+        id_df = pd.read_csv(
+            "./data/sample_data.csv", parse_dates=True, date_format="%Y-%m-%d", index_col=0
+        )
+
+        ts = TradingSimulation(input_data_index=id_df.index, close_values=cv_df)
+
+        with self.assertRaises(WrongValueForInputParameter):
+            ts.runSimulationRounds(signals=[0] * (len(id_df.index) + 1))
+
+    def test_run_simulation_rounds_open_positions_index(self):
+        # close values DataFrame
+        cv_df = pd.read_csv(
+            "./data/sample_data.csv", parse_dates=True, date_format="%Y-%m-%d", index_col=0
+        )[["close"]]
+
+        # input_data DataFrame
+        id_df = pd.read_csv(
+            "./data/sample_data.csv", parse_dates=True, date_format="%Y-%m-%d", index_col=0
+        )
+
+        ts = TradingSimulation(
+            input_data_index=id_df.index,
+            close_values=cv_df,
+            max_exposure=None,
+            short_exposure_factor=1.5,
+        )
+
+        ts.runSimulationRounds(signals=np.tile([-1, 0, 1, -1, 1], len(id_df.index) // 5))
+
+        opened = ts._portfolio[:, 1] == 1.0
+
+        self.assertListEqual(
+            sorted(i for _, i in ts._open_long_positions),
+            list(np.flatnonzero(opened & (ts._portfolio[:, 0] == 2.0))),
+        )
+
+        self.assertListEqual(
+            sorted(i for _, i in ts._open_short_positions),
+            list(np.flatnonzero(opened & (ts._portfolio[:, 0] == 1.0))),
         )
 
     # Tests for closeSimulation
@@ -968,21 +1068,19 @@ class TestTradingSimulation(unittest.TestCase):
             "final_balance": 3568.0,
         }
 
-        ts._simulation_data = pd.read_csv(
+        simulation_data_expected_result = pd.read_csv(
             "./data/simulation_data_full_with_actions.csv",
             parse_dates=True,
             date_format="%Y-%m-%d",
             index_col=0,
         )
+        simulation_data_expected_result.index = ts._input_data_index
 
-        ts._portfolio = pd.read_csv(
-            "./data/portfolio_simulation_data_full.csv",
-            parse_dates=True,
-            date_format="%Y-%m-%d",
-            index_col=0,
-        ).to_numpy(dtype=np.float64, copy=True)
+        ts._simulation_data = readSimulationData("./data/simulation_data_full_with_actions.csv")
+
+        setPortfolio(ts, "./data/portfolio_simulation_data_full.csv")
 
         sd_result, st_result = ts.closeSimulation()
 
-        pd.testing.assert_frame_equal(sd_result, ts._simulation_data)
+        pd.testing.assert_frame_equal(sd_result, simulation_data_expected_result)
         self.assertDictEqual(st_result, statistics_expected_result)
@@ -14,10 +14,11 @@ Project site is https://www.trading-technical-indicators.org/
 """
 
 from tti import indicators
+from tti import kernels
 from tti import utils
 
 from importlib.metadata import version
 
 __version__ = version("tti")
 
-__all__ = ["indicators", "utils"]
+__all__ = ["indicators", "kernels", "utils"]
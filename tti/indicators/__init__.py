@@ -5,63 +5,72 @@ the `tti.indicators` package includes the implementation of all of the
 supported Technical Indicators.
 """
 
-from ._accumulation_distribution_line import AccumulationDistributionLine
-from ._average_true_range import AverageTrueRange
-from ._bollinger_bands import BollingerBands
-from ._chaikin_money_flow import ChaikinMoneyFlow
-from ._chaikin_oscillator import ChaikinOscillator
-from ._chande_momentum_oscillator import ChandeMomentumOscillator
-from ._commodity_channel_index import CommodityChannelIndex
-from ._detrended_price_oscillator import DetrendedPriceOscillator
-from ._directional_movement_index import DirectionalMovementIndex
-from ._double_exponential_moving_average import DoubleExponentialMovingAverage
-from ._ease_of_movement import EaseOfMovement
-from ._envelopes import Envelopes
-from ._fibonacci_retracement import FibonacciRetracement
-from ._forecast_oscillator import ForecastOscillator
-from ._ichimoku_cloud import IchimokuCloud
-from ._intraday_momentum_index import IntradayMomentumIndex
-from ._klinger_oscillator import KlingerOscillator
-from ._linear_regression_indicator import LinearRegressionIndicator
-from ._linear_regression_slope import LinearRegressionSlope
-from ._market_facilitation_index import MarketFacilitationIndex
-from ._mass_index import MassIndex
-from ._median_price import MedianPrice
-from ._momentum import Momentum
-from ._moving_average import MovingAverage
-from ._moving_average_convergence_divergence import MovingAverageConvergenceDivergence
-from ._negative_volume_index import NegativeVolumeIndex
-from ._on_balance_volume import OnBalanceVolume
-from ._parabolic_sar import ParabolicSAR
-from ._performance import Performance
-from ._positive_volume_index import PositiveVolumeIndex
-from ._price_and_volume_trend import PriceAndVolumeTrend
-from ._price_channel import PriceChannel
-from ._price_oscillator import PriceOscillator
-from ._price_rate_of_change import PriceRateOfChange
-from ._projection_bands import ProjectionBands
-from ._projection_oscillator import ProjectionOscillator
-from ._qstick import Qstick
-from ._range_indicator import RangeIndicator
-from ._relative_momentum_index import RelativeMomentumIndex
-from ._relative_strength_index import RelativeStrengthIndex
-from ._relative_volatility_index import RelativeVolatilityIndex
-from ._standard_deviation import StandardDeviation
-from ._stochastic_momentum_index import StochasticMomentumIndex
-from ._stochastic_oscillator import StochasticOscillator
-from ._swing_index import SwingIndex
-from ._time_series_forecast import TimeSeriesForecast
-from ._triple_exponential_moving_average import TripleExponentialMovingAverage
-from ._typical_price import TypicalPrice
-from ._ultimate_oscillator import UltimateOscillator
-from ._vertical_horizontal_filter import VerticalHorizontalFilter
-from ._volatility_chaikins import VolatilityChaikins
-from ._volume_oscillator import VolumeOscillator
-from ._volume_rate_of_change import VolumeRateOfChange
-from ._weighted_close import WeightedClose
-from ._wilders_smoothing import WildersSmoothing
-from ._williams_accumulation_distribution import WilliamsAccumulationDistribution
-from ._williams_r import WilliamsR
+import importlib
+
+# Module of each object of the package, imported on first access (see
+# __getattr__), so that using an indicator does not import all the others
+_MODULES = {
+    "AccumulationDistributionLine": "._accumulation_distribution_line",
+    "AverageTrueRange": "._average_true_range",
+    "BollingerBands": "._bollinger_bands",
+    "ChaikinMoneyFlow": "._chaikin_money_flow",
+    "ChaikinOscillator": "._chaikin_oscillator",
+    "ChandeMomentumOscillator": "._chande_momentum_oscillator",
+    "CommodityChannelIndex": "._commodity_channel_index",
+    "DetrendedPriceOscillator": "._detrended_price_oscillator",
+    "DirectionalMovementIndex": "._directional_movement_index",
+    "DoubleExponentialMovingAverage": "._double_exponential_moving_average",
+    "EaseOfMovement": "._ease_of_movement",
+    "Envelopes": "._envelopes",
+    "FibonacciRetracement": "._fibonacci_retracement",
+    "ForecastOscillator": "._forecast_oscillator",
+    "IchimokuCloud": "._ichimoku_cloud",
+    "IntradayMomentumIndex": "._intraday_momentum_index",
+    "KlingerOscillator": "._klinger_oscillator",
+    "LinearRegressionIndicator": "._linear_regression_indicator",
+    "LinearRegressionSlope": "._linear_regression_slope",
+    "MarketFacilitationIndex": "._market_facilitation_index",
+    "MassIndex": "._mass_index",
+    "MedianPrice": "._median_price",
+    "Momentum": "._momentum",
+    "MovingAverage": "._moving_average",
+    "MovingAverageConvergenceDivergence": "._moving_average_convergence_divergence",
+    "NegativeVolumeIndex": "._negative_volume_index",
+    "OnBalanceVolume": "._on_balance_volume",
+    "ParabolicSAR": "._parabolic_sar",
+    "Performance": "._performance",
+    "PositiveVolumeIndex": "._positive_volume_index",
+    "PriceAndVolumeTrend": "._price_and_volume_trend",
+    "PriceChannel": "._price_channel",
+    "PriceOscillator": "._price_oscillator",
+    "PriceRateOfChange": "._price_rate_of_change",
+    "ProjectionBands": "._projection_bands",
+    "ProjectionOscillator": "._projection_oscillator",
+    "Qstick": "._qstick",
+    "RangeIndicator": "._range_indicator",
+    "RelativeMomentumIndex": "._relative_momentum_index",
+    "RelativeStrengthIndex": "._relative_strength_index",
+    "RelativeVolatilityIndex": "._relative_volatility_index",
+    "StandardDeviation": "._standard_deviation",
+    "StochasticMomentumIndex": "._stochastic_momentum_index",
+    "StochasticOscillator": "._stochastic_oscillator",
+    "SwingIndex": "._swing_index",
+    "TimeSeriesForecast": "._time_series_forecast",
+    "TripleExponentialMovingAverage": "._triple_exponential_moving_average",
+    "TypicalPrice": "._typical_price",
+    "UltimateOscillator": "._ultimate_oscillator",
+    "VerticalHorizontalFilter": "._vertical_horizontal_filter",
+    "VolatilityChaikins": "._volatility_chaikins",
+    "VolumeOscillator": "._volume_oscillator",
+    "VolumeRateOfChange": "._volume_rate_of_change",
+    "WeightedClose": "._weighted_close",
+    "WildersSmoothing": "._wilders_smoothing",
+    "WilliamsAccumulationDistribution": "._williams_accumulation_distribution",
+    "WilliamsR": "._williams_r",
+    "batch": "._batch",
+    "executeSuite": "._executor",
+    "TaskResult": "._executor",
+}
 
 
 __all__ = [
@@ -123,3 +132,40 @@ __all__ = [
     "WilliamsAccumulationDistribution",
     "WilliamsR",
 ]
+
+
+def __getattr__(name):
+    """
+    Imports on first access the module of an indicator (or other object) of
+    the package, and returns it.
+
+    Args:
+        name (str): The name of the object.
+
+    Returns:
+        object: The object.
+
+    Raises:
+        AttributeError: The package has no object with this name.
+    """
+
+    if name not in _MODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(_MODULES[name], __name__), name)
+
+    # Cached, the next accesses do not call __getattr__
+    globals()[name] = value
+
+    return value
+
+
+def __dir__():
+    """
+    Returns the names of the package, including the not yet imported ones.
+
+    Returns:
+        list: The names.
+    """
+
+    return sorted(set(globals()) | set(_MODULES))
@@ -5,9 +5,10 @@ File name: _accumulation_distribution_line.py
     Implements the Accumulation Distribution Line technical indicator.
 """
 
-import pandas as pd
+import numpy as np
 
 from ._technical_indicator import TechnicalIndicator
+from .. import kernels
 from ..utils.constants import TRADE_SIGNALS
 
 
@@ -23,6 +24,10 @@ class AccumulationDistributionLine(TechnicalIndicator):
         fill_missing_values (bool, default=True): If set to True, missing
             values in the input data are being filled.
 
+        precision (int, default=4): If not None, the calculated indicator is
+            truncated to integers (as the volume) when no value is missing.
+            If None, it is not truncated.
+
     Attributes:
         _input_data (pandas.DataFrame): The ``input_data`` after preprocessing.
 
@@ -41,12 +46,13 @@ class AccumulationDistributionLine(TechnicalIndicator):
         ValueError: Value error occurred when validating the ``input_data``.
     """
 
-    def __init__(self, input_data, fill_missing_values=True):
+    def __init__(self, input_data, fill_missing_values=True, precision=4):
         # Control is passing to the parent class
         super().__init__(
             calling_instance=self.__class__.__name__,
             input_data=input_data,
             fill_missing_values=fill_missing_values,
+            precision=precision,
         )
 
     def _calculateTi(self):
@@ -58,19 +64,18 @@ class AccumulationDistributionLine(TechnicalIndicator):
             ``pandas.DatetimeIndex``. It contains one column, the ``adl``.
         """
 
-        adl = pd.DataFrame(index=self._input_data.index, columns=["adl"], data=0, dtype="int64")
-
-        adl["adl"] = (
-            self._input_data["volume"]
-            * (
-                (self._input_data["close"] - self._input_data["low"])
-                - (self._input_data["high"] - self._input_data["close"])
-            )
-            / (self._input_data["high"] - self._input_data["low"])
+        adl = self._kernelData(
+            ["adl"],
+            kernels.accumulationDistributionLine(
+                *self._inputArrays("high", "low", "close", "volume")
+            ),
+            rounded=False,
         )
 
-        adl = adl.cumsum(axis=0)
+        if self._precision is None:
+            return adl
 
+        # Integer values, truncated as the volume, when no value is missing
         return adl.astype(dtype="int64", errors="ignore")
 
     def getTiSignal(self):
@@ -102,3 +107,32 @@ class AccumulationDistributionLine(TechnicalIndicator):
             return TRADE_SIGNALS["sell"]
 
         return TRADE_SIGNALS["hold"]
+
+    def _calculateTiSignalSeries(self):
+        """
+        Calculates the trading signal for each row of the calculated technical
+        indicator, in a vectorized way.
+
+        Returns:
+            numpy.ndarray: The numeric value of the trading signal for each row.
+        """
+
+        # Trading signals Convergences/Divergences calculated in 2-days period
+        close = self._signalInput("close")
+        price_slope = close - self._shiftValues(close)
+
+        adl = self._ti_data["adl"].to_numpy(dtype=np.float64)
+
+        return self._selectSignals(
+            [
+                (
+                    ((price_slope < 0) & (adl > 0)) | ((price_slope > 0) & (adl > 0)),
+                    TRADE_SIGNALS["buy"],
+                ),
+                (
+                    ((price_slope > 0) & (adl < 0)) | ((price_slope < 0) & (adl < 0)),
+                    TRADE_SIGNALS["sell"],
+                ),
+            ],
+            minimum_rows=2,
+        )
@@ -5,11 +5,11 @@ File name: _average_true_range.py
     Implements the Average True Range technical indicator.
 """
 
-import pandas as pd
+import numpy as np
 
 from ._technical_indicator import TechnicalIndicator
+from .. import kernels
 from ..utils.constants import TRADE_SIGNALS
-from ..utils.exceptions import NotEnoughInputData
 
 
 class AverageTrueRange(TechnicalIndicator):
@@ -24,6 +24,9 @@ class AverageTrueRange(TechnicalIndicator):
         fill_missing_values (bool, default=True): If set to True, missing
             values in the input data are being filled.
 
+        precision (int, default=4): The number of decimals the calculated
+            indicator is rounded to. If None, it is not rounded.
+
     Attributes:
         _input_data (pandas.DataFrame): The ``input_data`` after preprocessing.
 
@@ -34,6 +37,10 @@ class AverageTrueRange(TechnicalIndicator):
 
         _calling_instance (str): The name of the class.
 
+        _state (dict): The state of the calculation after the last row (last
+            close and not rounded ``atr``), used for updating the indicator
+            with new input data.
+
     Raises:
         WrongTypeForInputParameter: Input argument has wrong type.
         WrongValueForInputParameter: Unsupported value for input argument.
@@ -42,12 +49,13 @@ class AverageTrueRange(TechnicalIndicator):
         ValueError: Value error occurred when validating the ``input_data``.
     """
 
-    def __init__(self, input_data, fill_missing_values=True):
+    def __init__(self, input_data, fill_missing_values=True, precision=4):
         # Control is passing to the parent class
         super().__init__(
             calling_instance=self.__class__.__name__,
             input_data=input_data,
             fill_missing_values=fill_missing_values,
+            precision=precision,
         )
 
     def _calculateTi(self):
@@ -63,31 +71,47 @@ class AverageTrueRange(TechnicalIndicator):
             NotEnoughInputData: Not enough data for calculating the indicator.
         """
 
-        # Not enough data for the requested period
-        if len(self._input_data.index) < 14:
-            raise NotEnoughInputData("Average True Range", 2, len(self._input_data.index))
+        # Last (not rounded) values, they are the state used for updating the
+        # indicator with new input data
+        self._state = {}
+
+        return self._kernelData(
+            ["atr"],
+            kernels.averageTrueRange(
+                *self._inputArrays("high", "low", "close"),
+                true_range=self._trueRange(),
+                state=self._state,
+            ),
+        )
 
-        atr = pd.DataFrame(index=self._input_data.index, columns=["atr"], data=0, dtype="float64")
+    def _updateTi(self, new_input_data):
+        """
+        Calculates the technical indicator after new rows have been appended
+        to the input data. Only the new rows are calculated, continuing the
+        Wilder's Moving Average from the last calculated value.
 
-        # Calculate Today's High - Today's Low
-        atr["TH-TL"] = self._input_data["high"] - self._input_data["low"]
+        Args:
+            new_input_data (pandas.DataFrame): The new rows of the input data,
+                after preprocessing.
 
-        # Calculate Today's High - Yesterday's Close
-        atr["YC-TH"] = self._input_data["high"] - self._input_data["close"].shift(1)
+        Returns:
+            pandas.DataFrame: The calculated indicator for the new rows. Index
+            is of type ``pandas.DatetimeIndex``. It contains one column,
+            the ``atr``.
+        """
 
-        # Calculate Yesterday's Close - Today's Low
-        atr["YC-TL"] = self._input_data["close"].shift(1) - self._input_data["low"]
+        # The state is copied, the stored one can be shared with the result
+        # cache
+        state = dict(self._state)
 
-        atr["atr"] = atr[["TH-TL", "YC-TH", "YC-TL"]].max(axis=1)
+        atr = kernels.averageTrueRange(
+            *self._inputArrays("high", "low", "close", rows=len(new_input_data.index)),
+            state=state,
+        )
 
-        # Wilder's Moving Average
-        # Seed Wilder's MA with the mean of the first 14 TR values, then
-        # continue with an exponential moving average using alpha=1/14.
-        atr_seed = pd.Series(data=[atr["atr"].iloc[:14].mean()], index=[atr.index[13]])
-        atr_series = pd.concat([atr_seed, atr["atr"].iloc[14:]])
-        atr["atr"] = atr_series.ewm(alpha=1 / 14, adjust=False).mean().round(4)
+        self._state = state
 
-        return atr[["atr"]]
+        return self._kernelData(["atr"], atr, index=new_input_data.index)
 
     def getTiSignal(self):
         """
@@ -123,3 +147,45 @@ class AverageTrueRange(TechnicalIndicator):
                 return TRADE_SIGNALS["buy"]
 
         return TRADE_SIGNALS["hold"]
+
+    def _calculateTiSignalSeries(self):
+        """
+        Calculates the trading signal for each row of the calculated technical
+        indicator, in a vectorized way.
+
+        Returns:
+            numpy.ndarray: The numeric value of the trading signal for each row.
+        """
+
+        rows = len(self._ti_data.index)
+
+        close = self._signalInput("close")
+
+        # Simple Moving Averages, calculated on the first input data column
+        sma_05 = (
+            self._input_data.iloc[:rows, 0]
+            .rolling(window=5, min_periods=5)
+            .mean()
+            .to_numpy(dtype=np.float64)
+        )
+        sma_10 = (
+            self._input_data.iloc[:rows, 0]
+            .rolling(window=10, min_periods=5)
+            .mean()
+            .to_numpy(dtype=np.float64)
+        )
+
+        # Assumption on what high volatility means
+        high_volatility = self._ti_data["atr"].to_numpy(dtype=np.float64) > 0.01 * close
+
+        return self._selectSignals(
+            [
+                # Assuming long term upward rally
+                (high_volatility & (close > sma_05) & (close > sma_10), TRADE_SIGNALS["buy"]),
+                # Price falling is expected or secondary rally
+                (high_volatility & (close > sma_05), TRADE_SIGNALS["sell"]),
+                # Price raise is expected
+                (high_volatility & (close < sma_05), TRADE_SIGNALS["buy"]),
+            ],
+            minimum_rows=10,
+        )
@@ -0,0 +1,194 @@
+"""
+Trading-Technical-Indicators (tti) python library
+
+File name: _batch.py
+    Implements the calculation of a technical indicator for a panel of
+    symbols.
+"""
+
+import inspect
+import pandas as pd
+import pandas.api.types as pdtypes
+
+from ._technical_indicator import TechnicalIndicator
+from .properties.indicators_properties import INDICATORS_PROPERTIES
+from ..utils.data_preprocessing import fillMissingValues
+from ..utils.exceptions import WrongTypeForInputParameter
+
+
+def _splitPanel(panel, symbol_column):
+    """
+    Splits a panel to the input data of each symbol.
+
+    Args:
+        panel (pandas.DataFrame): The input data of all the symbols, in long
+            format or with MultiIndex columns.
+
+        symbol_column (str): The column which holds the symbol of each row,
+            when the panel is in long format.
+
+    Returns:
+        dict: Keys are the symbols and values the input data (pandas.DataFrame)
+        of each symbol, in the order the symbols appear in the panel.
+
+    Raises:
+        ValueError: The symbol column does not exist in the panel.
+    """
+
+    if isinstance(panel.columns, pd.MultiIndex):
+        return {symbol: panel[symbol] for symbol in panel.columns.get_level_values(0).unique()}
+
+    if symbol_column not in panel.columns:
+        raise ValueError(
+            "The panel should have MultiIndex columns (symbol, column) or "
+            + "contain the `"
+            + symbol_column
+            + "` column."
+        )
+
+    return {
+        symbol: data.drop(columns=symbol_column)
+        for symbol, data in panel.groupby(symbol_column, sort=False)
+    }
+
+
+def _buildPanelData(symbols_data, index, required_columns, fill_missing_values):
+    """
+    Builds the input data of a panel calculation, one pandas.DataFrame with a
+    column for each symbol, for each of the required input data columns.
+
+    Args:
+        symbols_data (dict): Keys are the symbols and values the input data
+            (pandas.DataFrame) of each symbol.
+
+        index (pandas.DatetimeIndex): The index the symbols should share.
+
+        required_columns ([str,]): The required input data columns of the
+            indicator.
+
+        fill_missing_values (bool): If True, missing values are filled for
+            each symbol, as described in the data_preprocessing.py module.
+
+    Returns:
+        dict or None: Keys are the required input data columns and values are
+        the pandas.DataFrame objects. None when the symbols do not share the
+        same index, or their input data are not valid, so each symbol should
+        be calculated separately.
+    """
+
+    panel_data = {}
+
+    for column in required_columns:
+        data = {}
+
+        for symbol, symbol_data in symbols_data.items():
+            # Make columns case insensitive
+            symbol_columns = {c.lower(): c for c in symbol_data.columns}
+
+            if (
+                column not in symbol_columns
+                or not symbol_data.index.equals(index)
+                or not pdtypes.is_numeric_dtype(symbol_data[symbol_columns[column]])
+            ):
+                return None
+
+            data[symbol] = symbol_data[symbol_columns[column]]
+
+        panel_data[column] = pd.concat(data, axis=1).sort_index(ascending=True)
+
+        if fill_missing_values:
+            panel_data[column] = fillMissingValues(panel_data[column])
+
+    return panel_data
+
+
+def batch(indicator, panel, symbol_column="symbol", **kwargs):
+    """
+    Calculates a technical indicator for a panel of symbols. Indicators whose
+    calculation consists of column-wise operations (for example
+    ``MovingAverage``, ``BollingerBands`` and
+    ``MovingAverageConvergenceDivergence``) are calculated for all the
+    symbols at once, when the symbols share the same index. The rest are
+    calculated separately for each symbol.
+
+    Args:
+        indicator (type): The technical indicator class, for example
+            ``tti.indicators.MovingAverage``.
+
+        panel (pandas.DataFrame): The input data of all the symbols. The index
+            is of type ``pandas.DatetimeIndex``. It is either in long format,
+            with the symbol of each row in the ``symbol_column`` column, or it
+            has MultiIndex columns, with the symbol in the first level and the
+            input data column in the second level.
+
+        symbol_column (str, default='symbol'): The column which holds the
+            symbol of each row, when the panel is in long format.
+
+        **kwargs: The input arguments of the technical indicator, for example
+            ``period`` or ``fill_missing_values``.
+
+    Returns:
+        pandas.DataFrame: The calculated indicator for all the symbols. Index
+        is of type ``pandas.DatetimeIndex``. It has MultiIndex columns, with
+        the symbol in the first level and the indicator column in the second
+        level.
+
+    Raises:
+        WrongTypeForInputParameter: Input argument has wrong type.
+        WrongValueForInputParameter: Unsupported value for input argument.
+        NotEnoughInputData: Not enough data for calculating the indicator.
+        TypeError: Type error occurred when validating the ``panel``.
+        ValueError: Value error occurred when validating the ``panel``.
+    """
+
+    if not inspect.isclass(indicator) or not issubclass(indicator, TechnicalIndicator):
+        raise WrongTypeForInputParameter(type(indicator), "indicator", "TechnicalIndicator class")
+
+    if not isinstance(panel, pd.DataFrame):
+        raise WrongTypeForInputParameter(type(panel), "panel", "pd.DataFrame")
+
+    if panel.empty:
+        raise ValueError("The panel cannot be an empty pandas.DataFrame.")
+
+    symbols_data = _splitPanel(panel, symbol_column)
+
+    symbols = list(symbols_data.keys())
+
+    # The first symbol is calculated through the indicator's constructor, so
+    # the input arguments are validated as for a single symbol. The rest of
+    # the symbols are calculated at once, when possible
+    ti = indicator(symbols_data[symbols[0]], **kwargs)
+
+    ti_data = None
+
+    if len(symbols) > 1:
+        panel_data = _buildPanelData(
+            {symbol: symbols_data[symbol] for symbol in symbols[1:]},
+            symbols_data[symbols[0]].index,
+            INDICATORS_PROPERTIES[indicator.__name__]["required_input_data"],
+            kwargs.get("fill_missing_values", True),
+        )
+
+        if panel_data is not None:
+            ti_data = ti._calculateTiPanel(panel_data=panel_data)
+
+    if ti_data is None:
+        ti_data = {symbols[0]: ti.getTiData()}
+
+        for symbol in symbols[1:]:
+            ti_data[symbol] = indicator(symbols_data[symbol], **kwargs).getTiData()
+
+        return pd.concat(ti_data, axis=1)
+
+    # The first symbol data, already calculated
+    for column, column_data in ti.getTiData().items():
+        ti_data[column][symbols[0]] = column_data
+
+    # Reorder the calculated columns to (symbol, indicator column)
+    ti_columns = list(ti_data.keys())
+
+    return (
+        pd.concat(ti_data, axis=1)
+        .swaplevel(axis=1)
+        .reindex(columns=pd.MultiIndex.from_product([symbols, ti_columns]))
+    )
@@ -5,12 +5,12 @@ File name: _bollinger_bands.py
     Implements the Bollinger Bands technical indicator.
 """
 
-import pandas as pd
+import numpy as np
 
 from ._technical_indicator import TechnicalIndicator
+from .. import kernels
 from ..utils.constants import TRADE_SIGNALS
 from ..utils.exceptions import (
-    NotEnoughInputData,
     WrongTypeForInputParameter,
     WrongValueForInputParameter,
 )
@@ -33,6 +33,9 @@ class BollingerBands(TechnicalIndicator):
         fill_missing_values (bool, default=True): If set to True, missing
             values in the input data are being filled.
 
+        precision (int, default=4): The number of decimals the calculated
+            indicator is rounded to. If None, it is not rounded.
+
     Attributes:
         _input_data (pandas.DataFrame): The ``input_data`` after preprocessing.
 
@@ -52,7 +55,7 @@ class BollingerBands(TechnicalIndicator):
         ValueError: Value error occurred when validating the ``input_data``.
     """
 
-    def __init__(self, input_data, period=20, std_number=2, fill_missing_values=True):
+    def __init__(self, input_data, period=20, std_number=2, fill_missing_values=True, precision=4):
         # Validate and store if needed, the input parameters
         if isinstance(period, int):
             if period > 0:
@@ -75,6 +78,7 @@ class BollingerBands(TechnicalIndicator):
             calling_instance=self.__class__.__name__,
             input_data=input_data,
             fill_missing_values=fill_missing_values,
+            precision=precision,
         )
 
     def _calculateTi(self):
@@ -91,30 +95,43 @@ class BollingerBands(TechnicalIndicator):
             NotEnoughInputData: Not enough data for calculating the indicator.
         """
 
-        # Not enough data for the requested period
-        if len(self._input_data.index) < self._period:
-            raise NotEnoughInputData("Bollinger Bands", self._period, len(self._input_data.index))
+        return self._kernelData(
+            ["middle_band", "upper_band", "lower_band"],
+            kernels.bollingerBands(
+                *self._inputArrays("close"),
+                self._period,
+                self._std_number,
+                decimals=self._precision,
+            ),
+        )
 
-        # Calculate the Middle Band using Simple Moving Average
-        bb = self._input_data.rolling(window=self._period, min_periods=self._period).mean().round(4)
+    def _calculateTiPanel(self, panel_data):
+        """
+        Calculates the technical indicator for a panel of symbols at once.
 
-        # Calculate Upper and Lower Bands
-        standard_deviation = self._input_data.rolling(
-            window=self._period, min_periods=self._period
-        ).std(ddof=0)
+        Args:
+            panel_data (dict): The input data of all the symbols. Keys are the
+                required input data columns and values are pandas.DataFrame
+                objects with one column for each symbol.
 
-        bb = pd.concat(
-            [
-                bb,
-                round(bb + standard_deviation * self._std_number, 4),
-                round(bb - standard_deviation * self._std_number, 4),
-            ],
-            axis=1,
-        )
+        Returns:
+            dict: Keys are the indicator columns (``middle_band``,
+            ``upper_band`` and ``lower_band``) and values are pandas.DataFrame
+            objects with one column for each symbol.
+        """
 
-        bb.columns = ["middle_band", "upper_band", "lower_band"]
+        close = panel_data["close"]
 
-        return bb
+        bands = kernels.bollingerBands(
+            close.to_numpy(dtype=self._float_dtype),
+            self._period,
+            self._std_number,
+            decimals=self._precision,
+        )
+
+        return self._panelData(
+            ["middle_band", "upper_band", "lower_band"], bands, close.index, close.columns
+        )
 
     def getTiSignal(self):
         """
@@ -140,3 +157,29 @@ class BollingerBands(TechnicalIndicator):
 
         else:
             return TRADE_SIGNALS["hold"]
+
+    def _calculateTiSignalSeries(self):
+        """
+        Calculates the trading signal for each row of the calculated technical
+        indicator, in a vectorized way.
+
+        Returns:
+            numpy.ndarray: The numeric value of the trading signal for each row.
+        """
+
+        close = self._signalInput("close")
+
+        return self._selectSignals(
+            [
+                # Price goes above upper band
+                (
+                    close > self._ti_data["upper_band"].to_numpy(dtype=np.float64),
+                    TRADE_SIGNALS["sell"],
+                ),
+                # Price goes below lower band
+                (
+                    close < self._ti_data["lower_band"].to_numpy(dtype=np.float64),
+                    TRADE_SIGNALS["buy"],
+                ),
+            ],
+        )
@@ -5,12 +5,12 @@ File name: _chaikin_money_flow.py
     Implements the Chaikin Money Flow technical indicator.
 """
 
-import pandas as pd
+import numpy as np
 
 from ._technical_indicator import TechnicalIndicator
+from .. import kernels
 from ..utils.constants import TRADE_SIGNALS
 from ..utils.exceptions import (
-    NotEnoughInputData,
     WrongTypeForInputParameter,
     WrongValueForInputParameter,
 )
@@ -31,6 +31,9 @@ class ChaikinMoneyFlow(TechnicalIndicator):
         fill_missing_values (bool, default=True): If set to True, missing
             values in the input data are being filled.
 
+        precision (int, default=4): The number of decimals the calculated
+            indicator is rounded to. If None, it is not rounded.
+
     Attributes:
         _input_data (pandas.DataFrame): The ``input_data`` after preprocessing.
 
@@ -49,7 +52,7 @@ class ChaikinMoneyFlow(TechnicalIndicator):
         ValueError: Value error occurred when validating the ``input_data``.
     """
 
-    def __init__(self, input_data, period=5, fill_missing_values=True):
+    def __init__(self, input_data, period=5, fill_missing_values=True, precision=4):
         # Validate and store if needed, the input parameters
         if isinstance(period, int):
             if period > 0:
@@ -64,6 +67,7 @@ class ChaikinMoneyFlow(TechnicalIndicator):
             calling_instance=self.__class__.__name__,
             input_data=input_data,
             fill_missing_values=fill_missing_values,
+            precision=precision,
         )
 
     def _calculateTi(self):
@@ -79,35 +83,13 @@ class ChaikinMoneyFlow(TechnicalIndicator):
             NotEnoughInputData: Not enough data for calculating the indicator.
         """
 
-        # Not enough data for the requested period
-        if len(self._input_data.index) < self._period:
-            raise NotEnoughInputData(
-                "Chaikin Money Flow", self._period, len(self._input_data.index)
-            )
-
-        cmf = pd.DataFrame(index=self._input_data.index, columns=["cmf"], data=0, dtype="float64")
-
-        cmf["numerator"] = (
-            self._input_data["volume"]
-            * (
-                (self._input_data["close"] - self._input_data["low"])
-                - (self._input_data["high"] - self._input_data["close"])
-            )
-            / (self._input_data["high"] - self._input_data["low"])
-        )
-
-        cmf["numerator"] = (
-            cmf["numerator"].rolling(window=self._period, min_periods=self._period).sum()
+        return self._kernelData(
+            ["cmf"],
+            kernels.chaikinMoneyFlow(
+                *self._inputArrays("high", "low", "close", "volume"), self._period
+            ),
         )
 
-        cmf["denominator"] = (
-            self._input_data["volume"].rolling(window=self._period, min_periods=self._period).sum()
-        )
-
-        cmf["cmf"] = (cmf["numerator"] / cmf["denominator"]).round(4)
-
-        return cmf[["cmf"]]
-
     def getTiSignal(self):
         """
         Calculates and returns the trading signal for the calculated technical
@@ -140,3 +122,35 @@ class ChaikinMoneyFlow(TechnicalIndicator):
 
         else:
             return TRADE_SIGNALS["hold"]
+
+    def _calculateTiSignalSeries(self):
+        """
+        Calculates the trading signal for each row of the calculated technical
+        indicator, in a vectorized way.
+
+        Returns:
+            numpy.ndarray: The numeric value of the trading signal for each row.
+        """
+
+        close = self._signalInput("close")
+        close_prev = self._shiftValues(close, periods=1)
+        close_prev_2 = self._shiftValues(close, periods=2)
+
+        # Highest and lowest close of the two previous periods
+        previous_max = np.where(close_prev > close_prev_2, close_prev, close_prev_2)
+        previous_min = np.where(close_prev < close_prev_2, close_prev, close_prev_2)
+
+        cmf = self._ti_data["cmf"].to_numpy(dtype=np.float64)
+        cmf_prev = self._shiftValues(cmf)
+
+        return self._selectSignals(
+            [
+                # A sell signal occurs when price reaches a higher high into
+                # overbought with the CMF starting to fall.
+                ((cmf_prev > cmf) & (previous_max < close), TRADE_SIGNALS["sell"]),
+                # A buy signal occurs when price reaches a lower low into
+                # overbought with the CMF starting to rise.
+                ((cmf_prev < cmf) & (previous_min > close), TRADE_SIGNALS["buy"]),
+            ],
+            minimum_rows=3,
+        )
@@ -5,12 +5,13 @@ File name: _chaikin_oscillator.py
     Implements the Chaikin Oscillator technical indicator.
 """
 
-import pandas as pd
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
 
 from ._technical_indicator import TechnicalIndicator
+from .. import kernels
 from ._accumulation_distribution_line import AccumulationDistributionLine
 from ..utils.constants import TRADE_SIGNALS
-from ..utils.exceptions import NotEnoughInputData
 
 
 class ChaikinOscillator(TechnicalIndicator):
@@ -25,6 +26,9 @@ class ChaikinOscillator(TechnicalIndicator):
         fill_missing_values (bool, default=True): If set to True, missing
             values in the input data are being filled.
 
+        precision (int, default=4): The number of decimals the calculated
+            indicator is rounded to. If None, it is not rounded.
+
     Attributes:
         _input_data (pandas.DataFrame): The ``input_data`` after preprocessing.
 
@@ -43,12 +47,13 @@ class ChaikinOscillator(TechnicalIndicator):
         ValueError: Value error occurred when validating the ``input_data``.
     """
 
-    def __init__(self, input_data, fill_missing_values=True):
+    def __init__(self, input_data, fill_missing_values=True, precision=4):
         # Control is passing to the parent class
         super().__init__(
             calling_instance=self.__class__.__name__,
             input_data=input_data,
             fill_missing_values=fill_missing_values,
+            precision=precision,
         )
 
     def _calculateTi(self):
@@ -64,21 +69,16 @@ class ChaikinOscillator(TechnicalIndicator):
             NotEnoughInputData: Not enough data for calculating the indicator.
         """
 
-        # Not enough data for the requested period
-        if len(self._input_data.index) < 10:
-            raise NotEnoughInputData("Chaikin Oscillator", 10, len(self._input_data.index))
-
-        co = pd.DataFrame(index=self._input_data.index, columns=["co"], data=0, dtype="float64")
-
-        adl = AccumulationDistributionLine(self._input_data).getTiData()
-
-        co["co"] = (
-            adl.ewm(span=3, min_periods=3, adjust=False).mean()
-            - adl.ewm(span=10, min_periods=10, adjust=False).mean()
+        return self._kernelData(
+            ["co"],
+            kernels.chaikinOscillator(
+                *self._inputArrays("high", "low", "close", "volume"),
+                adl=self._indicatorData(AccumulationDistributionLine)["adl"].to_numpy(
+                    dtype=np.float64
+                ),
+            ),
         )
 
-        return co.round(4)
-
     def getTiSignal(self):
         """
         Calculates and returns the trading signal for the calculated technical
@@ -114,3 +114,34 @@ class ChaikinOscillator(TechnicalIndicator):
 
         else:
             return TRADE_SIGNALS["hold"]
+
+    def _calculateTiSignalSeries(self):
+        """
+        Calculates the trading signal for each row of the calculated technical
+        indicator, in a vectorized way.
+
+        Returns:
+            numpy.ndarray: The numeric value of the trading signal for each row.
+        """
+
+        close = self._signalInput("close")
+
+        # 90-periods moving average
+        ma_90 = np.full(len(close), np.nan)
+        if len(close) >= 90:
+            ma_90[89:] = np.nanmean(sliding_window_view(close, 90), axis=1)
+
+        co = self._ti_data["co"].to_numpy(dtype=np.float64)
+        co_prev = self._shiftValues(co)
+
+        return self._selectSignals(
+            [
+                # Buy signal when price above 90-MA and indicator upturns in the
+                # negative area
+                ((close > ma_90) & (co_prev < co) & (co < 0.0), TRADE_SIGNALS["buy"]),
+                # Sell signal when price below 90-MA and indicator downturns in
+                # the positive area
+                ((close < ma_90) & (co_prev > co) & (co > 0.0), TRADE_SIGNALS["sell"]),
+            ],
+            minimum_rows=90,
+        )
@@ -5,12 +5,12 @@ File name: _chande_momentum_oscillator.py
     Implements the Chande Momentum Oscillator technical indicator.
 """
 
-import pandas as pd
+import numpy as np
 
 from ._technical_indicator import TechnicalIndicator
+from .. import kernels
 from ..utils.constants import TRADE_SIGNALS
 from ..utils.exceptions import (
-    NotEnoughInputData,
     WrongTypeForInputParameter,
     WrongValueForInputParameter,
 )
@@ -30,6 +30,9 @@ class ChandeMomentumOscillator(TechnicalIndicator):
         fill_missing_values (bool, default=True): If set to True, missing
             values in the input data are being filled.
 
+        precision (int, default=4): The number of decimals the calculated
+            indicator is rounded to. If None, it is not rounded.
+
     Attributes:
         _input_data (pandas.DataFrame): The ``input_data`` after preprocessing.
 
@@ -48,7 +51,7 @@ class ChandeMomentumOscillator(TechnicalIndicator):
         ValueError: Value error occurred when validating the ``input_data``.
     """
 
-    def __init__(self, input_data, period=5, fill_missing_values=True):
+    def __init__(self, input_data, period=5, fill_missing_values=True, precision=4):
         # Validate and store if needed, the input parameters
         if isinstance(period, int):
             if period > 0:
@@ -63,6 +66,7 @@ class ChandeMomentumOscillator(TechnicalIndicator):
             calling_instance=self.__class__.__name__,
             input_data=input_data,
             fill_missing_values=fill_missing_values,
+            precision=precision,
         )
 
     def _calculateTi(self):
@@ -78,38 +82,10 @@ class ChandeMomentumOscillator(TechnicalIndicator):
             NotEnoughInputData: Not enough data for calculating the indicator.
         """
 
-        # Not enough data for the requested period
-        if len(self._input_data.index) < self._period:
-            raise NotEnoughInputData(
-                "Chande Momentum Oscillator", self._period, len(self._input_data.index)
-            )
-
-        cmo = pd.DataFrame(index=self._input_data.index, columns=["cmo"], data=0, dtype="float64")
-
-        # Up movement changes
-        up_move_changes = self._input_data.diff(periods=1)
-        up_move_changes[up_move_changes < 0.0] = 0.0
-
-        # Calculate the periods sum for the up movement changes
-        up_move_changes = up_move_changes.rolling(
-            window=self._period, min_periods=self._period
-        ).sum()
-
-        # Down movement changes
-        down_move_changes = self._input_data.diff(periods=1)
-        down_move_changes[down_move_changes > 0.0] = 0.0
-
-        # Calculate the absolute periods sum for the down movement changes
-        down_move_changes = (
-            down_move_changes.rolling(window=self._period, min_periods=self._period).sum().abs()
-        )
-
-        cmo["cmo"] = (
-            100 * (up_move_changes - down_move_changes) / (up_move_changes + down_move_changes)
+        return self._kernelData(
+            ["cmo"], kernels.chandeMomentumOscillator(*self._inputArrays("close"), self._period)
         )
 
-        return cmo.round(4)
-
     def getTiSignal(self):
         """
         Calculates and returns the trading signal for the calculated technical
@@ -133,3 +109,25 @@ class ChandeMomentumOscillator(TechnicalIndicator):
             return TRADE_SIGNALS["buy"]
 
         return TRADE_SIGNALS["hold"]
+
+    def _calculateTiSignalSeries(self):
+        """
+        Calculates the trading signal for each row of the calculated technical
+        indicator, in a vectorized way.
+
+        Returns:
+            numpy.ndarray: The numeric value of the trading signal for each row.
+        """
+
+        cmo = self._ti_data["cmo"].to_numpy(dtype=np.float64)
+        cmo_prev = self._shiftValues(cmo)
+
+        return self._selectSignals(
+            [
+                # Overbought region
+                ((cmo_prev < 50.0) & (cmo > 50.0), TRADE_SIGNALS["sell"]),
+                # Oversold region
+                ((cmo_prev > -50.0) & (cmo < -50.0), TRADE_SIGNALS["buy"]),
+            ],
+            minimum_rows=2,
+        )
@@ -5,12 +5,12 @@ File name: _commodity_channel_index.py
     Implements the Commodity Channel Index technical indicator.
 """
 
-import pandas as pd
+import numpy as np
 
 from ._technical_indicator import TechnicalIndicator
+from .. import kernels
 from ..utils.constants import TRADE_SIGNALS
 from ..utils.exceptions import (
-    NotEnoughInputData,
     WrongTypeForInputParameter,
     WrongValueForInputParameter,
 )
@@ -31,6 +31,9 @@ class CommodityChannelIndex(TechnicalIndicator):
         fill_missing_values (bool, default=True): If set to True, missing
             values in the input data are being filled.
 
+        precision (int, default=4): The number of decimals the calculated
+            indicator is rounded to. If None, it is not rounded.
+
     Attributes:
         _input_data (pandas.DataFrame): The ``input_data`` after preprocessing.
 
@@ -49,7 +52,7 @@ class CommodityChannelIndex(TechnicalIndicator):
         ValueError: Value error occurred when validating the ``input_data``.
     """
 
-    def __init__(self, input_data, period=5, fill_missing_values=True):
+    def __init__(self, input_data, period=5, fill_missing_values=True, precision=4):
         # Validate and store if needed, the input parameters
         if isinstance(period, int):
             if period > 0:
@@ -64,6 +67,7 @@ class CommodityChannelIndex(TechnicalIndicator):
             calling_instance=self.__class__.__name__,
             input_data=input_data,
             fill_missing_values=fill_missing_values,
+            precision=precision,
         )
 
     def _calculateTi(self):
@@ -79,34 +83,15 @@ class CommodityChannelIndex(TechnicalIndicator):
             NotEnoughInputData: Not enough data for calculating the indicator.
         """
 
-        # Not enough data for the requested period
-        if len(self._input_data.index) < self._period:
-            raise NotEnoughInputData(
-                "Commodity Channel Index", self._period, len(self._input_data.index)
-            )
-
-        cci = pd.DataFrame(index=self._input_data.index, columns=["cci"], data=0, dtype="float64")
-
-        # Average of high, low and close
-        typical_price = self._input_data.sum(axis=1) / 3.0
-
-        # Simple moving average of the typical price
-        tp_sma = typical_price.rolling(window=self._period, min_periods=self._period).mean()
-
-        # Sum of absolute differences of the typical price sma from preceding
-        # periods typical prices
-        differences = pd.concat([tp_sma, typical_price], axis=1).pipe(
-            self._rolling_pipe,
-            self._period,
-            lambda x: sum(
-                (abs(x[0].values[self._period - 1] - x[1].values[i]) for i in range(self._period))
+        return self._kernelData(
+            ["cci"],
+            kernels.commodityChannelIndex(
+                *self._inputArrays("high", "low", "close"),
+                self._period,
+                typical_price=self._typicalPrice(),
             ),
         )
 
-        cci["cci"] = (typical_price - tp_sma) / (0.015 * differences / self._period)
-
-        return cci.round(4)
-
     def getTiSignal(self):
         """
         Calculates and returns the trading signal for the calculated technical
@@ -131,3 +116,23 @@ class CommodityChannelIndex(TechnicalIndicator):
 
         else:
             return TRADE_SIGNALS["hold"]
+
+    def _calculateTiSignalSeries(self):
+        """
+        Calculates the trading signal for each row of the calculated technical
+        indicator, in a vectorized way.
+
+        Returns:
+            numpy.ndarray: The numeric value of the trading signal for each row.
+        """
+
+        cci = self._ti_data["cci"].to_numpy(dtype=np.float64)
+
+        return self._selectSignals(
+            [
+                # Oversold area
+                (cci < -100, TRADE_SIGNALS["buy"]),
+                # Overbought area
+                (cci > 100, TRADE_SIGNALS["sell"]),
+            ],
+        )
@@ -5,12 +5,12 @@ File name: _detrended_price_oscillator.py
     Implements the Detrended Price Oscillator technical indicator.
 """
 
-import pandas as pd
+import numpy as np
 
 from ._technical_indicator import TechnicalIndicator
+from .. import kernels
 from ..utils.constants import TRADE_SIGNALS
 from ..utils.exceptions import (
-    NotEnoughInputData,
     WrongTypeForInputParameter,
     WrongValueForInputParameter,
 )
@@ -30,6 +30,9 @@ class DetrendedPriceOscillator(TechnicalIndicator):
         fill_missing_values (bool, default=True): If set to True, missing
             values in the input data are being filled.
 
+        precision (int, default=4): The number of decimals the calculated
+            indicator is rounded to. If None, it is not rounded.
+
     Attributes:
         _input_data (pandas.DataFrame): The ``input_data`` after preprocessing.
 
@@ -48,7 +51,7 @@ class DetrendedPriceOscillator(TechnicalIndicator):
         ValueError: Value error occurred when validating the ``input_data``.
     """
 
-    def __init__(self, input_data, period=6, fill_missing_values=True):
+    def __init__(self, input_data, period=6, fill_missing_values=True, precision=4):
         # Validate and store if needed, the input parameters
         if isinstance(period, int):
             if period > 0:
@@ -63,6 +66,7 @@ class DetrendedPriceOscillator(TechnicalIndicator):
             calling_instance=self.__class__.__name__,
             input_data=input_data,
             fill_missing_values=fill_missing_values,
+            precision=precision,
         )
 
     def _calculateTi(self):
@@ -78,23 +82,11 @@ class DetrendedPriceOscillator(TechnicalIndicator):
             NotEnoughInputData: Not enough data for calculating the indicator.
         """
 
-        # Not enough data for the requested period
-        if len(self._input_data.index) < self._period:
-            raise NotEnoughInputData(
-                "Detrended Price Oscillator", self._period, len(self._input_data.index)
-            )
-
-        dpo = pd.DataFrame(index=self._input_data.index, columns=["dpo"], data=0, dtype="float64")
-
-        # Simple moving average of the close prices
-        close_sma = (
-            self._input_data["close"].rolling(window=self._period, min_periods=self._period).mean()
+        # It is not calculated for the last int(period / 2) + 1 rows
+        return self._kernelData(
+            ["dpo"], kernels.detrendedPriceOscillator(*self._inputArrays("close"), self._period)
         )
 
-        dpo["dpo"] = self._input_data["close"] - close_sma.shift(-1 - int(self._period / 2))
-
-        return dpo.iloc[: -1 - int(self._period / 2)].round(4)
-
     def getTiSignal(self):
         """
         Calculates and returns the trading signal for the calculated technical
@@ -118,3 +110,24 @@ class DetrendedPriceOscillator(TechnicalIndicator):
 
         else:
             return TRADE_SIGNALS["hold"]
+
+    def _calculateTiSignalSeries(self):
+        """
+        Calculates the trading signal for each row of the calculated technical
+        indicator, in a vectorized way.
+
+        Returns:
+            numpy.ndarray: The numeric value of the trading signal for each row.
+        """
+
+        dpo = self._ti_data["dpo"].to_numpy(dtype=np.float64)
+        dpo_prev = self._shiftValues(dpo)
+
+        return self._selectSignals(
+            [
+                # Signal based on crossovers with zero line
+                ((dpo_prev < 0.0) & (dpo > 0.0), TRADE_SIGNALS["buy"]),
+                ((dpo_prev > 0.0) & (dpo < 0.0), TRADE_SIGNALS["sell"]),
+            ],
+            minimum_rows=2,
+        )
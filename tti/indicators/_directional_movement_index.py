@@ -5,12 +5,12 @@ File name: _directional_movement_index.py
     Implements the Directional Movement Index technical indicator.
 """
 
-import pandas as pd
 import numpy as np
 
 from ._technical_indicator import TechnicalIndicator
+from .. import kernels
 from ..utils.constants import TRADE_SIGNALS
-from ..utils.exceptions import NotEnoughInputData
+from ..utils.exceptions import WrongTypeForInputParameter, WrongValueForInputParameter
 
 
 class DirectionalMovementIndex(TechnicalIndicator):
@@ -22,9 +22,19 @@ class DirectionalMovementIndex(TechnicalIndicator):
             are ``high``, ``low``, ``close``. The index is of type
             ``pandas.DatetimeIndex``.
 
+        period (int, default=14): The past periods to be used for smoothing
+            the True Range and the Directional Movement.
+
+        adx_period (int, default=14): The past periods to be used for
+            smoothing the ``dx`` into the ``adx``. The ``adxr`` averages the
+            ``adx`` with its value ``adx_period - 1`` periods ago.
+
         fill_missing_values (bool, default=True): If set to True, missing
             values in the input data are being filled.
 
+        precision (int, default=4): The number of decimals the calculated
+            indicator is rounded to. If None, it is not rounded.
+
     Attributes:
         _input_data (pandas.DataFrame): The ``input_data`` after preprocessing.
 
@@ -36,6 +46,10 @@ class DirectionalMovementIndex(TechnicalIndicator):
 
         _calling_instance (str): The name of the class.
 
+        _state (dict): The state of the calculation after the last row (last
+            prices, not multiplied smoothed values and the last ``adx``
+            values), used for updating the indicator with new input data.
+
     Raises:
         WrongTypeForInputParameter: Input argument has wrong type.
         WrongValueForInputParameter: Unsupported value for input argument.
@@ -44,12 +58,30 @@ class DirectionalMovementIndex(TechnicalIndicator):
         ValueError: Value error occurred when validating the ``input_data``.
     """
 
-    def __init__(self, input_data, fill_missing_values=True):
+    def __init__(self, input_data, period=14, adx_period=14, fill_missing_values=True, precision=4):
+        # Validate and store if needed, the input parameters
+        if isinstance(period, int):
+            if period > 0:
+                self._period = period
+            else:
+                raise WrongValueForInputParameter(period, "period", ">0")
+        else:
+            raise WrongTypeForInputParameter(type(period), "period", "int")
+
+        if isinstance(adx_period, int):
+            if adx_period > 0:
+                self._adx_period = adx_period
+            else:
+                raise WrongValueForInputParameter(adx_period, "adx_period", ">0")
+        else:
+            raise WrongTypeForInputParameter(type(adx_period), "adx_period", "int")
+
         # Control is passing to the parent class
         super().__init__(
             calling_instance=self.__class__.__name__,
             input_data=input_data,
             fill_missing_values=fill_missing_values,
+            precision=precision,
         )
 
     def _calculateTi(self):
@@ -66,121 +98,53 @@ class DirectionalMovementIndex(TechnicalIndicator):
             NotEnoughInputData: Not enough data for calculating the indicator.
         """
 
-        # Not enough data for the requested period
-        if len(self._input_data.index) < 28:
-            raise NotEnoughInputData("Directional Movement Index", 28, len(self._input_data.index))
-
-        dmi = pd.DataFrame(
-            index=self._input_data.index,
-            columns=[
-                "true_range",
-                "+dm1",
-                "-dm1",
-                "tr14",
-                "+dm14",
-                "-dm14",
-                "+di14",
-                "-di14",
-                "di_diff",
-                "di_sum",
-                "dx",
-                "adx",
-                "adxr",
-            ],
-            dtype="float64",
-            data=None,
+        # Last prices and smoothed values, they are the state used for
+        # updating the indicator with new input data
+        self._state = {}
+
+        return self._kernelData(
+            ["+di", "-di", "dx", "adx", "adxr"],
+            kernels.directionalMovementIndex(
+                *self._inputArrays("high", "low", "close"),
+                self._period,
+                self._adx_period,
+                true_range=self._trueRange(),
+                state=self._state,
+            ),
         )
 
-        # Calculate the True Range
-        candidates = [
-            self._input_data["high"].values[1:] - self._input_data["low"].values[1:],
-            self._input_data["high"].values[1:] - self._input_data["close"].values[:-1],
-            self._input_data["close"].values[:-1] - self._input_data["low"].values[1:],
-        ]
-
-        dmi["true_range"].values[1:] = np.max(np.column_stack(candidates), axis=1)
-
-        # Calculate Directional Movement for one period
-        for i in range(1, len(self._input_data.index)):
-            dmi["+dm1"].values[i] = (
-                self._input_data["high"].values[i] - self._input_data["high"].values[i - 1]
-                if (
-                    (
-                        self._input_data["high"].values[i] - self._input_data["high"].values[i - 1]
-                        > self._input_data["low"].values[i - 1] - self._input_data["low"].values[i]
-                    )
-                    and (
-                        self._input_data["high"].values[i] - self._input_data["high"].values[i - 1]
-                        > 0
-                    )
-                )
-                else 0
-            )
-
-            dmi["-dm1"].values[i] = (
-                self._input_data["low"].values[i - 1] - self._input_data["low"].values[i]
-                if (
-                    (
-                        self._input_data["high"].values[i] - self._input_data["high"].values[i - 1]
-                        < self._input_data["low"].values[i - 1] - self._input_data["low"].values[i]
-                    )
-                    and (
-                        self._input_data["low"].values[i - 1] - self._input_data["low"].values[i]
-                        > 0
-                    )
-                )
-                else 0
-            )
-
-        # Calculate True Range and Directional Movement for 14 periods
-        # (smoothed)
-        dmi.loc[dmi.index[13], "tr14"] = dmi["true_range"].iloc[:14].sum()
-        dmi.loc[dmi.index[13], "+dm14"] = dmi["+dm1"].iloc[:14].sum()
-        dmi.loc[dmi.index[13], "-dm14"] = dmi["-dm1"].iloc[:14].sum()
-
-        for i in range(14, len(dmi.index)):
-            dmi["tr14"].values[i] = (
-                dmi["tr14"].values[i - 1]
-                - (dmi["tr14"].values[i - 1] / 14)
-                + dmi["true_range"].values[i]
-            )
-
-            dmi["+dm14"].values[i] = (
-                dmi["+dm14"].values[i - 1]
-                - (dmi["+dm14"].values[i - 1] / 14)
-                + dmi["+dm1"].values[i]
-            )
-
-            dmi["-dm14"].values[i] = (
-                dmi["-dm14"].values[i - 1]
-                - (dmi["-dm14"].values[i - 1] / 14)
-                + dmi["-dm1"].values[i]
-            )
-
-        # Calculate the +DI and -DI
-        dmi.loc[dmi.index[14:], "+di14"] = 100 * dmi["+dm14"].iloc[14:] / dmi["tr14"].iloc[14:]
-
-        dmi.loc[dmi.index[14:], "-di14"] = 100 * dmi["-dm14"].iloc[14:] / dmi["tr14"].iloc[14:]
-
-        # Calculate DX, ADX and ADXR
-        dmi["di_diff"] = abs(dmi["+di14"] - dmi["-di14"])
-        dmi["di_sum"] = abs(dmi["+di14"] + dmi["-di14"])
-
-        dmi["dx"] = 100.0 * dmi["di_diff"] / dmi["di_sum"]
-
-        dmi.loc[dmi.index[27], "adx"] = dmi["dx"].iloc[:28].sum() / 14
-
-        for i in range(28, len(dmi.index)):
-            dmi["adx"].values[i] = ((13 * dmi["adx"].values[i - 1]) + dmi["dx"].values[i]) / 14
-
-        for i in range(40, len(dmi.index)):
-            dmi["adxr"].values[i] = (dmi["adx"].values[i] + dmi["adx"].values[i - 13]) / 2.0
-
-        # Keep the required columns
-        dmi = dmi[["+di14", "-di14", "dx", "adx", "adxr"]]
-        dmi.columns = ["+di", "-di", "dx", "adx", "adxr"]
-
-        return dmi.round(4)
+    def _updateTi(self, new_input_data):
+        """
+        Calculates the technical indicator after new rows have been appended
+        to the input data. Only the new rows are calculated, continuing the
+        Wilder's smoothing from the last smoothed values.
+
+        Args:
+            new_input_data (pandas.DataFrame): The new rows of the input data,
+                after preprocessing.
+
+        Returns:
+            pandas.DataFrame: The calculated indicator for the new rows. Index
+            is of type ``pandas.DatetimeIndex``. It contains the ``+di``,
+            ``-di``, ``dx``, ``adx`` and ``adxr`` columns.
+        """
+
+        # The state is copied, the stored one can be shared with the result
+        # cache
+        state = dict(self._state)
+
+        dmi = kernels.directionalMovementIndex(
+            *self._inputArrays("high", "low", "close", rows=len(new_input_data.index)),
+            self._period,
+            self._adx_period,
+            state=state,
+        )
+
+        self._state = state
+
+        return self._kernelData(
+            ["+di", "-di", "dx", "adx", "adxr"], dmi, index=new_input_data.index
+        )
 
     def getTiSignal(self):
         """
@@ -216,3 +180,37 @@ class DirectionalMovementIndex(TechnicalIndicator):
 
         else:
             return TRADE_SIGNALS["hold"]
+
+    def _calculateTiSignalSeries(self):
+        """
+        Calculates the trading signal for each row of the calculated technical
+        indicator, in a vectorized way.
+
+        Returns:
+            numpy.ndarray: The numeric value of the trading signal for each row.
+        """
+
+        plus_di = self._ti_data["+di"].to_numpy(dtype=np.float64)
+        plus_di_prev = self._shiftValues(plus_di)
+
+        minus_di = self._ti_data["-di"].to_numpy(dtype=np.float64)
+        minus_di_prev = self._shiftValues(minus_di)
+
+        # ADXR > 25 is a strong trend, ADXR < 20 indicates no trend
+        trend = self._ti_data["adxr"].to_numpy(dtype=np.float64) >= 20
+
+        return self._selectSignals(
+            [
+                # A sell signal is given when -DI crosses above +DI
+                (
+                    (plus_di_prev > minus_di_prev) & (plus_di < minus_di) & trend,
+                    TRADE_SIGNALS["sell"],
+                ),
+                # A buy signal is given when +DI crosses above -DI
+                (
+                    (plus_di_prev < minus_di_prev) & (plus_di > minus_di) & trend,
+                    TRADE_SIGNALS["buy"],
+                ),
+            ],
+            minimum_rows=2,
+        )
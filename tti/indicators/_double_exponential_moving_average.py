@@ -5,12 +5,12 @@ File name: _double_exponential_moving_average.py
     Implements the Double Exponential Moving Average technical indicator.
 """
 
-import pandas as pd
+import numpy as np
 
 from ._technical_indicator import TechnicalIndicator
+from .. import kernels
 from ..utils.constants import TRADE_SIGNALS
 from ..utils.exceptions import (
-    NotEnoughInputData,
     WrongTypeForInputParameter,
     WrongValueForInputParameter,
 )
@@ -30,6 +30,9 @@ class DoubleExponentialMovingAverage(TechnicalIndicator):
         fill_missing_values (bool, default=True): If set to True, missing
             values in the input data are being filled.
 
+        precision (int, default=4): The number of decimals the calculated
+            indicator is rounded to. If None, it is not rounded.
+
     Attributes:
         _input_data (pandas.DataFrame): The ``input_data`` after preprocessing.
 
@@ -40,6 +43,10 @@ class DoubleExponentialMovingAverage(TechnicalIndicator):
 
         _calling_instance (str): The name of the class.
 
+        _state (dict): The state of the calculation after the last row (state
+            of the two exponential moving averages), used for updating the
+            indicator with new input data.
+
     Raises:
         WrongTypeForInputParameter: Input argument has wrong type.
         WrongValueForInputParameter: Unsupported value for input argument.
@@ -48,7 +55,7 @@ class DoubleExponentialMovingAverage(TechnicalIndicator):
         ValueError: Value error occurred when validating the ``input_data``.
     """
 
-    def __init__(self, input_data, period=5, fill_missing_values=True):
+    def __init__(self, input_data, period=5, fill_missing_values=True, precision=4):
         # Validate and store if needed, the input parameters
         if isinstance(period, int):
             if period > 0:
@@ -63,6 +70,7 @@ class DoubleExponentialMovingAverage(TechnicalIndicator):
             calling_instance=self.__class__.__name__,
             input_data=input_data,
             fill_missing_values=fill_missing_values,
+            precision=precision,
         )
 
     def _calculateTi(self):
@@ -78,23 +86,46 @@ class DoubleExponentialMovingAverage(TechnicalIndicator):
             NotEnoughInputData: Not enough data for calculating the indicator.
         """
 
-        # Not enough data for the requested period
-        if len(self._input_data.index) < self._period:
-            raise NotEnoughInputData(
-                "Double Exponential Moving Average", self._period, len(self._input_data.index)
-            )
+        # State of the exponential moving averages, used for updating the
+        # indicator with new input data
+        self._state = {}
 
-        dema = pd.DataFrame(index=self._input_data.index, columns=["dema"], data=0, dtype="float64")
+        return self._kernelData(
+            ["dema"],
+            kernels.doubleExponentialMovingAverage(
+                *self._inputArrays("close"), self._period, state=self._state
+            ),
+        )
+
+    def _updateTi(self, new_input_data):
+        """
+        Calculates the technical indicator after new rows have been appended
+        to the input data. Only the new rows are calculated, continuing the
+        exponential moving averages from their state.
+
+        Args:
+            new_input_data (pandas.DataFrame): The new rows of the input data,
+                after preprocessing.
+
+        Returns:
+            pandas.DataFrame: The calculated indicator for the new rows. Index
+            is of type ``pandas.DatetimeIndex``. It contains one column, the
+            ``dema``.
+        """
 
-        # Exponential moving average of prices
-        ema = self._input_data.ewm(span=self._period, min_periods=self._period, adjust=False).mean()
+        # The state is copied, the stored one can be shared with the result
+        # cache
+        state = dict(self._state)
 
-        # Exponential moving average of the exponential moving average
-        ema_of_ema = ema.ewm(span=self._period, min_periods=self._period, adjust=False).mean()
+        dema = kernels.doubleExponentialMovingAverage(
+            *self._inputArrays("close", rows=len(new_input_data.index)),
+            self._period,
+            state=state,
+        )
 
-        dema["dema"] = (2 * ema) - ema_of_ema
+        self._state = state
 
-        return dema.round(4)
+        return self._kernelData(["dema"], dema, index=new_input_data.index)
 
     def getTiSignal(self):
         """
@@ -115,3 +146,24 @@ class DoubleExponentialMovingAverage(TechnicalIndicator):
             return TRADE_SIGNALS["buy"]
 
         return TRADE_SIGNALS["hold"]
+
+    def _calculateTiSignalSeries(self):
+        """
+        Calculates the trading signal for each row of the calculated technical
+        indicator, in a vectorized way.
+
+        Returns:
+            numpy.ndarray: The numeric value of the trading signal for each row.
+        """
+
+        close = self._signalInput("close")
+
+        return self._selectSignals(
+            [
+                # Close price is below Moving Average
+                (
+                    close < self._ti_data["dema"].to_numpy(dtype=np.float64),
+                    TRADE_SIGNALS["buy"],
+                ),
+            ],
+        )
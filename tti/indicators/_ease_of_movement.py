@@ -5,12 +5,12 @@ File name: _ease_of_movement.py
     Implements the Ease Of Movement technical indicator.
 """
 
-import pandas as pd
+import numpy as np
 
 from ._technical_indicator import TechnicalIndicator
+from .. import kernels
 from ..utils.constants import TRADE_SIGNALS
 from ..utils.exceptions import (
-    NotEnoughInputData,
     WrongTypeForInputParameter,
     WrongValueForInputParameter,
 )
@@ -31,6 +31,9 @@ class EaseOfMovement(TechnicalIndicator):
         fill_missing_values (bool, default=True): If set to True, missing
             values in the input data are being filled.
 
+        precision (int, default=4): The number of decimals the calculated
+            indicator is rounded to. If None, it is not rounded.
+
     Attributes:
         _input_data (pandas.DataFrame): The ``input_data`` after preprocessing.
 
@@ -50,7 +53,7 @@ class EaseOfMovement(TechnicalIndicator):
         ValueError: Value error occurred when validating the ``input_data``.
     """
 
-    def __init__(self, input_data, period=40, fill_missing_values=True):
+    def __init__(self, input_data, period=40, fill_missing_values=True, precision=4):
         # Validate and store if needed, the input parameters
         if isinstance(period, int):
             if period > 0:
@@ -65,6 +68,7 @@ class EaseOfMovement(TechnicalIndicator):
             calling_instance=self.__class__.__name__,
             input_data=input_data,
             fill_missing_values=fill_missing_values,
+            precision=precision,
         )
 
     def _calculateTi(self):
@@ -81,31 +85,11 @@ class EaseOfMovement(TechnicalIndicator):
             NotEnoughInputData: Not enough data for calculating the indicator.
         """
 
-        # Not enough data for the requested period
-        if len(self._input_data.index) < max(self._period, 2):
-            raise NotEnoughInputData(
-                "Ease Of Movement", max(self._period, 2), len(self._input_data.index)
-            )
-
-        emv = pd.DataFrame(
-            index=self._input_data.index, columns=["emv", "emv_ma"], data=0, dtype="float64"
-        )
-
-        midpoint_move = 0.5 * (
-            (self._input_data["high"] + self._input_data["low"])
-            - (self._input_data["high"].shift(1) + self._input_data["low"].shift(1))
+        return self._kernelData(
+            ["emv", "emv_ma"],
+            kernels.easeOfMovement(*self._inputArrays("high", "low", "volume"), self._period),
         )
 
-        box_ratio = self._input_data["volume"] / (
-            (self._input_data["high"] - self._input_data["low"]) * 10000
-        )
-
-        emv["emv"] = midpoint_move / box_ratio
-
-        emv["emv_ma"] = emv["emv"].rolling(window=self._period, min_periods=self._period).mean()
-
-        return emv.round(4)
-
     def getTiSignal(self):
         """
         Calculates and returns the trading signal for the calculated technical
@@ -129,3 +113,25 @@ class EaseOfMovement(TechnicalIndicator):
             return TRADE_SIGNALS["sell"]
 
         return TRADE_SIGNALS["hold"]
+
+    def _calculateTiSignalSeries(self):
+        """
+        Calculates the trading signal for each row of the calculated technical
+        indicator, in a vectorized way.
+
+        Returns:
+            numpy.ndarray: The numeric value of the trading signal for each row.
+        """
+
+        emv_ma = self._ti_data["emv_ma"].to_numpy(dtype=np.float64)
+        emv_ma_prev = self._shiftValues(emv_ma)
+
+        return self._selectSignals(
+            [
+                # EMV-MA crosses above the zero line, buy signal
+                ((emv_ma_prev < 0.0) & (emv_ma > 0.0), TRADE_SIGNALS["buy"]),
+                # EMV-MA crosses below the zero line, sell signal
+                ((emv_ma_prev > 0.0) & (emv_ma < 0.0), TRADE_SIGNALS["sell"]),
+            ],
+            minimum_rows=2,
+        )
@@ -5,12 +5,12 @@ File name: _envelopes.py
     Implements the Envelopes technical indicator.
 """
 
-import pandas as pd
+import numpy as np
 
 from ._technical_indicator import TechnicalIndicator
+from .. import kernels
 from ..utils.constants import TRADE_SIGNALS
 from ..utils.exceptions import (
-    NotEnoughInputData,
     WrongTypeForInputParameter,
     WrongValueForInputParameter,
 )
@@ -32,6 +32,9 @@ class Envelopes(TechnicalIndicator):
         fill_missing_values (bool, default=True): If set to True, missing
             values in the input data are being filled.
 
+        precision (int, default=4): The number of decimals the calculated
+            indicator is rounded to. If None, it is not rounded.
+
     Attributes:
         _input_data (pandas.DataFrame): The ``input_data`` after preprocessing.
 
@@ -51,7 +54,7 @@ class Envelopes(TechnicalIndicator):
         ValueError: Value error occurred when validating the ``input_data``.
     """
 
-    def __init__(self, input_data, period=20, shift=0.10, fill_missing_values=True):
+    def __init__(self, input_data, period=20, shift=0.10, fill_missing_values=True, precision=4):
         # Validate and store if needed, the input parameters
         if isinstance(period, int):
             if period > 0:
@@ -74,6 +77,7 @@ class Envelopes(TechnicalIndicator):
             calling_instance=self.__class__.__name__,
             input_data=input_data,
             fill_missing_values=fill_missing_values,
+            precision=precision,
         )
 
     def _calculateTi(self):
@@ -90,24 +94,11 @@ class Envelopes(TechnicalIndicator):
             NotEnoughInputData: Not enough data for calculating the indicator.
         """
 
-        # Not enough data for the requested period
-        if len(self._input_data.index) < self._period:
-            raise NotEnoughInputData("Envelopes", self._period, len(self._input_data.index))
-
-        env = pd.DataFrame(
-            index=self._input_data.index,
-            columns=["upper_band", "lower_band"],
-            data=0,
-            dtype="float64",
+        return self._kernelData(
+            ["upper_band", "lower_band"],
+            kernels.envelopes(*self._inputArrays("close"), self._period, self._shift),
         )
 
-        ma = self._input_data.rolling(window=self._period, min_periods=self._period).mean()
-
-        env["upper_band"] = (1 + self._shift) * ma
-        env["lower_band"] = (1 - self._shift) * ma
-
-        return env.round(4)
-
     def getTiSignal(self):
         """
         Calculates and returns the trading signal for the calculated technical
@@ -132,3 +123,29 @@ class Envelopes(TechnicalIndicator):
 
         else:
             return TRADE_SIGNALS["hold"]
+
+    def _calculateTiSignalSeries(self):
+        """
+        Calculates the trading signal for each row of the calculated technical
+        indicator, in a vectorized way.
+
+        Returns:
+            numpy.ndarray: The numeric value of the trading signal for each row.
+        """
+
+        close = self._signalInput("close")
+
+        return self._selectSignals(
+            [
+                # Price goes above upper band
+                (
+                    close > self._ti_data["upper_band"].to_numpy(dtype=np.float64),
+                    TRADE_SIGNALS["sell"],
+                ),
+                # Price goes below lower band
+                (
+                    close < self._ti_data["lower_band"].to_numpy(dtype=np.float64),
+                    TRADE_SIGNALS["buy"],
+                ),
+            ],
+        )
@@ -0,0 +1,339 @@
+"""
+Trading-Technical-Indicators (tti) python library
+
+File name: _executor.py
+    Implements the parallel calculation of a suite of technical indicators
+    for a list of symbols.
+"""
+
+import collections
+import concurrent.futures
+import inspect
+import os
+import numpy as np
+import pandas as pd
+import pandas.api.types as pdtypes
+from multiprocessing import shared_memory, util
+
+from ._technical_indicator import TechnicalIndicator
+from ..utils.exceptions import WrongTypeForInputParameter, WrongValueForInputParameter
+
+# The result of calculating one indicator for one symbol. The ti_data is
+# None when the calculation failed and error holds the raised exception.
+TaskResult = collections.namedtuple(
+    "TaskResult", ["symbol", "indicator", "params", "ti_data", "error"]
+)
+
+# Worker process state, set by the _initWorker function
+_worker_shared_memory = None
+_worker_symbols_layout = None
+_worker_input_data = {}
+
+
+def _initWorker(shared_memory_name, symbols_layout):
+    """
+    Initializes a worker process, by attaching to the shared memory which
+    holds the input data of all the symbols.
+
+    Args:
+        shared_memory_name (str): The name of the shared memory block.
+
+        symbols_layout (list): The layout of each symbol in the shared memory
+            block, as returned by the _symbolsLayout function.
+    """
+
+    global _worker_shared_memory, _worker_symbols_layout, _worker_input_data
+
+    _worker_shared_memory = shared_memory.SharedMemory(name=shared_memory_name)
+    _worker_symbols_layout = symbols_layout
+    _worker_input_data = {}
+
+    # Closed when the worker exits. The atexit handlers are not run by the
+    # forked worker processes, the multiprocessing finalizers are
+    util.Finalize(None, _closeWorker, exitpriority=0)
+
+
+def _closeWorker():
+    """
+    Closes the shared memory attached by the _initWorker function, when the
+    worker process exits.
+    """
+
+    global _worker_shared_memory, _worker_input_data
+
+    _worker_input_data = {}
+
+    if _worker_shared_memory is not None:
+        _worker_shared_memory.close()
+        _worker_shared_memory = None
+
+
+def _symbolsLayout(symbols_data):
+    """
+    Calculates the layout of the input data of each symbol in the shared
+    memory block. The index is stored as int64 and the numeric columns as
+    float64 values (restored to their data type when read), so each symbol
+    occupies (columns + 1) * rows * 8 bytes.
+
+    Args:
+        symbols_data (list): The input data (pandas.DataFrame) of each symbol.
+
+    Returns:
+        (list, int): The layout of each symbol, a dictionary with the offset,
+        the rows, the columns and the index details of the symbol in the
+        shared memory block, and the total size of the block in bytes.
+    """
+
+    layout = []
+    offset = 0
+
+    for data in symbols_data:
+        columns = [c for c in data.columns if pdtypes.is_numeric_dtype(data[c])]
+
+        layout.append(
+            {
+                "offset": offset,
+                "rows": len(data.index),
+                "columns": columns,
+                "dtypes": data[columns].dtypes.to_dict(),
+                "index_name": data.index.name,
+                "index_unit": data.index.unit,
+                "index_tz": data.index.tz,
+            }
+        )
+
+        offset += (len(columns) + 1) * len(data.index) * 8
+
+    return layout, offset
+
+
+def _symbolArrays(buffer, layout):
+    """
+    Returns the index and the values arrays of a symbol, as views on the
+    shared memory block.
+
+    Args:
+        buffer (memoryview): The buffer of the shared memory block.
+
+        layout (dict): The layout of the symbol in the shared memory block.
+
+    Returns:
+        (numpy.ndarray, numpy.ndarray): The index (int64) and the values
+        (float64, one column for each input data column) of the symbol.
+    """
+
+    rows = layout["rows"]
+
+    index = np.ndarray((rows,), dtype=np.int64, buffer=buffer, offset=layout["offset"])
+
+    values = np.ndarray(
+        (rows, len(layout["columns"])),
+        dtype=np.float64,
+        buffer=buffer,
+        offset=layout["offset"] + rows * 8,
+    )
+
+    return index, values
+
+
+def _readSymbol(position):
+    """
+    Reads the input data of a symbol from the shared memory block, in a
+    worker process. The input data are cached, so each worker reads a symbol
+    only once.
+
+    Args:
+        position (int): The position of the symbol in the symbols list.
+
+    Returns:
+        pandas.DataFrame: The input data of the symbol.
+    """
+
+    if position not in _worker_input_data:
+        layout = _worker_symbols_layout[position]
+
+        index, values = _symbolArrays(_worker_shared_memory.buf, layout)
+
+        index = pd.DatetimeIndex(index.view("M8[" + layout["index_unit"] + "]"))
+
+        if layout["index_tz"] is not None:
+            index = index.tz_localize("UTC").tz_convert(layout["index_tz"])
+
+        index.name = layout["index_name"]
+
+        # The values are restored to the original data type of each column
+        _worker_input_data[position] = pd.DataFrame(
+            values.copy(), index=index, columns=layout["columns"]
+        ).astype(layout["dtypes"])
+
+    return _worker_input_data[position]
+
+
+def _runTask(task):
+    """
+    Calculates one indicator for one symbol, in a worker process.
+
+    Args:
+        task (tuple): The position of the symbol in the symbols list, the
+            indicator class and its input arguments.
+
+    Returns:
+        (pandas.DataFrame, Exception): The calculated indicator and None, or
+        None and the exception raised during the calculation.
+    """
+
+    position, indicator, params = task
+
+    try:
+        # Each indicator gets its own copy, since the input data are modified
+        # in place during their validation
+        ti = indicator(input_data=_readSymbol(position).copy(), **params)
+
+        return ti.getTiData(), None
+
+    except Exception as e:
+        return None, e
+
+
+def executeSuite(symbols, indicators=None, max_workers=None):
+    """
+    Calculates a suite of technical indicators for a list of symbols, in
+    parallel worker processes. The input data of the symbols are written once
+    to a shared memory block, which is read by the worker processes, instead
+    of being pickled for each calculation.
+
+    Args:
+        symbols (dict or list): The input data (pandas.DataFrame) of each
+            symbol. When a dictionary is given, the keys are the symbols,
+            otherwise the symbols are the positions in the list. Only the
+            numeric columns of the input data are used.
+
+        indicators (list, default=None): The indicators to be calculated,
+            either indicator classes or (indicator class, input arguments
+            dictionary) tuples. If None, all the indicators in
+            ``tti.indicators.__all__`` are calculated with their default input
+            arguments.
+
+        max_workers (int, default=None): The number of worker processes. If
+            None, the number of processors of the machine is used.
+
+    Returns:
+        [TaskResult,]: One result for each symbol and indicator, ordered by
+        symbol and then by indicator, as given in the input arguments. Each
+        result holds the symbol, the indicator class, its input arguments,
+        the calculated indicator (``pandas.DataFrame``) and the exception
+        raised during the calculation (or None if no exception was raised).
+
+    Raises:
+        WrongTypeForInputParameter: Input argument has wrong type.
+        WrongValueForInputParameter: Unsupported value for input argument.
+        TypeError: Type error occurred when validating the ``symbols``.
+    """
+
+    if isinstance(symbols, dict):
+        symbols_names = list(symbols.keys())
+        symbols_data = list(symbols.values())
+
+    elif isinstance(symbols, list):
+        symbols_names = list(range(len(symbols)))
+        symbols_data = symbols
+
+    else:
+        raise WrongTypeForInputParameter(type(symbols), "symbols", "dict or list")
+
+    for data in symbols_data:
+        if not isinstance(data, pd.DataFrame):
+            raise WrongTypeForInputParameter(type(data), "symbols", "pd.DataFrame")
+
+        if not isinstance(data.index, pd.DatetimeIndex):
+            raise TypeError(
+                "Invalid symbols index type. It was expected "
+                + "`pd.DatetimeIndex` but `"
+                + str(type(data.index).__name__)
+                + "` was found."
+            )
+
+    if indicators is None:
+        from .. import indicators as indicators_module
+
+        indicators = [getattr(indicators_module, name) for name in indicators_module.__all__]
+
+    if not isinstance(indicators, list):
+        raise WrongTypeForInputParameter(type(indicators), "indicators", "list")
+
+    suite = []
+
+    for indicator in indicators:
+        params = {}
+
+        if isinstance(indicator, tuple) and len(indicator) == 2:
+            indicator, params = indicator
+
+        if not inspect.isclass(indicator) or not issubclass(indicator, TechnicalIndicator):
+            raise WrongTypeForInputParameter(
+                type(indicator), "indicators", "TechnicalIndicator class"
+            )
+
+        if not isinstance(params, dict):
+            raise WrongTypeForInputParameter(type(params), "indicators", "dict")
+
+        suite.append((indicator, params))
+
+    if max_workers is not None:
+        if not isinstance(max_workers, int):
+            raise WrongTypeForInputParameter(type(max_workers), "max_workers", "int")
+
+        if max_workers <= 0:
+            raise WrongValueForInputParameter(max_workers, "max_workers", ">0")
+    else:
+        max_workers = os.cpu_count() or 1
+
+    tasks = [
+        (position, indicator, params)
+        for position in range(len(symbols_data))
+        for indicator, params in suite
+    ]
+
+    if len(tasks) == 0:
+        return []
+
+    symbols_layout, size = _symbolsLayout(symbols_data)
+
+    # Zero sized shared memory blocks are not supported
+    memory = shared_memory.SharedMemory(create=True, size=max(size, 1))
+
+    try:
+        for data, layout in zip(symbols_data, symbols_layout):
+            index, values = _symbolArrays(memory.buf, layout)
+
+            index[:] = data.index.asi8
+            values[:] = data[layout["columns"]].to_numpy(dtype=np.float64)
+
+            # Release the views, so the shared memory can be closed
+            del index, values
+
+        # Tasks are sent to the workers in chunks, to reduce the inter-process
+        # communication overhead. The results keep the order of the tasks.
+        chunksize = max(1, len(tasks) // (max_workers * 4))
+
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_initWorker,
+            initargs=(memory.name, symbols_layout),
+        ) as executor:
+            results = list(executor.map(_runTask, tasks, chunksize=chunksize))
+
+    finally:
+        memory.close()
+        memory.unlink()
+
+    return [
+        TaskResult(
+            symbol=symbols_names[position],
+            indicator=indicator,
+            params=params,
+            ti_data=ti_data,
+            error=error,
+        )
+        for (position, indicator, params), (ti_data, error) in zip(tasks, results)
+    ]
@@ -5,9 +5,10 @@ File name: _fibonacci_retracement.py
     Implements the Fibonacci Retracement technical indicator.
 """
 
-import pandas as pd
+import numpy as np
 
 from ._technical_indicator import TechnicalIndicator
+from .. import kernels
 from ..utils.constants import TRADE_SIGNALS
 
 
@@ -22,6 +23,9 @@ class FibonacciRetracement(TechnicalIndicator):
         fill_missing_values (bool, default=True): If set to True, missing
             values in the input data are being filled.
 
+        precision (int, default=4): The number of decimals the calculated
+            indicator is rounded to. If None, it is not rounded.
+
     Attributes:
         _input_data (pandas.DataFrame): The ``input_data`` after preprocessing.
 
@@ -42,12 +46,13 @@ class FibonacciRetracement(TechnicalIndicator):
         ValueError: Value error occurred when validating the ``input_data``.
     """
 
-    def __init__(self, input_data, fill_missing_values=True):
+    def __init__(self, input_data, fill_missing_values=True, precision=4):
         # Control is passing to the parent class
         super().__init__(
             calling_instance=self.__class__.__name__,
             input_data=input_data,
             fill_missing_values=fill_missing_values,
+            precision=precision,
         )
 
     def _calculateTi(self):
@@ -62,23 +67,11 @@ class FibonacciRetracement(TechnicalIndicator):
             ``rl_61.8`` and ``rl_100.0``.
         """
 
-        # Calculate max and min for the whole input data
-        total_max = self._input_data["close"].max()
-        total_min = self._input_data["close"].min()
-
-        max_min_difference = total_max - total_min
-
         # Retracement levels, only the first six are calculated
-        levels_multipliers = [0.0, 0.236, 0.382, 0.50, 0.618, 1.0]
-
-        retracement_levels = [total_max - c * max_min_difference for c in levels_multipliers]
-
-        return pd.DataFrame(
-            index=self._input_data.index,
-            data=[[retracement_levels[i] for i in range(len(retracement_levels))]]
-            * len(self._input_data.index),
-            columns=["rl_" + str(round(100 * i, 1)) for i in levels_multipliers],
-        ).round(4)
+        return self._kernelData(
+            ["rl_" + str(round(100 * i, 1)) for i in [0.0, 0.236, 0.382, 0.50, 0.618, 1.0]],
+            kernels.fibonacciRetracement(*self._inputArrays("close")),
+        )
 
     def getTiSignal(self):
         """
@@ -145,3 +138,35 @@ class FibonacciRetracement(TechnicalIndicator):
             return TRADE_SIGNALS["sell"]
 
         return TRADE_SIGNALS["hold"]
+
+    def _calculateTiSignalSeries(self):
+        """
+        Calculates the trading signal for each row of the calculated technical
+        indicator, in a vectorized way.
+
+        Returns:
+            numpy.ndarray: The numeric value of the trading signal for each row.
+        """
+
+        close = self._signalInput("close")
+        close_prev = self._shiftValues(close)
+
+        levels = ["rl_61.8", "rl_50.0", "rl_38.2", "rl_23.6"]
+
+        conditions = []
+
+        # Moves from one support level to another in downward direction
+        for level in levels:
+            rl = self._ti_data[level].to_numpy(dtype=np.float64)
+            conditions.append(
+                ((close_prev > self._shiftValues(rl)) & (close < rl), TRADE_SIGNALS["buy"])
+            )
+
+        # Moves from one support level to another in the upward direction
+        for level in levels:
+            rl = self._ti_data[level].to_numpy(dtype=np.float64)
+            conditions.append(
+                ((close_prev < self._shiftValues(rl)) & (close > rl), TRADE_SIGNALS["sell"])
+            )
+
+        return self._selectSignals(conditions, minimum_rows=2)
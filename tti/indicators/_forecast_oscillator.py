@@ -5,9 +5,10 @@ File name: _forecast_oscillator.py
     Implements the Forecast Oscillator technical indicator.
 """
 
-import pandas as pd
+import numpy as np
 
 from ._technical_indicator import TechnicalIndicator
+from .. import kernels
 from ._time_series_forecast import TimeSeriesForecast
 from ..utils.constants import TRADE_SIGNALS
 from ..utils.exceptions import (
@@ -31,6 +32,9 @@ class ForecastOscillator(TechnicalIndicator):
         fill_missing_values (bool, default=True): If set to True, missing
             values in the input data are being filled.
 
+        precision (int, default=4): The number of decimals the calculated
+            indicator is rounded to. If None, it is not rounded.
+
     Attributes:
         _input_data (pandas.DataFrame): The ``input_data`` after preprocessing.
 
@@ -49,7 +53,7 @@ class ForecastOscillator(TechnicalIndicator):
         ValueError: Value error occurred when validating the ``input_data``.
     """
 
-    def __init__(self, input_data, period=14, fill_missing_values=True):
+    def __init__(self, input_data, period=14, fill_missing_values=True, precision=4):
         # Validate and store if needed, the input parameters
         if isinstance(period, int):
             if period > 1:
@@ -64,6 +68,7 @@ class ForecastOscillator(TechnicalIndicator):
             calling_instance=self.__class__.__name__,
             input_data=input_data,
             fill_missing_values=fill_missing_values,
+            precision=precision,
         )
 
     def _calculateTi(self):
@@ -85,23 +90,17 @@ class ForecastOscillator(TechnicalIndicator):
                 "Forecast Oscillator", self._period, len(self._input_data.index)
             )
 
-        fosc = pd.DataFrame(
-            index=self._input_data.index, columns=["fosc"], data=None, dtype="float64"
-        )
-
-        fosc["fosc"] = (
-            100
-            * (
-                self._input_data["close"]
-                - TimeSeriesForecast(input_data=self._input_data, period=self._period)
-                .getTiData()["tsf"]
-                .shift(1)
-            )
-            / self._input_data["close"]
+        return self._kernelData(
+            ["fosc"],
+            kernels.forecastOscillator(
+                *self._inputArrays("close"),
+                self._period,
+                tsf=self._indicatorData(TimeSeriesForecast, period=self._period)["tsf"].to_numpy(
+                    dtype=np.float64
+                ),
+            ),
         )
 
-        return fosc.round(4)
-
     def getTiSignal(self):
         """
         Calculates and returns the trading signal for the calculated technical
@@ -124,3 +123,24 @@ class ForecastOscillator(TechnicalIndicator):
             return TRADE_SIGNALS["buy"]
 
         return TRADE_SIGNALS["hold"]
+
+    def _calculateTiSignalSeries(self):
+        """
+        Calculates the trading signal for each row of the calculated technical
+        indicator, in a vectorized way.
+
+        Returns:
+            numpy.ndarray: The numeric value of the trading signal for each row.
+        """
+
+        fosc = self._ti_data["fosc"].to_numpy(dtype=np.float64)
+        fosc_prev = self._shiftValues(fosc)
+
+        return self._selectSignals(
+            [
+                # Signal based on crossovers with zero line
+                ((fosc_prev < 0.0) & (fosc > 0.0), TRADE_SIGNALS["sell"]),
+                ((fosc_prev > 0.0) & (fosc < 0.0), TRADE_SIGNALS["buy"]),
+            ],
+            minimum_rows=2,
+        )
@@ -5,9 +5,10 @@ File name: _ichimoku_cloud.py
     Implements the Ichimoku Cloud technical indicator.
 """
 
-import pandas as pd
+import numpy as np
 
 from ._technical_indicator import TechnicalIndicator
+from .. import kernels
 from ..utils.constants import TRADE_SIGNALS
 
 
@@ -23,6 +24,9 @@ class IchimokuCloud(TechnicalIndicator):
         fill_missing_values (bool, default=True): If set to True, missing
             values in the input data are being filled.
 
+        precision (int, default=4): The number of decimals the calculated
+            indicator is rounded to. If None, it is not rounded.
+
     Attributes:
         _input_data (pandas.DataFrame): The ``input_data`` after preprocessing.
 
@@ -42,12 +46,13 @@ class IchimokuCloud(TechnicalIndicator):
         ValueError: Value error occurred when validating the ``input_data``.
     """
 
-    def __init__(self, input_data, fill_missing_values=True):
+    def __init__(self, input_data, fill_missing_values=True, precision=4):
         # Control is passing to the parent class
         super().__init__(
             calling_instance=self.__class__.__name__,
             input_data=input_data,
             fill_missing_values=fill_missing_values,
+            precision=precision,
         )
 
     def _calculateTi(self):
@@ -61,35 +66,15 @@ class IchimokuCloud(TechnicalIndicator):
             ``tenkan_sen``, ``kijun_sen``, ``senkou_a``, ``senkou_b``.
         """
 
-        # Build the indicator's dataframe
-        ic = pd.DataFrame(
-            index=self._input_data.index,
-            columns=["tenkan_sen", "kijun_sen", "senkou_a", "senkou_b"],
-            data=None,
+        # Lowest low and highest high of the three periods, calculated together
+        return self._kernelData(
+            ["tenkan_sen", "kijun_sen", "senkou_a", "senkou_b"],
+            kernels.ichimokuCloud(
+                *self._inputArrays("high", "low"),
+                extrema=self._priceExtrema([9, 26, 52], min_periods=1),
+            ),
         )
 
-        ic["tenkan_sen"] = (
-            self._input_data["high"].rolling(window=9, min_periods=1).max()
-            + self._input_data["low"].rolling(window=9, min_periods=1).min()
-        ) / 2
-
-        ic["kijun_sen"] = (
-            self._input_data["high"].rolling(window=26, min_periods=1).max()
-            + self._input_data["low"].rolling(window=26, min_periods=1).min()
-        ) / 2
-
-        ic["senkou_a"] = ((ic["tenkan_sen"] + ic["kijun_sen"]) / 2).shift(26)
-
-        ic["senkou_b"] = (
-            (
-                self._input_data["high"].rolling(window=52, min_periods=1).max()
-                + self._input_data["low"].rolling(window=52, min_periods=1).min()
-            )
-            / 2
-        ).shift(26)
-
-        return ic.round(4)
-
     @staticmethod
     def _whereInCloud(value, cloud):
         """
@@ -164,3 +149,62 @@ class IchimokuCloud(TechnicalIndicator):
             return TRADE_SIGNALS["sell"]
 
         return TRADE_SIGNALS["hold"]
+
+    def _calculateTiSignalSeries(self):
+        """
+        Calculates the trading signal for each row of the calculated technical
+        indicator, in a vectorized way.
+
+        Returns:
+            numpy.ndarray: The numeric value of the trading signal for each row.
+        """
+
+        close = self._signalInput("close")
+
+        tenkan_sen = self._ti_data["tenkan_sen"].to_numpy(dtype=np.float64)
+        tenkan_sen_prev = self._shiftValues(tenkan_sen)
+
+        kijun_sen = self._ti_data["kijun_sen"].to_numpy(dtype=np.float64)
+        kijun_sen_prev = self._shiftValues(kijun_sen)
+
+        senkou_a = self._ti_data["senkou_a"].to_numpy(dtype=np.float64)
+        senkou_b = self._ti_data["senkou_b"].to_numpy(dtype=np.float64)
+
+        # If 3 all 'close', 'tenkan_sen' and 'kijun_sen' are above the cloud
+        # if -3 all 'close', 'tenkan_sen' and 'kijun_sen' are below the cloud
+        position_in_cloud = np.zeros(len(close), dtype=np.int64)
+
+        for value in [close, tenkan_sen, kijun_sen]:
+            position = (senkou_a < value).astype(np.int64) + (senkou_b < value) - 1
+
+            # Rows with missing values follow the ordering of _whereInCloud
+            for i in np.flatnonzero(np.isnan(value) | np.isnan(senkou_a) | np.isnan(senkou_b)):
+                position[i] = self._whereInCloud(
+                    float(value[i]), [float(senkou_a[i]), float(senkou_b[i])]
+                )
+
+            position_in_cloud += position
+
+        return self._selectSignals(
+            [
+                # A buy signal is reinforced when the Tenkan Sen crosses above
+                # the Kijun Sen while the Tenkan Sen, Kijun Sen, and price are
+                # all above the cloud
+                (
+                    (tenkan_sen_prev < kijun_sen_prev)
+                    & (tenkan_sen > kijun_sen)
+                    & (position_in_cloud == 3),
+                    TRADE_SIGNALS["buy"],
+                ),
+                # A sell signal is reinforced when the TenKan Sen crosses below
+                # the Kijun Sen while the Tenkan Sen, Kijun Sen, and price are
+                # all below the cloud.
+                (
+                    (tenkan_sen_prev > kijun_sen_prev)
+                    & (tenkan_sen < kijun_sen)
+                    & (position_in_cloud == -3),
+                    TRADE_SIGNALS["sell"],
+                ),
+            ],
+            minimum_rows=2,
+        )
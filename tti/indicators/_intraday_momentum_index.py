@@ -5,12 +5,12 @@ File name: _intraday_momentum_index.py
     Implements the Intraday Momentum Index technical indicator.
 """
 
-import pandas as pd
+import numpy as np
 
 from ._technical_indicator import TechnicalIndicator
+from .. import kernels
 from ..utils.constants import TRADE_SIGNALS
 from ..utils.exceptions import (
-    NotEnoughInputData,
     WrongTypeForInputParameter,
     WrongValueForInputParameter,
 )
@@ -31,6 +31,9 @@ class IntradayMomentumIndex(TechnicalIndicator):
         fill_missing_values (bool, default=True): If set to True, missing
             values in the input data are being filled.
 
+        precision (int, default=4): The number of decimals the calculated
+            indicator is rounded to. If None, it is not rounded.
+
     Attributes:
         _input_data (pandas.DataFrame): The ``input_data`` after preprocessing.
 
@@ -49,7 +52,7 @@ class IntradayMomentumIndex(TechnicalIndicator):
         ValueError: Value error occurred when validating the ``input_data``.
     """
 
-    def __init__(self, input_data, period=14, fill_missing_values=True):
+    def __init__(self, input_data, period=14, fill_missing_values=True, precision=4):
         # Validate and store if needed, the input parameters
         if isinstance(period, int):
             if period > 0:
@@ -64,6 +67,7 @@ class IntradayMomentumIndex(TechnicalIndicator):
             calling_instance=self.__class__.__name__,
             input_data=input_data,
             fill_missing_values=fill_missing_values,
+            precision=precision,
         )
 
     def _calculateTi(self):
@@ -79,32 +83,11 @@ class IntradayMomentumIndex(TechnicalIndicator):
             NotEnoughInputData: Not enough data for calculating the indicator.
         """
 
-        # Not enough data for the requested period
-        if len(self._input_data.index) < self._period:
-            raise NotEnoughInputData(
-                "Intraday Momentum Index", self._period, len(self._input_data.index)
-            )
-
-        imi = pd.DataFrame(
-            index=self._input_data.index, columns=["imi"], data=None, dtype="float64"
+        return self._kernelData(
+            ["imi"],
+            kernels.intradayMomentumIndex(*self._inputArrays("open", "close"), self._period),
         )
 
-        # Calculate Upward Price Change
-        upc = self._input_data["close"] - self._input_data["open"]
-        upc[upc < 0.0] = 0.0
-
-        upc_sum = upc.rolling(window=self._period, min_periods=self._period).sum()
-
-        # Calculate Downward Price Change
-        dpc = self._input_data["open"] - self._input_data["close"]
-        dpc[dpc < 0.0] = 0.0
-
-        dpc_sum = dpc.rolling(window=self._period, min_periods=self._period).sum()
-
-        imi["imi"] = 100 * upc_sum / (upc_sum + dpc_sum)
-
-        return imi.round(4)
-
     def getTiSignal(self):
         """
         Calculates and returns the trading signal for the calculated technical
@@ -128,3 +111,25 @@ class IntradayMomentumIndex(TechnicalIndicator):
             return TRADE_SIGNALS["buy"]
 
         return TRADE_SIGNALS["hold"]
+
+    def _calculateTiSignalSeries(self):
+        """
+        Calculates the trading signal for each row of the calculated technical
+        indicator, in a vectorized way.
+
+        Returns:
+            numpy.ndarray: The numeric value of the trading signal for each row.
+        """
+
+        imi = self._ti_data["imi"].to_numpy(dtype=np.float64)
+        imi_prev = self._shiftValues(imi)
+
+        return self._selectSignals(
+            [
+                # Overbought region
+                ((imi_prev < 70.0) & (imi > 70.0), TRADE_SIGNALS["sell"]),
+                # Oversold region
+                ((imi_prev > 30.0) & (imi < 30.0), TRADE_SIGNALS["buy"]),
+            ],
+            minimum_rows=2,
+        )
@@ -5,11 +5,11 @@ File name: _klinger_oscillator.py
     Implements the Klinger Oscillator technical indicator.
 """
 
-import pandas as pd
+import numpy as np
 
 from ._technical_indicator import TechnicalIndicator
+from .. import kernels
 from ..utils.constants import TRADE_SIGNALS
-from ..utils.exceptions import NotEnoughInputData
 
 
 class KlingerOscillator(TechnicalIndicator):
@@ -24,6 +24,9 @@ class KlingerOscillator(TechnicalIndicator):
         fill_missing_values (bool, default=True): If set to True, missing
             values in the input data are being filled.
 
+        precision (int, default=4): The number of decimals the calculated
+            indicator is rounded to. If None, it is not rounded.
+
     Attributes:
         _input_data (pandas.DataFrame): The ``input_data`` after preprocessing.
 
@@ -42,12 +45,13 @@ class KlingerOscillator(TechnicalIndicator):
         ValueError: Value error occurred when validating the ``input_data``.
     """
 
-    def __init__(self, input_data, fill_missing_values=True):
+    def __init__(self, input_data, fill_missing_values=True, precision=4):
         # Control is passing to the parent class
         super().__init__(
             calling_instance=self.__class__.__name__,
             input_data=input_data,
             fill_missing_values=fill_missing_values,
+            precision=precision,
         )
 
     def _calculateTi(self):
@@ -63,39 +67,10 @@ class KlingerOscillator(TechnicalIndicator):
             NotEnoughInputData: Not enough data for calculating the indicator.
         """
 
-        # Not enough data for the requested period
-        if len(self._input_data.index) < 55:
-            raise NotEnoughInputData("Klinger Oscillator", 55, len(self._input_data.index))
-
-        ko = pd.DataFrame(index=self._input_data.index, columns=["ko"], data=None, dtype="float64")
-
-        # Trend Direction
-        t = self._input_data[["high", "low", "close"]].sum(axis=1) - self._input_data[
-            ["high", "low", "close"]
-        ].sum(axis=1).shift(1)
-        t[t > 0.0] = 1.0
-        t[t <= 0.0] = -1.0
-
-        # Daily Measurement
-        dm = self._input_data["high"] - self._input_data["low"]
-
-        # Cumulative Measurement
-        cm = [0.0]
-        for i in range(1, len(self._input_data)):
-            if t.iloc[i] == t.iloc[i - 1]:
-                cm.append(cm[i - 1] + dm.iloc[i])
-            else:
-                cm.append(dm.iloc[i - 1] + dm.iloc[i])
-
-        volume_force = self._input_data["volume"] * abs(2 * (dm / cm) - 1) * t * 100
-
-        ko["ko"] = (
-            volume_force.ewm(span=34, min_periods=34, adjust=False).mean()
-            - volume_force.ewm(span=55, min_periods=55, adjust=False).mean()
+        return self._kernelData(
+            ["ko"], kernels.klingerOscillator(*self._inputArrays("high", "low", "close", "volume"))
         )
 
-        return ko.round(4)
-
     def getTiSignal(self):
         """
         Calculates and returns the trading signal for the calculated technical
@@ -118,3 +93,24 @@ class KlingerOscillator(TechnicalIndicator):
             return TRADE_SIGNALS["buy"]
 
         return TRADE_SIGNALS["hold"]
+
+    def _calculateTiSignalSeries(self):
+        """
+        Calculates the trading signal for each row of the calculated technical
+        indicator, in a vectorized way.
+
+        Returns:
+            numpy.ndarray: The numeric value of the trading signal for each row.
+        """
+
+        ko = self._ti_data["ko"].to_numpy(dtype=np.float64)
+        ko_prev = self._shiftValues(ko)
+
+        return self._selectSignals(
+            [
+                # Signal based on crossovers with zero line
+                ((ko_prev < 0.0) & (ko > 0.0), TRADE_SIGNALS["sell"]),
+                ((ko_prev > 0.0) & (ko < 0.0), TRADE_SIGNALS["buy"]),
+            ],
+            minimum_rows=2,
+        )
@@ -5,19 +5,16 @@ File name: _linear_regression_indicator.py
     Implements the Linear Regression technical indicator.
 """
 
-import pandas as pd
+import numpy as np
 
 from ._technical_indicator import TechnicalIndicator
+from .. import kernels
 from ..utils.constants import TRADE_SIGNALS
 from ..utils.exceptions import (
-    NotEnoughInputData,
     WrongTypeForInputParameter,
     WrongValueForInputParameter,
 )
 
-import statsmodels.api as sm
-from statsmodels.regression.rolling import RollingOLS
-
 
 class LinearRegressionIndicator(TechnicalIndicator):
     """
@@ -33,6 +30,9 @@ class LinearRegressionIndicator(TechnicalIndicator):
         fill_missing_values (bool, default=True): If set to True, missing
             values in the input data are being filled.
 
+        precision (int, default=4): The number of decimals the calculated
+            indicator is rounded to. If None, it is not rounded.
+
     Attributes:
         _input_data (pandas.DataFrame): The ``input_data`` after preprocessing.
 
@@ -51,7 +51,7 @@ class LinearRegressionIndicator(TechnicalIndicator):
         ValueError: Value error occurred when validating the ``input_data``.
     """
 
-    def __init__(self, input_data, period=14, fill_missing_values=True):
+    def __init__(self, input_data, period=14, fill_missing_values=True, precision=4):
         # Validate and store if needed, the input parameters
         if isinstance(period, int):
             if period > 1:
@@ -66,6 +66,7 @@ class LinearRegressionIndicator(TechnicalIndicator):
             calling_instance=self.__class__.__name__,
             input_data=input_data,
             fill_missing_values=fill_missing_values,
+            precision=precision,
         )
 
     def _calculateTi(self):
@@ -81,28 +82,15 @@ class LinearRegressionIndicator(TechnicalIndicator):
             NotEnoughInputData: Not enough data for calculating the indicator.
         """
 
-        # Not enough data for the requested period
-        if len(self._input_data.index) < self._period:
-            raise NotEnoughInputData(
-                "Linear Regression Indicator", self._period, len(self._input_data.index)
-            )
-
-        lri = pd.DataFrame(
-            index=self._input_data.index, columns=["lri"], data=None, dtype="float64"
+        return self._kernelData(
+            ["lri"],
+            kernels.linearRegressionIndicator(
+                *self._inputArrays("close"),
+                self._period,
+                linear_regression=self._linearRegression("close", self._period),
+            ),
         )
 
-        # n-period Rolling OLS
-        rolling_ols = RollingOLS(
-            endog=self._input_data["close"].fillna(value=0, inplace=False).to_list(),
-            exog=sm.add_constant(list(range(len(self._input_data.index)))),
-            window=self._period,
-        ).fit(params_only=True)
-
-        for i in range(len(self._input_data.index)):
-            lri["lri"].values[i] = round(rolling_ols.params[i][0] + i * rolling_ols.params[i][1], 4)
-
-        return lri
-
     def getTiSignal(self):
         """
         Calculates and returns the trading signal for the calculated technical
@@ -132,3 +120,28 @@ class LinearRegressionIndicator(TechnicalIndicator):
             return TRADE_SIGNALS["sell"]
 
         return TRADE_SIGNALS["hold"]
+
+    def _calculateTiSignalSeries(self):
+        """
+        Calculates the trading signal for each row of the calculated technical
+        indicator, in a vectorized way.
+
+        Returns:
+            numpy.ndarray: The numeric value of the trading signal for each row.
+        """
+
+        close = self._signalInput("close")
+        close_prev = self._shiftValues(close)
+
+        lri = self._ti_data["lri"].to_numpy(dtype=np.float64)
+        lri_prev = self._shiftValues(lri)
+
+        return self._selectSignals(
+            [
+                # Close price goes below Linear Regression
+                ((close_prev > lri_prev) & (close < lri), TRADE_SIGNALS["buy"]),
+                # Close price goes above Linear Regression
+                ((close_prev < lri_prev) & (close > lri), TRADE_SIGNALS["sell"]),
+            ],
+            minimum_rows=2,
+        )
@@ -5,12 +5,12 @@ File name: _linear_regression_slope.py
     Implements the Linear Regression Slope technical indicator.
 """
 
-import pandas as pd
+import numpy as np
 
 from ._technical_indicator import TechnicalIndicator
+from .. import kernels
 from ..utils.constants import TRADE_SIGNALS
 from ..utils.exceptions import (
-    NotEnoughInputData,
     WrongTypeForInputParameter,
     WrongValueForInputParameter,
 )
@@ -30,6 +30,9 @@ class LinearRegressionSlope(TechnicalIndicator):
         fill_missing_values (bool, default=True): If set to True, missing
             values in the input data are being filled.
 
+        precision (int, default=4): The number of decimals the calculated
+            indicator is rounded to. If None, it is not rounded.
+
     Attributes:
         _input_data (pandas.DataFrame): The ``input_data`` after preprocessing.
 
@@ -48,7 +51,7 @@ class LinearRegressionSlope(TechnicalIndicator):
         ValueError: Value error occurred when validating the ``input_data``.
     """
 
-    def __init__(self, input_data, period=14, fill_missing_values=True):
+    def __init__(self, input_data, period=14, fill_missing_values=True, precision=4):
         # Validate and store if needed, the input parameters
         if isinstance(period, int):
             if period > 0:
@@ -63,6 +66,7 @@ class LinearRegressionSlope(TechnicalIndicator):
             calling_instance=self.__class__.__name__,
             input_data=input_data,
             fill_missing_values=fill_missing_values,
+            precision=precision,
         )
 
     def _calculateTi(self):
@@ -78,41 +82,15 @@ class LinearRegressionSlope(TechnicalIndicator):
             NotEnoughInputData: Not enough data for calculating the indicator.
         """
 
-        # Not enough data for the requested period
-        if len(self._input_data.index) < self._period:
-            raise NotEnoughInputData(
-                "Linear Regression Slope", self._period, len(self._input_data.index)
-            )
-
-        lrs = pd.DataFrame(index=self._input_data.index, columns=["lrs"], data=0.0, dtype="float64")
-
-        xy = (
-            (self._input_data["close"] * range(1, len(self._input_data.index) + 1))
-            .rolling(window=self._period, min_periods=self._period)
-            .sum()
-        )
-
-        x = (
-            pd.Series(index=self._input_data.index, data=range(1, len(self._input_data.index) + 1))
-            .rolling(window=self._period, min_periods=self._period)
-            .sum()
+        return self._kernelData(
+            ["lrs"],
+            kernels.linearRegressionSlope(
+                *self._inputArrays("close"),
+                self._period,
+                linear_regression=self._linearRegression("close", self._period),
+            ),
         )
 
-        xx = (
-            pd.Series(
-                index=self._input_data.index,
-                data=[x**2 for x in range(1, len(self._input_data.index) + 1)],
-            )
-            .rolling(window=self._period, min_periods=self._period)
-            .sum()
-        )
-
-        y = self._input_data["close"].rolling(window=self._period, min_periods=self._period).sum()
-
-        lrs["lrs"] = (self._period * xy - (x * y)) / ((self._period * xx) - (x * x))
-
-        return lrs.round(4)
-
     def getTiSignal(self):
         """
         Calculates and returns the trading signal for the calculated technical
@@ -137,3 +115,25 @@ class LinearRegressionSlope(TechnicalIndicator):
 
         else:
             return TRADE_SIGNALS["hold"]
+
+    def _calculateTiSignalSeries(self):
+        """
+        Calculates the trading signal for each row of the calculated technical
+        indicator, in a vectorized way.
+
+        Returns:
+            numpy.ndarray: The numeric value of the trading signal for each row.
+        """
+
+        lrs = self._ti_data["lrs"].to_numpy(dtype=np.float64)
+        lrs_prev = self._shiftValues(lrs)
+
+        return self._selectSignals(
+            [
+                # Slope becomes positive
+                ((lrs_prev < 0.0) & (lrs > 0.0), TRADE_SIGNALS["sell"]),
+                # Slope becomes negative
+                ((lrs_prev > 0.0) & (lrs < 0.0), TRADE_SIGNALS["buy"]),
+            ],
+            minimum_rows=2,
+        )
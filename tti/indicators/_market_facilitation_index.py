@@ -5,9 +5,10 @@ File name: _market_facilitation_index.py
     Implements the Market Facilitation Index technical indicator.
 """
 
-import pandas as pd
+import numpy as np
 
 from ._technical_indicator import TechnicalIndicator
+from .. import kernels
 from ..utils.constants import TRADE_SIGNALS
 
 
@@ -23,6 +24,9 @@ class MarketFacilitationIndex(TechnicalIndicator):
         fill_missing_values (bool, default=True): If set to True, missing
             values in the input data are being filled.
 
+        precision (int, default=10): The number of decimals the calculated
+            indicator is rounded to. If None, it is not rounded.
+
     Attributes:
         _input_data (pandas.DataFrame): The ``input_data`` after preprocessing.
 
@@ -41,12 +45,13 @@ class MarketFacilitationIndex(TechnicalIndicator):
         ValueError: Value error occurred when validating the ``input_data``.
     """
 
-    def __init__(self, input_data, fill_missing_values=True):
+    def __init__(self, input_data, fill_missing_values=True, precision=10):
         # Control is passing to the parent class
         super().__init__(
             calling_instance=self.__class__.__name__,
             input_data=input_data,
             fill_missing_values=fill_missing_values,
+            precision=precision,
         )
 
     def _calculateTi(self):
@@ -62,15 +67,11 @@ class MarketFacilitationIndex(TechnicalIndicator):
             NotEnoughInputData: Not enough data for calculating the indicator.
         """
 
-        mfi = pd.DataFrame(
-            index=self._input_data.index,
-            columns=["mfi"],
-            data=(self._input_data["high"] - self._input_data["low"]) / self._input_data["volume"],
-            dtype="float64",
+        return self._kernelData(
+            ["mfi"],
+            kernels.marketFacilitationIndex(*self._inputArrays("high", "low", "volume")),
         )
 
-        return mfi.round(10)
-
     def getTiSignal(self):
         """
         Calculates and returns the trading signal for the calculated technical
@@ -95,3 +96,25 @@ class MarketFacilitationIndex(TechnicalIndicator):
 
         else:
             return TRADE_SIGNALS["hold"]
+
+    def _calculateTiSignalSeries(self):
+        """
+        Calculates the trading signal for each row of the calculated technical
+        indicator, in a vectorized way.
+
+        Returns:
+            numpy.ndarray: The numeric value of the trading signal for each row.
+        """
+
+        mfi = self._ti_data["mfi"].to_numpy(dtype=np.float64)
+        mfi_prev = self._shiftValues(mfi)
+
+        return self._selectSignals(
+            [
+                # Warning for a downward breakout
+                (mfi_prev > mfi, TRADE_SIGNALS["buy"]),
+                # Warning for a upward breakout
+                (mfi_prev < mfi, TRADE_SIGNALS["sell"]),
+            ],
+            minimum_rows=2,
+        )
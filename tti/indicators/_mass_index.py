@@ -6,10 +6,11 @@ File name: _mass_index.py
 """
 
 import pandas as pd
+import numpy as np
 
 from ._technical_indicator import TechnicalIndicator
+from .. import kernels
 from ..utils.constants import TRADE_SIGNALS
-from ..utils.exceptions import NotEnoughInputData
 
 
 class MassIndex(TechnicalIndicator):
@@ -24,6 +25,9 @@ class MassIndex(TechnicalIndicator):
         fill_missing_values (bool, default=True): If set to True, missing
             values in the input data are being filled.
 
+        precision (int, default=4): The number of decimals the calculated
+            indicator is rounded to. If None, it is not rounded.
+
     Attributes:
         _input_data (pandas.DataFrame): The ``input_data`` after preprocessing.
 
@@ -42,12 +46,13 @@ class MassIndex(TechnicalIndicator):
         ValueError: Value error occurred when validating the ``input_data``.
     """
 
-    def __init__(self, input_data, fill_missing_values=True):
+    def __init__(self, input_data, fill_missing_values=True, precision=4):
         # Control is passing to the parent class
         super().__init__(
             calling_instance=self.__class__.__name__,
             input_data=input_data,
             fill_missing_values=fill_missing_values,
+            precision=precision,
         )
 
     def _calculateTi(self):
@@ -63,31 +68,25 @@ class MassIndex(TechnicalIndicator):
             NotEnoughInputData: Not enough data for calculating the indicator.
         """
 
-        # Not enough data for the 25-Mass Index
-        if len(self._input_data.index) < 25:
-            raise NotEnoughInputData("Mass Index", 25, len(self._input_data.index))
-
-        # Append to input_data the 9-ema for close prices
-        # This is required for the trading signal calculation and we want
-        # to include it in the graph
-        self._input_data["9_ema"] = (
-            self._input_data["close"].ewm(span=9, min_periods=9, adjust=False).mean()
-        )
-
-        mi = pd.DataFrame(index=self._input_data.index, columns=["mi"], data=None, dtype="float64")
-
-        high_low_diff = self._input_data["high"] - self._input_data["low"]
-
-        # Nine periods EMA of High-Low difference
-        ema_9 = high_low_diff.ewm(span=9, min_periods=9, adjust=False).mean()
+        return self._kernelData(["mi"], kernels.massIndex(*self._inputArrays("high", "low")))
 
-        # Nine periods EMA of the nine periods EMA of the High-Low difference
-        double_ema_9 = ema_9.ewm(span=9, min_periods=9, adjust=False).mean()
+    def _graphInputData(self):
+        """
+        Returns the input data plotted together with the calculated indicator,
+        the ``close`` prices and their 9-ema (``9_ema``).
 
-        # 25-period Mass Index
-        mi["mi"] = (ema_9 / double_ema_9).rolling(window=25, min_periods=25).sum()
+        Returns:
+            pandas.DataFrame: The input data to be plotted. Index is of type
+            ``pandas.DatetimeIndex``.
+        """
 
-        return mi.round(4)
+        return pd.DataFrame(
+            {
+                "close": self._input_data["close"],
+                "9_ema": self._exponentialMovingAverage("close", 9),
+            },
+            index=self._input_data.index,
+        )
 
     def getTiSignal(self):
         """
@@ -118,10 +117,43 @@ class MassIndex(TechnicalIndicator):
 
         # Signal based on 9-EMA trend
         if reversal_bulge:
-            if self._input_data["9_ema"].iat[-2] < self._input_data["9_ema"].iat[-1]:
+            ema_9 = self._exponentialMovingAverage("close", 9)[: len(self._ti_data.index)]
+
+            if ema_9[-2] < ema_9[-1]:
                 return TRADE_SIGNALS["sell"]
 
-            if self._input_data["9_ema"].iat[-2] > self._input_data["9_ema"].iat[-1]:
+            if ema_9[-2] > ema_9[-1]:
                 return TRADE_SIGNALS["buy"]
 
         return TRADE_SIGNALS["hold"]
+
+    def _calculateTiSignalSeries(self):
+        """
+        Calculates the trading signal for each row of the calculated technical
+        indicator, in a vectorized way.
+
+        Returns:
+            numpy.ndarray: The numeric value of the trading signal for each row.
+        """
+
+        mi = self._ti_data["mi"].to_numpy(dtype=np.float64)
+
+        # Look for a Reversal Bulge (indicator raises above 27 and then drops
+        # below 26.5. Specific values for 25-Mass Index. The most recent of the
+        # previous rows which is either above 27 or below 26.5 decides.
+        bulge_marker = np.where(mi > 27.0, 1.0, np.where(mi < 26.5, 0.0, np.nan))
+        reversal_bulge = (
+            self._shiftValues(pd.Series(bulge_marker).ffill().to_numpy(dtype=np.float64)) == 1.0
+        )
+
+        # Signal based on 9-EMA trend
+        ema_9 = self._exponentialMovingAverage("close", 9)[: len(self._ti_data.index)]
+        ema_9_prev = self._shiftValues(ema_9)
+
+        return self._selectSignals(
+            [
+                (reversal_bulge & (ema_9_prev < ema_9), TRADE_SIGNALS["sell"]),
+                (reversal_bulge & (ema_9_prev > ema_9), TRADE_SIGNALS["buy"]),
+            ],
+            minimum_rows=2,
+        )
@@ -5,9 +5,11 @@ File name: _median_price.py
     Implements the Median Price technical indicator.
 """
 
+import numpy as np
 import pandas as pd
 
 from ._technical_indicator import TechnicalIndicator
+from .. import kernels
 from ..utils.constants import TRADE_SIGNALS
 from ..utils.exceptions import WrongTypeForInputParameter, WrongValueForInputParameter
 
@@ -27,6 +29,9 @@ class MedianPrice(TechnicalIndicator):
         fill_missing_values (bool, default=True): If set to True, missing
             values in the input data are being filled.
 
+        precision (int, default=4): The number of decimals the calculated
+            indicator is rounded to. If None, it is not rounded.
+
     Attributes:
         _input_data (pandas.DataFrame): The ``input_data`` after preprocessing.
 
@@ -45,7 +50,7 @@ class MedianPrice(TechnicalIndicator):
         ValueError: Value error occurred when validating the ``input_data``.
     """
 
-    def __init__(self, input_data, period=20, fill_missing_values=True):
+    def __init__(self, input_data, period=20, fill_missing_values=True, precision=4):
         # Validate and store if needed, the input parameters
         if isinstance(period, int):
             if period > 0:
@@ -60,6 +65,7 @@ class MedianPrice(TechnicalIndicator):
             calling_instance=self.__class__.__name__,
             input_data=input_data,
             fill_missing_values=fill_missing_values,
+            precision=precision,
         )
 
     def _calculateTi(self):
@@ -72,24 +78,23 @@ class MedianPrice(TechnicalIndicator):
             ``pandas.DatetimeIndex``. It contains one column, the ``mp``.
         """
 
-        # Append to input_data the period-ema for close prices
-        # This is required for the trading signal calculation and we want
-        # to include it in the graph
-        self._input_data["close_ema"] = (
-            self._input_data["close"]
-            .ewm(span=self._period, min_periods=self._period, adjust=False)
-            .mean()
-        )
+        return self._kernelData(["mp"], kernels.medianPrice(*self._inputArrays("high", "low")))
 
-        mp = pd.DataFrame(
+    def _graphInputData(self):
+        """
+        Returns the input data plotted together with the calculated indicator,
+        the period-ema of the ``close`` prices (``close_ema``).
+
+        Returns:
+            pandas.DataFrame: The input data to be plotted. Index is of type
+            ``pandas.DatetimeIndex``.
+        """
+
+        return pd.DataFrame(
+            {"close_ema": self._exponentialMovingAverage("close", self._period)},
             index=self._input_data.index,
-            columns=["mp"],
-            data=0.5 * (self._input_data["high"] + self._input_data["low"]),
-            dtype="float64",
         )
 
-        return mp.round(4)
-
     def getTiSignal(self):
         """
         Calculates and returns the trading signal for the calculated technical
@@ -104,18 +109,49 @@ class MedianPrice(TechnicalIndicator):
         if len(self._ti_data.index) < self._period:
             return TRADE_SIGNALS["hold"]
 
+        close_ema = self._exponentialMovingAverage("close", self._period)[
+            : len(self._ti_data.index)
+        ]
+
         # Indicator value goes below Moving Average
         if (
-            self._input_data["close_ema"].iat[-2] < self._ti_data["mp"].iat[-2]
-            and self._input_data["close_ema"].iat[-1] > self._ti_data["mp"].iat[-1]
+            close_ema[-2] < self._ti_data["mp"].iat[-2]
+            and close_ema[-1] > self._ti_data["mp"].iat[-1]
         ):
             return TRADE_SIGNALS["buy"]
 
         # Indicator value goes above Moving Average
         if (
-            self._input_data["close_ema"].iat[-2] > self._ti_data["mp"].iat[-2]
-            and self._input_data["close_ema"].iat[-1] < self._ti_data["mp"].iat[-1]
+            close_ema[-2] > self._ti_data["mp"].iat[-2]
+            and close_ema[-1] < self._ti_data["mp"].iat[-1]
         ):
             return TRADE_SIGNALS["sell"]
 
         return TRADE_SIGNALS["hold"]
+
+    def _calculateTiSignalSeries(self):
+        """
+        Calculates the trading signal for each row of the calculated technical
+        indicator, in a vectorized way.
+
+        Returns:
+            numpy.ndarray: The numeric value of the trading signal for each row.
+        """
+
+        close_ema = self._exponentialMovingAverage("close", self._period)[
+            : len(self._ti_data.index)
+        ]
+        close_ema_prev = self._shiftValues(close_ema)
+
+        mp = self._ti_data["mp"].to_numpy(dtype=np.float64)
+        mp_prev = self._shiftValues(mp)
+
+        return self._selectSignals(
+            [
+                # Indicator value goes below Moving Average
+                ((close_ema_prev < mp_prev) & (close_ema > mp), TRADE_SIGNALS["buy"]),
+                # Indicator value goes above Moving Average
+                ((close_ema_prev > mp_prev) & (close_ema < mp), TRADE_SIGNALS["sell"]),
+            ],
+            minimum_rows=max(self._period, 2),
+        )
@@ -5,12 +5,12 @@ File name: _momentum.py
     Implements the Momentum technical indicator.
 """
 
-import pandas as pd
+import numpy as np
 
 from ._technical_indicator import TechnicalIndicator
+from .. import kernels
 from ..utils.constants import TRADE_SIGNALS
 from ..utils.exceptions import (
-    NotEnoughInputData,
     WrongTypeForInputParameter,
     WrongValueForInputParameter,
 )
@@ -30,6 +30,9 @@ class Momentum(TechnicalIndicator):
         fill_missing_values (bool, default=True): If set to True, missing
             values in the input data are being filled.
 
+        precision (int, default=4): The number of decimals the calculated
+            indicator is rounded to. If None, it is not rounded.
+
     Attributes:
         _input_data (pandas.DataFrame): The ``input_data`` after preprocessing.
 
@@ -48,7 +51,7 @@ class Momentum(TechnicalIndicator):
         ValueError: Value error occurred when validating the ``input_data``.
     """
 
-    def __init__(self, input_data, period=12, fill_missing_values=True):
+    def __init__(self, input_data, period=12, fill_missing_values=True, precision=4):
         # Validate and store if needed, the input parameters
         if isinstance(period, int):
             if period > 0:
@@ -63,6 +66,7 @@ class Momentum(TechnicalIndicator):
             calling_instance=self.__class__.__name__,
             input_data=input_data,
             fill_missing_values=fill_missing_values,
+            precision=precision,
         )
 
     def _calculateTi(self):
@@ -78,22 +82,10 @@ class Momentum(TechnicalIndicator):
             NotEnoughInputData: Not enough data for calculating the indicator.
         """
 
-        # Not enough data for the requested period
-        if len(self._input_data.index) < self._period:
-            raise NotEnoughInputData("Momentum", self._period, len(self._input_data.index))
-
-        mom = pd.DataFrame(
-            index=self._input_data.index, columns=["mom"], data=None, dtype="float64"
-        )
-
-        mom.iloc[self._period :, 0] = (
-            100.0
-            * self._input_data["close"].iloc[self._period :]
-            / self._input_data["close"].shift(self._period).iloc[self._period :]
+        return self._kernelData(
+            ["mom"], kernels.momentum(*self._inputArrays("close"), self._period)
         )
 
-        return mom.round(4)
-
     def getTiSignal(self):
         """
         Calculates and returns the trading signal for the calculated technical
@@ -126,3 +118,34 @@ class Momentum(TechnicalIndicator):
             return TRADE_SIGNALS["buy"]
 
         return TRADE_SIGNALS["hold"]
+
+    def _calculateTiSignalSeries(self):
+        """
+        Calculates the trading signal for each row of the calculated technical
+        indicator, in a vectorized way.
+
+        Returns:
+            numpy.ndarray: The numeric value of the trading signal for each row.
+        """
+
+        # Short term moving average for determining the bottoming and peaking
+        ema = (
+            self._ti_data["mom"]
+            .ewm(span=9, min_periods=9, adjust=False)
+            .mean()
+            .to_numpy(dtype=np.float64)
+        )
+        ema_prev = self._shiftValues(ema)
+
+        mom = self._ti_data["mom"].to_numpy(dtype=np.float64)
+        mom_prev = self._shiftValues(mom)
+
+        return self._selectSignals(
+            [
+                # Indicator value goes above Moving Average
+                ((mom_prev < ema_prev) & (mom > ema), TRADE_SIGNALS["sell"]),
+                # Indicator value goes below Moving Average
+                ((mom_prev > ema_prev) & (mom < ema), TRADE_SIGNALS["buy"]),
+            ],
+            minimum_rows=9,
+        )
@@ -6,12 +6,13 @@ File name: _moving_average.py
     and Variable) technical indicator.
 """
 
-import pandas as pd
+import numpy as np
 
 from ._linear_regression_slope import LinearRegressionSlope
 from ._linear_regression_indicator import LinearRegressionIndicator
 from ._chande_momentum_oscillator import ChandeMomentumOscillator
 from ._technical_indicator import TechnicalIndicator
+from .. import kernels
 from ..utils.constants import TRADE_SIGNALS
 from ..utils.exceptions import (
     NotEnoughInputData,
@@ -41,6 +42,9 @@ class MovingAverage(TechnicalIndicator):
         fill_missing_values (bool, default is True): If set to True, missing
             values in the input data are being filled.
 
+        precision (int, default is 4): The number of decimals the calculated
+            indicator is rounded to. If None, it is not rounded.
+
     Attributes:
         _input_data (pandas.DataFrame): The ``input_data`` after preprocessing.
 
@@ -51,6 +55,10 @@ class MovingAverage(TechnicalIndicator):
 
         _calling_instance (str): The name of the class.
 
+        _state (dict): The state of the calculation after the last row (not
+            rounded ``ma`` of the ``exponential`` moving average), used for
+            updating the indicator with new input data.
+
     Raises:
         WrongTypeForInputParameter: Input argument has wrong type.
         WrongValueForInputParameter: Unsupported value for input argument.
@@ -59,7 +67,9 @@ class MovingAverage(TechnicalIndicator):
         ValueError: Value error occurred when validating the ``input_data``.
     """
 
-    def __init__(self, input_data, period=20, ma_type="simple", fill_missing_values=True):
+    def __init__(
+        self, input_data, period=20, ma_type="simple", fill_missing_values=True, precision=4
+    ):
         # Validate and store if needed, the input parameters
         if isinstance(period, int):
             if ma_type == "time_series" and period < 2:
@@ -89,6 +99,7 @@ class MovingAverage(TechnicalIndicator):
             calling_instance=self.__class__.__name__,
             input_data=input_data,
             fill_missing_values=fill_missing_values,
+            precision=precision,
         )
 
     def _calculateTi(self):
@@ -111,69 +122,113 @@ class MovingAverage(TechnicalIndicator):
         if len(self._input_data.index) < 22 and self._ma_type == "variable":
             raise NotEnoughInputData("Moving Average (variable)", 22, len(self._input_data.index))
 
-        ma = pd.DataFrame(
-            index=self._input_data.index,
-            columns=["ma-" + self._ma_type],
-            data=None,
-            dtype="float64",
+        arguments = {}
+
+        if self._ma_type == "time_series":
+            # Similar to Time Series Forecast
+            arguments["slope"] = self._indicatorData(LinearRegressionSlope, period=self._period)[
+                "lrs"
+            ].to_numpy(dtype=np.float64)
+
+            arguments["value"] = self._indicatorData(
+                LinearRegressionIndicator, period=self._period
+            )["lri"].to_numpy(dtype=np.float64)
+
+        elif self._ma_type == "variable":
+            # Calculate CMO indicator for 9 periods by default
+            arguments["cmo"] = self._indicatorData(ChandeMomentumOscillator, period=9)[
+                "cmo"
+            ].to_numpy(dtype=np.float64)
+
+        # State of the exponential moving average (last not rounded value),
+        # used for updating the indicator with new input data
+        self._state = {}
+
+        return self._kernelData(
+            ["ma-" + self._ma_type],
+            kernels.movingAverage(
+                *self._inputArrays("close"),
+                self._period,
+                self._ma_type,
+                state=self._state,
+                **arguments,
+            ),
         )
 
-        if self._ma_type == "simple":
-            ma["ma-" + self._ma_type] = self._input_data.rolling(
-                window=self._period, min_periods=self._period
-            ).mean()
+    def _calculateTiPanel(self, panel_data):
+        """
+        Calculates the technical indicator for a panel of symbols at once.
+        Supported for the ``simple``, ``exponential`` and ``triangular``
+        moving averages.
 
-        elif self._ma_type == "exponential":
-            ma["ma-" + self._ma_type] = self._input_data.ewm(
-                span=self._period, min_periods=self._period, adjust=False
-            ).mean()
+        Args:
+            panel_data (dict): The input data of all the symbols. Keys are the
+                required input data columns and values are pandas.DataFrame
+                objects with one column for each symbol.
 
-        elif self._ma_type == "time_series":
-            # Similar to Time Series Forecast
-            ma.iloc[self._period - 1 :, 0] = (
-                pd.concat(
-                    objs=[
-                        LinearRegressionSlope(
-                            input_data=self._input_data, period=self._period
-                        ).getTiData(),
-                        LinearRegressionIndicator(
-                            input_data=self._input_data, period=self._period
-                        ).getTiData(),
-                    ],
-                    axis=1,
-                )
-                .sum(axis=1)
-                .iloc[self._period - 1 :]
-            )
+        Returns:
+            dict or None: Keys are the indicator columns (``ma``) and values
+            are pandas.DataFrame objects with one column for each symbol.
+            None when the moving average type is not supported.
+        """
+
+        if self._ma_type not in ["simple", "exponential", "triangular"]:
+            return None
+
+        close = panel_data["close"]
+
+        ma = kernels.movingAverage(
+            close.to_numpy(dtype=self._float_dtype), self._period, self._ma_type
+        )
+
+        return self._panelData(["ma-" + self._ma_type], ma, close.index, close.columns)
+
+    def _updateTi(self, new_input_data):
+        """
+        Calculates the technical indicator after new rows have been appended
+        to the input data. Only the new rows are calculated for the
+        ``simple``, ``exponential`` and ``triangular`` moving averages. The
+        rolling means of the ``simple`` and ``triangular`` moving averages
+        start from the last known input rows, with different rounding errors
+        than a calculation of all the rows, so the updated rows can differ
+        from it in the last decimal.
+
+        Args:
+            new_input_data (pandas.DataFrame): The new rows of the input data,
+                after preprocessing.
+
+        Returns:
+            pandas.DataFrame: The calculated indicator for the new rows. Index
+            is of type ``pandas.DatetimeIndex``. It contains one column,
+            the ``ma``.
+        """
+
+        rows = len(new_input_data.index)
+
+        if self._ma_type == "simple":
+            # Only the last period-1 known input rows are needed
+            close = self._inputArrays("close", rows=self._period - 1 + rows)
 
         elif self._ma_type == "triangular":
-            # Simple Moving Average of the Simple Moving Average
-            ma["ma-" + self._ma_type] = (
-                self._input_data.rolling(window=self._period, min_periods=self._period)
-                .mean()
-                .rolling(window=self._period, min_periods=self._period)
-                .mean()
-            )
+            # Only the last 2*(period-1) known input rows are needed
+            close = self._inputArrays("close", rows=2 * (self._period - 1) + rows)
 
-        elif self._ma_type == "variable":
-            # Calculate CMO indicator for 9 periods by default
-            cmo = ChandeMomentumOscillator(input_data=self._input_data, period=9).getTiData()
+        elif self._ma_type == "exponential":
+            # Continued from the last calculated value
+            close = self._inputArrays("close", rows=rows)
 
-            # Calculate Volatility Ratio
-            vr = (cmo.iloc[:] / 100).abs()
+        else:
+            return super()._updateTi(new_input_data)
 
-            # Calculate Scaling Multiplier
-            sm = 2 / (self._period + 1)
+        # The state is copied, the stored one can be shared with the result
+        # cache
+        state = dict(self._state)
 
-            # By default we start from period 22
-            ma.loc[ma.index[21], "ma-" + self._ma_type] = self._input_data["close"].iat[21]
+        ma = kernels.movingAverage(*close, self._period, self._ma_type, state=state)[-rows:]
 
-            for i in range(22, len(self._input_data.index)):
-                ma.loc[ma.index[i], "ma-" + self._ma_type] = (
-                    sm * self._input_data["close"].iat[i] * vr.iat[i, 0]
-                ) + (1 - (sm * vr.iat[i, 0])) * ma["ma-" + self._ma_type].iat[i - 1]
+        self._state = state
 
-        return ma.round(4)
+        return self._kernelData(["ma-" + self._ma_type], ma, index=new_input_data.index)
 
     def getTiSignal(self):
         """
@@ -194,3 +249,24 @@ class MovingAverage(TechnicalIndicator):
             return TRADE_SIGNALS["buy"]
 
         return TRADE_SIGNALS["hold"]
+
+    def _calculateTiSignalSeries(self):
+        """
+        Calculates the trading signal for each row of the calculated technical
+        indicator, in a vectorized way.
+
+        Returns:
+            numpy.ndarray: The numeric value of the trading signal for each row.
+        """
+
+        close = self._signalInput("close")
+
+        return self._selectSignals(
+            [
+                # Close price goes above Moving Average
+                (
+                    close > self._ti_data["ma-" + self._ma_type].to_numpy(dtype=np.float64),
+                    TRADE_SIGNALS["buy"],
+                ),
+            ],
+        )
@@ -5,11 +5,11 @@ File name: _moving_average_convergence_divergence.py
     Implements the Moving Average Convergence Divergence technical indicator.
 """
 
-import pandas as pd
+import numpy as np
 
 from ._technical_indicator import TechnicalIndicator
+from .. import kernels
 from ..utils.constants import TRADE_SIGNALS
-from ..utils.exceptions import NotEnoughInputData
 
 
 class MovingAverageConvergenceDivergence(TechnicalIndicator):
@@ -24,6 +24,9 @@ class MovingAverageConvergenceDivergence(TechnicalIndicator):
         fill_missing_values (bool, default=True): If set to True, missing
             values in the input data are being filled.
 
+        precision (int, default=4): The number of decimals the calculated
+            indicator is rounded to. If None, it is not rounded.
+
     Attributes:
         _input_data (pandas.DataFrame): The ``input_data`` after preprocessing.
 
@@ -35,6 +38,11 @@ class MovingAverageConvergenceDivergence(TechnicalIndicator):
 
         _calling_instance (str): The name of the class.
 
+        _state (dict): The state of the calculation after the last row (state
+            of the 12 and 26 periods exponential moving averages and of the
+            ``signal_line``), used for updating the indicator with new input
+            data.
+
     Raises:
         WrongTypeForInputParameter: Input argument has wrong type.
         WrongValueForInputParameter: Unsupported value for input argument.
@@ -43,12 +51,13 @@ class MovingAverageConvergenceDivergence(TechnicalIndicator):
         ValueError: Value error occurred when validating the ``input_data``.
     """
 
-    def __init__(self, input_data, fill_missing_values=True):
+    def __init__(self, input_data, fill_missing_values=True, precision=4):
         # Control is passing to the parent class
         super().__init__(
             calling_instance=self.__class__.__name__,
             input_data=input_data,
             fill_missing_values=fill_missing_values,
+            precision=precision,
         )
 
     def _calculateTi(self):
@@ -65,27 +74,69 @@ class MovingAverageConvergenceDivergence(TechnicalIndicator):
             NotEnoughInputData: Not enough data for calculating the indicator.
         """
 
-        # Not enough data, 26 periods are required
-        if len(self._input_data.index) < 26:
-            raise NotEnoughInputData(
-                "Moving Average Convergence Divergence", 26, len(self._input_data.index)
-            )
+        # State of the exponential moving averages, used for updating the
+        # indicator with new input data
+        self._state = {}
+
+        return self._kernelData(
+            ["macd", "signal_line"],
+            kernels.movingAverageConvergenceDivergence(
+                *self._inputArrays("close"), decimals=self._precision, state=self._state
+            ),
+        )
+
+    def _calculateTiPanel(self, panel_data):
+        """
+        Calculates the technical indicator for a panel of symbols at once.
+
+        Args:
+            panel_data (dict): The input data of all the symbols. Keys are the
+                required input data columns and values are pandas.DataFrame
+                objects with one column for each symbol.
 
-        # Calculate Exponential Moving Average for 26 periods
-        ema_26 = self._input_data.ewm(span=26, min_periods=26, adjust=False).mean().round(4)
+        Returns:
+            dict: Keys are the indicator columns (``macd`` and
+            ``signal_line``) and values are pandas.DataFrame objects with one
+            column for each symbol.
+        """
 
-        # Calculate Exponential Moving Average for 12 periods
-        ema_12 = self._input_data.ewm(span=12, min_periods=12, adjust=False).mean().round(4)
+        close = panel_data["close"]
 
-        # Calculate MACD
-        macd = ema_12 - ema_26
-        macd = pd.concat(
-            [macd, macd.ewm(span=9, min_periods=9, adjust=False).mean()], axis=1
-        ).round(4)
+        macd = kernels.movingAverageConvergenceDivergence(
+            close.to_numpy(dtype=self._float_dtype), decimals=self._precision
+        )
 
-        macd.columns = ["macd", "signal_line"]
+        return self._panelData(["macd", "signal_line"], macd, close.index, close.columns)
 
-        return macd
+    def _updateTi(self, new_input_data):
+        """
+        Calculates the technical indicator after new rows have been appended
+        to the input data. Only the new rows are calculated, continuing the
+        exponential moving averages from their state.
+
+        Args:
+            new_input_data (pandas.DataFrame): The new rows of the input data,
+                after preprocessing.
+
+        Returns:
+            pandas.DataFrame: The calculated indicator for the new rows. Index
+            is of type ``pandas.DatetimeIndex``. It contains two columns, the
+            ``macd`` and the ``signal_line``.
+        """
+
+        # The state is copied, the stored one can be shared with the result
+        # cache
+        state = dict(self._state)
+
+        macd = kernels.movingAverageConvergenceDivergence(
+            *self._inputArrays("close", rows=len(new_input_data.index)),
+            decimals=self._precision,
+            state=state,
+        )
+
+        self._state = state
+
+        return self._kernelData(["macd", "signal_line"], macd, index=new_input_data.index)
 
     def getTiSignal(self):
         """
@@ -124,3 +175,32 @@ class MovingAverageConvergenceDivergence(TechnicalIndicator):
             return TRADE_SIGNALS["buy"]
 
         return TRADE_SIGNALS["hold"]
+
+    def _calculateTiSignalSeries(self):
+        """
+        Calculates the trading signal for each row of the calculated technical
+        indicator, in a vectorized way.
+
+        Returns:
+            numpy.ndarray: The numeric value of the trading signal for each row.
+        """
+
+        macd = self._ti_data["macd"].to_numpy(dtype=np.float64)
+        macd_prev = self._shiftValues(macd)
+
+        signal_line = self._ti_data["signal_line"].to_numpy(dtype=np.float64)
+        signal_line_prev = self._shiftValues(signal_line)
+
+        return self._selectSignals(
+            [
+                # MACD rises above zero
+                ((macd_prev < 0) & (macd > 0), TRADE_SIGNALS["buy"]),
+                # MACD fall below zero
+                ((macd_prev > 0) & (macd < 0), TRADE_SIGNALS["sell"]),
+                # MACD falls below Signal Line
+                ((macd_prev > signal_line_prev) & (macd < signal_line), TRADE_SIGNALS["sell"]),
+                # MACD rises above Signal Line
+                ((macd_prev < signal_line_prev) & (macd > signal_line), TRADE_SIGNALS["buy"]),
+            ],
+            minimum_rows=2,
+        )
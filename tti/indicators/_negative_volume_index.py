@@ -5,11 +5,11 @@ File name: _negative_volume_index.py
     Implements the Negative Volume Index technical indicator.
 """
 
-import pandas as pd
+import numpy as np
 
 from ._technical_indicator import TechnicalIndicator
+from .. import kernels
 from ..utils.constants import TRADE_SIGNALS
-from ..utils.exceptions import NotEnoughInputData
 
 
 class NegativeVolumeIndex(TechnicalIndicator):
@@ -24,6 +24,9 @@ class NegativeVolumeIndex(TechnicalIndicator):
         fill_missing_values (bool, default=True): If set to True, missing
             values in the input data are being filled.
 
+        precision (int, default=4): The number of decimals the calculated
+            indicator is rounded to. If None, it is not rounded.
+
     Attributes:
         _input_data (pandas.DataFrame): The ``input_data`` after preprocessing.
 
@@ -42,12 +45,13 @@ class NegativeVolumeIndex(TechnicalIndicator):
         ValueError: Value error occurred when validating the ``input_data``.
     """
 
-    def __init__(self, input_data, fill_missing_values=True):
+    def __init__(self, input_data, fill_missing_values=True, precision=4):
         # Control is passing to the parent class
         super().__init__(
             calling_instance=self.__class__.__name__,
             input_data=input_data,
             fill_missing_values=fill_missing_values,
+            precision=precision,
         )
 
     def _calculateTi(self):
@@ -63,26 +67,10 @@ class NegativeVolumeIndex(TechnicalIndicator):
             NotEnoughInputData: Not enough data for calculating the indicator.
         """
 
-        # Not enough data
-        if len(self._input_data.index) < 2:
-            raise NotEnoughInputData("Negative Volume Index", 2, len(self._input_data.index))
-
-        nvi = pd.DataFrame(
-            index=self._input_data.index, columns=["nvi"], data=None, dtype="float64"
+        return self._kernelData(
+            ["nvi"], kernels.negativeVolumeIndex(*self._inputArrays("close", "volume"))
         )
 
-        nvi.loc[nvi.index[0], "nvi"] = 1000.0
-
-        for i in range(1, len(self._input_data.index)):
-            if self._input_data["volume"].iat[i] < self._input_data["volume"].iat[i - 1]:
-                nvi.loc[nvi.index[i], "nvi"] = nvi["nvi"].iat[i - 1] + (
-                    self._input_data["close"].iat[i] - self._input_data["close"].iat[i - 1]
-                ) * (nvi["nvi"].iat[i - 1] / self._input_data["close"].iat[i - 1])
-            else:
-                nvi.loc[nvi.index[i], "nvi"] = nvi["nvi"].iat[i - 1]
-
-        return nvi.round(4)
-
     def getTiSignal(self):
         """
         Calculates and returns the trading signal for the calculated technical
@@ -104,3 +92,25 @@ class NegativeVolumeIndex(TechnicalIndicator):
             return TRADE_SIGNALS["buy"]
 
         return TRADE_SIGNALS["hold"]
+
+    def _calculateTiSignalSeries(self):
+        """
+        Calculates the trading signal for each row of the calculated technical
+        indicator, in a vectorized way.
+
+        Returns:
+            numpy.ndarray: The numeric value of the trading signal for each row.
+        """
+
+        # Yearly moving average of the indicator (255 periods)
+        ema = (
+            self._ti_data["nvi"]
+            .ewm(span=255, min_periods=255, adjust=False)
+            .mean()
+            .to_numpy(dtype=np.float64)
+        )
+
+        return self._selectSignals(
+            [(self._ti_data["nvi"].to_numpy(dtype=np.float64) > ema, TRADE_SIGNALS["buy"])],
+            minimum_rows=255,
+        )
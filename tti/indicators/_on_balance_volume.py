@@ -5,9 +5,10 @@ File name: _on_balance_volume.py
     Implements the On Balance Volume technical indicator.
 """
 
-import pandas as pd
+import numpy as np
 
 from ._technical_indicator import TechnicalIndicator
+from .. import kernels
 from ..utils.constants import TRADE_SIGNALS
 
 
@@ -23,6 +24,9 @@ class OnBalanceVolume(TechnicalIndicator):
         fill_missing_values (bool, default=True): If set to True, missing
             values in the input data are being filled.
 
+        precision (int, default=4): The number of decimals the calculated
+            indicator is rounded to. If None, it is not rounded.
+
     Attributes:
         _input_data (pandas.DataFrame): The ``input_data`` after preprocessing.
 
@@ -33,6 +37,10 @@ class OnBalanceVolume(TechnicalIndicator):
 
         _calling_instance (str): The name of the class.
 
+        _state (dict): The state of the calculation after the last row (last
+            close and ``obv``), used for updating the indicator with new input
+            data.
+
     Raises:
         WrongTypeForInputParameter: Input argument has wrong type.
         WrongValueForInputParameter: Unsupported value for input argument.
@@ -41,12 +49,13 @@ class OnBalanceVolume(TechnicalIndicator):
         ValueError: Value error occurred when validating the ``input_data``.
     """
 
-    def __init__(self, input_data, fill_missing_values=True):
+    def __init__(self, input_data, fill_missing_values=True, precision=4):
         # Control is passing to the parent class
         super().__init__(
             calling_instance=self.__class__.__name__,
             input_data=input_data,
             fill_missing_values=fill_missing_values,
+            precision=precision,
         )
 
     def _calculateTi(self):
@@ -59,18 +68,63 @@ class OnBalanceVolume(TechnicalIndicator):
             ``pandas.DatetimeIndex``. It contains one column, the ``obv``.
         """
 
-        obv = pd.DataFrame(index=self._input_data.index, columns=["obv"], data=0, dtype="int64")
+        # Last close and On Balance Volume total, they are the state used for
+        # updating the indicator with new input data
+        self._state = {}
+
+        return self._integerData(
+            kernels.onBalanceVolume(*self._inputArrays("close", "volume"), state=self._state),
+            self._input_data.index,
+        )
+
+    def _updateTi(self, new_input_data):
+        """
+        Calculates the technical indicator after new rows have been appended
+        to the input data. Only the new rows are calculated, continuing from
+        the last On Balance Volume total.
+
+        Args:
+            new_input_data (pandas.DataFrame): The new rows of the input data,
+                after preprocessing.
 
-        inc = self._input_data["close"] > self._input_data["close"].shift(1)
-        dec = self._input_data["close"] < self._input_data["close"].shift(1)
+        Returns:
+            pandas.DataFrame: The calculated indicator for the new rows. Index
+            is of type ``pandas.DatetimeIndex``. It contains one column,
+            the ``obv``.
+        """
 
-        obv.loc[inc, "obv"] = self._input_data["volume"]
+        # The state is copied, the stored one can be shared with the result
+        # cache
+        state = dict(self._state)
+
+        obv = kernels.onBalanceVolume(
+            *self._inputArrays("close", "volume", rows=len(new_input_data.index)), state=state
+        )
 
-        obv.loc[dec, "obv"] = -self._input_data["volume"]
+        self._state = state
+
+        return self._integerData(obv, new_input_data.index)
+
+    def _integerData(self, obv, index):
+        """
+        Builds the calculated indicator from the On Balance Volume values. The
+        values are integers, as the volume, unless a value is missing or the
+        volume is not integer (then they are rounded to the precision).
 
-        obv["obv"] = obv["obv"].cumsum()
+        Args:
+            obv (numpy.ndarray): The On Balance Volume values.
 
-        return obv
+            index (pandas.DatetimeIndex): The index of the values.
+
+        Returns:
+            pandas.DataFrame: The calculated indicator.
+        """
+
+        integer = np.all(obv == np.trunc(obv))
+
+        return self._kernelData(["obv"], obv, rounded=not integer, index=index).astype(
+            "int64" if integer else self._float_dtype
+        )
 
     def getTiSignal(self):
         """
@@ -107,3 +161,32 @@ class OnBalanceVolume(TechnicalIndicator):
 
         else:
             return TRADE_SIGNALS["hold"]
+
+    def _calculateTiSignalSeries(self):
+        """
+        Calculates the trading signal for each row of the calculated technical
+        indicator, in a vectorized way.
+
+        Returns:
+            numpy.ndarray: The numeric value of the trading signal for each row.
+        """
+
+        obv = self._ti_data["obv"].to_numpy(dtype=np.float64)
+        obv_prev = self._shiftValues(obv, periods=1)
+        obv_prev_2 = self._shiftValues(obv, periods=2)
+
+        return self._selectSignals(
+            [
+                # Warning for a downward breakout
+                (
+                    (obv_prev_2 > obv_prev) & (obv_prev > obv),
+                    TRADE_SIGNALS["buy"],
+                ),
+                # Warning for a upward breakout
+                (
+                    (obv_prev_2 < obv_prev) & (obv_prev < obv),
+                    TRADE_SIGNALS["sell"],
+                ),
+            ],
+            minimum_rows=3,
+        )
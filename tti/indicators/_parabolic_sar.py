@@ -5,11 +5,11 @@ File name: _parabolic_sar.py
     Implements the Parabolic SAR technical indicator.
 """
 
-import pandas as pd
+import numpy as np
 
 from ._technical_indicator import TechnicalIndicator
+from .. import kernels
 from ..utils.constants import TRADE_SIGNALS
-from ..utils.exceptions import NotEnoughInputData
 
 
 class ParabolicSAR(TechnicalIndicator):
@@ -24,6 +24,9 @@ class ParabolicSAR(TechnicalIndicator):
         fill_missing_values (bool, default=True): If set to True, missing
             values in the input data are being filled.
 
+        precision (int, default=4): The number of decimals the calculated
+            indicator is rounded to. If None, it is not rounded.
+
     Attributes:
         _input_data (pandas.DataFrame): The ``input_data`` after preprocessing.
 
@@ -34,6 +37,14 @@ class ParabolicSAR(TechnicalIndicator):
 
         _calling_instance (str): The name of the class.
 
+        _state (dict): The state of the calculation after the last row, used
+            for updating the indicator with new input data. It contains the
+            acceleration factor (``af``), the extreme price of the current
+            position (``ep``, the highest high when `LONG` or the lowest low
+            when `SHORT`), the not rounded ``sar``, the current ``position``
+            (1 for `LONG` or -1 for `SHORT`) and the last two ``high`` and
+            ``low`` prices.
+
     Raises:
         WrongTypeForInputParameter: Input argument has wrong type.
         WrongValueForInputParameter: Unsupported value for input argument.
@@ -42,7 +53,7 @@ class ParabolicSAR(TechnicalIndicator):
         ValueError: Value error occurred when validating the ``input_data``.
     """
 
-    def __init__(self, input_data, fill_missing_values=True):
+    def __init__(self, input_data, fill_missing_values=True, precision=4):
         # Indicator parameters, currently constants but expose to user should
         # be considered.
         self._af_increase = 0.02
@@ -53,6 +64,7 @@ class ParabolicSAR(TechnicalIndicator):
             calling_instance=self.__class__.__name__,
             input_data=input_data,
             fill_missing_values=fill_missing_values,
+            precision=precision,
         )
 
     def _calculateTi(self):
@@ -68,142 +80,51 @@ class ParabolicSAR(TechnicalIndicator):
             NotEnoughInputData: Not enough data for calculating the indicator.
         """
 
-        # Not enough data for calculating SAR
-        if len(self._input_data.index) < 2:
-            raise NotEnoughInputData("Parabolic SAR", 2, len(self._input_data.index))
-
-        sar = pd.DataFrame(
-            index=self._input_data.index, columns=["af", "ep", "sar", "position"], data=None
+        # Acceleration factor, extreme price, SAR and position of the last
+        # row, they are the state used for updating the indicator with new
+        # input data
+        self._state = {}
+
+        return self._kernelData(
+            ["sar"],
+            kernels.parabolicSar(
+                *self._inputArrays("high", "low"),
+                af_increase=self._af_increase,
+                af_max=self._af_max,
+                state=self._state,
+            ),
         )
 
-        position_start_index = 0
-
-        for i in range(len(self._input_data.index)):
-            sar.values[i, :], position_start_index = self._calculateSarRow(
-                current_index=i,
-                position_start_index=position_start_index,
-                previous_sar=sar.values[i - 1, :],
-                position_changed=False,
-            )
-
-        return sar[["sar"]].astype(dtype="float64").round(4)
-
-    def _calculateSarRow(
-        self, current_index, position_start_index, previous_sar=None, position_changed=False
-    ):
+    def _updateTi(self, new_input_data):
         """
-        Calculate SAR in case we are in a `LONG` position.
+        Calculates the technical indicator after new rows have been appended
+        to the input data. Only the new rows are calculated, continuing from
+        the last acceleration factor, extreme price, SAR and position.
 
         Args:
-            current_index (int): The current dataframe index for which the SAR
-                calculation is requested.
-
-            position_start_index (int): The dataframe index (starting from 0)
-                in which the current position was started.
-
-            previous_sar (numpy.ndarray, default is None): The SAR row for the
-                previous period. Is not required when this is the first period
-                of the input data (current_index = 0).
-
-            position_changed (boolean, default is False): Indicates if this is
-                the first calculation for a new position. Is not required when
-                this is the first period of the input data (current_index = 0).
+            new_input_data (pandas.DataFrame): The new rows of the input data,
+                after preprocessing.
 
         Returns:
-            list (af, ep, sar, position):
-                - af (float): Acceleration factor for the current index.
-                - ep (float): Extreme price for the current index.
-                - sar (float): SAR indicator value for the current index.
-                - position (str, one of `LONG`, `SHORT`): The position for
-                    the current index.
-
-            int: Current position start index.
+            pandas.DataFrame: The calculated indicator for the new rows. Index
+            is of type ``pandas.DatetimeIndex``. It contains one column,
+            the ``sar``.
         """
 
-        # In case this is for the first period of the input data, calculation
-        # is based on an initial position assumption (guess the initial
-        #  position by checking the high values direction for the first two
-        #  days)
-        if current_index == 0:
-            af = self._af_increase
-
-            if self._input_data["high"].values[1] > self._input_data["high"].values[0]:
-                position = "LONG"
-                ep = self._input_data["high"].values[0]
-                sar = self._input_data["low"].values[0]
-            else:
-                position = "SHORT"
-                ep = self._input_data["low"].values[0]
-                sar = self._input_data["high"].values[0]
-
-            return [af, ep, sar, position], current_index
-
-        # Check if position changed, so to re-initialize the values
-        if position_changed:
-            af = self._af_increase
-
-            if previous_sar[3] == "LONG":
-                position = "SHORT"
-                ep = self._input_data["low"].values[current_index]
-                sar = self._input_data["high"].values[position_start_index:current_index].max()
-
-            else:
-                position = "LONG"
-                ep = self._input_data["high"].values[current_index]
-                sar = self._input_data["low"].values[position_start_index:current_index].min()
-
-            return [af, ep, sar, position], current_index
-
-        # Calculate Extreme Price, Highest price reached when in current
-        # `LONG` position, or Lowest price reached when in current `SHORT`
-        # position
-        if previous_sar[3] == "LONG":
-            ep = self._input_data["high"].values[position_start_index : current_index + 1].max()
-
-        else:
-            ep = self._input_data["low"].values[position_start_index : current_index + 1].min()
-
-        # Calculate Acceleration Factor, new high is reached when in `LONG` or
-        # new low is reached when in `SHORT`
-        if previous_sar[3] == "LONG" and ep > previous_sar[1]:
-            af = min(self._af_max, previous_sar[0] + self._af_increase)
-
-        elif previous_sar[3] == "SHORT" and ep < previous_sar[1]:
-            af = min(self._af_max, previous_sar[0] + self._af_increase)
-
-        else:
-            af = previous_sar[0]
+        # The state is copied, the stored one can be shared with the result
+        # cache
+        state = dict(self._state)
 
-        # Calculate SAR, when `LONG` not above the two prior lows, when `SHORT`
-        # not below the two prior highs
-        sar = previous_sar[2] + previous_sar[0] * (previous_sar[1] - previous_sar[2])
-
-        if previous_sar[3] == "LONG":
-            sar = min(
-                sar, self._input_data["low"].values[max(0, current_index - 2) : current_index].min()
-            )
+        sar = kernels.parabolicSar(
+            *self._inputArrays("high", "low", rows=len(new_input_data.index)),
+            af_increase=self._af_increase,
+            af_max=self._af_max,
+            state=state,
+        )
 
-        else:
-            sar = max(
-                sar,
-                self._input_data["high"].values[max(0, current_index - 2) : current_index].max(),
-            )
-
-        # Check if position changes
-        if (
-            previous_sar[3] == "SHORT" and self._input_data["high"].values[current_index] > sar
-        ) or (previous_sar[3] == "LONG" and self._input_data["low"].values[current_index] < sar):
-            return self._calculateSarRow(
-                current_index=current_index,
-                position_start_index=position_start_index,
-                previous_sar=previous_sar,
-                position_changed=True,
-            )
+        self._state = state
 
-        else:
-            position = previous_sar[3]
-
-        return [af, ep, sar, position], position_start_index
+        return self._kernelData(["sar"], sar, index=new_input_data.index)
 
     def getTiSignal(self):
         """
@@ -231,3 +152,26 @@ class ParabolicSAR(TechnicalIndicator):
 
         else:
             return TRADE_SIGNALS["hold"]
+
+    def _calculateTiSignalSeries(self):
+        """
+        Calculates the trading signal for each row of the calculated technical
+        indicator, in a vectorized way.
+
+        Returns:
+            numpy.ndarray: The numeric value of the trading signal for each row.
+        """
+
+        close = self._signalInput("close")
+        close_prev = self._shiftValues(close)
+
+        sar = self._ti_data["sar"].to_numpy(dtype=np.float64)
+        sar_prev = self._shiftValues(sar)
+
+        return self._selectSignals(
+            [
+                ((close_prev > sar_prev) & (close < sar), TRADE_SIGNALS["sell"]),
+                ((close_prev < sar_prev) & (close > sar), TRADE_SIGNALS["buy"]),
+            ],
+            minimum_rows=2,
+        )
@@ -5,9 +5,10 @@ File name: _performance.py
     Implements the Performance technical indicator.
 """
 
-import pandas as pd
+import numpy as np
 
 from ._technical_indicator import TechnicalIndicator
+from .. import kernels
 from ..utils.constants import TRADE_SIGNALS
 from ..utils.exceptions import WrongTypeForInputParameter, WrongValueForInputParameter
 
@@ -33,6 +34,9 @@ class Performance(TechnicalIndicator):
         fill_missing_values (bool, default=True): If set to True, missing
             values in the input data are being filled.
 
+        precision (int, default=4): The number of decimals the calculated
+            indicator is rounded to. If None, it is not rounded.
+
     Attributes:
         _input_data (pandas.DataFrame): The ``input_data`` after preprocessing.
 
@@ -52,7 +56,7 @@ class Performance(TechnicalIndicator):
         ValueError: Value error occurred when validating the ``input_data``.
     """
 
-    def __init__(self, input_data, mode="LONG", target=0.05, fill_missing_values=True):
+    def __init__(self, input_data, mode="LONG", target=0.05, fill_missing_values=True, precision=4):
         # Validate and store if needed, the input parameters
         if isinstance(mode, str):
             if mode in ["LONG", "SHORT"]:
@@ -78,6 +82,7 @@ class Performance(TechnicalIndicator):
             calling_instance=self.__class__.__name__,
             input_data=input_data,
             fill_missing_values=fill_missing_values,
+            precision=precision,
         )
 
     def _calculateTi(self):
@@ -91,21 +96,11 @@ class Performance(TechnicalIndicator):
             the ``target_<mode>``.
         """
 
-        prf = pd.DataFrame(
-            index=self._input_data.index,
-            columns=["prf", "target_" + self._mode],
-            data=None,
-            dtype="float64",
+        return self._kernelData(
+            ["prf", "target_" + self._mode],
+            kernels.performance(*self._inputArrays("close"), self._target),
         )
 
-        prf["prf"] = (
-            self._input_data["close"] - self._input_data["close"].iat[0]
-        ) / self._input_data["close"].iat[0]
-
-        prf["target_" + self._mode] = self._target
-
-        return prf.round(4)
-
     def getTiSignal(self):
         """
         Calculates and returns the trading signal for the calculated technical
@@ -127,3 +122,27 @@ class Performance(TechnicalIndicator):
             return TRADE_SIGNALS["buy"]
 
         return TRADE_SIGNALS["hold"]
+
+    def _calculateTiSignalSeries(self):
+        """
+        Calculates the trading signal for each row of the calculated technical
+        indicator, in a vectorized way.
+
+        Returns:
+            numpy.ndarray: The numeric value of the trading signal for each row.
+        """
+
+        prf = self._ti_data.iloc[:, 0].to_numpy(dtype=np.float64)
+
+        return self._selectSignals(
+            [
+                (
+                    np.full(len(prf), self._mode == "LONG") & (prf >= self._target),
+                    TRADE_SIGNALS["sell"],
+                ),
+                (
+                    np.full(len(prf), self._mode == "SHORT") & (prf <= self._target),
+                    TRADE_SIGNALS["buy"],
+                ),
+            ],
+        )
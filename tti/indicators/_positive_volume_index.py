@@ -5,11 +5,11 @@ File name: _positive_volume_index.py
     Implements the Positive Volume Index technical indicator.
 """
 
-import pandas as pd
+import numpy as np
 
 from ._technical_indicator import TechnicalIndicator
+from .. import kernels
 from ..utils.constants import TRADE_SIGNALS
-from ..utils.exceptions import NotEnoughInputData
 
 
 class PositiveVolumeIndex(TechnicalIndicator):
@@ -24,6 +24,9 @@ class PositiveVolumeIndex(TechnicalIndicator):
         fill_missing_values (bool, default=True): If set to True, missing
             values in the input data are being filled.
 
+        precision (int, default=4): The number of decimals the calculated
+            indicator is rounded to. If None, it is not rounded.
+
     Attributes:
         _input_data (pandas.DataFrame): The ``input_data`` after preprocessing.
 
@@ -42,12 +45,13 @@ class PositiveVolumeIndex(TechnicalIndicator):
         ValueError: Value error occurred when validating the ``input_data``.
     """
 
-    def __init__(self, input_data, fill_missing_values=True):
+    def __init__(self, input_data, fill_missing_values=True, precision=4):
         # Control is passing to the parent class
         super().__init__(
             calling_instance=self.__class__.__name__,
             input_data=input_data,
             fill_missing_values=fill_missing_values,
+            precision=precision,
         )
 
     def _calculateTi(self):
@@ -63,26 +67,10 @@ class PositiveVolumeIndex(TechnicalIndicator):
             NotEnoughInputData: Not enough data for calculating the indicator.
         """
 
-        # Not enough data
-        if len(self._input_data.index) < 2:
-            raise NotEnoughInputData("Positive Volume Index", 2, len(self._input_data.index))
-
-        pvi = pd.DataFrame(
-            index=self._input_data.index, columns=["pvi"], data=None, dtype="float64"
+        return self._kernelData(
+            ["pvi"], kernels.positiveVolumeIndex(*self._inputArrays("close", "volume"))
         )
 
-        pvi.loc[pvi.index[0], "pvi"] = 1000.0
-
-        for i in range(1, len(self._input_data.index)):
-            if self._input_data["volume"].iat[i] > self._input_data["volume"].iat[i - 1]:
-                pvi.loc[pvi.index[i], "pvi"] = pvi["pvi"].iat[i - 1] + (
-                    self._input_data["close"].iat[i] - self._input_data["close"].iat[i - 1]
-                ) * (pvi["pvi"].iat[i - 1] / self._input_data["close"].iat[i - 1])
-            else:
-                pvi.loc[pvi.index[i], "pvi"] = pvi["pvi"].iat[i - 1]
-
-        return pvi.round(4)
-
     def getTiSignal(self):
         """
         Calculates and returns the trading signal for the calculated technical
@@ -111,3 +99,32 @@ class PositiveVolumeIndex(TechnicalIndicator):
             return TRADE_SIGNALS["sell"]
 
         return TRADE_SIGNALS["hold"]
+
+    def _calculateTiSignalSeries(self):
+        """
+        Calculates the trading signal for each row of the calculated technical
+        indicator, in a vectorized way.
+
+        Returns:
+            numpy.ndarray: The numeric value of the trading signal for each row.
+        """
+
+        # Yearly moving average of the indicator (255 periods)
+        ema = (
+            self._ti_data["pvi"]
+            .ewm(span=255, min_periods=255, adjust=False)
+            .mean()
+            .to_numpy(dtype=np.float64)
+        )
+        ema_prev = self._shiftValues(ema)
+
+        pvi = self._ti_data["pvi"].to_numpy(dtype=np.float64)
+        pvi_prev = self._shiftValues(pvi)
+
+        return self._selectSignals(
+            [
+                ((pvi_prev < ema_prev) & (pvi > ema), TRADE_SIGNALS["buy"]),
+                ((pvi_prev > ema_prev) & (pvi < ema), TRADE_SIGNALS["sell"]),
+            ],
+            minimum_rows=255,
+        )
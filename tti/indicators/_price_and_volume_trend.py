@@ -5,11 +5,11 @@ File name: _price_and_volume_trend.py
     Implements the Price And Volume Trend technical indicator.
 """
 
-import pandas as pd
+import numpy as np
 
 from ._technical_indicator import TechnicalIndicator
+from .. import kernels
 from ..utils.constants import TRADE_SIGNALS
-from ..utils.exceptions import NotEnoughInputData
 
 
 class PriceAndVolumeTrend(TechnicalIndicator):
@@ -24,6 +24,9 @@ class PriceAndVolumeTrend(TechnicalIndicator):
         fill_missing_values (bool, default=True): If set to True, missing
             values in the input data are being filled.
 
+        precision (int, default=4): The number of decimals the calculated
+            indicator is rounded to. If None, it is not rounded.
+
     Attributes:
         _input_data (pandas.DataFrame): The ``input_data`` after preprocessing.
 
@@ -42,12 +45,13 @@ class PriceAndVolumeTrend(TechnicalIndicator):
         ValueError: Value error occurred when validating the ``input_data``.
     """
 
-    def __init__(self, input_data, fill_missing_values=True):
+    def __init__(self, input_data, fill_missing_values=True, precision=4):
         # Control is passing to the parent class
         super().__init__(
             calling_instance=self.__class__.__name__,
             input_data=input_data,
             fill_missing_values=fill_missing_values,
+            precision=precision,
         )
 
     def _calculateTi(self):
@@ -63,23 +67,10 @@ class PriceAndVolumeTrend(TechnicalIndicator):
             NotEnoughInputData: Not enough data for calculating the indicator.
         """
 
-        # Not enough data
-        if len(self._input_data.index) < 2:
-            raise NotEnoughInputData("Price and Volume Trend", 2, len(self._input_data.index))
-
-        pvt = pd.DataFrame(
-            index=self._input_data.index, columns=["pvt"], data=None, dtype="float64"
+        return self._kernelData(
+            ["pvt"], kernels.priceAndVolumeTrend(*self._inputArrays("close", "volume"))
         )
 
-        pvt.loc[pvt.index[0], "pvt"] = 0.0
-
-        for i in range(1, len(self._input_data.index)):
-            pvt.loc[pvt.index[i], "pvt"] = pvt["pvt"].iat[i - 1] + (
-                self._input_data["close"].iat[i] - self._input_data["close"].iat[i - 1]
-            ) * (self._input_data["volume"].iat[i] / self._input_data["close"].iat[i - 1])
-
-        return pvt.round(4)
-
     def getTiSignal(self):
         """
         Calculates and returns the trading signal for the calculated technical
@@ -115,3 +106,32 @@ class PriceAndVolumeTrend(TechnicalIndicator):
 
         else:
             return TRADE_SIGNALS["hold"]
+
+    def _calculateTiSignalSeries(self):
+        """
+        Calculates the trading signal for each row of the calculated technical
+        indicator, in a vectorized way.
+
+        Returns:
+            numpy.ndarray: The numeric value of the trading signal for each row.
+        """
+
+        pvt = self._ti_data["pvt"].to_numpy(dtype=np.float64)
+        pvt_prev = self._shiftValues(pvt, periods=1)
+        pvt_prev_2 = self._shiftValues(pvt, periods=2)
+
+        return self._selectSignals(
+            [
+                # Warning for a downward breakout
+                (
+                    (pvt_prev_2 > pvt_prev) & (pvt_prev > pvt),
+                    TRADE_SIGNALS["buy"],
+                ),
+                # Warning for a upward breakout
+                (
+                    (pvt_prev_2 < pvt_prev) & (pvt_prev < pvt),
+                    TRADE_SIGNALS["sell"],
+                ),
+            ],
+            minimum_rows=3,
+        )
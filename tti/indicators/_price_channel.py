@@ -5,12 +5,12 @@ File name: _price_channel.py
     Implements the Price Channel technical indicator.
 """
 
-import pandas as pd
+import numpy as np
 
 from ._technical_indicator import TechnicalIndicator
+from .. import kernels
 from ..utils.constants import TRADE_SIGNALS
 from ..utils.exceptions import (
-    NotEnoughInputData,
     WrongTypeForInputParameter,
     WrongValueForInputParameter,
 )
@@ -31,6 +31,9 @@ class PriceChannel(TechnicalIndicator):
         fill_missing_values (bool, default=True): If set to True, missing
             values in the input data are being filled.
 
+        precision (int, default=4): The number of decimals the calculated
+            indicator is rounded to. If None, it is not rounded.
+
     Attributes:
         _input_data (pandas.DataFrame): The ``input_data`` after preprocessing.
 
@@ -50,7 +53,7 @@ class PriceChannel(TechnicalIndicator):
         ValueError: Value error occurred when validating the ``input_data``.
     """
 
-    def __init__(self, input_data, period=5, fill_missing_values=True):
+    def __init__(self, input_data, period=5, fill_missing_values=True, precision=4):
         # Validate and store if needed, the input parameters
         if isinstance(period, int):
             if period > 0:
@@ -65,6 +68,7 @@ class PriceChannel(TechnicalIndicator):
             calling_instance=self.__class__.__name__,
             input_data=input_data,
             fill_missing_values=fill_missing_values,
+            precision=precision,
         )
 
     def _calculateTi(self):
@@ -81,33 +85,16 @@ class PriceChannel(TechnicalIndicator):
             NotEnoughInputData: Not enough data for calculating the indicator.
         """
 
-        # Not enough data
-        if len(self._input_data.index) < self._period:
-            raise NotEnoughInputData("Price Channel", self._period, len(self._input_data.index))
-
-        pch = pd.DataFrame(
-            index=self._input_data.index,
-            columns=["highest_high", "lowest_low"],
-            data=None,
-            dtype="float64",
-        )
-
-        pch["highest_high"] = (
-            self._input_data["high"]
-            .rolling(window=self._period, min_periods=self._period)
-            .max()
-            .shift(1)
+        return self._kernelData(
+            ["highest_high", "lowest_low"],
+            kernels.priceChannel(
+                *self._inputArrays("high", "low"),
+                self._period,
+                highest_high=self._highestHigh(self._period),
+                lowest_low=self._lowestLow(self._period),
+            ),
         )
 
-        pch["lowest_low"] = (
-            self._input_data["low"]
-            .rolling(window=self._period, min_periods=self._period)
-            .min()
-            .shift(1)
-        )
-
-        return pch.round(4)
-
     def getTiSignal(self):
         """
         Calculates and returns the trading signal for the calculated technical
@@ -132,3 +119,29 @@ class PriceChannel(TechnicalIndicator):
 
         else:
             return TRADE_SIGNALS["hold"]
+
+    def _calculateTiSignalSeries(self):
+        """
+        Calculates the trading signal for each row of the calculated technical
+        indicator, in a vectorized way.
+
+        Returns:
+            numpy.ndarray: The numeric value of the trading signal for each row.
+        """
+
+        close = self._signalInput("close")
+
+        return self._selectSignals(
+            [
+                # Price goes above highest high
+                (
+                    close > self._ti_data["highest_high"].to_numpy(dtype=np.float64),
+                    TRADE_SIGNALS["sell"],
+                ),
+                # Price goes below lowest low
+                (
+                    close < self._ti_data["lowest_low"].to_numpy(dtype=np.float64),
+                    TRADE_SIGNALS["buy"],
+                ),
+            ],
+        )
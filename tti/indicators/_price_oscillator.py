@@ -5,10 +5,12 @@ File name: _price_oscillator.py
     Implements the Price Oscillator technical indicator.
 """
 
+import numpy as np
+
 from ._technical_indicator import TechnicalIndicator
+from .. import kernels
 from ..utils.constants import TRADE_SIGNALS
 from ..utils.exceptions import (
-    NotEnoughInputData,
     WrongTypeForInputParameter,
     WrongValueForInputParameter,
 )
@@ -31,6 +33,9 @@ class PriceOscillator(TechnicalIndicator):
         fill_missing_values (bool, default=True): If set to True, missing
             values in the input data are being filled.
 
+        precision (int, default=4): The number of decimals the calculated
+            indicator is rounded to. If None, it is not rounded.
+
     Attributes:
         _input_data (pandas.DataFrame): The ``input_data`` after preprocessing.
 
@@ -49,7 +54,7 @@ class PriceOscillator(TechnicalIndicator):
         ValueError: Value error occurred when validating the ``input_data``.
     """
 
-    def __init__(self, input_data, long_ma=30, short_ma=10, fill_missing_values=True):
+    def __init__(self, input_data, long_ma=30, short_ma=10, fill_missing_values=True, precision=4):
         # Validate and store if needed, the input parameters
         if isinstance(long_ma, int):
             if long_ma > 0:
@@ -75,6 +80,7 @@ class PriceOscillator(TechnicalIndicator):
             calling_instance=self.__class__.__name__,
             input_data=input_data,
             fill_missing_values=fill_missing_values,
+            precision=precision,
         )
 
     def _calculateTi(self):
@@ -90,24 +96,10 @@ class PriceOscillator(TechnicalIndicator):
             NotEnoughInputData: Not enough data for calculating the indicator.
         """
 
-        # Not enough data
-        if len(self._input_data.index) < self._long_ma:
-            raise NotEnoughInputData("Price Oscillator", self._long_ma, len(self._input_data.index))
-
-        # Calculate Long Simple Moving Average
-        long_ma = self._input_data.rolling(window=self._long_ma, min_periods=self._long_ma).mean()
-
-        # Calculate Short Simple Moving Average
-        short_ma = self._input_data.rolling(
-            window=self._short_ma, min_periods=self._short_ma
-        ).mean()
-
-        # Calculate MACD
-        posc = 100 * (short_ma - long_ma) / long_ma
-
-        posc.columns = ["posc"]
-
-        return posc.round(4)
+        return self._kernelData(
+            ["posc"],
+            kernels.priceOscillator(*self._inputArrays("close"), self._long_ma, self._short_ma),
+        )
 
     def getTiSignal(self):
         """
@@ -131,3 +123,24 @@ class PriceOscillator(TechnicalIndicator):
             return TRADE_SIGNALS["sell"]
 
         return TRADE_SIGNALS["hold"]
+
+    def _calculateTiSignalSeries(self):
+        """
+        Calculates the trading signal for each row of the calculated technical
+        indicator, in a vectorized way.
+
+        Returns:
+            numpy.ndarray: The numeric value of the trading signal for each row.
+        """
+
+        posc = self._ti_data["posc"].to_numpy(dtype=np.float64)
+        posc_prev = self._shiftValues(posc)
+
+        return self._selectSignals(
+            [
+                # Signal based on crossovers with zero line
+                ((posc_prev < 0.0) & (posc > 0.0), TRADE_SIGNALS["buy"]),
+                ((posc_prev > 0.0) & (posc < 0.0), TRADE_SIGNALS["sell"]),
+            ],
+            minimum_rows=2,
+        )
@@ -5,12 +5,12 @@ File name: _price_rate_of_change.py
     Implements the Price Rate Of Change technical indicator.
 """
 
-import pandas as pd
+import numpy as np
 
 from ._technical_indicator import TechnicalIndicator
+from .. import kernels
 from ..utils.constants import TRADE_SIGNALS
 from ..utils.exceptions import (
-    NotEnoughInputData,
     WrongTypeForInputParameter,
     WrongValueForInputParameter,
 )
@@ -30,6 +30,9 @@ class PriceRateOfChange(TechnicalIndicator):
         fill_missing_values (bool, default=True): If set to True, missing
             values in the input data are being filled.
 
+        precision (int, default=4): The number of decimals the calculated
+            indicator is rounded to. If None, it is not rounded.
+
     Attributes:
         _input_data (pandas.DataFrame): The ``input_data`` after preprocessing.
 
@@ -48,7 +51,7 @@ class PriceRateOfChange(TechnicalIndicator):
         ValueError: Value error occurred when validating the ``input_data``.
     """
 
-    def __init__(self, input_data, period=25, fill_missing_values=True):
+    def __init__(self, input_data, period=25, fill_missing_values=True, precision=4):
         # Validate and store if needed, the input parameters
         if isinstance(period, int):
             if period > 0:
@@ -63,6 +66,7 @@ class PriceRateOfChange(TechnicalIndicator):
             calling_instance=self.__class__.__name__,
             input_data=input_data,
             fill_missing_values=fill_missing_values,
+            precision=precision,
         )
 
     def _calculateTi(self):
@@ -78,24 +82,10 @@ class PriceRateOfChange(TechnicalIndicator):
             NotEnoughInputData: Not enough data for calculating the indicator.
         """
 
-        # Not enough data for the requested period
-        if len(self._input_data.index) < self._period:
-            raise NotEnoughInputData(
-                "Price Rate of Change", self._period, len(self._input_data.index)
-            )
-
-        prc = pd.DataFrame(
-            index=self._input_data.index, columns=["prc"], data=None, dtype="float64"
-        )
-
-        prc["prc"] = (
-            100
-            * (self._input_data["close"] - self._input_data["close"].shift(self._period))
-            / self._input_data["close"].shift(self._period)
+        return self._kernelData(
+            ["prc"], kernels.priceRateOfChange(*self._inputArrays("close"), self._period)
         )
 
-        return prc.round(4)
-
     def getTiSignal(self):
         """
         Calculates and returns the trading signal for the calculated technical
@@ -131,3 +121,32 @@ class PriceRateOfChange(TechnicalIndicator):
 
         else:
             return TRADE_SIGNALS["hold"]
+
+    def _calculateTiSignalSeries(self):
+        """
+        Calculates the trading signal for each row of the calculated technical
+        indicator, in a vectorized way.
+
+        Returns:
+            numpy.ndarray: The numeric value of the trading signal for each row.
+        """
+
+        prc = self._ti_data["prc"].to_numpy(dtype=np.float64)
+        prc_prev = self._shiftValues(prc, periods=1)
+        prc_prev_2 = self._shiftValues(prc, periods=2)
+
+        return self._selectSignals(
+            [
+                # Warning for a downward breakout
+                (
+                    (prc_prev_2 > prc_prev) & (prc_prev > prc),
+                    TRADE_SIGNALS["buy"],
+                ),
+                # Warning for a upward breakout
+                (
+                    (prc_prev_2 < prc_prev) & (prc_prev < prc),
+                    TRADE_SIGNALS["sell"],
+                ),
+            ],
+            minimum_rows=3,
+        )
@@ -5,15 +5,12 @@ File name: _projection_bands.py
     Implements the Projection Bands technical indicator.
 """
 
-import pandas as pd
-
-import statsmodels.api as sm
-from statsmodels.regression.rolling import RollingOLS
+import numpy as np
 
 from ._technical_indicator import TechnicalIndicator
+from .. import kernels
 from ..utils.constants import TRADE_SIGNALS
 from ..utils.exceptions import (
-    NotEnoughInputData,
     WrongTypeForInputParameter,
     WrongValueForInputParameter,
 )
@@ -34,6 +31,9 @@ class ProjectionBands(TechnicalIndicator):
         fill_missing_values (bool, default=True): If set to True, missing
             values in the input data are being filled.
 
+        precision (int, default=4): The number of decimals the calculated
+            indicator is rounded to. If None, it is not rounded.
+
     Attributes:
         _input_data (pandas.DataFrame): The ``input_data`` after preprocessing.
 
@@ -53,7 +53,7 @@ class ProjectionBands(TechnicalIndicator):
         ValueError: Value error occurred when validating the ``input_data``.
     """
 
-    def __init__(self, input_data, period=14, fill_missing_values=True):
+    def __init__(self, input_data, period=14, fill_missing_values=True, precision=4):
         # Validate and store if needed, the input parameters
         if isinstance(period, int):
             if period > 1:
@@ -68,6 +68,7 @@ class ProjectionBands(TechnicalIndicator):
             calling_instance=self.__class__.__name__,
             input_data=input_data,
             fill_missing_values=fill_missing_values,
+            precision=precision,
         )
 
     def _calculateTi(self):
@@ -78,65 +79,25 @@ class ProjectionBands(TechnicalIndicator):
         Returns:
             pandas.DataFrame: The calculated indicator. Index is of type
             ``pandas.DatetimeIndex``. It contains two columns, the
-            ``upper_band``, ``lower_band``.
+            ``upper_band``, ``lower_band``. The bands are NaN for the windows
+            with missing values.
 
         Raises:
             NotEnoughInputData: Not enough data for calculating the indicator.
         """
 
-        # Not enough data for the requested period
-        if len(self._input_data.index) < self._period:
-            raise NotEnoughInputData("Projection Bands", self._period, len(self._input_data.index))
-
-        pbs = pd.DataFrame(
-            index=self._input_data.index,
-            columns=["upper_band", "lower_band"],
-            data=None,
-            dtype="float64",
-        )
-
-        # Calculate n-periods slope of high values
-        high_slope = (
-            RollingOLS(
-                endog=self._input_data["high"].fillna(value=0, inplace=False).to_list(),
-                exog=sm.add_constant(list(range(len(self._input_data.index)))),
-                window=self._period,
-            )
-            .fit(params_only=True)
-            .params[:, 1]
-        )
-
-        # Calculate n-periods slope of low values
-        low_slope = (
-            RollingOLS(
-                endog=self._input_data["low"].fillna(value=0, inplace=False).to_list(),
-                exog=sm.add_constant(list(range(len(self._input_data.index)))),
-                window=self._period,
-            )
-            .fit(params_only=True)
-            .params[:, 1]
+        return self._kernelData(
+            ["upper_band", "lower_band"],
+            kernels.projectionBands(
+                *self._inputArrays("high", "low"),
+                self._period,
+                slopes=(
+                    self._linearRegression("high", self._period)[0],
+                    self._linearRegression("low", self._period)[0],
+                ),
+            ),
         )
 
-        # Calculate the projection bands
-        for i in range(self._period - 1, len(self._input_data.index)):
-            pbs["upper_band"].values[i] = max(
-                [self._input_data["high"].values[i]]
-                + [
-                    (j * high_slope[i]) + self._input_data["high"].values[i - j]
-                    for j in range(1, self._period)
-                ]
-            )
-
-            pbs["lower_band"].values[i] = min(
-                [self._input_data["low"].values[i]]
-                + [
-                    (j * low_slope[i]) + self._input_data["low"].values[i - j]
-                    for j in range(1, self._period)
-                ]
-            )
-
-        return pbs.round(4)
-
     def getTiSignal(self):
         """
         Calculates and returns the trading signal for the calculated technical
@@ -166,3 +127,30 @@ class ProjectionBands(TechnicalIndicator):
             return TRADE_SIGNALS["buy"]
 
         return TRADE_SIGNALS["hold"]
+
+    def _calculateTiSignalSeries(self):
+        """
+        Calculates the trading signal for each row of the calculated technical
+        indicator, in a vectorized way.
+
+        Returns:
+            numpy.ndarray: The numeric value of the trading signal for each row.
+        """
+
+        close = self._signalInput("close")
+
+        upper_band = self._ti_data["upper_band"].to_numpy(dtype=np.float64)
+        lower_band = self._ti_data["lower_band"].to_numpy(dtype=np.float64)
+
+        bands_distance = upper_band - lower_band
+
+        return self._selectSignals(
+            [
+                # Price goes close to the upper band, closer than 15% of the
+                # bands distance
+                (upper_band - close < 0.15 * bands_distance, TRADE_SIGNALS["sell"]),
+                # Price goes close to the lower band, closer than 15% of the
+                # bands distance
+                (close - lower_band < 0.15 * bands_distance, TRADE_SIGNALS["buy"]),
+            ],
+        )
@@ -5,9 +5,10 @@ File name: _projection_oscillator.py
     Implements the Projection Oscillator technical indicator.
 """
 
-import pandas as pd
+import numpy as np
 
 from ._technical_indicator import TechnicalIndicator
+from .. import kernels
 from ._projection_bands import ProjectionBands
 from ..utils.constants import TRADE_SIGNALS
 from ..utils.exceptions import (
@@ -32,6 +33,9 @@ class ProjectionOscillator(TechnicalIndicator):
         fill_missing_values (bool, default=True): If set to True, missing
             values in the input data are being filled.
 
+        precision (int, default=4): The number of decimals the calculated
+            indicator is rounded to. If None, it is not rounded.
+
     Attributes:
         _input_data (pandas.DataFrame): The ``input_data`` after preprocessing.
 
@@ -51,7 +55,7 @@ class ProjectionOscillator(TechnicalIndicator):
         ValueError: Value error occurred when validating the ``input_data``.
     """
 
-    def __init__(self, input_data, period=14, fill_missing_values=True):
+    def __init__(self, input_data, period=14, fill_missing_values=True, precision=4):
         # Validate and store if needed, the input parameters
         if isinstance(period, int):
             if period > 1:
@@ -66,6 +70,7 @@ class ProjectionOscillator(TechnicalIndicator):
             calling_instance=self.__class__.__name__,
             input_data=input_data,
             fill_missing_values=fill_missing_values,
+            precision=precision,
         )
 
     def _calculateTi(self):
@@ -88,30 +93,20 @@ class ProjectionOscillator(TechnicalIndicator):
                 "Projection Oscillator", self._period, len(self._input_data.index)
             )
 
-        # Calculate Projection Bands
-        projection_bands = ProjectionBands(
-            input_data=self._input_data, period=self._period
-        ).getTiData()
-
-        posc = pd.DataFrame(
-            index=self._input_data.index,
-            columns=["posc", "trigger_line"],
-            data=None,
-            dtype="float64",
-        )
-
-        posc["posc"] = (
-            100
-            * (self._input_data["close"] - projection_bands["lower_band"])
-            / (projection_bands["upper_band"] - projection_bands["lower_band"])
+        projection_bands = self._indicatorData(ProjectionBands, period=self._period)
+
+        return self._kernelData(
+            ["posc", "trigger_line"],
+            kernels.projectionOscillator(
+                *self._inputArrays("high", "low", "close"),
+                self._period,
+                projection_bands=(
+                    projection_bands["upper_band"].to_numpy(dtype=np.float64),
+                    projection_bands["lower_band"].to_numpy(dtype=np.float64),
+                ),
+            ),
         )
 
-        # Trigger line, Exponential Moving Average of three days, can be an
-        # input argument to the class constructor in a later release
-        posc["trigger_line"] = posc["posc"].ewm(span=3, min_periods=3, adjust=False).mean()
-
-        return posc.round(4)
-
     def getTiSignal(self):
         """
         Calculates and returns the trading signal for the calculated technical
@@ -151,3 +146,40 @@ class ProjectionOscillator(TechnicalIndicator):
             return TRADE_SIGNALS["sell"]
 
         return TRADE_SIGNALS["hold"]
+
+    def _calculateTiSignalSeries(self):
+        """
+        Calculates the trading signal for each row of the calculated technical
+        indicator, in a vectorized way.
+
+        Returns:
+            numpy.ndarray: The numeric value of the trading signal for each row.
+        """
+
+        posc = self._ti_data["posc"].to_numpy(dtype=np.float64)
+        posc_prev = self._shiftValues(posc)
+
+        # posc above the trigger line, for the current and the previous rows
+        above = posc > self._ti_data["trigger_line"].to_numpy(dtype=np.float64)
+        below = posc < self._ti_data["trigger_line"].to_numpy(dtype=np.float64)
+
+        above_prev = [self._shiftValues(above, periods=p) == 1.0 for p in range(1, 4)]
+        below_prev = [self._shiftValues(below, periods=p) == 1.0 for p in range(1, 4)]
+
+        return self._selectSignals(
+            [
+                # Signals based on Overbought / Oversold Regions
+                ((posc_prev < 15) & (posc > 15), TRADE_SIGNALS["buy"]),
+                ((posc_prev > 85) & (posc < 85), TRADE_SIGNALS["sell"]),
+                # Signals based on Crossovers
+                (
+                    below_prev[2] & below_prev[1] & above_prev[0] & above,
+                    TRADE_SIGNALS["buy"],
+                ),
+                (
+                    above_prev[2] & above_prev[1] & below_prev[0] & below,
+                    TRADE_SIGNALS["sell"],
+                ),
+            ],
+            minimum_rows=4,
+        )
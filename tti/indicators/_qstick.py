@@ -5,12 +5,12 @@ File name: _qstick.py
     Implements the Qstick technical indicator.
 """
 
-import pandas as pd
+import numpy as np
 
 from ._technical_indicator import TechnicalIndicator
+from .. import kernels
 from ..utils.constants import TRADE_SIGNALS
 from ..utils.exceptions import (
-    NotEnoughInputData,
     WrongTypeForInputParameter,
     WrongValueForInputParameter,
 )
@@ -31,6 +31,9 @@ class Qstick(TechnicalIndicator):
         fill_missing_values (bool, default=True): If set to True, missing
             values in the input data are being filled.
 
+        precision (int, default=4): The number of decimals the calculated
+            indicator is rounded to. If None, it is not rounded.
+
     Attributes:
         _input_data (pandas.DataFrame): The ``input_data`` after preprocessing.
 
@@ -49,7 +52,7 @@ class Qstick(TechnicalIndicator):
         ValueError: Value error occurred when validating the ``input_data``.
     """
 
-    def __init__(self, input_data, period=8, fill_missing_values=True):
+    def __init__(self, input_data, period=8, fill_missing_values=True, precision=4):
         # Validate and store if needed, the input parameters
         if isinstance(period, int):
             if period > 0:
@@ -64,6 +67,7 @@ class Qstick(TechnicalIndicator):
             calling_instance=self.__class__.__name__,
             input_data=input_data,
             fill_missing_values=fill_missing_values,
+            precision=precision,
         )
 
     def _calculateTi(self):
@@ -79,20 +83,10 @@ class Qstick(TechnicalIndicator):
             NotEnoughInputData: Not enough data for calculating the indicator.
         """
 
-        # Not enough data for the requested period
-        if len(self._input_data.index) < self._period:
-            raise NotEnoughInputData("Qstick", self._period, len(self._input_data.index))
-
-        qstick = pd.DataFrame(
-            index=self._input_data.index, columns=["qstick"], data=None, dtype="float64"
+        return self._kernelData(
+            ["qstick"], kernels.qstick(*self._inputArrays("open", "close"), self._period)
         )
 
-        qstick["qstick"] = (self._input_data["close"] - self._input_data["open"]).rolling(
-            window=self._period, min_periods=self._period
-        ).sum() / self._period
-
-        return qstick.round(4)
-
     def getTiSignal(self):
         """
         Calculates and returns the trading signal for the calculated technical
@@ -127,3 +121,38 @@ class Qstick(TechnicalIndicator):
             return TRADE_SIGNALS["sell"]
 
         return TRADE_SIGNALS["hold"]
+
+    def _calculateTiSignalSeries(self):
+        """
+        Calculates the trading signal for each row of the calculated technical
+        indicator, in a vectorized way.
+
+        Returns:
+            numpy.ndarray: The numeric value of the trading signal for each row.
+        """
+
+        qstick = self._ti_data["qstick"].to_numpy(dtype=np.float64)
+        qstick_prev = self._shiftValues(qstick, periods=1)
+        qstick_prev_2 = self._shiftValues(qstick, periods=2)
+        qstick_prev_3 = self._shiftValues(qstick, periods=3)
+
+        return self._selectSignals(
+            [
+                # Signals based on Crossovers (zero line)
+                (
+                    (qstick_prev_3 < qstick_prev_2)
+                    & (qstick_prev_2 < 0)
+                    & (0 < qstick_prev)
+                    & (qstick_prev < qstick),
+                    TRADE_SIGNALS["buy"],
+                ),
+                (
+                    (qstick_prev_3 > qstick_prev_2)
+                    & (qstick_prev_2 > 0)
+                    & (0 > qstick_prev)
+                    & (qstick_prev > qstick),
+                    TRADE_SIGNALS["sell"],
+                ),
+            ],
+            minimum_rows=4,
+        )
@@ -6,11 +6,12 @@ File name: _range_indicator.py
 """
 
 import pandas as pd
+import numpy as np
 
 from ._technical_indicator import TechnicalIndicator
+from .. import kernels
 from ..utils.constants import TRADE_SIGNALS
 from ..utils.exceptions import (
-    NotEnoughInputData,
     WrongTypeForInputParameter,
     WrongValueForInputParameter,
 )
@@ -34,6 +35,9 @@ class RangeIndicator(TechnicalIndicator):
         fill_missing_values (bool, default=True): If set to True, missing
             values in the input data are being filled.
 
+        precision (int, default=4): The number of decimals the calculated
+            indicator is rounded to. If None, it is not rounded.
+
     Attributes:
         _input_data (pandas.DataFrame): The ``input_data`` after preprocessing.
 
@@ -52,7 +56,9 @@ class RangeIndicator(TechnicalIndicator):
         ValueError: Value error occurred when validating the ``input_data``.
     """
 
-    def __init__(self, input_data, range_period=5, smoothing_period=3, fill_missing_values=True):
+    def __init__(
+        self, input_data, range_period=5, smoothing_period=3, fill_missing_values=True, precision=4
+    ):
         # Validate and store if needed, the input parameters
         if isinstance(range_period, int):
             if range_period > 0:
@@ -75,6 +81,7 @@ class RangeIndicator(TechnicalIndicator):
             calling_instance=self.__class__.__name__,
             input_data=input_data,
             fill_missing_values=fill_missing_values,
+            precision=precision,
         )
 
     def _calculateTi(self):
@@ -90,74 +97,16 @@ class RangeIndicator(TechnicalIndicator):
             NotEnoughInputData: Not enough data for calculating the indicator.
         """
 
-        # Not enough data for the requested period
-        if len(self._input_data.index) < max(self._range_period, self._smoothing_period):
-            raise NotEnoughInputData(
-                "Range Indicator",
-                max(self._range_period, self._smoothing_period),
-                len(self._input_data.index),
-            )
-
-        ri = pd.DataFrame(
-            index=self._input_data.index,
-            columns=[
-                "true_range",
-                "see_text",
-                "see_text_range_min",
-                "see_text_range_max",
-                "see_text_range",
-                "ri",
-            ],
-            data=None,
-            dtype="float64",
-        )
-
-        ri["true_range"] = pd.concat(
-            [
-                self._input_data["high"] - self._input_data["low"],
-                self._input_data["high"] - self._input_data["close"].shift(1),
-                self._input_data["close"].shift(1) - self._input_data["low"],
-            ],
-            axis=1,
-        ).max(axis=1, skipna=False)
-
-        for i in range(1, len(self._input_data.index)):
-            if self._input_data["close"].iat[i] > self._input_data["close"].iat[i - 1]:
-                ri.loc[ri.index[i], "see_text"] = ri["true_range"].iat[i] / (
-                    self._input_data["close"].iat[i] - self._input_data["close"].iat[i - 1]
-                )
-
-            else:
-                ri.loc[ri.index[i], "see_text"] = ri["true_range"].iat[i]
-
-        ri["see_text_range_min"] = (
-            ri["see_text"].rolling(window=self._range_period, min_periods=self._range_period).min()
-        )
-
-        ri["see_text_range_max"] = (
-            ri["see_text"].rolling(window=self._range_period, min_periods=self._range_period).max()
-        )
-
-        ri["see_text_range"] = ri["see_text_range_max"] - ri["see_text_range_min"]
-
-        ri.loc[ri["see_text_range"] > 0, "see_text_range"] = (
-            100
-            * (ri["see_text"] - ri["see_text_range_min"])
-            / (ri["see_text_range_max"] - ri["see_text_range_min"])
-        )
-
-        ri.loc[ri["see_text_range"] <= 0, "see_text_range"] = 100 * (
-            ri["see_text"] - ri["see_text_range_min"]
-        )
-
-        ri["ri"] = (
-            ri["see_text_range"]
-            .ewm(span=self._smoothing_period, min_periods=self._smoothing_period, adjust=False)
-            .mean()
+        return self._kernelData(
+            ["ri"],
+            kernels.rangeIndicator(
+                *self._inputArrays("high", "low", "close"),
+                self._range_period,
+                self._smoothing_period,
+                true_range=self._trueRange(),
+            ),
         )
 
-        return ri[["ri"]].round(4)
-
     def getTiSignal(self):
         """
         Calculates and returns the trading signal for the calculated technical
@@ -193,3 +142,42 @@ class RangeIndicator(TechnicalIndicator):
                 return TRADE_SIGNALS["hold"]
 
         return TRADE_SIGNALS["hold"]
+
+    def _calculateTiSignalSeries(self):
+        """
+        Calculates the trading signal for each row of the calculated technical
+        indicator, in a vectorized way.
+
+        Returns:
+            numpy.ndarray: The numeric value of the trading signal for each row.
+        """
+
+        close = self._signalInput("close")
+        close_prev = self._shiftValues(close)
+
+        ri = self._ti_data["ri"].to_numpy(dtype=np.float64)
+        ri_prev = self._shiftValues(ri)
+
+        # Close price of the most recent row with indicator below 20
+        last_low_close = (
+            pd.Series(np.where(ri < 20, close, np.nan)).ffill().to_numpy(dtype=np.float64)
+        )
+        low_found = (
+            pd.Series(np.where(ri < 20, 1.0, np.nan)).ffill().to_numpy(dtype=np.float64) == 1.0
+        )
+
+        # Indication that a new trend starts
+        new_trend = (ri_prev < 20) & (ri > 20)
+
+        # Indication that current trend ends
+        trend_ends = (ri_prev < 70) & (ri > 70) & low_found
+
+        return self._selectSignals(
+            [
+                (new_trend & (close_prev < close), TRADE_SIGNALS["buy"]),
+                (new_trend, TRADE_SIGNALS["sell"]),
+                (trend_ends & (last_low_close < close), TRADE_SIGNALS["sell"]),
+                (trend_ends, TRADE_SIGNALS["buy"]),
+            ],
+            minimum_rows=2,
+        )
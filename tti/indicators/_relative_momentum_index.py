@@ -5,12 +5,12 @@ File name: _relative_momentum_index.py
     Implements the Relative Momentum Index technical indicator.
 """
 
-import pandas as pd
+import numpy as np
 
 from ._technical_indicator import TechnicalIndicator
+from .. import kernels
 from ..utils.constants import TRADE_SIGNALS
 from ..utils.exceptions import (
-    NotEnoughInputData,
     WrongTypeForInputParameter,
     WrongValueForInputParameter,
 )
@@ -33,6 +33,9 @@ class RelativeMomentumIndex(TechnicalIndicator):
         fill_missing_values (bool, default=True): If set to True, missing
             values in the input data are being filled.
 
+        precision (int, default=4): The number of decimals the calculated
+            indicator is rounded to. If None, it is not rounded.
+
     Attributes:
         _input_data (pandas.DataFrame): The ``input_data`` after preprocessing.
 
@@ -51,7 +54,9 @@ class RelativeMomentumIndex(TechnicalIndicator):
         ValueError: Value error occurred when validating the ``input_data``.
     """
 
-    def __init__(self, input_data, period=8, momentum_period=4, fill_missing_values=True):
+    def __init__(
+        self, input_data, period=8, momentum_period=4, fill_missing_values=True, precision=4
+    ):
         # Validate and store if needed, the input parameters
         if isinstance(period, int):
             if period > 0:
@@ -74,6 +79,7 @@ class RelativeMomentumIndex(TechnicalIndicator):
             calling_instance=self.__class__.__name__,
             input_data=input_data,
             fill_missing_values=fill_missing_values,
+            precision=precision,
         )
 
     def _calculateTi(self):
@@ -89,63 +95,13 @@ class RelativeMomentumIndex(TechnicalIndicator):
             NotEnoughInputData: Not enough data for calculating the indicator.
         """
 
-        # Not enough data for the requested period
-        if len(self._input_data.index) < self._period + self._momentum_period:
-            raise NotEnoughInputData(
-                "Relative Momentum Index",
-                self._period + self._momentum_period,
-                len(self._input_data.index),
-            )
-
-        rmi = pd.DataFrame(
-            index=self._input_data.index,
-            columns=["rmi", "upc", "dpc", "smoothed_upc", "smoothed_dpc"],
-            data=None,
-            dtype="float64",
-        )
-
-        # Calculate price change (current close - close momentum periods ago)
-        close_price_change = self._input_data["close"] - self._input_data["close"].shift(
-            self._momentum_period
-        )
-
-        # Upward price change
-        rmi.loc[close_price_change > 0, "upc"] = close_price_change
-        rmi.loc[close_price_change <= 0, "upc"] = 0
-
-        # Downward price change
-        rmi.loc[close_price_change < 0, "dpc"] = abs(close_price_change)
-        rmi.loc[close_price_change >= 0, "dpc"] = 0
-
-        # Wilder's Moving Average for upc and dpc
-        rmi.loc[rmi.index[self._period + self._momentum_period - 1], "smoothed_upc"] = (
-            rmi["upc"].iloc[self._momentum_period : self._period + self._momentum_period].mean()
+        return self._kernelData(
+            ["rmi"],
+            kernels.relativeMomentumIndex(
+                *self._inputArrays("close"), self._period, self._momentum_period
+            ),
         )
 
-        rmi.loc[rmi.index[self._period + self._momentum_period - 1], "smoothed_dpc"] = (
-            rmi["dpc"].iloc[self._momentum_period : self._period + self._momentum_period].mean()
-        )
-
-        for i in range(self._period + self._momentum_period, len(self._input_data.index)):
-            rmi.loc[rmi.index[i], "smoothed_upc"] = (
-                rmi["smoothed_upc"].iat[i - 1]
-                + (rmi["upc"].iat[i] - rmi["smoothed_upc"].iat[i - 1]) / self._period
-            )
-
-            rmi.loc[rmi.index[i], "smoothed_dpc"] = (
-                rmi["smoothed_dpc"].iat[i - 1]
-                + (rmi["dpc"].iat[i] - rmi["smoothed_dpc"].iat[i - 1]) / self._period
-            )
-
-        # Calculate indicator
-        rmi["rmi"] = (
-            100
-            * (rmi["smoothed_upc"] / rmi["smoothed_dpc"])
-            / (1 + rmi["smoothed_upc"] / rmi["smoothed_dpc"])
-        )
-
-        return rmi[["rmi"]].round(4)
-
     def getTiSignal(self):
         """
         Calculates and returns the trading signal for the calculated technical
@@ -169,3 +125,25 @@ class RelativeMomentumIndex(TechnicalIndicator):
             return TRADE_SIGNALS["buy"]
 
         return TRADE_SIGNALS["hold"]
+
+    def _calculateTiSignalSeries(self):
+        """
+        Calculates the trading signal for each row of the calculated technical
+        indicator, in a vectorized way.
+
+        Returns:
+            numpy.ndarray: The numeric value of the trading signal for each row.
+        """
+
+        rmi = self._ti_data["rmi"].to_numpy(dtype=np.float64)
+        rmi_prev = self._shiftValues(rmi)
+
+        return self._selectSignals(
+            [
+                # Overbought region
+                ((rmi_prev < 70.0) & (rmi > 70.0), TRADE_SIGNALS["sell"]),
+                # Oversold region
+                ((rmi_prev > 30.0) & (rmi < 30.0), TRADE_SIGNALS["buy"]),
+            ],
+            minimum_rows=2,
+        )
@@ -5,12 +5,12 @@ File name: _relative_strength_index.py
     Implements the Relative Strength Index technical indicator.
 """
 
-import pandas as pd
+import numpy as np
 
 from ._technical_indicator import TechnicalIndicator
+from .. import kernels
 from ..utils.constants import TRADE_SIGNALS
 from ..utils.exceptions import (
-    NotEnoughInputData,
     WrongTypeForInputParameter,
     WrongValueForInputParameter,
 )
@@ -30,6 +30,9 @@ class RelativeStrengthIndex(TechnicalIndicator):
         fill_missing_values (bool, default=True): If set to True, missing
             values in the input data are being filled.
 
+        precision (int, default=4): The number of decimals the calculated
+            indicator is rounded to. If None, it is not rounded.
+
     Attributes:
         _input_data (pandas.DataFrame): The ``input_data`` after preprocessing.
 
@@ -40,6 +43,10 @@ class RelativeStrengthIndex(TechnicalIndicator):
 
         _calling_instance (str): The name of the class.
 
+        _state (dict): The state of the calculation after the last row (last
+            close and smoothed upward and downward price changes), used for
+            updating the indicator with new input data.
+
     Raises:
         WrongTypeForInputParameter: Input argument has wrong type.
         WrongValueForInputParameter: Unsupported value for input argument.
@@ -48,7 +55,7 @@ class RelativeStrengthIndex(TechnicalIndicator):
         ValueError: Value error occurred when validating the ``input_data``.
     """
 
-    def __init__(self, input_data, period=14, fill_missing_values=True):
+    def __init__(self, input_data, period=14, fill_missing_values=True, precision=4):
         # Validate and store if needed, the input parameters
         if isinstance(period, int):
             if period > 0:
@@ -63,6 +70,7 @@ class RelativeStrengthIndex(TechnicalIndicator):
             calling_instance=self.__class__.__name__,
             input_data=input_data,
             fill_missing_values=fill_missing_values,
+            precision=precision,
         )
 
     def _calculateTi(self):
@@ -78,63 +86,50 @@ class RelativeStrengthIndex(TechnicalIndicator):
             NotEnoughInputData: Not enough data for calculating the indicator.
         """
 
-        # Not enough data for the requested period
-        if len(self._input_data.index) < self._period + 1:
-            raise NotEnoughInputData(
-                "Relative Strength Index", self._period + 1, len(self._input_data.index)
-            )
-
-        rsi = pd.DataFrame(
-            data=None, index=self._input_data.index, columns=["rsi"], dtype="float64"
+        # Last smoothed values, they are the state used for updating the
+        # indicator with new input data
+        self._state = {}
+
+        return self._kernelData(
+            ["rsi"],
+            kernels.relativeStrengthIndex(
+                *self._inputArrays("close"),
+                self._period,
+                state=self._state,
+                decimals=self._precision,
+            ),
         )
 
-        # Calculate Upward Price Change
-        upc = pd.DataFrame(data=None, index=self._input_data.index, columns=["upc", "smoothed_upc"])
+    def _updateTi(self, new_input_data):
+        """
+        Calculates the technical indicator after new rows have been appended
+        to the input data. Only the new rows are calculated, continuing the
+        Wilder's smoothing from the last smoothed values.
 
-        for i in range(1, len(self._input_data.index)):
-            upc["upc"].values[i] = round(
-                self._input_data["close"].values[i] - self._input_data["close"].values[i - 1]
-                if self._input_data["close"].values[i] > self._input_data["close"].values[i - 1]
-                else 0.0,
-                4,
-            )
+        Args:
+            new_input_data (pandas.DataFrame): The new rows of the input data,
+                after preprocessing.
 
-        upc.loc[upc.index[self._period], "smoothed_upc"] = (
-            upc["upc"].iloc[: self._period + 1].mean()
-        )
+        Returns:
+            pandas.DataFrame: The calculated indicator for the new rows. Index
+            is of type ``pandas.DatetimeIndex``. It contains one column
+            ``rsi``.
+        """
 
-        for i in range(self._period + 1, len(self._input_data.index)):
-            upc["smoothed_upc"].values[i] = round(
-                upc["smoothed_upc"].values[i - 1]
-                + (upc["upc"].values[i] - upc["smoothed_upc"].values[i - 1]) / self._period,
-                4,
-            )
-
-        # Calculate Downward Price Change
-        dpc = pd.DataFrame(data=None, index=self._input_data.index, columns=["dpc", "smoothed_dpc"])
-
-        for i in range(1, len(self._input_data.index)):
-            dpc["dpc"].values[i] = round(
-                self._input_data["close"].values[i - 1] - self._input_data["close"].values[i]
-                if self._input_data["close"].values[i] < self._input_data["close"].values[i - 1]
-                else 0.0,
-                4,
-            )
-
-        dpc.loc[dpc.index[self._period], "smoothed_dpc"] = (
-            dpc["dpc"].iloc[: self._period + 1].mean()
-        )
+        # The state is copied, the stored one can be shared with the result
+        # cache
+        state = dict(self._state)
 
-        for i in range(self._period + 1, len(self._input_data.index)):
-            dpc["smoothed_dpc"].values[i] = round(
-                dpc["smoothed_dpc"].values[i - 1]
-                + (dpc["dpc"].values[i] - dpc["smoothed_dpc"].values[i - 1]) / self._period,
-                4,
-            )
+        rsi = kernels.relativeStrengthIndex(
+            *self._inputArrays("close", rows=len(new_input_data.index)),
+            self._period,
+            state=state,
+            decimals=self._precision,
+        )
 
-        rsi["rsi"] = 100.0 - (100.0 / ((upc["smoothed_upc"] / dpc["smoothed_dpc"]) + 1.0))
+        self._state = state
 
-        return rsi.astype("float64").round(4)
+        return self._kernelData(["rsi"], rsi, index=new_input_data.index)
 
     def getTiSignal(self):
         """
@@ -159,3 +154,25 @@ class RelativeStrengthIndex(TechnicalIndicator):
             return TRADE_SIGNALS["buy"]
 
         return TRADE_SIGNALS["hold"]
+
+    def _calculateTiSignalSeries(self):
+        """
+        Calculates the trading signal for each row of the calculated technical
+        indicator, in a vectorized way.
+
+        Returns:
+            numpy.ndarray: The numeric value of the trading signal for each row.
+        """
+
+        rsi = self._ti_data["rsi"].to_numpy(dtype=np.float64)
+        rsi_prev = self._shiftValues(rsi)
+
+        return self._selectSignals(
+            [
+                # Overbought region
+                ((rsi_prev < 70.0) & (rsi > 70.0), TRADE_SIGNALS["sell"]),
+                # Oversold region
+                ((rsi_prev > 30.0) & (rsi < 30.0), TRADE_SIGNALS["buy"]),
+            ],
+            minimum_rows=2,
+        )
@@ -5,12 +5,12 @@ File name: _relative_volatility_index.py
     Implements the Relative Volatility Index technical indicator.
 """
 
-import pandas as pd
+import numpy as np
 
 from ._technical_indicator import TechnicalIndicator
+from .. import kernels
 from ..utils.constants import TRADE_SIGNALS
 from ..utils.exceptions import (
-    NotEnoughInputData,
     WrongTypeForInputParameter,
     WrongValueForInputParameter,
 )
@@ -31,6 +31,9 @@ class RelativeVolatilityIndex(TechnicalIndicator):
         fill_missing_values (bool, default=True): If set to True, missing
             values in the input data are being filled.
 
+        precision (int, default=4): The number of decimals the calculated
+            indicator is rounded to. If None, it is not rounded.
+
     Attributes:
         _input_data (pandas.DataFrame): The ``input_data`` after preprocessing.
 
@@ -49,7 +52,7 @@ class RelativeVolatilityIndex(TechnicalIndicator):
         ValueError: Value error occurred when validating the ``input_data``.
     """
 
-    def __init__(self, input_data, period=5, fill_missing_values=True):
+    def __init__(self, input_data, period=5, fill_missing_values=True, precision=4):
         # Validate and store if needed, the input parameters
         if isinstance(period, int):
             if period > 0:
@@ -64,6 +67,7 @@ class RelativeVolatilityIndex(TechnicalIndicator):
             calling_instance=self.__class__.__name__,
             input_data=input_data,
             fill_missing_values=fill_missing_values,
+            precision=precision,
         )
 
     def _calculateTi(self):
@@ -79,105 +83,11 @@ class RelativeVolatilityIndex(TechnicalIndicator):
             NotEnoughInputData: Not enough data for calculating the indicator.
         """
 
-        # Not enough data for the requested period
-        if len(self._input_data.index) < self._period + 10:
-            raise NotEnoughInputData(
-                "Relative Volatility Index", self._period + 10, len(self._input_data.index)
-            )
-
-        rvi = pd.DataFrame(
-            index=self._input_data.index,
-            columns=[
-                "rvi",
-                "uh",
-                "ul",
-                "dh",
-                "dl",
-                "smoothed_uh",
-                "smoothed_ul",
-                "smoothed_dh",
-                "smoothed_dl",
-                "rvih",
-                "rvil",
-            ],
-            data=None,
-            dtype="float64",
-        )
-
-        high_change = self._input_data["high"] - self._input_data["high"].shift(1)
-
-        low_change = self._input_data["low"] - self._input_data["low"].shift(1)
-
-        # Upward high and low change
-        rvi["uh"] = 0.0
-        rvi.loc[high_change > 0, "uh"] = (
-            self._input_data["high"].rolling(window=10, min_periods=10).std(ddof=0)
-        )
-
-        rvi["ul"] = 0.0
-        rvi.loc[low_change > 0, "ul"] = (
-            self._input_data["low"].rolling(window=10, min_periods=10).std(ddof=0)
-        )
-
-        # Downward high and low change
-        rvi["dh"] = 0.0
-        rvi.loc[high_change < 0, "dh"] = (
-            self._input_data["high"].rolling(window=10, min_periods=10).std(ddof=0)
+        return self._kernelData(
+            ["rvi"],
+            kernels.relativeVolatilityIndex(*self._inputArrays("high", "low"), self._period),
         )
 
-        rvi["dl"] = 0.0
-        rvi.loc[low_change < 0, "dl"] = (
-            self._input_data["low"].rolling(window=10, min_periods=10).std(ddof=0)
-        )
-
-        # Wilder's Moving Average for uh, ul and dh, dl
-        rvi.loc[rvi.index[9 + self._period - 1], "smoothed_uh"] = (
-            rvi["uh"].iloc[9 : self._period + 9].mean()
-        )
-
-        rvi.loc[rvi.index[9 + self._period - 1], "smoothed_dh"] = (
-            rvi["dh"].iloc[9 : self._period + 9].mean()
-        )
-
-        rvi.loc[rvi.index[9 + self._period - 1], "smoothed_ul"] = (
-            rvi["ul"].iloc[9 : self._period + 9].mean()
-        )
-
-        rvi.loc[rvi.index[9 + self._period - 1], "smoothed_dl"] = (
-            rvi["dl"].iloc[9 : self._period + 9].mean()
-        )
-
-        for i in range(self._period + 9, len(self._input_data.index)):
-            rvi.loc[rvi.index[i], "smoothed_uh"] = (
-                rvi["smoothed_uh"].iat[i - 1]
-                + (rvi["uh"].iat[i] - rvi["smoothed_uh"].iat[i - 1]) / self._period
-            )
-
-            rvi.loc[rvi.index[i], "smoothed_dh"] = (
-                rvi["smoothed_dh"].iat[i - 1]
-                + (rvi["dh"].iat[i] - rvi["smoothed_dh"].iat[i - 1]) / self._period
-            )
-
-            rvi.loc[rvi.index[i], "smoothed_ul"] = (
-                rvi["smoothed_ul"].iat[i - 1]
-                + (rvi["ul"].iat[i] - rvi["smoothed_ul"].iat[i - 1]) / self._period
-            )
-
-            rvi.loc[rvi.index[i], "smoothed_dl"] = (
-                rvi["smoothed_dl"].iat[i - 1]
-                + (rvi["dl"].iat[i] - rvi["smoothed_dl"].iat[i - 1]) / self._period
-            )
-
-        # Calculate RVI High and Low
-        rvi["rvih"] = 100 * rvi["smoothed_uh"] / (rvi["smoothed_uh"] + rvi["smoothed_dh"])
-
-        rvi["rvil"] = 100 * rvi["smoothed_ul"] / (rvi["smoothed_ul"] + rvi["smoothed_dl"])
-
-        # Calculate indicator
-        rvi["rvi"] = (rvi["rvih"] + rvi["rvil"]) / 2
-
-        return rvi[["rvi"]].round(4)
-
     def getTiSignal(self):
         """
         Calculates and returns the trading signal for the calculated technical
@@ -199,3 +109,23 @@ class RelativeVolatilityIndex(TechnicalIndicator):
             return TRADE_SIGNALS["sell"]
 
         return TRADE_SIGNALS["hold"]
+
+    def _calculateTiSignalSeries(self):
+        """
+        Calculates the trading signal for each row of the calculated technical
+        indicator, in a vectorized way.
+
+        Returns:
+            numpy.ndarray: The numeric value of the trading signal for each row.
+        """
+
+        rvi = self._ti_data["rvi"].to_numpy(dtype=np.float64)
+        rvi_prev = self._shiftValues(rvi)
+
+        return self._selectSignals(
+            [
+                ((rvi_prev > 40) & (rvi < 40), TRADE_SIGNALS["buy"]),
+                ((rvi_prev < 60) & (rvi > 60), TRADE_SIGNALS["sell"]),
+            ],
+            minimum_rows=2,
+        )
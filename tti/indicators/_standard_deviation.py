@@ -5,10 +5,12 @@ File name: _standard_deviation.py
     Implements the Standard Deviation technical indicator.
 """
 
+import numpy as np
+
 from ._technical_indicator import TechnicalIndicator
+from .. import kernels
 from ..utils.constants import TRADE_SIGNALS
 from ..utils.exceptions import (
-    NotEnoughInputData,
     WrongTypeForInputParameter,
     WrongValueForInputParameter,
 )
@@ -28,6 +30,9 @@ class StandardDeviation(TechnicalIndicator):
         fill_missing_values (bool, default=True): If set to True, missing
             values in the input data are being filled.
 
+        precision (int, default=4): The number of decimals the calculated
+            indicator is rounded to. If None, it is not rounded.
+
     Attributes:
         _input_data (pandas.DataFrame): The ``input_data`` after preprocessing.
 
@@ -46,7 +51,7 @@ class StandardDeviation(TechnicalIndicator):
         ValueError: Value error occurred when validating the ``input_data``.
     """
 
-    def __init__(self, input_data, period=20, fill_missing_values=True):
+    def __init__(self, input_data, period=20, fill_missing_values=True, precision=4):
         # Validate and store if needed, the input parameters
         if isinstance(period, int):
             if period > 0:
@@ -61,6 +66,7 @@ class StandardDeviation(TechnicalIndicator):
             calling_instance=self.__class__.__name__,
             input_data=input_data,
             fill_missing_values=fill_missing_values,
+            precision=precision,
         )
 
     def _calculateTi(self):
@@ -79,23 +85,10 @@ class StandardDeviation(TechnicalIndicator):
             NotEnoughInputData: Not enough data for calculating the indicator.
         """
 
-        # Not enough data for the requested period
-        if len(self._input_data.index) < self._period:
-            raise NotEnoughInputData(
-                "Standard Deviation", self._period, len(self._input_data.index)
-            )
-
-        # Calculate Upper and Lower Bands
-        sd = (
-            self._input_data.rolling(window=self._period, min_periods=self._period)
-            .std(ddof=0)
-            .round(4)
+        return self._kernelData(
+            ["sd"], kernels.standardDeviation(*self._inputArrays("close"), self._period)
         )
 
-        sd.columns = ["sd"]
-
-        return sd
-
     def getTiSignal(self):
         """
         Calculates and returns the trading signal for the calculated technical
@@ -124,3 +117,36 @@ class StandardDeviation(TechnicalIndicator):
             return TRADE_SIGNALS["buy"]
 
         return TRADE_SIGNALS["hold"]
+
+    def _calculateTiSignalSeries(self):
+        """
+        Calculates the trading signal for each row of the calculated technical
+        indicator, in a vectorized way.
+
+        Returns:
+            numpy.ndarray: The numeric value of the trading signal for each row.
+        """
+
+        rows = len(self._ti_data.index)
+
+        close = self._signalInput("close")
+
+        # Simple Moving Average, calculated on the first input data column
+        sma = (
+            self._input_data.iloc[:rows, 0]
+            .rolling(window=self._period, min_periods=self._period)
+            .mean()
+            .round(4)
+            .to_numpy(dtype=np.float64)
+        )
+
+        high_volatility = self._ti_data["sd"].to_numpy(dtype=np.float64) > 2
+
+        return self._selectSignals(
+            [
+                # Price above average and volatility is high
+                ((close > sma) & high_volatility, TRADE_SIGNALS["sell"]),
+                # Price below average and volatility is high
+                ((close < sma) & high_volatility, TRADE_SIGNALS["buy"]),
+            ],
+        )
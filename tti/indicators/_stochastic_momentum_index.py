@@ -5,12 +5,12 @@ File name: _stochastic_momentum_index.py
     Implements the Stochastic Momentum Index technical indicator.
 """
 
-import pandas as pd
+import numpy as np
 
 from ._technical_indicator import TechnicalIndicator
+from .. import kernels
 from ..utils.constants import TRADE_SIGNALS
 from ..utils.exceptions import (
-    NotEnoughInputData,
     WrongTypeForInputParameter,
     WrongValueForInputParameter,
 )
@@ -37,6 +37,9 @@ class StochasticMomentumIndex(TechnicalIndicator):
         fill_missing_values (bool, default=True): If set to True, missing
             values in the input data are being filled.
 
+        precision (int, default=4): The number of decimals the calculated
+            indicator is rounded to. If None, it is not rounded.
+
     Attributes:
         _input_data (pandas.DataFrame): The ``input_data`` after preprocessing.
 
@@ -62,6 +65,7 @@ class StochasticMomentumIndex(TechnicalIndicator):
         smoothing_period=3,
         double_smoothing_period=3,
         fill_missing_values=True,
+        precision=4,
     ):
         # Validate and store if needed, the input parameters
         if isinstance(period, int):
@@ -97,6 +101,7 @@ class StochasticMomentumIndex(TechnicalIndicator):
             calling_instance=self.__class__.__name__,
             input_data=input_data,
             fill_missing_values=fill_missing_values,
+            precision=precision,
         )
 
     def _calculateTi(self):
@@ -112,78 +117,18 @@ class StochasticMomentumIndex(TechnicalIndicator):
             NotEnoughInputData: Not enough data for calculating the indicator.
         """
 
-        # Not enough data for the requested period
-        if len(self._input_data.index) < self._period:
-            raise NotEnoughInputData(
-                "Stochastic Momentum Index", self._period, len(self._input_data.index)
-            )
-
-        smi = pd.DataFrame(
-            index=self._input_data.index, columns=["smi"], data=None, dtype="float64"
-        )
-
-        # Calculate highest high for the last periods
-        smi["highest_high"] = (
-            self._input_data["high"].rolling(window=self._period, min_periods=self._period).max()
-        )
-
-        # Calculate highest high for the last periods
-        smi["lowest_low"] = (
-            self._input_data["low"].rolling(window=self._period, min_periods=self._period).min()
+        return self._kernelData(
+            ["smi"],
+            kernels.stochasticMomentumIndex(
+                *self._inputArrays("high", "low", "close"),
+                self._period,
+                self._smoothing_period,
+                self._double_smoothing_period,
+                highest_high=self._highestHigh(self._period),
+                lowest_low=self._lowestLow(self._period),
+            ),
         )
 
-        # Midpoint between highest high and lowest low
-        smi["midpoint"] = (smi["highest_high"] + smi["lowest_low"]) / 2
-
-        # Distance of Close from Midpoint
-        smi["distance"] = self._input_data["close"] - smi["midpoint"]
-
-        # Exponential Moving Average of the distance
-        smi["distance_ema"] = (
-            smi["distance"]
-            .ewm(span=self._smoothing_period, min_periods=self._smoothing_period, adjust=False)
-            .mean()
-        )
-
-        # Double Exponential Moving Average of the distance
-        smi["distance_double_ema"] = (
-            smi["distance_ema"]
-            .ewm(
-                span=self._double_smoothing_period,
-                min_periods=self._double_smoothing_period,
-                adjust=False,
-            )
-            .mean()
-        )
-
-        # Difference between highest high and lowest low
-        smi["hh_ll_diff"] = smi["highest_high"] - smi["lowest_low"]
-
-        # Exponential Moving Average of the difference between highest high and
-        # lowest low
-        smi["hh_ll_diff_ema"] = (
-            smi["hh_ll_diff"]
-            .ewm(span=self._smoothing_period, min_periods=self._smoothing_period, adjust=False)
-            .mean()
-        )
-
-        # Double Exponential Moving Average of the difference between highest
-        # high and lowest low
-        smi["hh_ll_diff_double_ema"] = (
-            smi["hh_ll_diff_ema"]
-            .ewm(
-                span=self._double_smoothing_period,
-                min_periods=self._double_smoothing_period,
-                adjust=False,
-            )
-            .mean()
-        )
-
-        # Calculate SMI
-        smi["smi"] = 100 * (smi["distance_double_ema"] / (0.5 * smi["hh_ll_diff_double_ema"]))
-
-        return smi[["smi"]].round(4)
-
     def getTiSignal(self):
         """
         Calculates and returns the trading signal for the calculated technical
@@ -207,3 +152,25 @@ class StochasticMomentumIndex(TechnicalIndicator):
             return TRADE_SIGNALS["sell"]
 
         return TRADE_SIGNALS["hold"]
+
+    def _calculateTiSignalSeries(self):
+        """
+        Calculates the trading signal for each row of the calculated technical
+        indicator, in a vectorized way.
+
+        Returns:
+            numpy.ndarray: The numeric value of the trading signal for each row.
+        """
+
+        smi = self._ti_data["smi"].to_numpy(dtype=np.float64)
+        smi_prev = self._shiftValues(smi)
+
+        return self._selectSignals(
+            [
+                # Buy when SMI falls below -40
+                ((smi_prev > -40.0) & (smi < -40.0), TRADE_SIGNALS["buy"]),
+                # Sell when SMI raises above +40
+                ((smi_prev < 40.0) & (smi > 40.0), TRADE_SIGNALS["sell"]),
+            ],
+            minimum_rows=2,
+        )
@@ -5,12 +5,12 @@ File name: _stochastic_oscillator.py
     Implements the Stochastic Oscillator technical indicator.
 """
 
-import pandas as pd
+import numpy as np
 
 from ._technical_indicator import TechnicalIndicator
+from .. import kernels
 from ..utils.constants import TRADE_SIGNALS
 from ..utils.exceptions import (
-    NotEnoughInputData,
     WrongTypeForInputParameter,
     WrongValueForInputParameter,
 )
@@ -44,6 +44,9 @@ class StochasticOscillator(TechnicalIndicator):
         fill_missing_values (bool, default=True): If set to True, missing
             values in the input data are being filled.
 
+        precision (int, default=4): The number of decimals the calculated
+            indicator is rounded to. If None, it is not rounded.
+
     Attributes:
         _input_data (pandas.DataFrame): The ``input_data`` after preprocessing.
 
@@ -71,6 +74,7 @@ class StochasticOscillator(TechnicalIndicator):
         d_periods=3,
         d_method="simple",
         fill_missing_values=True,
+        precision=4,
     ):
         # Validate and store if needed, the input parameters
         if isinstance(k_periods, int):
@@ -110,6 +114,7 @@ class StochasticOscillator(TechnicalIndicator):
             calling_instance=self.__class__.__name__,
             input_data=input_data,
             fill_missing_values=fill_missing_values,
+            precision=precision,
         )
 
     def _calculateTi(self):
@@ -129,69 +134,52 @@ class StochasticOscillator(TechnicalIndicator):
             NotEnoughInputData: Not enough data for calculating the indicator.
         """
 
-        # Not enough data for the requested k_periods
-        if len(self._input_data.index) < self._k_periods:
-            raise NotEnoughInputData(
-                "Stochastic Oscillator", self._k_periods, len(self._input_data.index)
-            )
-
-        so = pd.concat(
-            [
-                self._input_data,
-                self._input_data["low"].rolling(self._k_periods).min(),
-                self._input_data["high"].rolling(self._k_periods).max(),
-            ],
-            axis=1,
+        return self._kernelData(
+            ["%K", "%D"],
+            kernels.stochasticOscillator(
+                *self._inputArrays("high", "low", "close"),
+                self._k_periods,
+                self._k_slowing_periods,
+                self._d_periods,
+                self._d_method,
+                highest_high=self._highestHigh(self._k_periods),
+                lowest_low=self._lowestLow(self._k_periods),
+                decimals=self._precision,
+            ),
         )
 
-        columns_names = list(self._input_data.columns) + ["lowest_low", "highest_high"]
-
-        so.columns = columns_names
-
-        so = pd.concat(
-            [
-                so,
-                self._input_data["close"] - so["lowest_low"],
-                so["highest_high"] - so["lowest_low"],
-            ],
-            axis=1,
-        )
-
-        columns_names += ["numerator", "denominator"]
+    def _updateTi(self, new_input_data):
+        """
+        Calculates the technical indicator after new rows have been appended
+        to the input data. Only the new rows are calculated, from the last
+        known input rows which are in their windows.
 
-        so.columns = columns_names
+        Args:
+            new_input_data (pandas.DataFrame): The new rows of the input data,
+                after preprocessing.
 
-        so = pd.concat(
-            [
-                so,
-                so["numerator"].rolling(self._k_slowing_periods).sum(),
-                so["denominator"].rolling(self._k_slowing_periods).sum(),
-            ],
-            axis=1,
-        )
+        Returns:
+            pandas.DataFrame: The calculated indicator for the new rows. Index
+            is of type ``pandas.DatetimeIndex``. It contains two columns, the
+            ``%K`` and the ``%D``.
+        """
 
-        columns_names += ["smoothed_numerator", "smoothed_denominator"]
+        rows = len(new_input_data.index)
 
-        so.columns = columns_names
+        # Only the rows of the windows of the highest high and lowest low, of
+        # the %K slowing and of the %D are needed
+        window_rows = self._k_periods + self._k_slowing_periods + self._d_periods - 3
 
-        so = round(100 * so["smoothed_numerator"] / so["smoothed_denominator"], 4)
-        so = pd.concat(
-            [
-                so,
-                so.rolling(
-                    window=self._d_periods,
-                    min_periods=self._d_periods,
-                    win_type=(None if self._d_method == "simple" else self._d_method),
-                )
-                .mean()
-                .round(4),
-            ],
-            axis=1,
+        k, d = kernels.stochasticOscillator(
+            *self._inputArrays("high", "low", "close", rows=window_rows + rows),
+            self._k_periods,
+            self._k_slowing_periods,
+            self._d_periods,
+            self._d_method,
+            decimals=self._precision,
         )
 
-        so.columns = ["%K", "%D"]
-
-        return so
+        return self._kernelData(["%K", "%D"], (k[-rows:], d[-rows:]), index=new_input_data.index)
 
     def getTiSignal(self):
         """
@@ -244,3 +232,48 @@ class StochasticOscillator(TechnicalIndicator):
             return TRADE_SIGNALS["buy"]
 
         return TRADE_SIGNALS["hold"]
+
+    def _calculateTiSignalSeries(self):
+        """
+        Calculates the trading signal for each row of the calculated technical
+        indicator, in a vectorized way.
+
+        Returns:
+            numpy.ndarray: The numeric value of the trading signal for each row.
+        """
+
+        k = self._ti_data["%K"].to_numpy(dtype=np.float64)
+        k_prev = self._shiftValues(k)
+
+        d = self._ti_data["%D"].to_numpy(dtype=np.float64)
+        d_prev = self._shiftValues(d)
+
+        return self._selectSignals(
+            [
+                # A sell signal is given when the oscillator rises above the 80
+                # and then falls below 80.
+                (
+                    ((k_prev > 80.0) & (k < 80.0)) | ((d_prev > 80.0) & (d < 80.0)),
+                    TRADE_SIGNALS["sell"],
+                ),
+                # A buy signal is given when the oscillator falls below 20 and
+                # then rises above 20.
+                (
+                    ((k_prev < 20.0) & (k > 20.0)) | ((d_prev < 20.0) & (d > 20.0)),
+                    TRADE_SIGNALS["buy"],
+                ),
+                # A sell signal occurs when a decreasing %K line crosses below
+                # the %D line in the overbought region (%K > 80.)
+                (
+                    (k_prev - k > 0.0) & (k - d < 0.0) & (k > 80.0),
+                    TRADE_SIGNALS["sell"],
+                ),
+                # A buy signal occurs when an increasing %K line crosses above
+                # the %D line in the  oversold region (%K < 20.)
+                (
+                    (k_prev - k < 0.0) & (k - d > 0.0) & (k < 20.0),
+                    TRADE_SIGNALS["buy"],
+                ),
+            ],
+            minimum_rows=2,
+        )
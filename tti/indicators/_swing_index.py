@@ -5,9 +5,10 @@ File name: _swing_index.py
     Implements the Swing Index technical indicator.
 """
 
-import pandas as pd
+import numpy as np
 
 from ._technical_indicator import TechnicalIndicator
+from .. import kernels
 from ..utils.constants import TRADE_SIGNALS
 
 
@@ -23,6 +24,9 @@ class SwingIndex(TechnicalIndicator):
         fill_missing_values (bool, default=True): If set to True, missing
             values in the input data are being filled.
 
+        precision (int, default=4): The number of decimals the calculated
+            indicator is rounded to. If None, it is not rounded.
+
     Attributes:
         _input_data (pandas.DataFrame): The ``input_data`` after preprocessing.
 
@@ -41,12 +45,13 @@ class SwingIndex(TechnicalIndicator):
         ValueError: Value error occurred when validating the ``input_data``.
     """
 
-    def __init__(self, input_data, fill_missing_values=True):
+    def __init__(self, input_data, fill_missing_values=True, precision=4):
         # Control is passing to the parent class
         super().__init__(
             calling_instance=self.__class__.__name__,
             input_data=input_data,
             fill_missing_values=fill_missing_values,
+            precision=precision,
         )
 
     def _calculateTi(self):
@@ -59,53 +64,10 @@ class SwingIndex(TechnicalIndicator):
             ``pandas.DatetimeIndex``. It contains one column, the ``swi``.
         """
 
-        swi = pd.DataFrame(
-            index=self._input_data.index, columns=["swi"], data=None, dtype="float64"
+        return self._kernelData(
+            ["swi"], kernels.swingIndex(*self._inputArrays("open", "high", "low", "close"))
         )
 
-        # Absolute Difference between today's high and yesterday's close
-        swi["abs_th_yc_diff"] = (
-            self._input_data["high"] - self._input_data["close"].shift(1)
-        ).abs()
-
-        # Absolute Difference between today's low and yesterday's close
-        swi["abs_tl_yc_diff"] = (self._input_data["low"] - self._input_data["close"].shift(1)).abs()
-
-        # Difference between high and low
-        swi["th_tl_diff"] = self._input_data["high"] - self._input_data["low"]
-
-        # Absolute Difference between yesterday's close and open
-        swi["abs_yc_yo_diff"] = (
-            self._input_data["close"].shift(1) - self._input_data["open"].shift(1)
-        ).abs()
-
-        # Difference between today's and yesterday's close
-        swi["tc_yc_diff"] = self._input_data["close"] - self._input_data["close"].shift(1)
-
-        # Difference between today's close and open
-        swi["tc_to_diff"] = self._input_data["close"] - self._input_data["open"]
-
-        # Difference between yesterday's close and open
-        swi["yc_yo_diff"] = self._input_data["close"].shift(1) - self._input_data["open"].shift(1)
-
-        # Calculate Indicator
-        swi["numerator"] = swi["tc_yc_diff"] + 0.5 * swi["tc_to_diff"] + 0.25 * swi["yc_yo_diff"]
-
-        swi["K"] = pd.concat([swi["abs_th_yc_diff"], swi["abs_tl_yc_diff"]], axis=1).max(axis=1)
-
-        swi["R"] = (
-            pd.concat(
-                [swi["abs_th_yc_diff"], swi["abs_tl_yc_diff"], swi["th_tl_diff"]], axis=1
-            ).max(axis=1)
-            + 0.25 * swi["abs_yc_yo_diff"]
-        )
-
-        swi["swi"] = 50 * (swi["numerator"] / swi["R"]) * (swi["K"] / 3)
-        swi.loc[swi["swi"] > 100.0, ["swi"]] = 100.0
-        swi.loc[swi["swi"] < -100.0, ["swi"]] = -100.0
-
-        return swi[["swi"]].round(4)
-
     def getTiSignal(self):
         """
         Calculates and returns the trading signal for the calculated technical
@@ -129,3 +91,25 @@ class SwingIndex(TechnicalIndicator):
             return TRADE_SIGNALS["buy"]
 
         return TRADE_SIGNALS["hold"]
+
+    def _calculateTiSignalSeries(self):
+        """
+        Calculates the trading signal for each row of the calculated technical
+        indicator, in a vectorized way.
+
+        Returns:
+            numpy.ndarray: The numeric value of the trading signal for each row.
+        """
+
+        swi = self._ti_data["swi"].to_numpy(dtype=np.float64)
+        swi_prev = self._shiftValues(swi)
+
+        return self._selectSignals(
+            [
+                # SWI raises above zero, short uptrend
+                ((swi_prev < 0.0) & (swi > 0.0), TRADE_SIGNALS["sell"]),
+                # SWI falls below zero, short downtrend
+                ((swi_prev > 0.0) & (swi < 0.0), TRADE_SIGNALS["buy"]),
+            ],
+            minimum_rows=2,
+        )
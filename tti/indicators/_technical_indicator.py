@@ -5,14 +5,21 @@ File name: _technical_indicator.py
     Parent class for all the technical indicators.
 """
 
+import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
 from abc import ABC, abstractmethod
 
 from .properties.indicators_properties import INDICATORS_PROPERTIES
 from ..utils.plot import linesGraph
 from ..utils.data_validation import validateInputData
-from ..utils.exceptions import WrongTypeForInputParameter
+from ..utils.data_preprocessing import fillMissingValues
+from ..utils.prepared_input import PreparedInput
+from ..utils.result_cache import ResultCache, getResultCache
+from ..utils.row_buffer import RowBuffer
+from ..utils.float_dtype import getFloatDtype
+from ..utils.rolling_extrema import rollingExtrema
+from ..utils.constants import TRADE_SIGNALS
+from ..utils.exceptions import WrongTypeForInputParameter, WrongValueForInputParameter
 from ..utils.trading_simulation import TradingSimulation
 
 
@@ -25,12 +32,16 @@ class TechnicalIndicator(ABC):
     Args:
         calling_instance (str): The name of the calling class.
 
-        input_data (pandas.DataFrame): The input data. The index is of type
-            ``pandas.DatetimeIndex``.
+        input_data (pandas.DataFrame or tti.utils.PreparedInput): The input
+            data. The index is of type ``pandas.DatetimeIndex``. Input data
+            given as ``tti.utils.PreparedInput`` are not validated again.
 
         fill_missing_values (bool, default=True): If set to True,
             missing values in the input data are being filled.
 
+        precision (int, default=4): The number of decimals the calculated
+            indicator is rounded to. If None, it is not rounded.
+
     Attributes:
         _calling_instance (str): The name of the calling class.
 
@@ -38,60 +49,520 @@ class TechnicalIndicator(ABC):
 
         _input_data (pandas.DataFrame): The input data after preprocessing.
 
+        _fill_missing_values (bool): If True, missing values in the input
+            data are being filled.
+
+        _float_dtype (numpy.dtype): The floating point data type of the
+            calculations, as set by ``tti.utils.setFloatDtype`` when the
+            indicator was created.
+
+        _precision (int): The number of decimals the calculated indicator is
+            rounded to, or None if it is not rounded.
+
         _ti_data (pandas.DataFrame): Technical Indicator calculated data.
 
+        _prepared_input (tti.utils.PreparedInput): The prepared input the
+            indicator was created from, or None.
+
+        _features (dict): The intermediate calculations (features) of the
+            input data, which are shared with the other indicators created
+            from the same prepared input.
+
+        _row_buffers (dict): The preallocated storage (``tti.utils.RowBuffer``)
+            of the input data and the calculated indicator rows, for appending
+            the rows of the ``update`` method.
+
     Raises:
         WrongTypeForInputParameter: The type of an input parameter is invalid.
+        WrongValueForInputParameter: Unsupported value for input argument.
         NotEnoughInputData: Not enough data for calculating the indicator.
     """
 
-    def __init__(self, calling_instance, input_data, fill_missing_values=True):
+    def __init__(self, calling_instance, input_data, fill_missing_values=True, precision=4):
         # Validate fill missing values input parameter
         if not isinstance(fill_missing_values, bool):
             raise WrongTypeForInputParameter(
                 type(fill_missing_values), "fill_missing_values", "bool"
             )
 
+        # Validate precision input parameter
+        if precision is not None:
+            if not isinstance(precision, int) or isinstance(precision, bool):
+                raise WrongTypeForInputParameter(type(precision), "precision", "int or None")
+
+            if precision < 0:
+                raise WrongValueForInputParameter(precision, "precision", ">=0")
+
+        # The input arguments of the indicator, already set by the calling
+        # class. They are part of the key of the cached results.
+        arguments = repr(sorted(vars(self).items()))
+
         self._calling_instance = calling_instance
+        self._fill_missing_values = fill_missing_values
+        self._float_dtype = getFloatDtype()
+        self._precision = precision
 
         # Read the properties for the specific Technical Indicator
         self._properties = INDICATORS_PROPERTIES[calling_instance]
 
         # Input data preprocessing
-        self._input_data = validateInputData(
-            input_data,
-            self._properties["required_input_data"],
-            calling_instance,
-            fill_missing_values=fill_missing_values,
-        )
+        if isinstance(input_data, PreparedInput):
+            self._input_data = input_data.getInputData(
+                self._properties["required_input_data"],
+                calling_instance,
+                fill_missing_values=fill_missing_values,
+            )
+            self._prepared_input = input_data
+            self._features = input_data.getFeatures(fill_missing_values, self._float_dtype)
+        else:
+            self._input_data = validateInputData(
+                input_data,
+                self._properties["required_input_data"],
+                calling_instance,
+                fill_missing_values=fill_missing_values,
+            )
+            self._prepared_input = None
+            self._features = {}
+
+        self._row_buffers = {"input_data": RowBuffer(), "ti_data": RowBuffer()}
 
         # Calculation of the Technical Indicator
+        result_cache = getResultCache()
+
+        if result_cache is None:
+            self._ti_data = self._calculateTi()
+        else:
+            self._calculateTiCached(
+                result_cache,
+                (
+                    calling_instance,
+                    arguments,
+                    fill_missing_values,
+                    precision,
+                    self._float_dtype.name,
+                    (
+                        ResultCache.fingerprint(self._input_data)
+                        if self._prepared_input is None
+                        else self._prepared_input.getFingerprint(
+                            self._properties["required_input_data"], fill_missing_values
+                        )
+                    ),
+                ),
+            )
+
+    def _calculateTiCached(self, result_cache, key):
+        """
+        Calculates the technical indicator, or takes it from the result cache
+        when it is already calculated for the same input data and arguments.
+        Together with the indicator, the state of the instance set during the
+        calculation (attributes and input data columns) is cached as well.
+
+        Args:
+            result_cache (tti.utils.ResultCache): The result cache.
+
+            key (tuple): The key of the result, the class name, the input
+                arguments, the fill missing values option, the precision, the
+                floating point data type and the fingerprint of the input
+                data.
+        """
+
+        result = result_cache.get(key)
+
+        if result is not None:
+            self._ti_data, state = result
+
+            for name, value in state["attributes"].items():
+                setattr(self, name, value)
+
+            for column, values in state["input_data"].items():
+                self._input_data[column] = values
+
+            return
+
+        attributes = dict(vars(self))
+        input_data_columns = list(self._input_data.columns)
+
         self._ti_data = self._calculateTi()
 
-    @staticmethod
-    def _rolling_pipe(df, window, function):
+        state = {
+            "attributes": {
+                name: value
+                for name, value in vars(self).items()
+                if name != "_ti_data" and (name not in attributes or attributes[name] is not value)
+            },
+            "input_data": {
+                column: self._input_data[column]
+                for column in self._input_data.columns
+                if column not in input_data_columns
+            },
+        }
+
+        result_cache.put(key, self._ti_data, state)
+
+    def _feature(self, name, calculate):
+        """
+        Returns an intermediate calculation (feature) of the input data, which
+        is calculated only the first time it is requested. Features are
+        shared among the indicators created from the same prepared input, so
+        the returned value should not be modified in place.
+
+        Args:
+            name (tuple): The name of the feature, including its arguments.
+
+            calculate (function): Calculates the feature, when it is not
+                already calculated.
+
+        Returns:
+            object: The feature.
+        """
+
+        if name not in self._features:
+            self._features[name] = calculate()
+
+        return self._features[name]
+
+    def _inputArrays(self, *columns, rows=None):
+        """
+        Returns input data columns as arrays, as required by the indicators
+        kernels (``tti.kernels`` package).
+
+        Args:
+            *columns (str): The input data columns.
+
+            rows (int, default=None): If not None, only the given number of
+                last rows is returned.
+
+        Returns:
+            tuple: The values of each column (numpy.ndarray of the floating
+            point data type of the indicator).
+        """
+
+        values = tuple(
+            self._input_data[column].to_numpy(dtype=self._float_dtype) for column in columns
+        )
+
+        return values if rows is None else tuple(column[-rows:] for column in values)
+
+    def _kernelData(self, columns, values, rounded=True, index=None):
+        """
+        Builds the calculated indicator from the arrays returned by an
+        indicator kernel (``tti.kernels`` package).
+
+        Args:
+            columns ([str,]): The indicator columns.
+
+            values (numpy.ndarray or tuple): The values of each column. A
+                single array when the indicator has one column.
+
+            rounded (bool, default=True): If True, the values are rounded to
+                the ``precision`` of the indicator.
+
+            index (pandas.Index, default=None): The index of the calculated
+                indicator. If None, it is the first rows of the input data
+                index (the values can be fewer than the input data rows).
+
+        Returns:
+            pandas.DataFrame: The calculated indicator, of the floating point
+            data type of the indicator.
+        """
+
+        if isinstance(values, np.ndarray):
+            values = (values,)
+
+        if index is None:
+            index = self._input_data.index[: len(values[0])]
+
+        ti_data = pd.DataFrame(dict(zip(columns, values)), index=index, dtype=self._float_dtype)
+
+        if not rounded or self._precision is None:
+            return ti_data
+
+        return ti_data.round(self._precision)
+
+    def _panelData(self, columns, values, index, symbols):
         """
-        Applies a function to a pandas rolling pipe.
+        Builds the calculated indicator for a panel of symbols, from the
+        two-dimensional arrays (one column for each symbol) returned by an
+        indicator kernel (``tti.kernels`` package).
 
         Args:
-            df (pandas.DataFrame): The input pandas.DataFrame.
+            columns ([str,]): The indicator columns.
 
-            window (int): The size of the rolling window.
+            values (numpy.ndarray or tuple): The values of each column. A
+                single array when the indicator has one column.
 
-            function (function): The function to be applied.
+            index (pandas.DatetimeIndex): The index of the input data.
+
+            symbols (pandas.Index): The symbols.
 
         Returns:
-           pandas.Series: The result of the applied function.
+            dict: Keys are the indicator columns and values are
+            pandas.DataFrame objects with one column for each symbol.
         """
 
-        return pd.Series(
-            [
-                df.iloc[i - window : i].pipe(function) if i >= window else None
-                for i in range(1, len(df) + 1)
-            ],
-            index=df.index,
+        if isinstance(values, np.ndarray):
+            values = (values,)
+
+        panel_data = {}
+
+        for column, column_values in zip(columns, values):
+            panel_data[column] = pd.DataFrame(
+                column_values, index=index, columns=symbols, dtype=self._float_dtype
+            )
+
+            if self._precision is not None:
+                panel_data[column] = panel_data[column].round(self._precision)
+
+        return panel_data
+
+    def _trueRange(self):
+        """
+        Returns the True Range of the input data, the maximum of the current
+        high-low range and the distances of the current high and low from the
+        previous close. The True Range of the first row (no previous close) is
+        NaN.
+
+        Returns:
+            numpy.ndarray: The True Range.
+        """
+
+        from ..kernels._primitives import trueRange
+
+        return self._feature(
+            ("true_range",), lambda: trueRange(*self._inputArrays("high", "low", "close"))
         )
 
+    def _priceExtrema(self, periods, min_periods=None):
+        """
+        Returns the rolling lowest low and highest high of the input data, for
+        several periods. The extrema which are not already calculated are
+        calculated together, in one pass.
+
+        Args:
+            periods ([int,]): The sizes of the rolling windows.
+
+            min_periods (int, default=None): The minimum number of values in
+                a window, for calculating its extrema. If None, it is the
+                period of the window.
+
+        Returns:
+            dict: For each period, a (lowest low, highest high) tuple of
+            numpy.ndarray objects.
+        """
+
+        def name(extremum, period):
+            return (extremum, period, period if min_periods is None else min_periods)
+
+        missing_periods = [p for p in periods if name("highest_high", p) not in self._features]
+
+        if missing_periods:
+            extrema = rollingExtrema(
+                *self._inputArrays("low", "high"), missing_periods, min_periods
+            )
+
+            for period, (lowest_low, highest_high) in extrema.items():
+                self._features[name("lowest_low", period)] = lowest_low
+                self._features[name("highest_high", period)] = highest_high
+
+        return {
+            period: (
+                self._features[name("lowest_low", period)],
+                self._features[name("highest_high", period)],
+            )
+            for period in periods
+        }
+
+    def _highestHigh(self, period, min_periods=None):
+        """
+        Returns the rolling highest high of the input data.
+
+        Args:
+            period (int): The size of the rolling window.
+
+            min_periods (int, default=None): The minimum number of values in
+                the window, for calculating a value. If None, it is the
+                ``period``.
+
+        Returns:
+            numpy.ndarray: The highest high.
+        """
+
+        return self._priceExtrema([period], min_periods)[period][1]
+
+    def _lowestLow(self, period, min_periods=None):
+        """
+        Returns the rolling lowest low of the input data.
+
+        Args:
+            period (int): The size of the rolling window.
+
+            min_periods (int, default=None): The minimum number of values in
+                the window, for calculating a value. If None, it is the
+                ``period``.
+
+        Returns:
+            numpy.ndarray: The lowest low.
+        """
+
+        return self._priceExtrema([period], min_periods)[period][0]
+
+    def _typicalPrice(self):
+        """
+        Returns the Typical Price of the input data, the average of the high,
+        low and close prices.
+
+        Returns:
+            numpy.ndarray: The Typical Price.
+        """
+
+        from ..kernels import typicalPrice
+
+        return self._feature(
+            ("typical_price",), lambda: typicalPrice(*self._inputArrays("high", "low", "close"))
+        )
+
+    def _linearRegression(self, column, period):
+        """
+        Returns the rolling least squares regression line of an input data
+        column against the (evenly spaced) row number.
+
+        Args:
+            column (str): The input data column.
+
+            period (int): The size of the rolling window.
+
+        Returns:
+            (numpy.ndarray, numpy.ndarray): The ``slope`` of the regression
+            line and its ``value`` at the last row of the window.
+        """
+
+        from ..kernels._primitives import linearRegression
+
+        return self._feature(
+            ("linear_regression", column, period),
+            lambda: linearRegression(*self._inputArrays(column), period),
+        )
+
+    def _exponentialMovingAverage(self, column, span):
+        """
+        Returns the exponential moving average of an input data column, with
+        smoothing factor ``2 / (span + 1)``. The first ``span - 1`` values are
+        missing.
+
+        Args:
+            column (str): The input data column.
+
+            span (int): The span of the moving average.
+
+        Returns:
+            numpy.ndarray: The exponential moving average.
+        """
+
+        from ..kernels._primitives import exponentialMovingAverage
+
+        return self._feature(
+            ("exponential_moving_average", column, span),
+            lambda: exponentialMovingAverage(*self._inputArrays(column), span),
+        )
+
+    def _indicatorData(self, indicator, **kwargs):
+        """
+        Returns the calculated data of another indicator for the same input
+        data, as used by the composite indicators. The other indicator is
+        created from the prepared input (if any), so it shares its features.
+
+        Args:
+            indicator (type): The technical indicator class.
+
+            **kwargs: The input arguments of the technical indicator.
+
+        Returns:
+            pandas.DataFrame: The calculated data of the technical indicator.
+        """
+
+        # The other indicator is rounded as this one
+        kwargs["precision"] = self._precision
+
+        return self._feature(
+            (indicator.__name__,) + tuple(sorted(kwargs.items())),
+            lambda: indicator(
+                input_data=(
+                    self._input_data if self._prepared_input is None else self._prepared_input
+                ),
+                **kwargs,
+            ).getTiData(),
+        )
+
+    @staticmethod
+    def _shiftValues(values, periods=1):
+        """
+        Shifts the values of an array forward, filling the emptied positions
+        with NaN. It is used for accessing the previous rows of a column when
+        calculating the trading signal of all the rows at once.
+
+        Args:
+            values (numpy.ndarray or pandas.Series): The values to be shifted.
+
+            periods (int, default=1): Number of periods to shift.
+
+        Returns:
+            numpy.ndarray: The shifted values (dtype float64).
+        """
+
+        values = np.asarray(values, dtype=np.float64)
+        shifted = np.full(len(values), np.nan, dtype=np.float64)
+
+        if periods < len(values):
+            shifted[periods:] = values[: len(values) - periods]
+
+        return shifted
+
+    @staticmethod
+    def _selectSignals(conditions, minimum_rows=1):
+        """
+        Builds the trading signal of each row from a list of conditions. The
+        conditions are evaluated in the given order and the first one which is
+        True for a row defines the signal of that row, otherwise the signal is
+        ``hold``.
+
+        Args:
+            conditions ([(numpy.ndarray, (str, int)),]): Pairs of a boolean
+                mask and the trading signal (one of the ``TRADE_SIGNALS``)
+                produced when the mask is True.
+
+            minimum_rows (int, default=1): The minimum number of rows required
+                for calculating a trading signal. The signal of the rows before
+                is ``hold``.
+
+        Returns:
+            numpy.ndarray: The numeric value of the trading signal for each row.
+        """
+
+        signals = np.select(
+            [np.asarray(mask, dtype=bool) for mask, _ in conditions],
+            [signal[1] for _, signal in conditions],
+            default=TRADE_SIGNALS["hold"][1],
+        ).astype(np.int64)
+
+        signals[: max(minimum_rows - 1, 0)] = TRADE_SIGNALS["hold"][1]
+
+        return signals
+
+    def _signalInput(self, column):
+        """
+        Returns an input data column aligned to the rows of the calculated
+        indicator. The row ``i`` of the indicator is used together with the
+        input data up to (and including) the row ``i``.
+
+        Args:
+            column (str): The input data column.
+
+        Returns:
+            numpy.ndarray: The column values (dtype float64).
+        """
+
+        return self._input_data[column].to_numpy(dtype=np.float64)[: len(self._ti_data.index)]
+
     @abstractmethod
     def _calculateTi(self):
         """
@@ -107,6 +578,55 @@ class TechnicalIndicator(ABC):
 
         raise NotImplementedError
 
+    def _calculateTiPanel(self, panel_data):
+        """
+        Calculates the technical indicator for a panel of symbols at once,
+        with the parameters of this instance. It is used by the
+        ``tti.indicators.batch`` function.
+
+        This implementation returns None, meaning that the indicator does not
+        support the calculation for a panel of symbols, and it is calculated
+        separately for each symbol. Indicators whose calculation consists of
+        column-wise operations override it.
+
+        Args:
+            panel_data (dict): The input data of all the symbols. Keys are the
+                required input data columns and values are pandas.DataFrame
+                objects with one column for each symbol. The index is of type
+                ``pandas.DatetimeIndex``, sorted, and missing values are
+                already filled (if requested).
+
+        Returns:
+            dict or None: Keys are the indicator columns and values are
+            pandas.DataFrame objects with the calculated indicator, one column
+            for each symbol.
+        """
+
+        return None
+
+    def _updateTi(self, new_input_data):
+        """
+        Calculates the technical indicator after new rows have been appended
+        to the input data. The input data are taken from an attribute of the
+        parent class and already contain the new rows.
+
+        This implementation recalculates the indicator for the whole input
+        data, the already calculated rows do not change. Indicators which keep
+        the state of their calculation, or need only the last input data rows,
+        override it and calculate only the new rows.
+
+        Args:
+            new_input_data (pandas.DataFrame): The new rows of the input data,
+                after preprocessing.
+
+        Returns:
+            pandas.DataFrame: The calculated indicator for the rows following
+            the already calculated ones. Index is of type
+            ``pandas.DatetimeIndex``.
+        """
+
+        return self._calculateTi().iloc[len(self._ti_data.index) :]
+
     @abstractmethod
     def getTiSignal(self):
         """
@@ -123,6 +643,126 @@ class TechnicalIndicator(ABC):
 
         raise NotImplementedError
 
+    def _calculateTiSignalSeries(self):
+        """
+        Calculates the trading signal for each row of the calculated technical
+        indicator. The signal of row ``i`` is the one returned by the
+        ``getTiSignal`` method when only the data up to row ``i`` are known.
+
+        This implementation calls the ``getTiSignal`` method once per row, on
+        a view of the data limited to that row. Indicators override it with an
+        equivalent vectorized calculation.
+
+        Returns:
+            numpy.ndarray: The numeric value of the trading signal for each row.
+        """
+
+        full_ti_data = self._ti_data
+        full_input_data = self._input_data
+
+        signals = np.zeros(len(full_ti_data.index), dtype=np.int64)
+
+        try:
+            for i in range(len(full_ti_data.index)):
+                self._input_data = full_input_data.iloc[: i + 1]
+                self._ti_data = full_ti_data.iloc[: i + 1]
+
+                signals[i] = self.getTiSignal()[1]
+
+        finally:
+            # Restore input and indicator data to full range
+            self._ti_data = full_ti_data
+            self._input_data = full_input_data
+
+        return signals
+
+    def getTiSignalSeries(self):
+        """
+        Calculates and returns the trading signal for each row of the
+        calculated technical indicator, in a single pass. The signal of each
+        row is the same as the one returned by the ``getTiSignal`` method when
+        only the data up to that row are known.
+
+        Returns:
+            pandas.DataFrame: The trading signals. Index is of type
+            ``pandas.DatetimeIndex``, the same as the index of the calculated
+            indicator. It contains one column ``signal``, with the numeric
+            value of the trading signal (``buy`` is -1, ``hold`` is 0 and
+            ``sell`` is 1).
+        """
+
+        return pd.DataFrame(
+            index=self._ti_data.index,
+            columns=["signal"],
+            data=self._calculateTiSignalSeries(),
+            dtype="int64",
+        )
+
+    def update(self, new_rows):
+        """
+        Appends new rows to the input data and calculates the technical
+        indicator for them. Indicators which keep the state of their
+        calculation (for example moving averages, Wilder's smoothing, Moving
+        Average Convergence Divergence, Directional Movement Index, Parabolic
+        SAR and On Balance Volume), or which need only the last rows of the
+        input data (Stochastic Oscillator), calculate only the new rows. The
+        rows are appended to preallocated arrays, so the time needed does not
+        depend on the length of the already known data. The updated rows of
+        the simple and triangular moving averages can differ in the last
+        decimal from a calculation of all the rows.
+
+        Args:
+            new_rows (pandas.DataFrame): The new input data rows. The index is
+                of type ``pandas.DatetimeIndex``, and it should be later than
+                the index of the already known input data. The required columns
+                are the same as for the ``input_data`` of the indicator.
+
+        Returns:
+            pandas.DataFrame: The rows added to the calculated indicator. Index
+            is of type ``pandas.DatetimeIndex``.
+
+        Raises:
+            WrongTypeForInputParameter: Input argument has wrong type.
+            WrongValueForInputParameter: Unsupported value for input argument.
+            TypeError: Type error occurred when validating the ``new_rows``.
+            ValueError: Value error occurred when validating the ``new_rows``.
+        """
+
+        new_input_data = validateInputData(
+            new_rows,
+            self._properties["required_input_data"],
+            self._calling_instance,
+            fill_missing_values=False,
+        )
+
+        if new_input_data.index[0] <= self._input_data.index[-1]:
+            raise WrongValueForInputParameter(
+                new_input_data.index[0],
+                "new_rows index",
+                "> " + str(self._input_data.index[-1]),
+            )
+
+        # Missing values are filled forward from the already known input data
+        if self._fill_missing_values:
+            new_input_data = fillMissingValues(
+                pd.concat([self._input_data.iloc[-1:], new_input_data])
+            ).iloc[1:]
+
+        ti_data_rows = len(self._ti_data.index)
+
+        # The rows are appended without copying the already known ones
+        self._input_data = self._row_buffers["input_data"].append(self._input_data, new_input_data)
+
+        # The input data differ now from the prepared input
+        self._prepared_input = None
+        self._features = {}
+
+        self._ti_data = self._row_buffers["ti_data"].append(
+            self._ti_data, self._updateTi(new_input_data)
+        )
+
+        return self._ti_data.iloc[ti_data_rows:]
+
     def getTiData(self):
         """
         Returns the Technical Indicator values for the whole period.
@@ -156,6 +796,20 @@ class TechnicalIndicator(ABC):
         except (Exception, ValueError):
             return None
 
+    def _graphInputData(self):
+        """
+        Returns the input data plotted together with the calculated indicator
+        (``graph_input_columns`` property). Indicators which plot values
+        derived from the input data override it, so the values are not kept
+        as input data columns.
+
+        Returns:
+            pandas.DataFrame: The input data to be plotted. Index is of type
+            ``pandas.DatetimeIndex``.
+        """
+
+        return self._input_data[self._properties["graph_input_columns"]]
+
     def getTiGraph(self):
         """
         Generates a plot customized for each Technical Indicator.
@@ -166,11 +820,9 @@ class TechnicalIndicator(ABC):
 
         # Check if split to subplots is required for this Indicator
         if self._properties["graph_subplots"]:
-            data = [self._input_data[self._properties["graph_input_columns"]], self._ti_data]
+            data = [self._graphInputData(), self._ti_data]
         else:
-            data = pd.concat(
-                [self._input_data[self._properties["graph_input_columns"]], self._ti_data], axis=1
-            )
+            data = pd.concat([self._graphInputData(), self._ti_data], axis=1)
 
         return linesGraph(
             data=data,
@@ -195,6 +847,8 @@ class TechnicalIndicator(ABC):
         Returns:
             matplotlib.pyplot: The produced graph.
         """
+        import matplotlib.pyplot as plt
+
         fig, axes = plt.subplots(
             nrows=3,
             ncols=1,
@@ -405,22 +1059,9 @@ class TechnicalIndicator(ABC):
             short_exposure_factor=short_exposure_factor,
         )
 
-        # keep safe the full input and indicator data
-        full_ti_data = self._ti_data
-        full_input_data = self._input_data
-
-        # Run simulation rounds for the whole period
-        for i in range(len(self._ti_data.index)):
-            # Limit the input and indicator data to this simulation round
-            self._input_data = full_input_data[full_input_data.index <= full_input_data.index[i]]
-
-            self._ti_data = full_ti_data[full_ti_data.index <= full_ti_data.index[i]]
-
-            simulator.runSimulationRound(i_index=i, signal=self.getTiSignal())
-
-        # Restore input and indicator data to full range
-        self._ti_data = full_ti_data
-        self._input_data = full_input_data
+        # Run simulation rounds for the whole period. The signal of each round
+        # is calculated using only the data up to that round
+        simulator.runSimulationRounds(signals=self._calculateTiSignalSeries())
 
         simulation_data, statistics = simulator.closeSimulation()
 
@@ -5,9 +5,10 @@ File name: _time_series_forecast.py
     Implements the Time Series Forecast technical indicator.
 """
 
-import pandas as pd
+import numpy as np
 
 from ._technical_indicator import TechnicalIndicator
+from .. import kernels
 from ._linear_regression_slope import LinearRegressionSlope
 from ._linear_regression_indicator import LinearRegressionIndicator
 from ..utils.constants import TRADE_SIGNALS
@@ -32,6 +33,9 @@ class TimeSeriesForecast(TechnicalIndicator):
         fill_missing_values (bool, default=True): If set to True, missing
             values in the input data are being filled.
 
+        precision (int, default=4): The number of decimals the calculated
+            indicator is rounded to. If None, it is not rounded.
+
     Attributes:
         _input_data (pandas.DataFrame): The ``input_data`` after preprocessing.
 
@@ -50,7 +54,7 @@ class TimeSeriesForecast(TechnicalIndicator):
         ValueError: Value error occurred when validating the ``input_data``.
     """
 
-    def __init__(self, input_data, period=14, fill_missing_values=True):
+    def __init__(self, input_data, period=14, fill_missing_values=True, precision=4):
         # Validate and store if needed, the input parameters
         if isinstance(period, int):
             if period > 1:
@@ -65,6 +69,7 @@ class TimeSeriesForecast(TechnicalIndicator):
             calling_instance=self.__class__.__name__,
             input_data=input_data,
             fill_missing_values=fill_missing_values,
+            precision=precision,
         )
 
     def _calculateTi(self):
@@ -86,28 +91,20 @@ class TimeSeriesForecast(TechnicalIndicator):
                 "Time Series Forecast", self._period, len(self._input_data.index)
             )
 
-        tsf = pd.DataFrame(
-            index=self._input_data.index, columns=["tsf"], data=None, dtype="float64"
-        )
-
-        tsf.iloc[self._period - 1 :, 0] = (
-            pd.concat(
-                objs=[
-                    LinearRegressionSlope(
-                        input_data=self._input_data, period=self._period
-                    ).getTiData(),
-                    LinearRegressionIndicator(
-                        input_data=self._input_data, period=self._period
-                    ).getTiData(),
-                ],
-                axis=1,
-            )
-            .sum(axis=1)
-            .iloc[self._period - 1 :]
+        return self._kernelData(
+            ["tsf"],
+            kernels.timeSeriesForecast(
+                *self._inputArrays("close"),
+                self._period,
+                slope=self._indicatorData(LinearRegressionSlope, period=self._period)[
+                    "lrs"
+                ].to_numpy(dtype=np.float64),
+                value=self._indicatorData(LinearRegressionIndicator, period=self._period)[
+                    "lri"
+                ].to_numpy(dtype=np.float64),
+            ),
         )
 
-        return tsf.round(4)
-
     def getTiSignal(self):
         """
         Calculates and returns the trading signal for the calculated technical
@@ -137,3 +134,28 @@ class TimeSeriesForecast(TechnicalIndicator):
             return TRADE_SIGNALS["sell"]
 
         return TRADE_SIGNALS["hold"]
+
+    def _calculateTiSignalSeries(self):
+        """
+        Calculates the trading signal for each row of the calculated technical
+        indicator, in a vectorized way.
+
+        Returns:
+            numpy.ndarray: The numeric value of the trading signal for each row.
+        """
+
+        close = self._signalInput("close")
+        close_prev = self._shiftValues(close)
+
+        tsf = self._ti_data["tsf"].to_numpy(dtype=np.float64)
+        tsf_prev = self._shiftValues(tsf)
+
+        return self._selectSignals(
+            [
+                # Close price goes below Time Series Forecast
+                ((close_prev > tsf_prev) & (close < tsf), TRADE_SIGNALS["buy"]),
+                # Close price goes above Time Series Forecast
+                ((close_prev < tsf_prev) & (close > tsf), TRADE_SIGNALS["sell"]),
+            ],
+            minimum_rows=2,
+        )
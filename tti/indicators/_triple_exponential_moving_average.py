@@ -5,12 +5,12 @@ File name: _triple_exponential_moving_average.py
     Implements the Triple Exponential Moving Average technical indicator.
 """
 
-import pandas as pd
+import numpy as np
 
 from ._technical_indicator import TechnicalIndicator
+from .. import kernels
 from ..utils.constants import TRADE_SIGNALS
 from ..utils.exceptions import (
-    NotEnoughInputData,
     WrongTypeForInputParameter,
     WrongValueForInputParameter,
 )
@@ -30,6 +30,9 @@ class TripleExponentialMovingAverage(TechnicalIndicator):
         fill_missing_values (bool, default=True): If set to True, missing
             values in the input data are being filled.
 
+        precision (int, default=4): The number of decimals the calculated
+            indicator is rounded to. If None, it is not rounded.
+
     RAttributes:
         _input_data (pandas.DataFrame): The ``input_data`` after preprocessing.
 
@@ -40,6 +43,10 @@ class TripleExponentialMovingAverage(TechnicalIndicator):
 
         _calling_instance (str): The name of the class.
 
+        _state (dict): The state of the calculation after the last row (state
+            of the three exponential moving averages), used for updating the
+            indicator with new input data.
+
     Raises:
         WrongTypeForInputParameter: Input argument has wrong type.
         WrongValueForInputParameter: Unsupported value for input argument.
@@ -48,7 +55,7 @@ class TripleExponentialMovingAverage(TechnicalIndicator):
         ValueError: Value error occurred when validating the ``input_data``.
     """
 
-    def __init__(self, input_data, period=5, fill_missing_values=True):
+    def __init__(self, input_data, period=5, fill_missing_values=True, precision=4):
         # Validate and store if needed, the input parameters
         if isinstance(period, int):
             if period > 0:
@@ -63,6 +70,7 @@ class TripleExponentialMovingAverage(TechnicalIndicator):
             calling_instance=self.__class__.__name__,
             input_data=input_data,
             fill_missing_values=fill_missing_values,
+            precision=precision,
         )
 
     def _calculateTi(self):
@@ -78,28 +86,46 @@ class TripleExponentialMovingAverage(TechnicalIndicator):
             NotEnoughInputData: Not enough data for calculating the indicator.
         """
 
-        # Not enough data for the requested period
-        if len(self._input_data.index) < self._period:
-            raise NotEnoughInputData(
-                "Triple Exponential Moving Average", self._period, len(self._input_data.index)
-            )
+        # State of the exponential moving averages, used for updating the
+        # indicator with new input data
+        self._state = {}
 
-        tema = pd.DataFrame(index=self._input_data.index, columns=["tema"], data=0, dtype="float64")
+        return self._kernelData(
+            ["tema"],
+            kernels.tripleExponentialMovingAverage(
+                *self._inputArrays("close"), self._period, state=self._state
+            ),
+        )
 
-        # Exponential moving average of prices
-        ema = self._input_data.ewm(span=self._period, min_periods=self._period, adjust=False).mean()
+    def _updateTi(self, new_input_data):
+        """
+        Calculates the technical indicator after new rows have been appended
+        to the input data. Only the new rows are calculated, continuing the
+        exponential moving averages from their state.
 
-        # Double Exponential moving average of prices
-        double_ema = ema.ewm(span=self._period, min_periods=self._period, adjust=False).mean()
+        Args:
+            new_input_data (pandas.DataFrame): The new rows of the input data,
+                after preprocessing.
 
-        # Triple Exponential moving average of prices
-        triple_ema = double_ema.ewm(
-            span=self._period, min_periods=self._period, adjust=False
-        ).mean()
+        Returns:
+            pandas.DataFrame: The calculated indicator for the new rows. Index
+            is of type ``pandas.DatetimeIndex``. It contains one column, the
+            ``tema``.
+        """
+
+        # The state is copied, the stored one can be shared with the result
+        # cache
+        state = dict(self._state)
+
+        tema = kernels.tripleExponentialMovingAverage(
+            *self._inputArrays("close", rows=len(new_input_data.index)),
+            self._period,
+            state=state,
+        )
 
-        tema["tema"] = (3 * ema) - (3 * double_ema) + triple_ema
+        self._state = state
 
-        return tema.round(4)
+        return self._kernelData(["tema"], tema, index=new_input_data.index)
 
     def getTiSignal(self):
         """
@@ -124,3 +150,25 @@ class TripleExponentialMovingAverage(TechnicalIndicator):
             return TRADE_SIGNALS["sell"]
 
         return TRADE_SIGNALS["hold"]
+
+    def _calculateTiSignalSeries(self):
+        """
+        Calculates the trading signal for each row of the calculated technical
+        indicator, in a vectorized way.
+
+        Returns:
+            numpy.ndarray: The numeric value of the trading signal for each row.
+        """
+
+        close = self._signalInput("close")
+
+        tema = self._ti_data["tema"].to_numpy(dtype=np.float64)
+
+        return self._selectSignals(
+            [
+                # Close price is below Moving Average
+                (close < tema, TRADE_SIGNALS["buy"]),
+                # Close price is above Moving Average
+                (close > tema, TRADE_SIGNALS["sell"]),
+            ],
+        )
@@ -5,7 +5,7 @@ File name: _typical_price.py
     Implements the Typical Price technical indicator.
 """
 
-import pandas as pd
+import numpy as np
 
 from ._technical_indicator import TechnicalIndicator
 from ..utils.constants import TRADE_SIGNALS
@@ -27,6 +27,9 @@ class TypicalPrice(TechnicalIndicator):
         fill_missing_values (bool, default=True): If set to True, missing
             values in the input data are being filled.
 
+        precision (int, default=4): The number of decimals the calculated
+            indicator is rounded to. If None, it is not rounded.
+
     Attributes:
         _input_data (pandas.DataFrame): The ``input_data`` after preprocessing.
 
@@ -45,7 +48,7 @@ class TypicalPrice(TechnicalIndicator):
         ValueError: Value error occurred when validating the ``input_data``.
     """
 
-    def __init__(self, input_data, period=200, fill_missing_values=True):
+    def __init__(self, input_data, period=200, fill_missing_values=True, precision=4):
         # Validate and store if needed, the input parameters
         if isinstance(period, int):
             if period > 0:
@@ -60,6 +63,7 @@ class TypicalPrice(TechnicalIndicator):
             calling_instance=self.__class__.__name__,
             input_data=input_data,
             fill_missing_values=fill_missing_values,
+            precision=precision,
         )
 
     def _calculateTi(self):
@@ -72,14 +76,7 @@ class TypicalPrice(TechnicalIndicator):
             ``pandas.DatetimeIndex``. It contains one column, the ``tp``.
         """
 
-        tp = pd.DataFrame(
-            index=self._input_data.index,
-            columns=["tp"],
-            data=self._input_data.mean(axis=1),
-            dtype="float64",
-        )
-
-        return tp.round(4)
+        return self._kernelData(["tp"], self._typicalPrice())
 
     def getTiSignal(self):
         """
@@ -103,3 +100,30 @@ class TypicalPrice(TechnicalIndicator):
             return TRADE_SIGNALS["buy"]
 
         return TRADE_SIGNALS["hold"]
+
+    def _calculateTiSignalSeries(self):
+        """
+        Calculates the trading signal for each row of the calculated technical
+        indicator, in a vectorized way.
+
+        Returns:
+            numpy.ndarray: The numeric value of the trading signal for each row.
+        """
+
+        rows = len(self._ti_data.index)
+
+        # Moving average, calculated on the first input data column
+        ma = (
+            self._input_data.iloc[:rows, 0]
+            .rolling(window=self._period, min_periods=self._period)
+            .mean()
+            .to_numpy(dtype=np.float64)
+        )
+
+        return self._selectSignals(
+            [
+                # Indicator goes above Moving Average
+                (self._ti_data["tp"].to_numpy(dtype=np.float64) > ma, TRADE_SIGNALS["buy"]),
+            ],
+            minimum_rows=self._period,
+        )
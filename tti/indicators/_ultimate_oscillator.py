@@ -5,11 +5,12 @@ File name: _ultimate_oscillator.py
     Implements the Ultimate Oscillator technical indicator.
 """
 
-import pandas as pd
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
 
 from ._technical_indicator import TechnicalIndicator
+from .. import kernels
 from ..utils.constants import TRADE_SIGNALS
-from ..utils.exceptions import NotEnoughInputData
 
 
 class UltimateOscillator(TechnicalIndicator):
@@ -24,6 +25,9 @@ class UltimateOscillator(TechnicalIndicator):
         fill_missing_values (bool, default=True): If set to True, missing
             values in the input data are being filled.
 
+        precision (int, default=4): The number of decimals the calculated
+            indicator is rounded to. If None, it is not rounded.
+
     Attributes:
         _input_data (pandas.DataFrame): The ``input_data`` after preprocessing.
 
@@ -42,12 +46,13 @@ class UltimateOscillator(TechnicalIndicator):
         ValueError: Value error occurred when validating the ``input_data``.
     """
 
-    def __init__(self, input_data, fill_missing_values=True):
+    def __init__(self, input_data, fill_missing_values=True, precision=4):
         # Control is passing to the parent class
         super().__init__(
             calling_instance=self.__class__.__name__,
             input_data=input_data,
             fill_missing_values=fill_missing_values,
+            precision=precision,
         )
 
     def _calculateTi(self):
@@ -63,56 +68,13 @@ class UltimateOscillator(TechnicalIndicator):
             NotEnoughInputData: Not enough data for calculating the indicator.
         """
 
-        # Not enough data for the requested period
-        if len(self._input_data.index) < 28:
-            raise NotEnoughInputData("Ultimate Oscillator", 28, len(self._input_data.index))
-
-        uosc = pd.DataFrame(
-            index=self._input_data.index, columns=["uosc"], data=None, dtype="float64"
+        return self._kernelData(
+            ["uosc"],
+            kernels.ultimateOscillator(
+                *self._inputArrays("high", "low", "close"), true_range=self._trueRange()
+            ),
         )
 
-        uosc["true_high"] = pd.concat(
-            [self._input_data["high"], self._input_data["close"].shift(1)], axis=1
-        ).max(axis=1, skipna=False)
-
-        uosc["true_low"] = pd.concat(
-            [self._input_data["low"], self._input_data["close"].shift(1)], axis=1
-        ).min(axis=1, skipna=False)
-
-        uosc["range"] = uosc["true_high"] - uosc["true_low"]
-
-        uosc["7_range_sum"] = uosc["range"].rolling(window=7, min_periods=7).sum()
-
-        uosc["buying_units"] = self._input_data["close"] - uosc["true_low"]
-
-        uosc["7_buying_units_sum"] = uosc["buying_units"].rolling(window=7, min_periods=7).sum()
-
-        uosc["7_bus_rs_division"] = uosc["7_buying_units_sum"] / uosc["7_range_sum"]
-
-        uosc["14_range_sum"] = uosc["range"].rolling(window=14, min_periods=14).sum()
-
-        uosc["14_buying_units_sum"] = uosc["buying_units"].rolling(window=14, min_periods=14).sum()
-
-        uosc["14_bus_rs_division"] = uosc["14_buying_units_sum"] / uosc["14_range_sum"]
-
-        uosc["28_range_sum"] = uosc["range"].rolling(window=28, min_periods=28).sum()
-
-        uosc["28_buying_units_sum"] = uosc["buying_units"].rolling(window=28, min_periods=28).sum()
-
-        uosc["28_bus_rs_division"] = uosc["28_buying_units_sum"] / uosc["28_range_sum"]
-
-        uosc["uosc"] = (
-            100
-            * (
-                (4 * uosc["7_bus_rs_division"])
-                + (2 * uosc["14_bus_rs_division"])
-                + uosc["28_bus_rs_division"]
-            )
-            / 7
-        )
-
-        return uosc[["uosc"]].round(4)
-
     def getTiSignal(self):
         """
         Calculates and returns the trading signal for the calculated technical
@@ -147,3 +109,62 @@ class UltimateOscillator(TechnicalIndicator):
                     return TRADE_SIGNALS["buy"]
 
         return TRADE_SIGNALS["hold"]
+
+    def _calculateTiSignalSeries(self):
+        """
+        Calculates the trading signal for each row of the calculated technical
+        indicator, in a vectorized way.
+
+        Returns:
+            numpy.ndarray: The numeric value of the trading signal for each row.
+        """
+
+        # Last periods to consider when looking for bullish or bearish
+        # divergence
+        span_period = 30
+
+        rows = len(self._ti_data.index)
+
+        if rows < span_period:
+            return np.full(rows, TRADE_SIGNALS["hold"][1], dtype=np.int64)
+
+        close_windows = sliding_window_view(self._signalInput("close"), span_period)
+        uosc = self._ti_data["uosc"].to_numpy(dtype=np.float64)
+        uosc_windows = sliding_window_view(uosc, span_period)
+
+        # Position of the lowest value in each window, missing values skipped
+        close_low_index = self._nanArgMin(close_windows)
+        uosc_low_index = self._nanArgMin(uosc_windows)
+
+        # Buy when indicator makes a highest high during the bullish period
+        highest_high = np.full(rows, False)
+        highest_high[span_period - 1 :] = (
+            np.all(uosc_windows[:, :-1] != 0.0, axis=1).astype(np.float64) < uosc[span_period - 1 :]
+        )
+
+        bullish_divergence = np.full(rows, False)
+        bullish_divergence[span_period - 1 :] = close_low_index != uosc_low_index
+
+        return self._selectSignals(
+            [(bullish_divergence & highest_high, TRADE_SIGNALS["buy"])],
+            minimum_rows=span_period,
+        )
+
+    @staticmethod
+    def _nanArgMin(windows):
+        """
+        Returns the position of the lowest value in each window, ignoring the
+        missing values. Windows with only missing values get -1.
+
+        Args:
+            windows (numpy.ndarray): Two dimensional array, one window per row.
+
+        Returns:
+            numpy.ndarray: The position of the lowest value in each window.
+        """
+
+        all_missing = np.all(np.isnan(windows), axis=1)
+
+        return np.where(
+            all_missing, -1, np.argmin(np.where(np.isnan(windows), np.inf, windows), axis=1)
+        )
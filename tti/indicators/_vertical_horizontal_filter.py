@@ -5,14 +5,14 @@ File name: _vertical_horizontal_filter.py
     Implements the Vertical Horizontal Filter technical indicator.
 """
 
-import pandas as pd
+import numpy as np
 
 from ._technical_indicator import TechnicalIndicator
+from .. import kernels
 from ._double_exponential_moving_average import DoubleExponentialMovingAverage
 from ._momentum import Momentum
 from ..utils.constants import TRADE_SIGNALS
 from ..utils.exceptions import (
-    NotEnoughInputData,
     WrongTypeForInputParameter,
     WrongValueForInputParameter,
 )
@@ -32,6 +32,9 @@ class VerticalHorizontalFilter(TechnicalIndicator):
         fill_missing_values (bool, default=True): If set to True, missing
             values in the input data are being filled.
 
+        precision (int, default=4): The number of decimals the calculated
+            indicator is rounded to. If None, it is not rounded.
+
     Attributes:
         _input_data (pandas.DataFrame): The ``input_data`` after preprocessing.
 
@@ -50,7 +53,7 @@ class VerticalHorizontalFilter(TechnicalIndicator):
         ValueError: Value error occurred when validating the ``input_data``.
     """
 
-    def __init__(self, input_data, period=5, fill_missing_values=True):
+    def __init__(self, input_data, period=5, fill_missing_values=True, precision=4):
         # Validate and store if needed, the input parameters
         if isinstance(period, int):
             if period > 0:
@@ -65,6 +68,7 @@ class VerticalHorizontalFilter(TechnicalIndicator):
             calling_instance=self.__class__.__name__,
             input_data=input_data,
             fill_missing_values=fill_missing_values,
+            precision=precision,
         )
 
     def _calculateTi(self):
@@ -80,38 +84,10 @@ class VerticalHorizontalFilter(TechnicalIndicator):
             NotEnoughInputData: Not enough data for calculating the indicator.
         """
 
-        # Not enough data for the requested period
-        if len(self._input_data.index) < self._period:
-            raise NotEnoughInputData(
-                "Vertical Horizontal Filter", self._period, len(self._input_data.index)
-            )
-
-        vhf = pd.DataFrame(
-            index=self._input_data.index, columns=["vhf"], data=None, dtype="float64"
-        )
-
-        vhf["highest_close"] = (
-            self._input_data["close"].rolling(window=self._period, min_periods=self._period).max()
-        )
-
-        vhf["lowest_close"] = (
-            self._input_data["close"].rolling(window=self._period, min_periods=self._period).min()
-        )
-
-        # Absolute difference between highest_close and lowest_close
-        vhf["hc_lc_diff"] = (vhf["highest_close"] - vhf["lowest_close"]).abs()
-
-        # Absolute difference of today's close with yesterday's close
-        vhf["close_change"] = (self._input_data["close"] - self._input_data["close"].shift(1)).abs()
-
-        vhf["close_change_sum"] = (
-            vhf["close_change"].rolling(window=self._period, min_periods=self._period).sum()
+        return self._kernelData(
+            ["vhf"], kernels.verticalHorizontalFilter(*self._inputArrays("close"), self._period)
         )
 
-        vhf["vhf"] = vhf["hc_lc_diff"] / vhf["close_change_sum"]
-
-        return vhf[["vhf"]].round(4)
-
     def getTiSignal(self):
         """
         Calculates and returns the trading signal for the calculated technical
@@ -151,3 +127,41 @@ class VerticalHorizontalFilter(TechnicalIndicator):
                 return Momentum(self._input_data, period=12).getTiSignal()
 
         return TRADE_SIGNALS["hold"]
+
+    def _calculateTiSignalSeries(self):
+        """
+        Calculates the trading signal for each row of the calculated technical
+        indicator, in a vectorized way.
+
+        Returns:
+            numpy.ndarray: The numeric value of the trading signal for each row.
+        """
+
+        rows = len(self._ti_data.index)
+
+        vhf = self._ti_data["vhf"].to_numpy(dtype=np.float64)
+        vhf_prev = self._shiftValues(vhf, periods=1)
+        vhf_prev_2 = self._shiftValues(vhf, periods=2)
+
+        # Number of input data rows known at each row
+        known_rows = np.arange(1, rows + 1)
+
+        signals = np.full(rows, TRADE_SIGNALS["hold"][1], dtype=np.int64)
+
+        # Rising values indicate a trend
+        rising = (vhf_prev_2 < vhf_prev) & (vhf_prev < vhf) & (known_rows >= 5)
+
+        if rising.any():
+            signals[rising] = DoubleExponentialMovingAverage(
+                self._input_data, period=5
+            )._calculateTiSignalSeries()[:rows][rising]
+
+        # Falling values indicate a ranging market
+        falling = (vhf_prev_2 > vhf_prev) & (vhf_prev > vhf) & (known_rows >= 12)
+
+        if falling.any():
+            signals[falling] = Momentum(self._input_data, period=12)._calculateTiSignalSeries()[
+                :rows
+            ][falling]
+
+        return signals
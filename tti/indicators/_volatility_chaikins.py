@@ -5,12 +5,12 @@ File name: _volatility_chaikins.py
     Implements the Volatility Chaikins technical indicator.
 """
 
-import pandas as pd
+import numpy as np
 
 from ._technical_indicator import TechnicalIndicator
+from .. import kernels
 from ..utils.constants import TRADE_SIGNALS
 from ..utils.exceptions import (
-    NotEnoughInputData,
     WrongTypeForInputParameter,
     WrongValueForInputParameter,
 )
@@ -36,6 +36,9 @@ class VolatilityChaikins(TechnicalIndicator):
         fill_missing_values (bool, default=True): If set to True, missing
             values in the input data are being filled.
 
+        precision (int, default=4): The number of decimals the calculated
+            indicator is rounded to. If None, it is not rounded.
+
     Attributes:
         _input_data (pandas.DataFrame): The ``input_data`` after preprocessing.
 
@@ -54,7 +57,9 @@ class VolatilityChaikins(TechnicalIndicator):
         ValueError: Value error occurred when validating the ``input_data``.
     """
 
-    def __init__(self, input_data, ema_period=10, change_period=10, fill_missing_values=True):
+    def __init__(
+        self, input_data, ema_period=10, change_period=10, fill_missing_values=True, precision=4
+    ):
         # Validate and store if needed, the input parameters
         if isinstance(ema_period, int):
             if ema_period > 0:
@@ -77,6 +82,7 @@ class VolatilityChaikins(TechnicalIndicator):
             calling_instance=self.__class__.__name__,
             input_data=input_data,
             fill_missing_values=fill_missing_values,
+            precision=precision,
         )
 
     def _calculateTi(self):
@@ -92,34 +98,13 @@ class VolatilityChaikins(TechnicalIndicator):
             NotEnoughInputData: Not enough data for calculating the indicator.
         """
 
-        # Not enough data for the requested period
-        if len(self._input_data.index) < max(self._ema_period, self._change_period):
-            raise NotEnoughInputData(
-                "Volatility Chaikins",
-                max(self._ema_period, self._change_period),
-                len(self._input_data.index),
-            )
-
-        vch = pd.DataFrame(
-            index=self._input_data.index, columns=["vch"], data=None, dtype="float64"
-        )
-
-        vch["high_low_diff_ema"] = (
-            (self._input_data["high"] - self._input_data["low"])
-            .ewm(span=self._ema_period, min_periods=self._ema_period, adjust=False)
-            .mean()
-        )
-
-        vch["high_low_diff_ema_change"] = vch["high_low_diff_ema"] - vch["high_low_diff_ema"].shift(
-            self._change_period
-        )
-
-        vch["vch"] = 100 * (
-            vch["high_low_diff_ema_change"] / vch["high_low_diff_ema"].shift(self._change_period)
+        return self._kernelData(
+            ["vch"],
+            kernels.volatilityChaikins(
+                *self._inputArrays("high", "low"), self._ema_period, self._change_period
+            ),
         )
 
-        return vch[["vch"]].round(4)
-
     def getTiSignal(self):
         """
         Calculates and returns the trading signal for the calculated technical
@@ -149,3 +134,30 @@ class VolatilityChaikins(TechnicalIndicator):
             return TRADE_SIGNALS["sell"]
 
         return TRADE_SIGNALS["hold"]
+
+    def _calculateTiSignalSeries(self):
+        """
+        Calculates the trading signal for each row of the calculated technical
+        indicator, in a vectorized way.
+
+        Returns:
+            numpy.ndarray: The numeric value of the trading signal for each row.
+        """
+
+        vch = self._ti_data["vch"].to_numpy(dtype=np.float64)
+        vch_prev = self._shiftValues(vch, periods=1)
+        vch_prev_2 = self._shiftValues(vch, periods=2)
+
+        return self._selectSignals(
+            [
+                (
+                    (vch_prev_2 < vch_prev) & (vch_prev < vch),
+                    TRADE_SIGNALS["buy"],
+                ),
+                (
+                    (vch_prev_2 > vch_prev) & (vch_prev > vch),
+                    TRADE_SIGNALS["sell"],
+                ),
+            ],
+            minimum_rows=3,
+        )
@@ -5,12 +5,12 @@ File name: _volume_oscillator.py
     Implements the Volume Oscillator technical indicator.
 """
 
-import pandas as pd
+import numpy as np
 
 from ._technical_indicator import TechnicalIndicator
+from .. import kernels
 from ..utils.constants import TRADE_SIGNALS
 from ..utils.exceptions import (
-    NotEnoughInputData,
     WrongTypeForInputParameter,
     WrongValueForInputParameter,
 )
@@ -33,6 +33,9 @@ class VolumeOscillator(TechnicalIndicator):
         fill_missing_values (bool, default=True): If set to True, missing
             values in the input data are being filled.
 
+        precision (int, default=4): The number of decimals the calculated
+            indicator is rounded to. If None, it is not rounded.
+
     Attributes:
         _input_data (pandas.DataFrame): The ``input_data`` after preprocessing.
 
@@ -51,7 +54,9 @@ class VolumeOscillator(TechnicalIndicator):
         ValueError: Value error occurred when validating the ``input_data``.
     """
 
-    def __init__(self, input_data, long_period=5, short_period=2, fill_missing_values=True):
+    def __init__(
+        self, input_data, long_period=5, short_period=2, fill_missing_values=True, precision=4
+    ):
         # Validate and store if needed, the input parameters
         if isinstance(long_period, int):
             if long_period > 0:
@@ -79,6 +84,7 @@ class VolumeOscillator(TechnicalIndicator):
             calling_instance=self.__class__.__name__,
             input_data=input_data,
             fill_missing_values=fill_missing_values,
+            precision=precision,
         )
 
     def _calculateTi(self):
@@ -94,27 +100,13 @@ class VolumeOscillator(TechnicalIndicator):
             NotEnoughInputData: Not enough data for calculating the indicator.
         """
 
-        # Not enough data for the requested period
-        if len(self._input_data.index) < self._long_period:
-            raise NotEnoughInputData(
-                "Volume Oscillator", self._long_period, len(self._input_data.index)
-            )
-
-        vosc = pd.DataFrame(
-            index=self._input_data.index, columns=["vosc"], data=None, dtype="float64"
+        return self._kernelData(
+            ["vosc"],
+            kernels.volumeOscillator(
+                *self._inputArrays("volume"), self._long_period, self._short_period
+            ),
         )
 
-        vosc["vosc"] = (
-            self._input_data["volume"]
-            .rolling(window=self._short_period, min_periods=self._short_period)
-            .mean()
-            - self._input_data["volume"]
-            .rolling(window=self._long_period, min_periods=self._long_period)
-            .mean()
-        )
-
-        return vosc.round(4)
-
     def getTiSignal(self):
         """
         Calculates and returns the trading signal for the calculated technical
@@ -146,3 +138,30 @@ class VolumeOscillator(TechnicalIndicator):
             return TRADE_SIGNALS["sell"]
 
         return TRADE_SIGNALS["hold"]
+
+    def _calculateTiSignalSeries(self):
+        """
+        Calculates the trading signal for each row of the calculated technical
+        indicator, in a vectorized way.
+
+        Returns:
+            numpy.ndarray: The numeric value of the trading signal for each row.
+        """
+
+        vosc = self._ti_data["vosc"].to_numpy(dtype=np.float64)
+        vosc_prev = self._shiftValues(vosc, periods=1)
+        vosc_prev_2 = self._shiftValues(vosc, periods=2)
+
+        return self._selectSignals(
+            [
+                (
+                    (0 < vosc_prev_2) & (vosc_prev_2 < vosc_prev) & (vosc_prev < vosc),
+                    TRADE_SIGNALS["buy"],
+                ),
+                (
+                    (vosc_prev_2 > vosc_prev) & (vosc_prev > vosc) & (vosc > 0),
+                    TRADE_SIGNALS["sell"],
+                ),
+            ],
+            minimum_rows=3,
+        )
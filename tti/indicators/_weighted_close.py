@@ -5,9 +5,10 @@ File name: _weighted_close.py
     Implements the Weighted Close technical indicator.
 """
 
-import pandas as pd
+import numpy as np
 
 from ._technical_indicator import TechnicalIndicator
+from .. import kernels
 from ..utils.constants import TRADE_SIGNALS
 
 
@@ -23,6 +24,9 @@ class WeightedClose(TechnicalIndicator):
         fill_missing_values (bool, default=True): If set to True, missing
             values in the input data are being filled.
 
+        precision (int, default=4): The number of decimals the calculated
+            indicator is rounded to. If None, it is not rounded.
+
     Attributes:
         _input_data (pandas.DataFrame): The ``input_data`` after preprocessing.
 
@@ -41,12 +45,13 @@ class WeightedClose(TechnicalIndicator):
         ValueError: Value error occurred when validating the ``input_data``.
     """
 
-    def __init__(self, input_data, fill_missing_values=True):
+    def __init__(self, input_data, fill_missing_values=True, precision=4):
         # Control is passing to the parent class
         super().__init__(
             calling_instance=self.__class__.__name__,
             input_data=input_data,
             fill_missing_values=fill_missing_values,
+            precision=precision,
         )
 
     def _calculateTi(self):
@@ -59,13 +64,9 @@ class WeightedClose(TechnicalIndicator):
             ``pandas.DatetimeIndex``. It contains one column, the ``wc``.
         """
 
-        wc = pd.DataFrame(index=self._input_data.index, columns=["wc"], data=None, dtype="float64")
-
-        wc["wc"] = (
-            2 * self._input_data["close"] + self._input_data["high"] + self._input_data["low"]
-        ) / 4
-
-        return wc.round(4)
+        return self._kernelData(
+            ["wc"], kernels.weightedClose(*self._inputArrays("high", "low", "close"))
+        )
 
     def getTiSignal(self):
         """
@@ -94,3 +95,28 @@ class WeightedClose(TechnicalIndicator):
             return TRADE_SIGNALS["sell"]
 
         return TRADE_SIGNALS["hold"]
+
+    def _calculateTiSignalSeries(self):
+        """
+        Calculates the trading signal for each row of the calculated technical
+        indicator, in a vectorized way.
+
+        Returns:
+            numpy.ndarray: The numeric value of the trading signal for each row.
+        """
+
+        close = self._signalInput("close")
+        close_prev = self._shiftValues(close)
+
+        wc = self._ti_data["wc"].to_numpy(dtype=np.float64)
+        wc_prev = self._shiftValues(wc)
+
+        return self._selectSignals(
+            [
+                # Close price goes below Weighted Close
+                ((close_prev > wc_prev) & (close < wc), TRADE_SIGNALS["buy"]),
+                # Close price goes above Weighted Close
+                ((close_prev < wc_prev) & (close > wc), TRADE_SIGNALS["sell"]),
+            ],
+            minimum_rows=2,
+        )
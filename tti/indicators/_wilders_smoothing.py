@@ -5,12 +5,12 @@ File name: _wilders_smoothing.py
     Implements the Wilders Smoothing technical indicator.
 """
 
-import pandas as pd
+import numpy as np
 
 from ._technical_indicator import TechnicalIndicator
+from .. import kernels
 from ..utils.constants import TRADE_SIGNALS
 from ..utils.exceptions import (
-    NotEnoughInputData,
     WrongTypeForInputParameter,
     WrongValueForInputParameter,
 )
@@ -30,6 +30,9 @@ class WildersSmoothing(TechnicalIndicator):
         fill_missing_values (bool, default=True): If set to True, missing
             values in the input data are being filled.
 
+        precision (int, default=4): The number of decimals the calculated
+            indicator is rounded to. If None, it is not rounded.
+
     Attributes:
         _input_data (pandas.DataFrame): The ``input_data`` after preprocessing.
 
@@ -40,6 +43,10 @@ class WildersSmoothing(TechnicalIndicator):
 
         _calling_instance (str): The name of the class.
 
+        _state (dict): The state of the calculation after the last row (not
+            rounded ``ws``), used for updating the indicator with new input
+            data.
+
     Raises:
         WrongTypeForInputParameter: Input argument has wrong type.
         WrongValueForInputParameter: Unsupported value for input argument.
@@ -48,7 +55,7 @@ class WildersSmoothing(TechnicalIndicator):
         ValueError: Value error occurred when validating the ``input_data``.
     """
 
-    def __init__(self, input_data, period=5, fill_missing_values=True):
+    def __init__(self, input_data, period=5, fill_missing_values=True, precision=4):
         # Validate and store if needed, the input parameters
         if isinstance(period, int):
             if period > 0:
@@ -63,6 +70,7 @@ class WildersSmoothing(TechnicalIndicator):
             calling_instance=self.__class__.__name__,
             input_data=input_data,
             fill_missing_values=fill_missing_values,
+            precision=precision,
         )
 
     def _calculateTi(self):
@@ -78,26 +86,42 @@ class WildersSmoothing(TechnicalIndicator):
             NotEnoughInputData: Not enough data for calculating the indicator.
         """
 
-        # Not enough data for the requested period
-        if len(self._input_data.index) < self._period:
-            raise NotEnoughInputData(
-                "Wilder's Smoothing", self._period, len(self._input_data.index)
-            )
+        # Last (not rounded) value, it is the state used for updating the
+        # indicator with new input data
+        self._state = {}
+
+        return self._kernelData(
+            ["ws"],
+            kernels.wildersSmoothing(*self._inputArrays("close"), self._period, state=self._state),
+        )
+
+    def _updateTi(self, new_input_data):
+        """
+        Calculates the technical indicator after new rows have been appended
+        to the input data. Only the new rows are calculated, continuing from
+        the last calculated value.
+
+        Args:
+            new_input_data (pandas.DataFrame): The new rows of the input data,
+                after preprocessing.
+
+        Returns:
+            pandas.DataFrame: The calculated indicator for the new rows. Index
+            is of type ``pandas.DatetimeIndex``. It contains one column,
+            the ``ws``.
+        """
 
-        ws = pd.DataFrame(index=self._input_data.index, columns=["ws"], data=None, dtype="float64")
+        # The state is copied, the stored one can be shared with the result
+        # cache
+        state = dict(self._state)
 
-        # Wilder's Moving Average
-        ws.loc[ws.index[self._period - 1], "ws"] = (
-            self._input_data["close"].iloc[: self._period].mean()
+        ws = kernels.wildersSmoothing(
+            *self._inputArrays("close", rows=len(new_input_data.index)), self._period, state=state
         )
 
-        for i in range(self._period, len(self._input_data.index)):
-            ws.loc[ws.index[i], "ws"] = (
-                ws["ws"].iat[i - 1]
-                + (self._input_data["close"].iat[i] - ws["ws"].iat[i - 1]) / self._period
-            )
+        self._state = state
 
-        return ws.round(4)
+        return self._kernelData(["ws"], ws, index=new_input_data.index)
 
     def getTiSignal(self):
         """
@@ -126,3 +150,28 @@ class WildersSmoothing(TechnicalIndicator):
             return TRADE_SIGNALS["sell"]
 
         return TRADE_SIGNALS["hold"]
+
+    def _calculateTiSignalSeries(self):
+        """
+        Calculates the trading signal for each row of the calculated technical
+        indicator, in a vectorized way.
+
+        Returns:
+            numpy.ndarray: The numeric value of the trading signal for each row.
+        """
+
+        close = self._signalInput("close")
+        close_prev = self._shiftValues(close)
+
+        ws = self._ti_data["ws"].to_numpy(dtype=np.float64)
+        ws_prev = self._shiftValues(ws)
+
+        return self._selectSignals(
+            [
+                # Close price goes below indicator
+                ((close_prev > ws_prev) & (close < ws), TRADE_SIGNALS["buy"]),
+                # Close price goes above indicator
+                ((close_prev < ws_prev) & (close > ws), TRADE_SIGNALS["sell"]),
+            ],
+            minimum_rows=2,
+        )
@@ -5,9 +5,10 @@ File name: _williams_accumulation_distribution.py
     Implements the Williams Accumulation Distribution technical indicator.
 """
 
-import pandas as pd
+import numpy as np
 
 from ._technical_indicator import TechnicalIndicator
+from .. import kernels
 from ..utils.constants import TRADE_SIGNALS
 
 
@@ -24,6 +25,9 @@ class WilliamsAccumulationDistribution(TechnicalIndicator):
         fill_missing_values (bool, default=True): If set to True, missing
             values in the input data are being filled.
 
+        precision (int, default=4): The number of decimals the calculated
+            indicator is rounded to. If None, it is not rounded.
+
     Attributes:
         _input_data (pandas.DataFrame): The ``input_data`` after preprocessing.
 
@@ -42,12 +46,13 @@ class WilliamsAccumulationDistribution(TechnicalIndicator):
         ValueError: Value error occurred when validating the ``input_data``.
     """
 
-    def __init__(self, input_data, fill_missing_values=True):
+    def __init__(self, input_data, fill_missing_values=True, precision=4):
         # Control is passing to the parent class
         super().__init__(
             calling_instance=self.__class__.__name__,
             input_data=input_data,
             fill_missing_values=fill_missing_values,
+            precision=precision,
         )
 
     def _calculateTi(self):
@@ -60,31 +65,11 @@ class WilliamsAccumulationDistribution(TechnicalIndicator):
             ``pandas.DatetimeIndex``. It contains one column, the ``wad``.
         """
 
-        wad = pd.DataFrame(
-            index=self._input_data.index, columns=["wad"], data=None, dtype="float64"
+        return self._kernelData(
+            ["wad"],
+            kernels.williamsAccumulationDistribution(*self._inputArrays("high", "low", "close")),
         )
 
-        # Calculate the true range high
-        wad["trh"] = pd.concat(
-            [self._input_data["close"].shift(1), self._input_data["high"]], axis=1
-        ).max(axis=1, skipna=False)
-
-        # Calculate the true range low
-        wad["trl"] = pd.concat(
-            [self._input_data["close"].shift(1), self._input_data["low"]], axis=1
-        ).min(axis=1, skipna=False)
-
-        # Calculate today's Accumulation Distribution
-        wad["wad"] = self._input_data["close"] - self._input_data["close"].shift(1)
-
-        pos_mask = wad["wad"] > 0
-        neg_mask = wad["wad"] < 0
-
-        wad.loc[pos_mask, "wad"] = self._input_data["close"] - wad["trl"]
-        wad.loc[neg_mask, "wad"] = self._input_data["close"] - wad["trh"]
-
-        return wad[["wad"]].round(4)
-
     def getTiSignal(self):
         """
         Calculates and returns the trading signal for the calculated technical
@@ -113,3 +98,39 @@ class WilliamsAccumulationDistribution(TechnicalIndicator):
             return TRADE_SIGNALS["sell"]
 
         return TRADE_SIGNALS["hold"]
+
+    def _calculateTiSignalSeries(self):
+        """
+        Calculates the trading signal for each row of the calculated technical
+        indicator, in a vectorized way.
+
+        Returns:
+            numpy.ndarray: The numeric value of the trading signal for each row.
+        """
+
+        # Last periods to consider when looking for divergences
+        span_period = 30
+
+        rows = len(self._ti_data.index)
+
+        close = self._input_data["close"].iloc[:rows]
+        wad = self._ti_data["wad"]
+
+        close_values = close.to_numpy(dtype=np.float64)
+        wad_values = wad.to_numpy(dtype=np.float64)
+
+        return self._selectSignals(
+            [
+                (
+                    (close.rolling(span_period, min_periods=1).min().to_numpy() == close_values)
+                    & (wad.rolling(span_period, min_periods=1).min().to_numpy() != wad_values),
+                    TRADE_SIGNALS["buy"],
+                ),
+                (
+                    (close.rolling(span_period, min_periods=1).max().to_numpy() == close_values)
+                    & (wad.rolling(span_period, min_periods=1).max().to_numpy() != wad_values),
+                    TRADE_SIGNALS["sell"],
+                ),
+            ],
+            minimum_rows=span_period,
+        )
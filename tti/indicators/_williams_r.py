@@ -5,13 +5,12 @@ File name: _williams_r.py
     Implements the Williams %R technical indicator.
 """
 
-import pandas as pd
 import numpy as np
 
 from ._technical_indicator import TechnicalIndicator
+from .. import kernels
 from ..utils.constants import TRADE_SIGNALS
 from ..utils.exceptions import (
-    NotEnoughInputData,
     WrongTypeForInputParameter,
     WrongValueForInputParameter,
 )
@@ -32,6 +31,9 @@ class WilliamsR(TechnicalIndicator):
         fill_missing_values (bool, default=True): If set to True, missing
             values in the input data are being filled.
 
+        precision (int, default=4): The number of decimals the calculated
+            indicator is rounded to. If None, it is not rounded.
+
     Attributes:
         _input_data (pandas.DataFrame): The ``input_data`` after preprocessing.
 
@@ -50,7 +52,7 @@ class WilliamsR(TechnicalIndicator):
         ValueError: Value error occurred when validating the ``input_data``.
     """
 
-    def __init__(self, input_data, period=5, fill_missing_values=True):
+    def __init__(self, input_data, period=5, fill_missing_values=True, precision=4):
         # Validate and store if needed, the input parameters
         if isinstance(period, int):
             if period > 0:
@@ -65,6 +67,7 @@ class WilliamsR(TechnicalIndicator):
             calling_instance=self.__class__.__name__,
             input_data=input_data,
             fill_missing_values=fill_missing_values,
+            precision=precision,
         )
 
     def _calculateTi(self):
@@ -80,27 +83,16 @@ class WilliamsR(TechnicalIndicator):
             NotEnoughInputData: Not enough data for calculating the indicator.
         """
 
-        # Not enough data for the requested period
-        if len(self._input_data.index) < self._period:
-            raise NotEnoughInputData("William's %R", self._period, len(self._input_data.index))
-
-        wr = pd.DataFrame(index=self._input_data.index, columns=["wr"], data=None, dtype="float64")
-
-        wr["highest_high"] = (
-            self._input_data["high"].rolling(window=self._period, min_periods=self._period).max()
+        return self._kernelData(
+            ["wr"],
+            kernels.williamsR(
+                *self._inputArrays("high", "low", "close"),
+                self._period,
+                highest_high=self._highestHigh(self._period),
+                lowest_low=self._lowestLow(self._period),
+            ),
         )
 
-        wr["lowest_low"] = (
-            self._input_data["low"].rolling(window=self._period, min_periods=self._period).min()
-        )
-
-        wr["wr"] = -100 * (
-            (wr["highest_high"] - self._input_data["close"])
-            / (wr["highest_high"] - wr["lowest_low"])
-        )
-
-        return wr[["wr"]].round(4)
-
     def getTiSignal(self):
         """
         Calculates and returns the trading signal for the calculated technical
@@ -144,3 +136,45 @@ class WilliamsR(TechnicalIndicator):
             return TRADE_SIGNALS["sell"]
 
         return TRADE_SIGNALS["hold"]
+
+    def _calculateTiSignalSeries(self):
+        """
+        Calculates the trading signal for each row of the calculated technical
+        indicator, in a vectorized way.
+
+        Returns:
+            numpy.ndarray: The numeric value of the trading signal for each row.
+        """
+
+        wr = self._ti_data["wr"].to_numpy(dtype=np.float64)
+        wr_prev = self._shiftValues(wr)
+
+        positions = np.arange(len(wr))
+
+        # Index of the last row (before the current one) in the oversold area,
+        # which is <= -80
+        last_oversold_index = self._shiftValues(
+            np.maximum.accumulate(np.where(wr <= -80, positions, -1))
+        )
+
+        # Index of the last row (before the current one) in the overbought
+        # area, which is >= -20
+        last_overbought_index = self._shiftValues(
+            np.maximum.accumulate(np.where(wr >= -20, positions, -1))
+        )
+
+        return self._selectSignals(
+            [
+                # Indicator was in the oversold area before
+                (
+                    (last_oversold_index > last_overbought_index) & (wr_prev < -50) & (wr > -50),
+                    TRADE_SIGNALS["buy"],
+                ),
+                # Indicator was in the overbought area before
+                (
+                    (last_oversold_index < last_overbought_index) & (wr_prev > -50) & (wr < -50),
+                    TRADE_SIGNALS["sell"],
+                ),
+            ],
+            minimum_rows=2,
+        )
@@ -0,0 +1,109 @@
+"""
+Trading-Technical-Indicators (tti) python library
+
+the `tti.kernels` package includes the calculation of the trading technical
+indicators on numpy arrays. Each kernel takes the required input data columns
+(float64 arrays) and the indicator parameters, and returns the indicator
+columns as arrays. The classes of the `tti.indicators` package are wrappers
+around these kernels.
+"""
+
+import importlib
+
+__all__ = [
+    "accumulationDistributionLine",
+    "averageTrueRange",
+    "bollingerBands",
+    "chaikinMoneyFlow",
+    "chaikinOscillator",
+    "chandeMomentumOscillator",
+    "commodityChannelIndex",
+    "detrendedPriceOscillator",
+    "directionalMovementIndex",
+    "doubleExponentialMovingAverage",
+    "easeOfMovement",
+    "envelopes",
+    "fibonacciRetracement",
+    "forecastOscillator",
+    "ichimokuCloud",
+    "intradayMomentumIndex",
+    "klingerOscillator",
+    "linearRegressionIndicator",
+    "linearRegressionSlope",
+    "marketFacilitationIndex",
+    "massIndex",
+    "medianPrice",
+    "momentum",
+    "movingAverage",
+    "movingAverageConvergenceDivergence",
+    "negativeVolumeIndex",
+    "onBalanceVolume",
+    "parabolicSar",
+    "performance",
+    "positiveVolumeIndex",
+    "priceAndVolumeTrend",
+    "priceChannel",
+    "priceOscillator",
+    "priceRateOfChange",
+    "projectionBands",
+    "projectionOscillator",
+    "qstick",
+    "rangeIndicator",
+    "relativeMomentumIndex",
+    "relativeStrengthIndex",
+    "relativeVolatilityIndex",
+    "standardDeviation",
+    "stochasticMomentumIndex",
+    "stochasticOscillator",
+    "swingIndex",
+    "timeSeriesForecast",
+    "tripleExponentialMovingAverage",
+    "typicalPrice",
+    "ultimateOscillator",
+    "verticalHorizontalFilter",
+    "volatilityChaikins",
+    "volumeOscillator",
+    "volumeRateOfChange",
+    "weightedClose",
+    "wildersSmoothing",
+    "williamsAccumulationDistribution",
+    "williamsR",
+]
+
+
+def __getattr__(name):
+    """
+    Imports on first access the module of the kernels, and returns the
+    requested kernel. All the kernels are defined in the same module, so they
+    are all set in the package namespace at once.
+
+    Args:
+        name (str): The name of the kernel.
+
+    Returns:
+        function: The kernel.
+
+    Raises:
+        AttributeError: The package has no kernel with this name.
+    """
+
+    if name not in __all__:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    module = importlib.import_module("._indicators", __name__)
+
+    # Cached, the next accesses do not call __getattr__
+    globals().update({kernel: getattr(module, kernel) for kernel in __all__})
+
+    return globals()[name]
+
+
+def __dir__():
+    """
+    Returns the names of the package, including the not yet imported ones.
+
+    Returns:
+        list: The names.
+    """
+
+    return sorted(set(globals()) | set(__all__))
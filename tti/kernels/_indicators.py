@@ -0,0 +1,2389 @@
+"""
+Trading-Technical-Indicators (tti) python library
+
+File name: _indicators.py
+    Kernels of the technical indicators, defined under the tti.kernels
+    package. A kernel calculates an indicator from numpy arrays of the input
+    data columns and returns numpy arrays (not rounded), one for each
+    indicator column. The classes of the tti.indicators package are wrappers
+    around these kernels.
+"""
+
+import numpy as np
+import pandas as pd
+
+from ._primitives import (
+    asArray,
+    cumulativeSum,
+    exponentialMovingAverage,
+    exponentialWeightedMean,
+    linearRecurrence,
+    linearRegression,
+    mean,
+    reduceSlidingWindows,
+    rollingMean,
+    rollingStd,
+    rollingSum,
+    roundValues,
+    shift,
+    trueRange,
+    wildersRecursion,
+)
+from ..utils.rolling_extrema import rollingExtrema
+from ..utils.exceptions import NotEnoughInputData, WrongValueForInputParameter
+
+
+def _requireRows(values, rows, indicator):
+    """
+    Checks that there are enough input data for calculating an indicator.
+
+    Args:
+        values (numpy.ndarray): Input data column.
+
+        rows (int): The minimum number of rows required.
+
+        indicator (str): The name of the indicator.
+
+    Raises:
+        NotEnoughInputData: Not enough data for calculating the indicator.
+    """
+
+    if len(values) < rows:
+        raise NotEnoughInputData(indicator, rows, len(values))
+
+
+def _nanAdd(x, y):
+    """
+    Adds two arrays, treating missing values as zero (as the ``sum`` of a
+    pandas.DataFrame).
+
+    Args:
+        x (numpy.ndarray): The first array.
+
+        y (numpy.ndarray): The second array.
+
+    Returns:
+        numpy.ndarray: The sum.
+    """
+
+    return np.where(np.isnan(x), 0.0, x) + np.where(np.isnan(y), 0.0, y)
+
+
+@np.errstate(divide="ignore", invalid="ignore")
+def accumulationDistributionLine(high, low, close, volume):
+    """
+    Calculates the Accumulation Distribution Line. When no value is missing,
+    the values are truncated to integers.
+
+    Args:
+        high (numpy.ndarray): The high prices.
+
+        low (numpy.ndarray): The low prices.
+
+        close (numpy.ndarray): The close prices.
+
+        volume (numpy.ndarray): The volume.
+
+    Returns:
+        numpy.ndarray: The ``adl``.
+    """
+
+    high, low, close, volume = asArray(high), asArray(low), asArray(close), asArray(volume)
+
+    adl = cumulativeSum(volume * ((close - low) - (high - close)) / (high - low))
+
+    if np.isfinite(adl).all():
+        adl = np.trunc(adl)
+
+    return adl
+
+
+# Center of mass of the Average True Range smoothing, as calculated by pandas
+# for alpha=1/14
+_ATR_COM = (1 - 1 / 14) / (1 / 14)
+
+
+@np.errstate(divide="ignore", invalid="ignore")
+def averageTrueRange(high, low, close, *, true_range=None, state=None):
+    """
+    Calculates the Average True Range, the Wilder's Moving Average of the True
+    Range, starting from the mean of the first 14 values.
+
+    Args:
+        high (numpy.ndarray): The high prices.
+
+        low (numpy.ndarray): The low prices.
+
+        close (numpy.ndarray): The close prices.
+
+        true_range (numpy.ndarray, default=None): The already calculated True
+            Range. Where it is missing, it is recalculated skipping its
+            missing parts.
+
+        state (dict, default=None): If given, it is updated with the state
+            after the last row. If it already contains a state, the
+            calculation continues from it and the arrays contain only the
+            new rows.
+
+    Returns:
+        numpy.ndarray: The ``atr``.
+
+    Raises:
+        NotEnoughInputData: Not enough data for calculating the indicator.
+    """
+
+    high, low, close = asArray(high), asArray(low), asArray(close)
+
+    if state:
+        previous_close = np.concatenate([[state["close"]], close[:-1]])
+
+        # True Range: max of Today's High - Today's Low, Today's High -
+        # Yesterday's Close and Yesterday's Close - Today's Low. Missing parts
+        # are skipped
+        true_range = np.fmax(np.fmax(high - low, high - previous_close), previous_close - low)
+
+        # Missing values are skipped, as in the full calculation
+        atr = exponentialWeightedMean(true_range, _ATR_COM, state, "atr")
+
+    else:
+        if len(close) < 14:
+            raise NotEnoughInputData("Average True Range", 2, len(close))
+
+        if true_range is None:
+            true_range = trueRange(high, low, close)
+
+        # Missing parts of the True Range are skipped, where it is missing.
+        # For the first row (no previous close) it is Today's High - Today's
+        # Low
+        rows = np.flatnonzero(np.isnan(true_range))
+        previous_close = np.where(rows > 0, close[rows - 1], np.nan)
+
+        true_range = true_range.copy()
+        true_range[rows] = np.fmax(
+            np.fmax(high[rows] - low[rows], high[rows] - previous_close),
+            previous_close - low[rows],
+        )
+
+        # Seed Wilder's MA with the mean of the first 14 TR values, then
+        # continue with an exponential moving average using alpha=1/14.
+        atr = np.full(len(close), np.nan, dtype=np.float64)
+        atr[13:] = exponentialWeightedMean(
+            np.concatenate([[mean(true_range[:14])], true_range[14:]]),
+            _ATR_COM,
+            state,
+            "atr",
+        )
+
+    if state is not None:
+        state["close"] = close[-1]
+
+    return atr
+
+
+def bollingerBands(close, period=20, std_number=2, *, decimals=4):
+    """
+    Calculates the Bollinger Bands. The bands are calculated from the rounded
+    middle band.
+
+    Args:
+        close (numpy.ndarray): The close prices. Two-dimensional for a panel
+            of symbols (one column for each symbol).
+
+        period (int, default=20): The past periods to be used for the
+            calculation of the middle band.
+
+        std_number (int or float, default=2): The number of standard
+            deviations of the bands from the middle band.
+
+        decimals (int, default=4): The number of decimals the middle band is
+            rounded to. If None, it is not rounded.
+
+    Returns:
+        (numpy.ndarray, numpy.ndarray, numpy.ndarray): The ``middle_band``,
+        ``upper_band`` and ``lower_band``.
+
+    Raises:
+        NotEnoughInputData: Not enough data for calculating the indicator.
+    """
+
+    close = asArray(close)
+
+    _requireRows(close, period, "Bollinger Bands")
+
+    # Simple Moving Average
+    middle_band = roundValues(rollingMean(close, period), decimals)
+
+    standard_deviation = rollingStd(close, period)
+
+    return (
+        middle_band,
+        middle_band + standard_deviation * std_number,
+        middle_band - standard_deviation * std_number,
+    )
+
+
+@np.errstate(divide="ignore", invalid="ignore")
+def chaikinMoneyFlow(high, low, close, volume, period=5):
+    """
+    Calculates the Chaikin Money Flow.
+
+    Args:
+        high (numpy.ndarray): The high prices.
+
+        low (numpy.ndarray): The low prices.
+
+        close (numpy.ndarray): The close prices.
+
+        volume (numpy.ndarray): The volume.
+
+        period (int, default=5): The past periods to be used for the
+            calculation of the indicator.
+
+    Returns:
+        numpy.ndarray: The ``cmf``.
+
+    Raises:
+        NotEnoughInputData: Not enough data for calculating the indicator.
+    """
+
+    high, low, close, volume = asArray(high), asArray(low), asArray(close), asArray(volume)
+
+    _requireRows(close, period, "Chaikin Money Flow")
+
+    numerator = volume * ((close - low) - (high - close)) / (high - low)
+
+    return rollingSum(numerator, period) / rollingSum(volume, period)
+
+
+def chaikinOscillator(high, low, close, volume, *, adl=None):
+    """
+    Calculates the Chaikin Oscillator, the difference of the 3 and 10 periods
+    exponential moving averages of the Accumulation Distribution Line.
+
+    Args:
+        high (numpy.ndarray): The high prices.
+
+        low (numpy.ndarray): The low prices.
+
+        close (numpy.ndarray): The close prices.
+
+        volume (numpy.ndarray): The volume.
+
+        adl (numpy.ndarray, default=None): The already calculated
+            Accumulation Distribution Line.
+
+    Returns:
+        numpy.ndarray: The ``co``.
+
+    Raises:
+        NotEnoughInputData: Not enough data for calculating the indicator.
+    """
+
+    _requireRows(close, 10, "Chaikin Oscillator")
+
+    if adl is None:
+        adl = accumulationDistributionLine(high, low, close, volume)
+
+    adl = asArray(adl)
+
+    return exponentialMovingAverage(adl, 3) - exponentialMovingAverage(adl, 10)
+
+
+@np.errstate(divide="ignore", invalid="ignore")
+def chandeMomentumOscillator(close, period=5):
+    """
+    Calculates the Chande Momentum Oscillator.
+
+    Args:
+        close (numpy.ndarray): The close prices.
+
+        period (int, default=5): The past periods to be used for the
+            calculation of the indicator.
+
+    Returns:
+        numpy.ndarray: The ``cmo``.
+
+    Raises:
+        NotEnoughInputData: Not enough data for calculating the indicator.
+    """
+
+    close = asArray(close)
+
+    _requireRows(close, period, "Chande Momentum Oscillator")
+
+    changes = close - shift(close)
+
+    # Periods sum of the up and (absolute) down movement changes
+    up_move_changes = rollingSum(np.where(changes < 0.0, 0.0, changes), period)
+    down_move_changes = np.abs(rollingSum(np.where(changes > 0.0, 0.0, changes), period))
+
+    return 100 * (up_move_changes - down_move_changes) / (up_move_changes + down_move_changes)
+
+
+@np.errstate(divide="ignore", invalid="ignore")
+def commodityChannelIndex(high, low, close, period=5, *, typical_price=None):
+    """
+    Calculates the Commodity Channel Index.
+
+    Args:
+        high (numpy.ndarray): The high prices.
+
+        low (numpy.ndarray): The low prices.
+
+        close (numpy.ndarray): The close prices.
+
+        period (int, default=5): The past periods to be used for the
+            calculation of the indicator.
+
+        typical_price (numpy.ndarray, default=None): The already calculated
+            Typical Price.
+
+    Returns:
+        numpy.ndarray: The ``cci``.
+
+    Raises:
+        NotEnoughInputData: Not enough data for calculating the indicator.
+    """
+
+    _requireRows(close, period, "Commodity Channel Index")
+
+    if typical_price is None:
+        typical_price = typicalPrice(high, low, close)
+
+    # Simple moving average of the typical price
+    tp_sma = rollingMean(typical_price, period)
+
+    # Sum of absolute differences of the typical price sma from preceding
+    # periods typical prices
+    differences = reduceSlidingWindows(
+        typical_price,
+        period,
+        lambda windows, rows: np.abs(tp_sma[rows, None] - windows).sum(axis=1),
+    )
+
+    return (typical_price - tp_sma) / (0.015 * differences / period)
+
+
+def detrendedPriceOscillator(close, period=6):
+    """
+    Calculates the Detrended Price Oscillator. It is not calculated for the
+    last ``int(period / 2) + 1`` rows.
+
+    Args:
+        close (numpy.ndarray): The close prices.
+
+        period (int, default=6): The past periods to be used for the
+            calculation of the indicator.
+
+    Returns:
+        numpy.ndarray: The ``dpo``, shorter than the input data.
+
+    Raises:
+        NotEnoughInputData: Not enough data for calculating the indicator.
+    """
+
+    close = asArray(close)
+
+    _requireRows(close, period, "Detrended Price Oscillator")
+
+    dpo = close - shift(rollingMean(close, period), -1 - int(period / 2))
+
+    return dpo[: -1 - int(period / 2)]
+
+
+@np.errstate(divide="ignore", invalid="ignore")
+def directionalMovementIndex(
+    high, low, close, period=14, adx_period=14, *, true_range=None, state=None
+):
+    """
+    Calculates the Directional Movement Index.
+
+    Args:
+        high (numpy.ndarray): The high prices.
+
+        low (numpy.ndarray): The low prices.
+
+        close (numpy.ndarray): The close prices.
+
+        period (int, default=14): The past periods to be used for smoothing
+            the True Range and the Directional Movement.
+
+        adx_period (int, default=14): The past periods to be used for
+            smoothing the ``dx`` into the ``adx``. The ``adxr`` averages the
+            ``adx`` with its value ``adx_period - 1`` periods ago.
+
+        true_range (numpy.ndarray, default=None): The already calculated True
+            Range.
+
+        state (dict, default=None): If given, it is updated with the state
+            after the last row (last prices, smoothed values and the last
+            ``adx_period - 1`` values of the ``adx``). If it already contains
+            a state, the calculation continues from it and the arrays contain
+            only the new rows.
+
+    Returns:
+        (numpy.ndarray, numpy.ndarray, numpy.ndarray, numpy.ndarray,
+        numpy.ndarray): The ``+di``, ``-di``, ``dx``, ``adx`` and ``adxr``.
+
+    Raises:
+        NotEnoughInputData: Not enough data for calculating the indicator.
+    """
+
+    high, low, close = asArray(high), asArray(low), asArray(close)
+
+    # Rows of the first smoothed values and of the first adx, they are the
+    # seeds of the Wilder's smoothing, and the first returned row
+    smoothed_row, adx_row, first = period - 1, period + adx_period - 1, 0
+
+    # The state is updated during the calculation
+    continued = bool(state)
+
+    if continued:
+        # The last known row precedes the new rows, for the True Range and
+        # the Directional Movement of the first new row
+        high = np.concatenate([[state["high"]], high])
+        low = np.concatenate([[state["low"]], low])
+        close = np.concatenate([[state["close"]], close])
+
+        true_range = None
+        smoothed_row, adx_row, first = 0, 0, 1
+    else:
+        _requireRows(close, period + adx_period, "Directional Movement Index")
+
+    if true_range is None:
+        true_range = trueRange(high, low, close)
+
+    rows = len(close)
+
+    # Calculate Directional Movement for one period. A missing price fails
+    # both comparisons, giving zero movement.
+    up_move = high - shift(high)
+    down_move = shift(low) - low
+
+    dm1 = {
+        "+": np.where((up_move > down_move) & (up_move > 0), up_move, 0.0),
+        "-": np.where((up_move < down_move) & (down_move > 0), down_move, 0.0),
+    }
+
+    dm1["+"][0] = dm1["-"][0] = np.nan
+
+    # Calculate True Range and Directional Movement for the period
+    # (smoothed). The smoothed sums are the Wilder's smoothing of the values
+    # multiplied by the period.
+    smoothed = {}
+
+    for column, values in [("tr", true_range), ("+", dm1["+"]), ("-", dm1["-"])]:
+        smoothed[column] = np.full(rows, np.nan, dtype=np.float64)
+
+        if continued:
+            seed = state["smoothed_" + column]
+        else:
+            smoothed[column][smoothed_row] = np.nansum(values[:period])
+            seed = smoothed[column][smoothed_row] / period
+
+        smoothed_values = wildersRecursion(values[smoothed_row + 1 :], period, seed)
+        smoothed[column][smoothed_row + 1 :] = period * smoothed_values
+
+        # The not multiplied smoothed value, the smoothing continues from it
+        if state is not None:
+            state["smoothed_" + column] = smoothed_values[-1]
+
+    # Calculate the +DI and -DI
+    di = {}
+
+    for column in ["+", "-"]:
+        di[column] = np.full(rows, np.nan, dtype=np.float64)
+        di[column][smoothed_row + 1 :] = (
+            100 * smoothed[column][smoothed_row + 1 :] / smoothed["tr"][smoothed_row + 1 :]
+        )
+
+    # Calculate DX, ADX and ADXR
+    dx = 100.0 * np.abs(di["+"] - di["-"]) / np.abs(di["+"] + di["-"])
+
+    # The ADX is seeded with the mean of the first adx_period DX values
+    adx = np.full(rows, np.nan, dtype=np.float64)
+
+    if continued:
+        seed = state["adx"]
+    else:
+        adx[adx_row] = np.nansum(dx[: adx_row + 1]) / adx_period
+        seed = adx[adx_row]
+
+    adx[adx_row + 1 :] = wildersRecursion(dx[adx_row + 1 :], adx_period, seed)
+
+    # The last adx_period - 1 known values of the adx precede the new rows
+    previous_adx = state["previous_adx"] if continued else np.empty(0)
+    adx_values = np.concatenate([previous_adx, adx[first:]])
+
+    adxr = ((adx_values + shift(adx_values, adx_period - 1)) / 2.0)[len(previous_adx) :]
+
+    if state is not None:
+        state.update(
+            high=high[-1],
+            low=low[-1],
+            close=close[-1],
+            adx=adx[-1],
+            previous_adx=adx_values[len(adx_values) - (adx_period - 1) :],
+        )
+
+    return di["+"][first:], di["-"][first:], dx[first:], adx[first:], adxr
+
+
+def doubleExponentialMovingAverage(close, period=5, *, state=None):
+    """
+    Calculates the Double Exponential Moving Average.
+
+    Args:
+        close (numpy.ndarray): The close prices.
+
+        period (int, default=5): The past periods to be used for the
+            calculation of the indicator.
+
+        state (dict, default=None): If given, it is updated with the state
+            after the last row (the state of the two exponential moving
+            averages). If it already contains a state, the calculation
+            continues from it and the array contains only the new rows.
+
+    Returns:
+        numpy.ndarray: The ``dema``.
+
+    Raises:
+        NotEnoughInputData: Not enough data for calculating the indicator.
+    """
+
+    close = asArray(close)
+
+    if not state:
+        _requireRows(close, period, "Double Exponential Moving Average")
+
+    ema = exponentialMovingAverage(close, period, state=state)
+
+    return (2 * ema) - exponentialMovingAverage(ema, period, state=state, key="double_ema")
+
+
+@np.errstate(divide="ignore", invalid="ignore")
+def easeOfMovement(high, low, volume, period=40):
+    """
+    Calculates the Ease of Movement and its simple moving average.
+
+    Args:
+        high (numpy.ndarray): The high prices.
+
+        low (numpy.ndarray): The low prices.
+
+        volume (numpy.ndarray): The volume.
+
+        period (int, default=40): The past periods to be used for the
+            calculation of the moving average.
+
+    Returns:
+        (numpy.ndarray, numpy.ndarray): The ``emv`` and ``emv_ma``.
+
+    Raises:
+        NotEnoughInputData: Not enough data for calculating the indicator.
+    """
+
+    high, low, volume = asArray(high), asArray(low), asArray(volume)
+
+    _requireRows(high, max(period, 2), "Ease Of Movement")
+
+    midpoint_move = 0.5 * ((high + low) - (shift(high) + shift(low)))
+
+    box_ratio = volume / ((high - low) * 10000)
+
+    emv = midpoint_move / box_ratio
+
+    return emv, rollingMean(emv, period)
+
+
+def envelopes(close, period=20, shift=0.10):
+    """
+    Calculates the Envelopes, the simple moving average shifted up and down.
+
+    Args:
+        close (numpy.ndarray): The close prices.
+
+        period (int, default=20): The past periods to be used for the
+            calculation of the moving average.
+
+        shift (float, default=0.10): The shift of the bands, as a fraction of
+            the moving average.
+
+    Returns:
+        (numpy.ndarray, numpy.ndarray): The ``upper_band`` and
+        ``lower_band``.
+
+    Raises:
+        NotEnoughInputData: Not enough data for calculating the indicator.
+    """
+
+    close = asArray(close)
+
+    _requireRows(close, period, "Envelopes")
+
+    ma = rollingMean(close, period)
+
+    return (1 + shift) * ma, (1 - shift) * ma
+
+
+def fibonacciRetracement(close):
+    """
+    Calculates the Fibonacci Retracement levels (0%, 23.6%, 38.2%, 50%, 61.8%
+    and 100%) between the maximum and the minimum of the close prices.
+
+    Args:
+        close (numpy.ndarray): The close prices.
+
+    Returns:
+        tuple: The six retracement levels (numpy.ndarray objects), constant
+        for all the rows.
+    """
+
+    close = asArray(close)
+
+    # Calculate max and min for the whole input data
+    total_max = np.nanmax(close)
+    max_min_difference = total_max - np.nanmin(close)
+
+    return tuple(
+        np.full(len(close), total_max - c * max_min_difference, dtype=close.dtype)
+        for c in [0.0, 0.236, 0.382, 0.50, 0.618, 1.0]
+    )
+
+
+@np.errstate(divide="ignore", invalid="ignore")
+def forecastOscillator(close, period=14, *, tsf=None, decimals=4):
+    """
+    Calculates the Forecast Oscillator.
+
+    Args:
+        close (numpy.ndarray): The close prices.
+
+        period (int, default=14): The past periods to be used for the
+            calculation of the Time Series Forecast.
+
+        tsf (numpy.ndarray, default=None): The already calculated Time Series
+            Forecast. If None, it is calculated and rounded.
+
+        decimals (int, default=4): The number of decimals the calculated Time
+            Series Forecast is rounded to. If None, it is not rounded.
+
+    Returns:
+        numpy.ndarray: The ``fosc``.
+
+    Raises:
+        NotEnoughInputData: Not enough data for calculating the indicator.
+    """
+
+    close = asArray(close)
+
+    _requireRows(close, period, "Forecast Oscillator")
+
+    if tsf is None:
+        tsf = roundValues(timeSeriesForecast(close, period, decimals=decimals), decimals)
+
+    return 100 * (close - shift(asArray(tsf))) / close
+
+
+def ichimokuCloud(high, low, *, extrema=None):
+    """
+    Calculates the Ichimoku Cloud, from the middle of the lowest low and
+    highest high of 9, 26 and 52 periods.
+
+    Args:
+        high (numpy.ndarray): The high prices.
+
+        low (numpy.ndarray): The low prices.
+
+        extrema (dict, default=None): The already calculated lowest low and
+            highest high, as returned by ``tti.utils.rollingExtrema`` for the
+            periods 9, 26 and 52 with ``min_periods`` equal to 1.
+
+    Returns:
+        (numpy.ndarray, numpy.ndarray, numpy.ndarray, numpy.ndarray): The
+        ``tenkan_sen``, ``kijun_sen``, ``senkou_a`` and ``senkou_b``.
+    """
+
+    if extrema is None:
+        extrema = rollingExtrema(low, high, [9, 26, 52], min_periods=1)
+
+    tenkan_sen = (extrema[9][1] + extrema[9][0]) / 2
+
+    kijun_sen = (extrema[26][1] + extrema[26][0]) / 2
+
+    return (
+        tenkan_sen,
+        kijun_sen,
+        shift((tenkan_sen + kijun_sen) / 2, 26),
+        shift((extrema[52][1] + extrema[52][0]) / 2, 26),
+    )
+
+
+@np.errstate(divide="ignore", invalid="ignore")
+def intradayMomentumIndex(open, close, period=14):
+    """
+    Calculates the Intraday Momentum Index.
+
+    Args:
+        open (numpy.ndarray): The open prices.
+
+        close (numpy.ndarray): The close prices.
+
+        period (int, default=14): The past periods to be used for the
+            calculation of the indicator.
+
+    Returns:
+        numpy.ndarray: The ``imi``.
+
+    Raises:
+        NotEnoughInputData: Not enough data for calculating the indicator.
+    """
+
+    open, close = asArray(open), asArray(close)
+
+    _requireRows(close, period, "Intraday Momentum Index")
+
+    # Upward and Downward Price Change
+    upc = close - open
+    upc_sum = rollingSum(np.where(upc < 0.0, 0.0, upc), period)
+
+    dpc = open - close
+    dpc_sum = rollingSum(np.where(dpc < 0.0, 0.0, dpc), period)
+
+    return 100 * upc_sum / (upc_sum + dpc_sum)
+
+
+@np.errstate(divide="ignore", invalid="ignore")
+def klingerOscillator(high, low, close, volume):
+    """
+    Calculates the Klinger Oscillator.
+
+    Args:
+        high (numpy.ndarray): The high prices.
+
+        low (numpy.ndarray): The low prices.
+
+        close (numpy.ndarray): The close prices.
+
+        volume (numpy.ndarray): The volume.
+
+    Returns:
+        numpy.ndarray: The ``ko``.
+
+    Raises:
+        NotEnoughInputData: Not enough data for calculating the indicator.
+    """
+
+    high, low, close, volume = asArray(high), asArray(low), asArray(close), asArray(volume)
+
+    _requireRows(close, 55, "Klinger Oscillator")
+
+    # Trend Direction
+    prices_sum = np.nansum([high, low, close], axis=0)
+    trend = prices_sum - shift(prices_sum)
+    trend = np.where(trend > 0.0, 1.0, np.where(trend <= 0.0, -1.0, trend))
+
+    # Daily Measurement
+    dm = high - low
+
+    # Cumulative Measurement, the cumulative sum of the daily measurement
+    # which restarts from the previous daily measurement when the trend
+    # direction changes
+    trend_changed = trend != shift(trend)
+
+    cm = np.where(trend_changed, shift(dm) + dm, dm)
+    cm[:1] = 0.0
+
+    cm = pd.Series(cm).groupby(np.cumsum(trend_changed)).cumsum(skipna=False).to_numpy()
+
+    volume_force = volume * np.abs(2 * (dm / cm) - 1) * trend * 100
+
+    return exponentialMovingAverage(volume_force, 34) - exponentialMovingAverage(volume_force, 55)
+
+
+def linearRegressionIndicator(close, period=14, *, linear_regression=None):
+    """
+    Calculates the Linear Regression Indicator, the value of the rolling least
+    squares regression line at the last row of its window.
+
+    Args:
+        close (numpy.ndarray): The close prices.
+
+        period (int, default=14): The past periods to be used for the
+            calculation of the indicator.
+
+        linear_regression ((numpy.ndarray, numpy.ndarray), default=None): The
+            already calculated slope and value of the regression line.
+
+    Returns:
+        numpy.ndarray: The ``lri``.
+
+    Raises:
+        NotEnoughInputData: Not enough data for calculating the indicator.
+    """
+
+    close = asArray(close)
+
+    _requireRows(close, period, "Linear Regression Indicator")
+
+    if linear_regression is None:
+        linear_regression = linearRegression(close, period)
+
+    return linear_regression[1]
+
+
+def linearRegressionSlope(close, period=14, *, linear_regression=None):
+    """
+    Calculates the Linear Regression Slope, the slope of the rolling least
+    squares regression line.
+
+    Args:
+        close (numpy.ndarray): The close prices.
+
+        period (int, default=14): The past periods to be used for the
+            calculation of the indicator.
+
+        linear_regression ((numpy.ndarray, numpy.ndarray), default=None): The
+            already calculated slope and value of the regression line.
+
+    Returns:
+        numpy.ndarray: The ``lrs``.
+
+    Raises:
+        NotEnoughInputData: Not enough data for calculating the indicator.
+    """
+
+    close = asArray(close)
+
+    _requireRows(close, period, "Linear Regression Slope")
+
+    if linear_regression is None:
+        linear_regression = linearRegression(close, period)
+
+    return linear_regression[0]
+
+
+@np.errstate(divide="ignore", invalid="ignore")
+def marketFacilitationIndex(high, low, volume):
+    """
+    Calculates the Market Facilitation Index.
+
+    Args:
+        high (numpy.ndarray): The high prices.
+
+        low (numpy.ndarray): The low prices.
+
+        volume (numpy.ndarray): The volume.
+
+    Returns:
+        numpy.ndarray: The ``mfi``.
+    """
+
+    return (asArray(high) - asArray(low)) / asArray(volume)
+
+
+@np.errstate(divide="ignore", invalid="ignore")
+def massIndex(high, low):
+    """
+    Calculates the 25-periods Mass Index.
+
+    Args:
+        high (numpy.ndarray): The high prices.
+
+        low (numpy.ndarray): The low prices.
+
+    Returns:
+        numpy.ndarray: The ``mi``.
+
+    Raises:
+        NotEnoughInputData: Not enough data for calculating the indicator.
+    """
+
+    high, low = asArray(high), asArray(low)
+
+    _requireRows(high, 25, "Mass Index")
+
+    # Nine periods EMA of High-Low difference, and its nine periods EMA
+    ema_9 = exponentialMovingAverage(high - low, 9)
+    double_ema_9 = exponentialMovingAverage(ema_9, 9)
+
+    return rollingSum(ema_9 / double_ema_9, 25)
+
+
+def medianPrice(high, low):
+    """
+    Calculates the Median Price.
+
+    Args:
+        high (numpy.ndarray): The high prices.
+
+        low (numpy.ndarray): The low prices.
+
+    Returns:
+        numpy.ndarray: The ``mp``.
+    """
+
+    return 0.5 * (asArray(high) + asArray(low))
+
+
+@np.errstate(divide="ignore", invalid="ignore")
+def momentum(close, period=12):
+    """
+    Calculates the Momentum.
+
+    Args:
+        close (numpy.ndarray): The close prices.
+
+        period (int, default=12): The past periods to be used for the
+            calculation of the indicator.
+
+    Returns:
+        numpy.ndarray: The ``mom``.
+
+    Raises:
+        NotEnoughInputData: Not enough data for calculating the indicator.
+    """
+
+    close = asArray(close)
+
+    _requireRows(close, period, "Momentum")
+
+    mom = np.full(len(close), np.nan, dtype=close.dtype)
+    mom[period:] = 100.0 * close[period:] / close[: len(close) - period]
+
+    return mom
+
+
+def movingAverage(
+    close,
+    period=20,
+    ma_type="simple",
+    *,
+    slope=None,
+    value=None,
+    cmo=None,
+    state=None,
+    decimals=4,
+):
+    """
+    Calculates the Moving Average.
+
+    Args:
+        close (numpy.ndarray): The close prices. Two-dimensional for a panel
+            of symbols (one column for each symbol), for the ``simple``,
+            ``exponential`` and ``triangular`` moving averages.
+
+        period (int, default=20): The past periods to be used for the
+            calculation of the moving average.
+
+        ma_type (str, default='simple'): The type of the moving average.
+            Supported types are ``simple``, ``exponential``, ``time_series``,
+            ``triangular`` and ``variable``.
+
+        slope (numpy.ndarray, default=None): The already calculated Linear
+            Regression Slope, for the ``time_series`` moving average. If None,
+            it is calculated and rounded.
+
+        value (numpy.ndarray, default=None): The already calculated Linear
+            Regression Indicator, for the ``time_series`` moving average. If
+            None, it is calculated and rounded.
+
+        cmo (numpy.ndarray, default=None): The already calculated 9-periods
+            Chande Momentum Oscillator, for the ``variable`` moving average.
+            If None, it is calculated and rounded.
+
+        state (dict, default=None): If given, it is updated with the state
+            after the last row, for the ``exponential`` moving average. If it
+            already contains a state, the calculation continues from it and
+            the array contains only the new rows.
+
+        decimals (int, default=4): The number of decimals the calculated
+            ``slope``, ``value`` and ``cmo`` are rounded to. If None, they are
+            not rounded.
+
+    Returns:
+        numpy.ndarray: The ``ma``.
+
+    Raises:
+        WrongValueForInputParameter: Unsupported value for input argument.
+        NotEnoughInputData: Not enough data for calculating the indicator.
+    """
+
+    close = asArray(close)
+
+    if state and ma_type == "exponential":
+        # Continued from the state, the close prices are only the new rows
+        return exponentialMovingAverage(close, period, state=state)
+
+    if ma_type == "variable":
+        _requireRows(close, 22, "Moving Average (variable)")
+    else:
+        _requireRows(close, period, "Moving Average")
+
+    if ma_type == "simple":
+        return rollingMean(close, period)
+
+    elif ma_type == "exponential":
+        return exponentialMovingAverage(close, period, state=state)
+
+    elif ma_type == "time_series":
+        # Similar to Time Series Forecast
+        return timeSeriesForecast(close, period, slope=slope, value=value, decimals=decimals)
+
+    elif ma_type == "triangular":
+        # Simple Moving Average of the Simple Moving Average
+        return rollingMean(rollingMean(close, period), period)
+
+    elif ma_type == "variable":
+        if cmo is None:
+            cmo = roundValues(chandeMomentumOscillator(close, 9), decimals)
+
+        # Volatility Ratio and Scaling Multiplier
+        vr = np.abs(asArray(cmo) / 100)
+        sm = 2 / (period + 1)
+
+        # By default we start from period 22, with a variable smoothing factor
+        # for each period
+        ma = np.full(len(close), np.nan, dtype=np.float64)
+        ma[21] = close[21]
+        ma[22:] = linearRecurrence(1 - sm * vr[22:], sm * close[22:] * vr[22:], close[21])
+
+        return ma
+
+    raise WrongValueForInputParameter(
+        ma_type, "ma_type", "'simple', 'exponential', 'time_series', 'triangular' or 'variable'"
+    )
+
+
+def movingAverageConvergenceDivergence(close, *, decimals=4, state=None):
+    """
+    Calculates the Moving Average Convergence Divergence, from the rounded 12
+    and 26 periods exponential moving averages.
+
+    Args:
+        close (numpy.ndarray): The close prices. Two-dimensional for a panel
+            of symbols (one column for each symbol).
+
+        decimals (int, default=4): The number of decimals the exponential
+            moving averages are rounded to. If None, they are not rounded.
+
+        state (dict, default=None): If given, it is updated with the state
+            after the last row (the state of the three exponential moving
+            averages). If it already contains a state, the calculation
+            continues from it and the array contains only the new rows.
+
+    Returns:
+        (numpy.ndarray, numpy.ndarray): The ``macd`` and ``signal_line``.
+
+    Raises:
+        NotEnoughInputData: Not enough data for calculating the indicator.
+    """
+
+    close = asArray(close)
+
+    if not state:
+        _requireRows(close, 26, "Moving Average Convergence Divergence")
+
+    macd = roundValues(
+        exponentialMovingAverage(close, 12, state=state, key="ema_12"), decimals
+    ) - roundValues(exponentialMovingAverage(close, 26, state=state, key="ema_26"), decimals)
+
+    return macd, exponentialMovingAverage(macd, 9, state=state, key="signal_line")
+
+
+@np.errstate(divide="ignore", invalid="ignore")
+def negativeVolumeIndex(close, volume):
+    """
+    Calculates the Negative Volume Index, starting from 1000.
+
+    Args:
+        close (numpy.ndarray): The close prices.
+
+        volume (numpy.ndarray): The volume.
+
+    Returns:
+        numpy.ndarray: The ``nvi``.
+
+    Raises:
+        NotEnoughInputData: Not enough data for calculating the indicator.
+    """
+
+    close, volume = asArray(close), asArray(volume)
+
+    _requireRows(close, 2, "Negative Volume Index")
+
+    # The index changes by the close price rate of change, only when the
+    # volume decreases
+    rate_of_change = np.where(
+        volume[1:] < volume[:-1], 1.0 + (close[1:] - close[:-1]) / close[:-1], 1.0
+    )
+
+    return 1000.0 * np.cumprod(np.concatenate([[1.0], rate_of_change]))
+
+
+def onBalanceVolume(close, volume, *, state=None):
+    """
+    Calculates the On Balance Volume.
+
+    Args:
+        close (numpy.ndarray): The close prices.
+
+        volume (numpy.ndarray): The volume.
+
+        state (dict, default=None): If given, it is updated with the state
+            after the last row. If it already contains a state, the
+            calculation continues from it and the arrays contain only the
+            new rows.
+
+    Returns:
+        numpy.ndarray: The ``obv``.
+    """
+
+    close, volume = asArray(close), asArray(volume)
+
+    previous_close = np.concatenate([[state["close"] if state else np.nan], close[:-1]])
+
+    obv = cumulativeSum(
+        np.where(close > previous_close, volume, np.where(close < previous_close, -volume, 0.0))
+    )
+
+    # Continued from the last On Balance Volume total
+    if state:
+        obv = obv + state["obv"]
+
+    if state is not None:
+        state.update(close=close[-1], obv=obv[-1])
+
+    return obv
+
+
+def parabolicSar(high, low, *, af_increase=0.02, af_max=0.2, state=None):
+    """
+    Calculates the Parabolic SAR in a single pass. The extreme price of the
+    current position is tracked incrementally, and when the position changes
+    the SAR is the extreme price of the previous position.
+
+    Args:
+        high (numpy.ndarray): The high prices.
+
+        low (numpy.ndarray): The low prices.
+
+        af_increase (float, default=0.02): The initial acceleration factor and
+            its increase when a new extreme price is reached.
+
+        af_max (float, default=0.2): The maximum acceleration factor.
+
+        state (dict, default=None): If given, it is updated with the state
+            after the last row (acceleration factor, extreme price, SAR,
+            position and the last two rows). If it already contains a state,
+            the calculation continues from it and the arrays contain only the
+            new rows.
+
+    Returns:
+        numpy.ndarray: The ``sar``.
+
+    Raises:
+        NotEnoughInputData: Not enough data for calculating the indicator.
+    """
+
+    high, low = asArray(high), asArray(low)
+
+    if state:
+        # The new rows follow the last two known rows
+        high = np.concatenate([state["high"], high])
+        low = np.concatenate([state["low"], low])
+
+        af, ep, sar, position = state["af"], state["ep"], state["sar"], state["position"]
+        sars, first_row = [], 2
+
+    else:
+        _requireRows(high, 2, "Parabolic SAR")
+
+        # Initial position assumption (guess the initial position by checking
+        # the high values direction for the first two days)
+        af = af_increase
+
+        if high[1] > high[0]:
+            position, ep, sar = 1, high[0], low[0]
+        else:
+            position, ep, sar = -1, low[0], high[0]
+
+        sars, first_row = [sar], 1
+
+    # The lowest low and highest high of the two rows before each row
+    prior_low = np.empty(len(low), dtype=low.dtype)
+    prior_low[1] = low[0]
+    prior_low[2:] = np.minimum(low[1:-1], low[:-2])
+
+    prior_high = np.empty(len(high), dtype=high.dtype)
+    prior_high[1] = high[0]
+    prior_high[2:] = np.maximum(high[1:-1], high[:-2])
+
+    highs, lows = high.tolist(), low.tolist()
+    prior_low, prior_high = prior_low.tolist(), prior_high.tolist()
+
+    for i in range(first_row, len(highs)):
+        sar = sar + af * (ep - sar)
+
+        if position == 1:
+            # Highest price reached in the position (a missing value makes it
+            # missing until the position changes)
+            current_ep = highs[i] if ep == ep and not highs[i] <= ep else ep
+
+            # When `LONG`, SAR is not above the two prior lows
+            sar = min(sar, prior_low[i])
+
+            if lows[i] < sar:
+                af, ep, sar, position = af_increase, lows[i], ep, -1
+
+            else:
+                if current_ep > ep:
+                    af = min(af_max, af + af_increase)
+
+                ep = current_ep
+
+        else:
+            # Lowest price reached in the position (a missing value makes it
+            # missing until the position changes)
+            current_ep = lows[i] if ep == ep and not lows[i] >= ep else ep
+
+            # When `SHORT`, SAR is not below the two prior highs
+            sar = max(sar, prior_high[i])
+
+            if highs[i] > sar:
+                af, ep, sar, position = af_increase, highs[i], ep, 1
+
+            else:
+                if current_ep < ep:
+                    af = min(af_max, af + af_increase)
+
+                ep = current_ep
+
+        sars.append(sar)
+
+    if state is not None:
+        state.update(
+            af=af, ep=ep, sar=sar, position=position, high=high[-2:].copy(), low=low[-2:].copy()
+        )
+
+    return np.array(sars, dtype=np.float64)
+
+
+@np.errstate(divide="ignore", invalid="ignore")
+def performance(close, target=0.05):
+    """
+    Calculates the Performance, the return of the close prices since the first
+    row.
+
+    Args:
+        close (numpy.ndarray): The close prices.
+
+        target (float, default=0.05): The target return.
+
+    Returns:
+        (numpy.ndarray, numpy.ndarray): The ``prf`` and the ``target``
+        (constant for all the rows).
+    """
+
+    close = asArray(close)
+
+    return (close - close[0]) / close[0], np.full(len(close), target, dtype=close.dtype)
+
+
+@np.errstate(divide="ignore", invalid="ignore")
+def positiveVolumeIndex(close, volume):
+    """
+    Calculates the Positive Volume Index, starting from 1000.
+
+    Args:
+        close (numpy.ndarray): The close prices.
+
+        volume (numpy.ndarray): The volume.
+
+    Returns:
+        numpy.ndarray: The ``pvi``.
+
+    Raises:
+        NotEnoughInputData: Not enough data for calculating the indicator.
+    """
+
+    close, volume = asArray(close), asArray(volume)
+
+    _requireRows(close, 2, "Positive Volume Index")
+
+    # The index changes by the close price rate of change, only when the
+    # volume increases
+    rate_of_change = np.where(
+        volume[1:] > volume[:-1], 1.0 + (close[1:] - close[:-1]) / close[:-1], 1.0
+    )
+
+    return 1000.0 * np.cumprod(np.concatenate([[1.0], rate_of_change]))
+
+
+@np.errstate(divide="ignore", invalid="ignore")
+def priceAndVolumeTrend(close, volume):
+    """
+    Calculates the Price and Volume Trend.
+
+    Args:
+        close (numpy.ndarray): The close prices.
+
+        volume (numpy.ndarray): The volume.
+
+    Returns:
+        numpy.ndarray: The ``pvt``.
+
+    Raises:
+        NotEnoughInputData: Not enough data for calculating the indicator.
+    """
+
+    close, volume = asArray(close), asArray(volume)
+
+    _requireRows(close, 2, "Price and Volume Trend")
+
+    return np.cumsum(np.concatenate([[0.0], (close[1:] - close[:-1]) * (volume[1:] / close[:-1])]))
+
+
+def priceChannel(high, low, period=5, *, highest_high=None, lowest_low=None):
+    """
+    Calculates the Price Channel, the highest high and lowest low of the
+    previous periods.
+
+    Args:
+        high (numpy.ndarray): The high prices.
+
+        low (numpy.ndarray): The low prices.
+
+        period (int, default=5): The past periods to be used for the
+            calculation of the indicator.
+
+        highest_high (numpy.ndarray, default=None): The already calculated
+            rolling highest high of the period.
+
+        lowest_low (numpy.ndarray, default=None): The already calculated
+            rolling lowest low of the period.
+
+    Returns:
+        (numpy.ndarray, numpy.ndarray): The ``highest_high`` and
+        ``lowest_low``.
+
+    Raises:
+        NotEnoughInputData: Not enough data for calculating the indicator.
+    """
+
+    _requireRows(high, period, "Price Channel")
+
+    if highest_high is None or lowest_low is None:
+        lowest_low, highest_high = rollingExtrema(low, high, [period])[period]
+
+    return shift(asArray(highest_high)), shift(asArray(lowest_low))
+
+
+@np.errstate(divide="ignore", invalid="ignore")
+def priceOscillator(close, long_ma=30, short_ma=10):
+    """
+    Calculates the Price Oscillator, from a long and a short simple moving
+    average.
+
+    Args:
+        close (numpy.ndarray): The close prices.
+
+        long_ma (int, default=30): The periods of the long moving average.
+
+        short_ma (int, default=10): The periods of the short moving average.
+
+    Returns:
+        numpy.ndarray: The ``posc``.
+
+    Raises:
+        NotEnoughInputData: Not enough data for calculating the indicator.
+    """
+
+    close = asArray(close)
+
+    _requireRows(close, long_ma, "Price Oscillator")
+
+    long_ma = rollingMean(close, long_ma)
+
+    return 100 * (rollingMean(close, short_ma) - long_ma) / long_ma
+
+
+@np.errstate(divide="ignore", invalid="ignore")
+def priceRateOfChange(close, period=25):
+    """
+    Calculates the Price Rate of Change.
+
+    Args:
+        close (numpy.ndarray): The close prices.
+
+        period (int, default=25): The past periods to be used for the
+            calculation of the indicator.
+
+    Returns:
+        numpy.ndarray: The ``prc``.
+
+    Raises:
+        NotEnoughInputData: Not enough data for calculating the indicator.
+    """
+
+    close = asArray(close)
+
+    _requireRows(close, period, "Price Rate of Change")
+
+    previous_close = shift(close, period)
+
+    return 100 * (close - previous_close) / previous_close
+
+
+def projectionBands(high, low, period=14, *, slopes=None):
+    """
+    Calculates the Projection Bands, the highest (lowest) of the current high
+    (low) and the preceding highs (lows) projected to the current period with
+    the n-periods slope. The bands of the windows with missing values are
+    missing, as their slopes.
+
+    Args:
+        high (numpy.ndarray): The high prices.
+
+        low (numpy.ndarray): The low prices.
+
+        period (int, default=14): The past periods to be used for the
+            calculation of the indicator.
+
+        slopes ((numpy.ndarray, numpy.ndarray), default=None): The already
+            calculated slopes of the highs and of the lows regression lines.
+
+    Returns:
+        (numpy.ndarray, numpy.ndarray): The ``upper_band`` and
+        ``lower_band``.
+
+    Raises:
+        NotEnoughInputData: Not enough data for calculating the indicator.
+    """
+
+    high, low = asArray(high), asArray(low)
+
+    _requireRows(high, period, "Projection Bands")
+
+    if slopes is None:
+        slopes = linearRegression(high, period)[0], linearRegression(low, period)[0]
+
+    # Periods from each preceding value of the window to the last one
+    periods = np.arange(period - 1, 0, -1, dtype=np.float64)
+
+    bands = []
+
+    for values, slope, reduce in [(high, slopes[0], np.fmax), (low, slopes[1], np.fmin)]:
+        slope = asArray(slope)
+
+        projections = reduceSlidingWindows(
+            values,
+            period,
+            lambda windows, rows: reduce.reduce(
+                windows[:, :-1] + periods * slope[rows, None], axis=1
+            ),
+        ).astype(values.dtype, copy=False)
+
+        # Missing where the window contains missing values (missing slope)
+        band = np.where(np.isnan(values) | np.isnan(slope), np.nan, reduce(values, projections))
+        band[: period - 1] = np.nan
+
+        bands.append(band)
+
+    return tuple(bands)
+
+
+@np.errstate(divide="ignore", invalid="ignore")
+def projectionOscillator(high, low, close, period=14, *, projection_bands=None, decimals=4):
+    """
+    Calculates the Projection Oscillator and its trigger line (3-periods
+    exponential moving average).
+
+    Args:
+        high (numpy.ndarray): The high prices.
+
+        low (numpy.ndarray): The low prices.
+
+        close (numpy.ndarray): The close prices.
+
+        period (int, default=14): The past periods to be used for the
+            calculation of the Projection Bands.
+
+        projection_bands ((numpy.ndarray, numpy.ndarray), default=None): The
+            already calculated upper and lower Projection Bands. If None,
+            they are calculated and rounded.
+
+        decimals (int, default=4): The number of decimals the calculated
+            Projection Bands are rounded to. If None, they are not rounded.
+
+    Returns:
+        (numpy.ndarray, numpy.ndarray): The ``posc`` and ``trigger_line``.
+
+    Raises:
+        NotEnoughInputData: Not enough data for calculating the indicator.
+    """
+
+    close = asArray(close)
+
+    _requireRows(close, period, "Projection Oscillator")
+
+    if projection_bands is None:
+        projection_bands = tuple(roundValues(projectionBands(high, low, period), decimals))
+
+    upper_band, lower_band = asArray(projection_bands[0]), asArray(projection_bands[1])
+
+    posc = 100 * (close - lower_band) / (upper_band - lower_band)
+
+    # Trigger line, Exponential Moving Average of three days
+    return posc, exponentialMovingAverage(posc, 3)
+
+
+def qstick(open, close, period=8):
+    """
+    Calculates the Qstick, the simple moving average of the close-open
+    difference.
+
+    Args:
+        open (numpy.ndarray): The open prices.
+
+        close (numpy.ndarray): The close prices.
+
+        period (int, default=8): The past periods to be used for the
+            calculation of the indicator.
+
+    Returns:
+        numpy.ndarray: The ``qstick``.
+
+    Raises:
+        NotEnoughInputData: Not enough data for calculating the indicator.
+    """
+
+    open, close = asArray(open), asArray(close)
+
+    _requireRows(close, period, "Qstick")
+
+    return rollingSum(close - open, period) / period
+
+
+@np.errstate(divide="ignore", invalid="ignore")
+def rangeIndicator(high, low, close, range_period=5, smoothing_period=3, *, true_range=None):
+    """
+    Calculates the Range Indicator.
+
+    Args:
+        high (numpy.ndarray): The high prices.
+
+        low (numpy.ndarray): The low prices.
+
+        close (numpy.ndarray): The close prices.
+
+        range_period (int, default=5): The past periods to be used for the
+            calculation of the range.
+
+        smoothing_period (int, default=3): The periods of the exponential
+            moving average of the range.
+
+        true_range (numpy.ndarray, default=None): The already calculated True
+            Range.
+
+    Returns:
+        numpy.ndarray: The ``ri``.
+
+    Raises:
+        NotEnoughInputData: Not enough data for calculating the indicator.
+    """
+
+    close = asArray(close)
+
+    _requireRows(close, max(range_period, smoothing_period), "Range Indicator")
+
+    if true_range is None:
+        true_range = trueRange(asArray(high), asArray(low), close)
+
+    price_change = close - shift(close)
+
+    # True Range divided by the close price change, when the close price
+    # increases
+    see_text = np.where(price_change > 0, true_range / price_change, true_range)
+
+    range_min, range_max = rollingExtrema(see_text, see_text, [range_period])[range_period]
+
+    see_text_range = range_max - range_min
+    see_text_range = np.where(
+        see_text_range > 0,
+        100 * (see_text - range_min) / (range_max - range_min),
+        np.where(see_text_range <= 0, 100 * (see_text - range_min), see_text_range),
+    )
+
+    return exponentialMovingAverage(see_text_range, smoothing_period)
+
+
+@np.errstate(divide="ignore", invalid="ignore")
+def relativeMomentumIndex(close, period=8, momentum_period=4):
+    """
+    Calculates the Relative Momentum Index.
+
+    Args:
+        close (numpy.ndarray): The close prices.
+
+        period (int, default=8): The past periods to be used for the
+            calculation of the indicator.
+
+        momentum_period (int, default=4): The periods of the close price
+            change.
+
+    Returns:
+        numpy.ndarray: The ``rmi``.
+
+    Raises:
+        NotEnoughInputData: Not enough data for calculating the indicator.
+    """
+
+    close = asArray(close)
+
+    _requireRows(close, period + momentum_period, "Relative Momentum Index")
+
+    # Calculate price change (current close - close momentum periods ago)
+    close_price_change = close - shift(close, momentum_period)
+
+    # Upward and Downward price change
+    upc = np.where(
+        close_price_change > 0, close_price_change, np.where(close_price_change <= 0, 0.0, np.nan)
+    )
+    dpc = np.where(
+        close_price_change < 0,
+        np.abs(close_price_change),
+        np.where(close_price_change >= 0, 0.0, np.nan),
+    )
+
+    # Wilder's Moving Average for upc and dpc, starting from the mean of the
+    # first period values
+    seed_row = period + momentum_period - 1
+
+    smoothed = []
+
+    for values in [upc, dpc]:
+        smoothed_values = np.full(len(close), np.nan, dtype=np.float64)
+        smoothed_values[seed_row] = mean(values[momentum_period : seed_row + 1])
+        smoothed_values[seed_row + 1 :] = wildersRecursion(
+            values[seed_row + 1 :], period, smoothed_values[seed_row]
+        )
+
+        smoothed.append(smoothed_values)
+
+    return 100 * (smoothed[0] / smoothed[1]) / (1 + smoothed[0] / smoothed[1])
+
+
+@np.errstate(divide="ignore", invalid="ignore")
+def relativeStrengthIndex(close, period=14, *, state=None, decimals=4):
+    """
+    Calculates the Relative Strength Index. The price changes and their
+    Wilder's smoothing are rounded.
+
+    Args:
+        close (numpy.ndarray): The close prices.
+
+        period (int, default=14): The past periods to be used for the
+            calculation of the indicator.
+
+        state (dict, default=None): If given, it is updated with the state
+            after the last row. If it already contains a state, the
+            calculation continues from it and the array contains only the
+            new rows.
+
+        decimals (int, default=4): The number of decimals the price changes
+            and each smoothed value are rounded to. If None, they are not
+            rounded, and the smoothing is calculated in a vectorized way.
+
+    Returns:
+        numpy.ndarray: The ``rsi``.
+
+    Raises:
+        NotEnoughInputData: Not enough data for calculating the indicator.
+    """
+
+    close = asArray(close)
+
+    if not state:
+        _requireRows(close, period + 1, "Relative Strength Index")
+
+    previous_close = np.concatenate([[state["close"] if state else np.nan], close[:-1]])
+    price_change = close - previous_close
+
+    # Upward and Downward Price Change
+    upc = roundValues(np.where(price_change > 0, price_change, 0.0), decimals)
+    dpc = roundValues(np.where(price_change < 0, -price_change, 0.0), decimals)
+
+    if state:
+        smoothed_upc = wildersRecursion(upc, period, state["smoothed_upc"], decimals=decimals)
+        smoothed_dpc = wildersRecursion(dpc, period, state["smoothed_dpc"], decimals=decimals)
+
+    else:
+        # Wilder's smoothing, starting from the mean of the first period
+        # values
+        smoothed_upc = np.full(len(upc), np.nan, dtype=np.float64)
+        smoothed_dpc = np.full(len(dpc), np.nan, dtype=np.float64)
+
+        smoothed_upc[period] = mean(upc[1 : period + 1])
+        smoothed_dpc[period] = mean(dpc[1 : period + 1])
+
+        smoothed_upc[period + 1 :] = wildersRecursion(
+            upc[period + 1 :], period, smoothed_upc[period], decimals=decimals
+        )
+        smoothed_dpc[period + 1 :] = wildersRecursion(
+            dpc[period + 1 :], period, smoothed_dpc[period], decimals=decimals
+        )
+
+    if state is not None:
+        state.update(close=close[-1], smoothed_upc=smoothed_upc[-1], smoothed_dpc=smoothed_dpc[-1])
+
+    return 100.0 - (100.0 / ((smoothed_upc / smoothed_dpc) + 1.0))
+
+
+@np.errstate(divide="ignore", invalid="ignore")
+def relativeVolatilityIndex(high, low, period=5):
+    """
+    Calculates the Relative Volatility Index, from the 10-periods standard
+    deviation of the high and low prices.
+
+    Args:
+        high (numpy.ndarray): The high prices.
+
+        low (numpy.ndarray): The low prices.
+
+        period (int, default=5): The past periods to be used for the
+            calculation of the indicator.
+
+    Returns:
+        numpy.ndarray: The ``rvi``.
+
+    Raises:
+        NotEnoughInputData: Not enough data for calculating the indicator.
+    """
+
+    high, low = asArray(high), asArray(low)
+
+    _requireRows(high, period + 10, "Relative Volatility Index")
+
+    seed_row = 9 + period - 1
+
+    rvi = []
+
+    for values in [high, low]:
+        change = values - shift(values)
+        std = rollingStd(values, 10)
+
+        # Wilder's Moving Average for the upward and downward change
+        # standard deviation, starting from the mean of the first period
+        # values
+        smoothed = []
+
+        for std_values in [np.where(change > 0, std, 0.0), np.where(change < 0, std, 0.0)]:
+            smoothed_values = np.full(len(values), np.nan, dtype=np.float64)
+            smoothed_values[seed_row] = mean(std_values[9 : period + 9])
+            smoothed_values[seed_row + 1 :] = wildersRecursion(
+                std_values[seed_row + 1 :], period, smoothed_values[seed_row]
+            )
+
+            smoothed.append(smoothed_values)
+
+        # RVI High and Low
+        rvi.append(100 * smoothed[0] / (smoothed[0] + smoothed[1]))
+
+    return (rvi[0] + rvi[1]) / 2
+
+
+def standardDeviation(close, period=20):
+    """
+    Calculates the Standard Deviation (population) of the close prices.
+
+    Args:
+        close (numpy.ndarray): The close prices.
+
+        period (int, default=20): The past periods to be used for the
+            calculation of the indicator.
+
+    Returns:
+        numpy.ndarray: The ``sd``.
+
+    Raises:
+        NotEnoughInputData: Not enough data for calculating the indicator.
+    """
+
+    close = asArray(close)
+
+    _requireRows(close, period, "Standard Deviation")
+
+    return rollingStd(close, period)
+
+
+@np.errstate(divide="ignore", invalid="ignore")
+def stochasticMomentumIndex(
+    high,
+    low,
+    close,
+    period=5,
+    smoothing_period=3,
+    double_smoothing_period=3,
+    *,
+    highest_high=None,
+    lowest_low=None,
+):
+    """
+    Calculates the Stochastic Momentum Index.
+
+    Args:
+        high (numpy.ndarray): The high prices.
+
+        low (numpy.ndarray): The low prices.
+
+        close (numpy.ndarray): The close prices.
+
+        period (int, default=5): The past periods of the highest high and
+            lowest low.
+
+        smoothing_period (int, default=3): The periods of the first
+            exponential moving average.
+
+        double_smoothing_period (int, default=3): The periods of the second
+            exponential moving average.
+
+        highest_high (numpy.ndarray, default=None): The already calculated
+            rolling highest high of the period.
+
+        lowest_low (numpy.ndarray, default=None): The already calculated
+            rolling lowest low of the period.
+
+    Returns:
+        numpy.ndarray: The ``smi``.
+
+    Raises:
+        NotEnoughInputData: Not enough data for calculating the indicator.
+    """
+
+    close = asArray(close)
+
+    _requireRows(close, period, "Stochastic Momentum Index")
+
+    if highest_high is None or lowest_low is None:
+        lowest_low, highest_high = rollingExtrema(low, high, [period])[period]
+
+    highest_high, lowest_low = asArray(highest_high), asArray(lowest_low)
+
+    # Distance of Close from the Midpoint between highest high and lowest low,
+    # and the difference between highest high and lowest low, double
+    # exponentially smoothed
+    distance, hh_ll_diff = [
+        exponentialMovingAverage(
+            exponentialMovingAverage(values, smoothing_period), double_smoothing_period
+        )
+        for values in [close - (highest_high + lowest_low) / 2, highest_high - lowest_low]
+    ]
+
+    return 100 * (distance / (0.5 * hh_ll_diff))
+
+
+@np.errstate(divide="ignore", invalid="ignore")
+def stochasticOscillator(
+    high,
+    low,
+    close,
+    k_periods=14,
+    k_slowing_periods=1,
+    d_periods=3,
+    d_method="simple",
+    *,
+    highest_high=None,
+    lowest_low=None,
+    decimals=4,
+):
+    """
+    Calculates the Stochastic Oscillator. The %D is calculated from the
+    rounded %K.
+
+    Args:
+        high (numpy.ndarray): The high prices.
+
+        low (numpy.ndarray): The low prices.
+
+        close (numpy.ndarray): The close prices.
+
+        k_periods (int, default=14): The past periods of the highest high and
+            lowest low.
+
+        k_slowing_periods (int, default=1): The smoothing periods of the %K.
+
+        d_periods (int, default=3): The periods of the %D moving average.
+
+        d_method (str, default='simple'): The type of the %D moving average,
+            ``simple`` or ``exponential``.
+
+        highest_high (numpy.ndarray, default=None): The already calculated
+            rolling highest high of the ``k_periods``.
+
+        lowest_low (numpy.ndarray, default=None): The already calculated
+            rolling lowest low of the ``k_periods``.
+
+        decimals (int, default=4): The number of decimals the %K is rounded
+            to. If None, it is not rounded.
+
+    Returns:
+        (numpy.ndarray, numpy.ndarray): The ``%K`` and ``%D``.
+
+    Raises:
+        NotEnoughInputData: Not enough data for calculating the indicator.
+    """
+
+    close = asArray(close)
+
+    _requireRows(close, k_periods, "Stochastic Oscillator")
+
+    if highest_high is None or lowest_low is None:
+        lowest_low, highest_high = rollingExtrema(low, high, [k_periods])[k_periods]
+
+    highest_high, lowest_low = asArray(highest_high), asArray(lowest_low)
+
+    k = roundValues(
+        100
+        * rollingSum(close - lowest_low, k_slowing_periods)
+        / rollingSum(highest_high - lowest_low, k_slowing_periods),
+        decimals,
+    )
+
+    d = (
+        pd.Series(k)
+        .rolling(
+            window=d_periods,
+            min_periods=d_periods,
+            win_type=(None if d_method == "simple" else d_method),
+        )
+        .mean()
+        .to_numpy()
+    )
+
+    return k, d
+
+
+@np.errstate(divide="ignore", invalid="ignore")
+def swingIndex(open, high, low, close):
+    """
+    Calculates the Swing Index, limited to the [-100, 100] range.
+
+    Args:
+        open (numpy.ndarray): The open prices.
+
+        high (numpy.ndarray): The high prices.
+
+        low (numpy.ndarray): The low prices.
+
+        close (numpy.ndarray): The close prices.
+
+    Returns:
+        numpy.ndarray: The ``swi``.
+    """
+
+    open, high, low, close = asArray(open), asArray(high), asArray(low), asArray(close)
+
+    yesterday_close, yesterday_open = shift(close), shift(open)
+
+    # Absolute Difference of today's high and low from yesterday's close
+    abs_th_yc_diff = np.abs(high - yesterday_close)
+    abs_tl_yc_diff = np.abs(low - yesterday_close)
+
+    # Difference between yesterday's close and open
+    yc_yo_diff = yesterday_close - yesterday_open
+
+    numerator = (close - yesterday_close) + 0.5 * (close - open) + 0.25 * yc_yo_diff
+
+    k = np.fmax(abs_th_yc_diff, abs_tl_yc_diff)
+
+    r = np.fmax(k, high - low) + 0.25 * np.abs(yc_yo_diff)
+
+    return np.clip(50 * (numerator / r) * (k / 3), -100.0, 100.0)
+
+
+def timeSeriesForecast(close, period=14, *, slope=None, value=None, decimals=4):
+    """
+    Calculates the Time Series Forecast, the sum of the Linear Regression
+    Slope and the Linear Regression Indicator.
+
+    Args:
+        close (numpy.ndarray): The close prices.
+
+        period (int, default=14): The past periods to be used for the
+            calculation of the indicator.
+
+        slope (numpy.ndarray, default=None): The already calculated Linear
+            Regression Slope. If None, it is calculated and rounded.
+
+        value (numpy.ndarray, default=None): The already calculated Linear
+            Regression Indicator. If None, it is calculated and rounded.
+
+        decimals (int, default=4): The number of decimals the calculated
+            ``slope`` and ``value`` are rounded to. If None, they are not
+            rounded.
+
+    Returns:
+        numpy.ndarray: The ``tsf``.
+
+    Raises:
+        NotEnoughInputData: Not enough data for calculating the indicator.
+    """
+
+    close = asArray(close)
+
+    _requireRows(close, period, "Time Series Forecast")
+
+    if slope is None or value is None:
+        slope, value = (roundValues(values, decimals) for values in linearRegression(close, period))
+
+    tsf = np.full(len(close), np.nan, dtype=close.dtype)
+    tsf[period - 1 :] = _nanAdd(asArray(slope), asArray(value))[period - 1 :]
+
+    return tsf
+
+
+def tripleExponentialMovingAverage(close, period=5, *, state=None):
+    """
+    Calculates the Triple Exponential Moving Average.
+
+    Args:
+        close (numpy.ndarray): The close prices.
+
+        period (int, default=5): The past periods to be used for the
+            calculation of the indicator.
+
+        state (dict, default=None): If given, it is updated with the state
+            after the last row (the state of the three exponential moving
+            averages). If it already contains a state, the calculation
+            continues from it and the array contains only the new rows.
+
+    Returns:
+        numpy.ndarray: The ``tema``.
+
+    Raises:
+        NotEnoughInputData: Not enough data for calculating the indicator.
+    """
+
+    close = asArray(close)
+
+    if not state:
+        _requireRows(close, period, "Triple Exponential Moving Average")
+
+    ema = exponentialMovingAverage(close, period, state=state)
+    double_ema = exponentialMovingAverage(ema, period, state=state, key="double_ema")
+
+    return (
+        (3 * ema)
+        - (3 * double_ema)
+        + exponentialMovingAverage(double_ema, period, state=state, key="triple_ema")
+    )
+
+
+@np.errstate(divide="ignore", invalid="ignore")
+def typicalPrice(high, low, close):
+    """
+    Calculates the Typical Price, the average of the high, low and close
+    prices. Missing prices are ignored.
+
+    Args:
+        high (numpy.ndarray): The high prices.
+
+        low (numpy.ndarray): The low prices.
+
+        close (numpy.ndarray): The close prices.
+
+    Returns:
+        numpy.ndarray: The ``tp``.
+    """
+
+    prices = np.array([asArray(high), asArray(low), asArray(close)])
+
+    return np.nansum(prices, axis=0) / np.sum(~np.isnan(prices), axis=0)
+
+
+@np.errstate(divide="ignore", invalid="ignore")
+def ultimateOscillator(high, low, close, *, true_range=None):
+    """
+    Calculates the Ultimate Oscillator, from the 7, 14 and 28 periods buying
+    pressure.
+
+    Args:
+        high (numpy.ndarray): The high prices.
+
+        low (numpy.ndarray): The low prices.
+
+        close (numpy.ndarray): The close prices.
+
+        true_range (numpy.ndarray, default=None): The already calculated True
+            Range.
+
+    Returns:
+        numpy.ndarray: The ``uosc``.
+
+    Raises:
+        NotEnoughInputData: Not enough data for calculating the indicator.
+    """
+
+    high, low, close = asArray(high), asArray(low), asArray(close)
+
+    _requireRows(close, 28, "Ultimate Oscillator")
+
+    # The true high - true low range is the True Range
+    if true_range is None:
+        true_range = trueRange(high, low, close)
+
+    buying_units = close - np.minimum(low, shift(close))
+
+    averages = [
+        rollingSum(buying_units, period) / rollingSum(true_range, period) for period in [7, 14, 28]
+    ]
+
+    return 100 * ((4 * averages[0]) + (2 * averages[1]) + averages[2]) / 7
+
+
+@np.errstate(divide="ignore", invalid="ignore")
+def verticalHorizontalFilter(close, period=5):
+    """
+    Calculates the Vertical Horizontal Filter.
+
+    Args:
+        close (numpy.ndarray): The close prices.
+
+        period (int, default=5): The past periods to be used for the
+            calculation of the indicator.
+
+    Returns:
+        numpy.ndarray: The ``vhf``.
+
+    Raises:
+        NotEnoughInputData: Not enough data for calculating the indicator.
+    """
+
+    close = asArray(close)
+
+    _requireRows(close, period, "Vertical Horizontal Filter")
+
+    lowest_close, highest_close = rollingExtrema(close, close, [period])[period]
+
+    # Sum of the absolute close changes
+    close_change_sum = rollingSum(np.abs(close - shift(close)), period)
+
+    return np.abs(highest_close - lowest_close) / close_change_sum
+
+
+@np.errstate(divide="ignore", invalid="ignore")
+def volatilityChaikins(high, low, ema_period=10, change_period=10):
+    """
+    Calculates the Volatility Chaikins, the rate of change of the exponential
+    moving average of the high-low difference.
+
+    Args:
+        high (numpy.ndarray): The high prices.
+
+        low (numpy.ndarray): The low prices.
+
+        ema_period (int, default=10): The periods of the exponential moving
+            average.
+
+        change_period (int, default=10): The periods of the rate of change.
+
+    Returns:
+        numpy.ndarray: The ``vch``.
+
+    Raises:
+        NotEnoughInputData: Not enough data for calculating the indicator.
+    """
+
+    high, low = asArray(high), asArray(low)
+
+    _requireRows(high, max(ema_period, change_period), "Volatility Chaikins")
+
+    high_low_diff_ema = exponentialMovingAverage(high - low, ema_period)
+    previous_ema = shift(high_low_diff_ema, change_period)
+
+    return 100 * ((high_low_diff_ema - previous_ema) / previous_ema)
+
+
+def volumeOscillator(volume, long_period=5, short_period=2):
+    """
+    Calculates the Volume Oscillator, the difference of a short and a long
+    simple moving average of the volume.
+
+    Args:
+        volume (numpy.ndarray): The volume.
+
+        long_period (int, default=5): The periods of the long moving average.
+
+        short_period (int, default=2): The periods of the short moving
+            average.
+
+    Returns:
+        numpy.ndarray: The ``vosc``.
+
+    Raises:
+        NotEnoughInputData: Not enough data for calculating the indicator.
+    """
+
+    volume = asArray(volume)
+
+    _requireRows(volume, long_period, "Volume Oscillator")
+
+    return rollingMean(volume, short_period) - rollingMean(volume, long_period)
+
+
+@np.errstate(divide="ignore", invalid="ignore")
+def volumeRateOfChange(volume, period=5):
+    """
+    Calculates the Volume Rate of Change.
+
+    Args:
+        volume (numpy.ndarray): The volume.
+
+        period (int, default=5): The past periods to be used for the
+            calculation of the indicator.
+
+    Returns:
+        numpy.ndarray: The ``vrc``.
+
+    Raises:
+        NotEnoughInputData: Not enough data for calculating the indicator.
+    """
+
+    volume = asArray(volume)
+
+    _requireRows(volume, period, "Volume Rate of Change")
+
+    previous_volume = shift(volume, period)
+
+    return 100 * ((volume - previous_volume) / previous_volume)
+
+
+def weightedClose(high, low, close):
+    """
+    Calculates the Weighted Close, the average of the high, low and twice the
+    close prices.
+
+    Args:
+        high (numpy.ndarray): The high prices.
+
+        low (numpy.ndarray): The low prices.
+
+        close (numpy.ndarray): The close prices.
+
+    Returns:
+        numpy.ndarray: The ``wc``.
+    """
+
+    return (2 * asArray(close) + asArray(high) + asArray(low)) / 4
+
+
+def wildersSmoothing(close, period=5, *, state=None):
+    """
+    Calculates the Wilder's Smoothing, starting from the mean of the first
+    period values.
+
+    Args:
+        close (numpy.ndarray): The close prices.
+
+        period (int, default=5): The past periods to be used for the
+            calculation of the indicator.
+
+        state (dict, default=None): If given, it is updated with the state
+            after the last row. If it already contains a state, the
+            calculation continues from it and the array contains only the
+            new rows.
+
+    Returns:
+        numpy.ndarray: The ``ws``.
+
+    Raises:
+        NotEnoughInputData: Not enough data for calculating the indicator.
+    """
+
+    close = asArray(close)
+
+    if state:
+        ws = wildersRecursion(close, period, state["ws"])
+
+    else:
+        _requireRows(close, period, "Wilder's Smoothing")
+
+        ws = np.full(len(close), np.nan, dtype=np.float64)
+        ws[period - 1] = mean(close[:period])
+        ws[period:] = wildersRecursion(close[period:], period, ws[period - 1])
+
+    if state is not None:
+        state["ws"] = ws[-1]
+
+    return ws
+
+
+def williamsAccumulationDistribution(high, low, close):
+    """
+    Calculates the Williams Accumulation Distribution of each row.
+
+    Args:
+        high (numpy.ndarray): The high prices.
+
+        low (numpy.ndarray): The low prices.
+
+        close (numpy.ndarray): The close prices.
+
+    Returns:
+        numpy.ndarray: The ``wad``.
+    """
+
+    high, low, close = asArray(high), asArray(low), asArray(close)
+
+    yesterday_close = shift(close)
+
+    wad = close - yesterday_close
+
+    # Distance from the true range low (high) when the close increases
+    # (decreases)
+    return np.where(
+        wad > 0,
+        close - np.minimum(yesterday_close, low),
+        np.where(wad < 0, close - np.maximum(yesterday_close, high), wad),
+    )
+
+
+@np.errstate(divide="ignore", invalid="ignore")
+def williamsR(high, low, close, period=5, *, highest_high=None, lowest_low=None):
+    """
+    Calculates the William's %R.
+
+    Args:
+        high (numpy.ndarray): The high prices.
+
+        low (numpy.ndarray): The low prices.
+
+        close (numpy.ndarray): The close prices.
+
+        period (int, default=5): The past periods to be used for the
+            calculation of the indicator.
+
+        highest_high (numpy.ndarray, default=None): The already calculated
+            rolling highest high of the period.
+
+        lowest_low (numpy.ndarray, default=None): The already calculated
+            rolling lowest low of the period.
+
+    Returns:
+        numpy.ndarray: The ``wr``.
+
+    Raises:
+        NotEnoughInputData: Not enough data for calculating the indicator.
+    """
+
+    close = asArray(close)
+
+    _requireRows(close, period, "William's %R")
+
+    if highest_high is None or lowest_low is None:
+        lowest_low, highest_high = rollingExtrema(low, high, [period])[period]
+
+    highest_high, lowest_low = asArray(highest_high), asArray(lowest_low)
+
+    return -100 * ((highest_high - close) / (highest_high - lowest_low))
@@ -0,0 +1,490 @@
+"""
+Trading-Technical-Indicators (tti) python library
+
+File name: _primitives.py
+    Array primitives shared by the technical indicators kernels, defined under
+    the tti.kernels package.
+"""
+
+import math
+import numpy as np
+import pandas as pd
+
+# Number of values of the temporary arrays of the blocks of windows, see the
+# reduceSlidingWindows function
+_BLOCK_SIZE = 1 << 16
+
+
+def asArray(values):
+    """
+    Returns the values as a floating point ``numpy.ndarray``, without a copy
+    when they are already such an array. Values of dtype float32 are kept as
+    they are, any other dtype is converted to float64.
+
+    Args:
+        values (array-like): The values.
+
+    Returns:
+        numpy.ndarray: The values (dtype float32 or float64).
+    """
+
+    values = np.asarray(values)
+
+    return values if values.dtype in [np.float32, np.float64] else values.astype(np.float64)
+
+
+def _window(values):
+    """
+    Wraps the values in a pandas object without index, for using the pandas
+    rolling and exponential window functions. One-dimensional values are
+    wrapped in a series, two-dimensional values (one column for each symbol)
+    in a dataframe.
+
+    Args:
+        values (numpy.ndarray): The values.
+
+    Returns:
+        pandas.Series or pandas.DataFrame: The wrapped values.
+    """
+
+    return pd.Series(values) if values.ndim == 1 else pd.DataFrame(values)
+
+
+def rollingSum(values, period):
+    """
+    Calculates the rolling sum of the values, for full windows only.
+
+    Args:
+        values (numpy.ndarray): The values, one or two-dimensional.
+
+        period (int): The size of the rolling window.
+
+    Returns:
+        numpy.ndarray: The rolling sum.
+    """
+
+    return _window(values).rolling(window=period, min_periods=period).sum().to_numpy()
+
+
+def rollingMean(values, period):
+    """
+    Calculates the rolling mean (simple moving average) of the values, for full
+    windows only.
+
+    Args:
+        values (numpy.ndarray): The values, one or two-dimensional.
+
+        period (int): The size of the rolling window.
+
+    Returns:
+        numpy.ndarray: The rolling mean.
+    """
+
+    return _window(values).rolling(window=period, min_periods=period).mean().to_numpy()
+
+
+def rollingStd(values, period):
+    """
+    Calculates the rolling population standard deviation of the values, for
+    full windows only.
+
+    Args:
+        values (numpy.ndarray): The values, one or two-dimensional.
+
+        period (int): The size of the rolling window.
+
+    Returns:
+        numpy.ndarray: The rolling standard deviation.
+    """
+
+    return _window(values).rolling(window=period, min_periods=period).std(ddof=0).to_numpy()
+
+
+def exponentialMovingAverage(values, span, state=None, key="ema"):
+    """
+    Calculates the exponential moving average of the values, with smoothing
+    factor ``2 / (span + 1)``. The first ``span - 1`` values are missing.
+
+    Args:
+        values (numpy.ndarray): The values, one or two-dimensional.
+
+        span (int): The span of the moving average.
+
+        state (dict, default=None): If given, it is updated with the state
+            after the last row, for one-dimensional values. If it already
+            contains a state, the calculation continues from it and the values
+            are only the new rows.
+
+        key (str, default='ema'): The key of the state in ``state``, for
+            calculations with more than one exponential moving average.
+
+    Returns:
+        numpy.ndarray: The exponential moving average.
+    """
+
+    if state is None:
+        return _window(values).ewm(span=span, min_periods=span, adjust=False).mean().to_numpy()
+
+    values = asArray(values)
+
+    observations = state[key][2] if key in state else 0
+
+    ema = exponentialWeightedMean(values, (span - 1) / 2, state, key)
+
+    ema[observations + np.cumsum(~np.isnan(values)) < span] = np.nan
+
+    return ema
+
+
+def exponentialWeightedMean(values, com, state=None, key="ewm"):
+    """
+    Calculates the exponential weighted mean of the values (``adjust=False``,
+    missing values are skipped), as by pandas.
+
+    Args:
+        values (numpy.ndarray): The values, one-dimensional.
+
+        com (float): The center of mass, the smoothing factor is
+            ``1 / (1 + com)``.
+
+        state (dict, default=None): If given, it is updated with the state
+            after the last value. If it already contains a state, the
+            calculation continues from it, in a loop which takes time
+            proportional to the number of the values only.
+
+        key (str, default='ewm'): The key of the state in ``state``.
+
+    Returns:
+        numpy.ndarray: The exponential weighted mean.
+    """
+
+    values = asArray(values)
+
+    # Calculated as by pandas, from the center of mass
+    alpha = 1.0 / (1.0 + com)
+
+    if state is None or key not in state:
+        ewm = _window(values).ewm(com=com, adjust=False).mean().to_numpy()
+
+        if state is None:
+            return ewm
+
+        # The state is the last mean, the weight of the last mean for the
+        # next value (it decreases with each missing value) and the number of
+        # the not missing values
+        observed = np.flatnonzero(~np.isnan(values))
+
+        state[key] = np.array(
+            [
+                ewm[-1] if len(ewm) else np.nan,
+                (1.0 - alpha) ** (len(values) - 1 - observed[-1]) if len(observed) else 1.0,
+                len(observed),
+            ]
+        )
+
+        return ewm
+
+    ewm, weight, observations = state[key].tolist()
+
+    result = np.empty(len(values), dtype=np.float64)
+
+    for i, value in enumerate(values.tolist()):
+        observed = not math.isnan(value)
+        observations += observed
+
+        if not math.isnan(ewm):
+            weight *= 1.0 - alpha
+
+            if observed:
+                # An equal value is skipped (as by pandas), avoiding
+                # numerical errors on constant values
+                if ewm != value:
+                    ewm = (weight * ewm + alpha * value) / (weight + alpha)
+
+                weight = 1.0
+
+        elif observed:
+            ewm = value
+
+        result[i] = ewm
+
+    state[key] = np.array([ewm, weight, observations])
+
+    return result
+
+
+def shift(values, periods=1):
+    """
+    Shifts the values along the rows, filling the emptied positions with NaN.
+
+    Args:
+        values (numpy.ndarray): The values, one or two-dimensional.
+
+        periods (int, default=1): Number of rows to shift, forward when
+            positive and backward when negative.
+
+    Returns:
+        numpy.ndarray: The shifted values, float32 for float32 values and
+        float64 otherwise.
+    """
+
+    shifted = np.full(
+        values.shape, np.nan, dtype=np.float32 if values.dtype == np.float32 else np.float64
+    )
+
+    if abs(periods) < len(values):
+        if periods >= 0:
+            shifted[periods:] = values[: len(values) - periods]
+        else:
+            shifted[:periods] = values[-periods:]
+
+    return shifted
+
+
+def roundValues(values, decimals):
+    """
+    Rounds the values (as by ``numpy.round``), when rounding is required.
+
+    Args:
+        values (numpy.ndarray): The values.
+
+        decimals (int): The number of decimals. If None, the values are
+            returned as they are, without a copy.
+
+    Returns:
+        numpy.ndarray: The rounded values.
+    """
+
+    return values if decimals is None else np.round(values, decimals)
+
+
+def mean(values):
+    """
+    Calculates the mean of the values, ignoring the missing ones.
+
+    Args:
+        values (numpy.ndarray): The values.
+
+    Returns:
+        float: The mean, NaN when all the values are missing.
+    """
+
+    return pd.Series(values).mean()
+
+
+def cumulativeSum(values):
+    """
+    Calculates the cumulative sum of the values. Missing values are skipped,
+    they remain missing and do not affect the next sums.
+
+    Args:
+        values (numpy.ndarray): The values.
+
+    Returns:
+        numpy.ndarray: The cumulative sums.
+    """
+
+    sums = np.nancumsum(values)
+    sums[np.isnan(values)] = np.nan
+
+    return sums
+
+
+def slidingWindows(values, window):
+    """
+    Returns a strided view of all the windows of the values (no window is
+    copied).
+
+    Args:
+        values (numpy.ndarray): The values, one-dimensional.
+
+        window (int): The size of the window.
+
+    Returns:
+        numpy.ndarray: The windows, of shape (windows, window). The window
+        ``i`` ends at the row ``i + window - 1``.
+    """
+
+    return np.lib.stride_tricks.sliding_window_view(values, window)
+
+
+def reduceSlidingWindows(values, window, function):
+    """
+    Calculates one value for each window of the values, by calling a function
+    on blocks of consecutive windows. The windows are strided views (no window
+    is copied), and the blocks are sized so that the temporary arrays of the
+    function hold about ``_BLOCK_SIZE`` values, whatever the number of the
+    windows.
+
+    Args:
+        values (numpy.ndarray): The values, one-dimensional.
+
+        window (int): The size of the window.
+
+        function (callable): Called with the windows of a block, of shape
+            (windows, window), and the slice of the rows the windows end at.
+            It returns one value for each window.
+
+    Returns:
+        numpy.ndarray: The value of each window, at the row the window ends
+        at. The first ``window - 1`` values are NaN.
+    """
+
+    windows = slidingWindows(values, window)
+
+    block = max(1, _BLOCK_SIZE // window)
+
+    results = [
+        function(
+            windows[start : start + block], slice(start + window - 1, start + window - 1 + block)
+        )
+        for start in range(0, len(windows), block)
+    ]
+
+    dtype = results[0].dtype if results else np.float64
+
+    return np.concatenate([np.full(window - 1, np.nan, dtype=dtype)] + results)
+
+
+def trueRange(high, low, close):
+    """
+    Calculates the True Range, the maximum of the current high-low range and
+    the distances of the current high and low from the previous close. The
+    True Range of the first row (no previous close) is NaN.
+
+    Args:
+        high (numpy.ndarray): The high prices.
+
+        low (numpy.ndarray): The low prices.
+
+        close (numpy.ndarray): The close prices.
+
+    Returns:
+        numpy.ndarray: The True Range.
+    """
+
+    previous_close = shift(close)
+
+    return np.maximum(np.maximum(high - low, high - previous_close), previous_close - low)
+
+
+@np.errstate(divide="ignore", invalid="ignore")
+def linearRegression(values, period):
+    """
+    Calculates the rolling least squares regression line of the values against
+    the (evenly spaced) row number. The sums of each window are updated in
+    constant time, as the rolling sums of the values and of the values weighted
+    by their row number.
+
+    Args:
+        values (numpy.ndarray): The values.
+
+        period (int): The size of the rolling window.
+
+    Returns:
+        (numpy.ndarray, numpy.ndarray): The ``slope`` of the regression line
+        and its ``value`` at the last row of the window. For a period of one
+        the slope is undefined (NaN). Both are NaN for the windows with
+        missing values.
+    """
+
+    x = np.arange(len(values), dtype=np.float64)
+
+    y_sum = rollingSum(values, period)
+
+    # Sum of the values weighted by their position in the window
+    xy_sum = rollingSum(values * x, period) - (x - (period - 1)) * y_sum
+
+    slope = (xy_sum - (period - 1) / 2 * y_sum) / (period * (period**2 - 1) / 12)
+
+    return slope, y_sum / period + slope * (period - 1) / 2
+
+
+def wildersRecursion(values, period, seed, decimals=None):
+    """
+    Calculates the Wilder's smoothing of the values, continuing from a seed
+    value: ``smoothed[i] = smoothed[i - 1] + (values[i] - smoothed[i - 1])
+    / period``. It is an exponential moving average with ``alpha`` equal to
+    ``1 / period``, calculated in a vectorized way when the smoothed values
+    are not rounded.
+
+    Args:
+        values (numpy.ndarray): The values to be smoothed, following the seed.
+
+        period (int): The smoothing period.
+
+        seed (float): The smoothed value preceding the first of the values,
+            usually the mean of the first ``period`` values.
+
+        decimals (int, default=None): If not None, each smoothed value is
+            rounded (as by ``numpy.round``) to the given number of decimals
+            before the next one is calculated.
+
+    Returns:
+        numpy.ndarray: The smoothed values.
+    """
+
+    values = asArray(values)
+
+    if decimals is None:
+        values = np.concatenate([[seed], values])
+
+        smoothed = pd.Series(values).ewm(alpha=1.0 / period, adjust=False).mean().to_numpy()
+
+        # A missing value is not skipped, it makes missing all the next ones
+        smoothed[np.logical_or.accumulate(np.isnan(values))] = np.nan
+
+        return smoothed[1:]
+
+    # Rounding makes each value depend on the rounded previous one
+    scale = 10.0**decimals
+    smoothed = np.empty(len(values), dtype=np.float64)
+    seed = float(seed)
+
+    for i, value in enumerate(values.tolist()):
+        seed = (seed + (value - seed) / period) * scale
+        seed = (round(seed) if math.isfinite(seed) else seed) / scale
+
+        smoothed[i] = seed
+
+    return smoothed
+
+
+def linearRecurrence(multipliers, values, initial):
+    """
+    Calculates a first order linear recurrence with time-varying coefficients,
+    ``result[i] = values[i] + multipliers[i] * result[i - 1]``, as an
+    exponential moving average with a variable smoothing factor.
+
+    Each step is an affine function of the previous result, and the functions
+    are composed with a prefix scan: after the pass with a step ``s``, each
+    row holds the composition of the functions of the ``2 * s`` rows up to it.
+    The scan takes ``log2(n)`` vectorized passes. The multipliers are only
+    multiplied together, unlike in a closed form (cumulative product of the
+    multipliers, divided out of the values) which underflows for long series.
+
+    Args:
+        multipliers (numpy.ndarray): The multipliers of the previous result.
+
+        values (numpy.ndarray): The values added to each result.
+
+        initial (float): The result preceding the first of the values.
+
+    Returns:
+        numpy.ndarray: The results.
+    """
+
+    multipliers = asArray(multipliers).astype(np.float64)
+    values = asArray(values).astype(np.float64)
+
+    step = 1
+
+    while step < len(values):
+        # The function of each row composed with the function of the rows
+        # preceding it (the right hand sides use the previous pass values)
+        values[step:] = values[step:] + multipliers[step:] * values[:-step]
+        multipliers[step:] = multipliers[step:] * multipliers[:-step]
+
+        step *= 2
+
+    return values + multipliers * float(initial)
@@ -5,5 +5,21 @@ the `tti.utils` package includes the implementation of library utilities.
 """
 
 from .data_preprocessing import fillMissingValues
+from .prepared_input import PreparedInput
+from .indicator_store import IndicatorStore
+from .rolling_extrema import rollingExtrema, RollingExtrema
+from .result_cache import ResultCache, setResultCache, getResultCache
+from .float_dtype import setFloatDtype, getFloatDtype
 
-__all__ = ["fillMissingValues"]
+__all__ = [
+    "fillMissingValues",
+    "PreparedInput",
+    "ResultCache",
+    "setResultCache",
+    "getResultCache",
+    "setFloatDtype",
+    "getFloatDtype",
+    "IndicatorStore",
+    "rollingExtrema",
+    "RollingExtrema",
+]
@@ -46,6 +46,42 @@ def validateInputData(input_data, required_columns, indicator_name, fill_missing
         ValueError: Value error occurred when validating the ``input_data``.
     """
 
+    validateDataFrame(input_data)
+
+    # Make columns case insensitive
+    input_data.columns = [c.lower() for c in input_data.columns]
+
+    validateRequiredColumns(input_data, required_columns, indicator_name)
+
+    # Remove not required columns, if any
+    input_data = input_data[[c for c in input_data.columns if c in required_columns]]
+
+    # Sort dataframe on index ascending (filling of the missing values sorts
+    # the dataframe as well)
+    if fill_missing_values:
+        input_data = fillMissingValues(input_data)
+    else:
+        input_data = input_data.sort_index(ascending=True, inplace=False)
+
+    return input_data
+
+
+def validateDataFrame(input_data):
+    """
+    Validates that the data parameter is a pandas.DataFrame, that its index
+    is of type date and that it is not empty. It raises an exception in case
+    the validation fails.
+
+    Args:
+        input_data (pandas.DataFrame): The input data. The index is of type
+            ``pandas.DatetimeIndex``.
+
+    Raises:
+        WrongTypeForInputParameter: Input argument has wrong type.
+        TypeError: Type error occurred when validating the ``input_data``.
+        ValueError: Value error occurred when validating the ``input_data``.
+    """
+
     # Validate that the input_data parameter is a pandas.DataFrame object
     if not isinstance(input_data, pd.DataFrame):
         raise WrongTypeForInputParameter(type(input_data), "input_data", "pd.DataFrame")
@@ -63,8 +99,26 @@ def validateInputData(input_data, required_columns, indicator_name, fill_missing
     if input_data.empty:
         raise ValueError("The input_data cannot be an empty pandas.DataFrame.")
 
-    # Make columns case insensitive
-    input_data.columns = [c.lower() for c in input_data.columns]
+
+def validateRequiredColumns(input_data, required_columns, indicator_name):
+    """
+    Validates that the data parameter contains the required columns
+    (required_columns parameter) with numeric data type. It raises an
+    exception in case the validation fails.
+
+    Args:
+        input_data (pandas.DataFrame): The input data, with lower case
+            columns.
+
+        required_columns ([str,]): The columns which should be contained in the
+            dataframe for the specific indicator.
+
+        indicator_name (str): The name of the indicator. To be used in case
+            an exception is raised.
+
+    Raises:
+        ValueError: Value error occurred when validating the ``input_data``.
+    """
 
     # Validate that the data frame holds columns of numeric type and that all
     # the required columns are contained.
@@ -89,16 +143,3 @@ def validateInputData(input_data, required_columns, indicator_name, fill_missing
                 + str(input_data[column].dtype)
                 + "`."
             )
-
-    # Remove not required columns, if any
-    for column in input_data.columns:
-        if column not in required_columns:
-            input_data = input_data.drop(columns=column, inplace=False)
-
-    # Sort dataframe on index ascending
-    input_data = input_data.sort_index(ascending=True, inplace=False)
-
-    if fill_missing_values:
-        input_data = fillMissingValues(input_data)
-
-    return input_data
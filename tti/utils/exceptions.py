@@ -6,6 +6,27 @@ File name: exceptions.py
 """
 
 
+def _restoreException(exception_class, message):
+    """
+    Restores an exception of the library from its message, when it is
+    unpickled (for example when it is raised in a worker process).
+    """
+
+    exception = Exception.__new__(exception_class)
+    Exception.__init__(exception, message)
+
+    return exception
+
+
+def _reduceException(exception):
+    """
+    Pickles an exception of the library through its message, since the
+    exceptions are constructed from other arguments.
+    """
+
+    return _restoreException, (type(exception), str(exception))
+
+
 class NotEnoughInputData(Exception):
     def __init__(
         self,
@@ -22,6 +43,8 @@ class NotEnoughInputData(Exception):
 
         super().__init__(message)
 
+    __reduce__ = _reduceException
+
 
 class WrongValueForInputParameter(Exception):
     def __init__(
@@ -38,6 +61,8 @@ class WrongValueForInputParameter(Exception):
 
         super().__init__(message)
 
+    __reduce__ = _reduceException
+
 
 class WrongTypeForInputParameter(Exception):
     def __init__(
@@ -54,6 +79,8 @@ class WrongTypeForInputParameter(Exception):
 
         super().__init__(message)
 
+    __reduce__ = _reduceException
+
 
 class NotValidInputDataForSimulation(Exception):
     def __init__(
@@ -66,3 +93,5 @@ class NotValidInputDataForSimulation(Exception):
         message += details
 
         super().__init__(message)
+
+    __reduce__ = _reduceException
@@ -0,0 +1,66 @@
+"""
+Trading-Technical-Indicators (tti) python library
+
+File name: float_dtype.py
+    Floating point data type of the technical indicators calculations,
+    defined under the tti.utils package.
+"""
+
+import numpy as np
+
+from .exceptions import WrongTypeForInputParameter, WrongValueForInputParameter
+
+# The floating point data type used by the technical indicators
+_float_dtype = np.dtype(np.float64)
+
+
+def setFloatDtype(float_dtype):
+    """
+    Sets the floating point data type used when creating technical
+    indicators. The input data columns are passed to the indicators kernels
+    (``tti.kernels`` package) in this data type, and the calculated indicators
+    are returned in it. The ``float32`` halves the memory of these arrays, at
+    the cost of precision (about seven significant digits). Indicators which
+    compare price differences, such as the Directional Movement Index and the
+    Klinger Oscillator, can differ more, when the compared values are closer
+    than this precision. Recursive calculations are carried in float64.
+    Default is ``float64``.
+
+    An indicator keeps the data type it was created with, also when it is
+    updated with new input data.
+
+    Args:
+        float_dtype (str or numpy.dtype): The data type, ``float32`` or
+            ``float64``.
+
+    Raises:
+        WrongTypeForInputParameter: Input argument has wrong type.
+        WrongValueForInputParameter: Unsupported value for input argument.
+    """
+
+    global _float_dtype
+
+    if not isinstance(float_dtype, (str, type, np.dtype)):
+        raise WrongTypeForInputParameter(type(float_dtype), "float_dtype", "str or numpy.dtype")
+
+    try:
+        dtype = np.dtype(float_dtype)
+    except TypeError:
+        dtype = None
+
+    if dtype not in [np.float32, np.float64]:
+        raise WrongValueForInputParameter(float_dtype, "float_dtype", "float32, float64")
+
+    _float_dtype = dtype
+
+
+def getFloatDtype():
+    """
+    Returns the floating point data type used when creating technical
+    indicators.
+
+    Returns:
+        numpy.dtype: The data type, ``float32`` or ``float64``.
+    """
+
+    return _float_dtype
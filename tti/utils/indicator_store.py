@@ -0,0 +1,522 @@
+"""
+Trading-Technical-Indicators (tti) python library
+
+File name: indicator_store.py
+    On disk store of the calculated technical indicators implementation,
+    defined under the tti.utils package.
+"""
+
+import hashlib
+import inspect
+import json
+import os
+import urllib.parse
+import numpy as np
+import pandas as pd
+
+from .data_validation import validateDataFrame
+from .exceptions import WrongTypeForInputParameter, WrongValueForInputParameter
+from .float_dtype import getFloatDtype
+from .result_cache import ResultCache
+from .row_buffer import RowBuffer
+
+# Instance attributes which are not stored as metadata, they are stored in
+# arrays, restored from the indicator properties or they are not valid for a
+# restored indicator
+_NOT_STORED_ATTRIBUTES = [
+    "_input_data",
+    "_ti_data",
+    "_prepared_input",
+    "_features",
+    "_row_buffers",
+    "_properties",
+    "_float_dtype",
+    "_state",
+]
+
+
+class IndicatorStore:
+    """
+    On disk store of calculated technical indicators. For each symbol,
+    indicator, input arguments and floating point data type, the calculated
+    indicator and its input data are stored in ``.npy`` segment files,
+    together with a JSON metadata file (first and last input data timestamps,
+    digests of the input data, attributes of the indicator instance) and the
+    state of the indicator calculation in a ``.npz`` file.
+
+    The symbols are percent encoded in the directory names, so any symbol (for
+    example ``BRK/B``) is stored in its own directory of the store.
+
+    When the indicator is requested again for input data with new rows
+    appended, the stored segments are read through memory mapping and only the
+    new rows are calculated, through the ``update`` method of the indicator.
+    The new rows are written in a new segment, the already stored ones are not
+    rewritten. The last segments are merged when the new ones are not
+    smaller, so the number of segments grows logarithmically with the number
+    of the stored rows.
+
+    The stored files are read without ``pickle``, so no code is executed when
+    an indicator is restored.
+
+    Args:
+        directory (str): The directory of the store. It is created if it does
+            not exist.
+
+    Attributes:
+        _directory (str): The directory of the store.
+
+    Raises:
+        WrongTypeForInputParameter: Input argument has wrong type.
+    """
+
+    def __init__(self, directory):
+        if not isinstance(directory, (str, os.PathLike)):
+            raise WrongTypeForInputParameter(type(directory), "directory", "str")
+
+        self._directory = os.fspath(directory)
+
+        os.makedirs(self._directory, exist_ok=True)
+
+    def _path(self, symbol, indicator, kwargs):
+        """
+        Returns the directory of the stored indicator files.
+
+        Args:
+            symbol (str): The symbol.
+
+            indicator (type): The technical indicator class.
+
+            kwargs (dict): The input arguments of the technical indicator.
+
+        Returns:
+            str: The directory of the stored indicator files.
+        """
+
+        arguments = hashlib.blake2b(
+            repr((sorted(kwargs.items()), getFloatDtype().name)).encode(), digest_size=8
+        )
+
+        # Path separators are encoded, and a leading dot so that the symbol is
+        # not the current or the parent directory
+        symbol_directory = urllib.parse.quote(symbol, safe="")
+
+        if symbol_directory.startswith("."):
+            symbol_directory = "%2E" + symbol_directory[1:]
+
+        return os.path.join(
+            self._directory, symbol_directory, indicator.__name__ + "_" + arguments.hexdigest()
+        )
+
+    def getIndicator(self, symbol, indicator, input_data, **kwargs):
+        """
+        Returns a technical indicator for the given input data. The stored
+        indicator is used and extended with the new rows of the input data, if
+        any. When there is no stored indicator, or the input data already
+        stored have changed, the indicator is calculated for all the input
+        data. The store is updated with the returned indicator.
+
+        The input data can be either all the input data of the symbol, when
+        the already stored rows are compared to the digests of the stored
+        input data, or only the rows after the last stored one, when no
+        comparison is needed. Input data which start after the first stored
+        row and contain already stored rows are not accepted, since they
+        can not be compared to the stored input data.
+
+        Args:
+            symbol (str): The symbol of the input data.
+
+            indicator (type): The technical indicator class, for example
+                ``tti.indicators.MovingAverage``.
+
+            input_data (pandas.DataFrame): The input data of the symbol. The
+                index is of type ``pandas.DatetimeIndex``.
+
+            **kwargs: The input arguments of the technical indicator, for
+                example ``period`` or ``fill_missing_values``.
+
+        Returns:
+            tti.indicators.TechnicalIndicator: The technical indicator.
+
+        Raises:
+            WrongTypeForInputParameter: Input argument has wrong type.
+            WrongValueForInputParameter: Unsupported value for input argument.
+            NotEnoughInputData: Not enough data for calculating the indicator.
+            TypeError: Type error occurred when validating the ``input_data``.
+            ValueError: Value error occurred when validating the
+                ``input_data``.
+        """
+
+        from ..indicators._technical_indicator import TechnicalIndicator
+
+        if not isinstance(symbol, str):
+            raise WrongTypeForInputParameter(type(symbol), "symbol", "str")
+
+        if not symbol:
+            raise WrongValueForInputParameter(symbol, "symbol", "non empty str")
+
+        if not inspect.isclass(indicator) or not issubclass(indicator, TechnicalIndicator):
+            raise WrongTypeForInputParameter(
+                type(indicator), "indicator", "TechnicalIndicator class"
+            )
+
+        validateDataFrame(input_data)
+
+        # Columns are case insensitive, as for the indicators, so the digests
+        # are calculated for the lower case columns
+        input_data = input_data.sort_index(ascending=True).rename(columns=lambda c: c.lower())
+
+        path = self._path(symbol, indicator, kwargs)
+
+        ti = self._load(path, indicator, input_data)
+
+        if ti is None:
+            ti = indicator(input_data=input_data, **kwargs)
+            self._save(path, ti, input_data)
+
+        return ti
+
+    def _load(self, path, indicator, input_data):
+        """
+        Restores a stored indicator and extends it with the new rows of the
+        input data.
+
+        Args:
+            path (str): The directory of the stored indicator files.
+
+            indicator (type): The technical indicator class.
+
+            input_data (pandas.DataFrame): The input data, sorted on the index.
+
+        Returns:
+            tti.indicators.TechnicalIndicator: The restored indicator, or None
+            when it is not stored or the stored input data have changed.
+
+        Raises:
+            WrongValueForInputParameter: The input data start after the first
+                stored row and contain already stored rows.
+        """
+
+        from ..indicators.properties.indicators_properties import INDICATORS_PROPERTIES
+
+        if not os.path.exists(os.path.join(path, "metadata.json")):
+            return None
+
+        with open(os.path.join(path, "metadata.json"), "r") as metadata_file:
+            metadata = json.load(metadata_file)
+
+        properties = INDICATORS_PROPERTIES[metadata["attributes"]["_calling_instance"]]
+
+        new_rows = input_data.index > pd.Timestamp(metadata["last_timestamp"])
+
+        # Only part of the stored rows, the stored indicator is not replaced
+        # by the one of these rows
+        if not np.all(new_rows) and input_data.index[0] > pd.Timestamp(metadata["first_timestamp"]):
+            raise WrongValueForInputParameter(
+                input_data.index[0],
+                "input_data first index",
+                "<= {} or > {}".format(metadata["first_timestamp"], metadata["last_timestamp"]),
+            )
+
+        # Only the rows already stored are compared with the stored digests,
+        # there are none when the input data are only the new rows
+        if not np.all(new_rows) and not self._equalDigests(
+            input_data[~new_rows], properties, metadata["digests"]
+        ):
+            return None
+
+        segments = [
+            {
+                kind: np.load(self._segmentFile(path, segment, kind), mmap_mode="r")
+                for kind in ["input", "index", "ti"]
+            }
+            for segment in metadata["segments"]
+        ]
+
+        # Segment files changed after the metadata were written
+        if any(
+            len(arrays["input"]) != segment["input_rows"]
+            or len(arrays["index"]) != segment["input_rows"]
+            or len(arrays["ti"]) != segment["rows"]
+            for arrays, segment in zip(segments, metadata["segments"])
+        ):
+            return None
+
+        # The instance is restored without calling its constructor, so the
+        # indicator is not calculated again
+        ti = indicator.__new__(indicator)
+        ti.__dict__.update(metadata["attributes"])
+
+        ti._properties = properties
+        ti._float_dtype = np.dtype(metadata["float_dtype"])
+
+        if metadata["state"] is not None:
+            with np.load(self._stateFile(path, metadata), allow_pickle=False) as state_file:
+                ti._state = {name: state_file[name][()] for name in metadata["state"]}
+
+        index = pd.DatetimeIndex(
+            np.concatenate([arrays["index"] for arrays in segments]).view(
+                metadata["index"]["dtype"]
+            )
+        )
+
+        if metadata["index"]["tz"] is not None:
+            index = index.tz_localize("UTC").tz_convert(metadata["index"]["tz"])
+
+        index.name = metadata["index"]["name"]
+
+        ti._input_data = pd.DataFrame(
+            np.concatenate([arrays["input"] for arrays in segments]),
+            index=index,
+            columns=metadata["input_columns"],
+        ).astype(dict(zip(metadata["input_columns"], metadata["input_dtypes"])))
+
+        # A single segment is used through memory mapping, without reading it
+        values = (
+            segments[0]["ti"]
+            if len(segments) == 1
+            else np.concatenate([arrays["ti"] for arrays in segments])
+        )
+
+        ti._ti_data = pd.DataFrame(values, index=index[: len(values)], columns=metadata["columns"])
+
+        if any(dtype != "float64" for dtype in metadata["dtypes"]):
+            ti._ti_data = ti._ti_data.astype(dict(zip(metadata["columns"], metadata["dtypes"])))
+
+        ti._prepared_input = None
+        ti._features = {}
+        ti._row_buffers = {"input_data": RowBuffer(), "ti_data": RowBuffer()}
+
+        if np.any(new_rows):
+            ti.update(input_data[new_rows])
+            self._save(path, ti, input_data[new_rows], metadata)
+
+        return ti
+
+    def _save(self, path, ti, input_data, metadata=None):
+        """
+        Stores an indicator. Only the rows which are not already stored are
+        written, in a new segment, merged with the last stored segments which
+        are not larger. The metadata file is replaced only when the segment is
+        completely written, and then the files of the replaced segments are
+        removed.
+
+        Args:
+            path (str): The directory of the stored indicator files.
+
+            ti (tti.indicators.TechnicalIndicator): The indicator.
+
+            input_data (pandas.DataFrame): The input data rows which are not
+                already stored, before preprocessing.
+
+            metadata (dict, default=None): The metadata of the stored
+                indicator, or None when the indicator is not stored.
+        """
+
+        os.makedirs(path, exist_ok=True)
+
+        if metadata is None:
+            segments, digests = [], []
+
+            # The stored segments can be replaced, so the stored indicator is
+            # removed first
+            if os.path.exists(os.path.join(path, "metadata.json")):
+                os.remove(os.path.join(path, "metadata.json"))
+        else:
+            segments, digests = list(metadata["segments"]), list(metadata["digests"])
+
+        segment = {
+            "input_start": sum(segment["input_rows"] for segment in segments),
+            "start": sum(segment["rows"] for segment in segments),
+        }
+
+        segment["input_rows"] = len(ti._input_data.index) - segment["input_start"]
+        segment["rows"] = len(ti._ti_data.index) - segment["start"]
+
+        # The new rows are merged with the last segments which are not
+        # larger, and the merged segment is written from the indicator data
+        while segments and segments[-1]["input_rows"] <= segment["input_rows"]:
+            merged = segments.pop()
+
+            segment = {
+                "input_start": merged["input_start"],
+                "input_rows": merged["input_rows"] + segment["input_rows"],
+                "start": merged["start"],
+                "rows": merged["rows"] + segment["rows"],
+            }
+
+        segments.append(segment)
+
+        self._write(
+            {
+                self._segmentFile(path, segment, "input"): ti._input_data.iloc[
+                    segment["input_start"] :
+                ].to_numpy(dtype=np.float64),
+                self._segmentFile(path, segment, "index"): ti._input_data.index[
+                    segment["input_start"] :
+                ].asi8,
+                self._segmentFile(path, segment, "ti"): ti._ti_data.iloc[
+                    segment["start"] :
+                ].to_numpy(dtype=np.float64),
+            }
+        )
+
+        digests.append(
+            [
+                len(input_data.index),
+                ResultCache.fingerprint(input_data[ti._properties["required_input_data"]]),
+            ]
+        )
+
+        index = ti._input_data.index
+
+        metadata = {
+            "first_timestamp": index[0].isoformat(),
+            "last_timestamp": index[-1].isoformat(),
+            "digests": digests,
+            "segments": segments,
+            "input_columns": list(ti._input_data.columns),
+            "input_dtypes": [str(dtype) for dtype in ti._input_data.dtypes],
+            "columns": list(ti._ti_data.columns),
+            "dtypes": [str(dtype) for dtype in ti._ti_data.dtypes],
+            "index": {
+                "dtype": "M8[" + index.unit + "]",
+                "tz": None if index.tz is None else str(index.tz),
+                "name": index.name,
+            },
+            "float_dtype": ti._float_dtype.name,
+            "attributes": {
+                name: value
+                for name, value in vars(ti).items()
+                if name not in _NOT_STORED_ATTRIBUTES
+            },
+            "state": list(ti._state.keys()) if hasattr(ti, "_state") else None,
+        }
+
+        if metadata["state"] is not None:
+            self._write(
+                {
+                    self._stateFile(path, metadata): {
+                        name: np.asarray(value) for name, value in ti._state.items()
+                    }
+                }
+            )
+
+        with open(os.path.join(path, "metadata.json.tmp"), "w") as metadata_file:
+            json.dump(metadata, metadata_file)
+
+        os.replace(os.path.join(path, "metadata.json.tmp"), os.path.join(path, "metadata.json"))
+
+        # Files of the replaced segments and state
+        stored_files = {"metadata.json"}.union(
+            os.path.basename(self._segmentFile(path, segment, kind))
+            for segment in segments
+            for kind in ["input", "index", "ti"]
+        )
+
+        if metadata["state"] is not None:
+            stored_files.add(os.path.basename(self._stateFile(path, metadata)))
+
+        for file_name in set(os.listdir(path)) - stored_files:
+            os.remove(os.path.join(path, file_name))
+
+    @staticmethod
+    def _write(files):
+        """
+        Writes arrays to files. Each file is replaced only when completely
+        written.
+
+        Args:
+            files (dict): Keys are the file paths and values are the arrays
+                (numpy.ndarray) for ``.npy`` files, or dictionaries of arrays
+                for ``.npz`` files.
+        """
+
+        for file_path, values in files.items():
+            with open(file_path + ".tmp", "wb") as stored_file:
+                if isinstance(values, dict):
+                    np.savez(stored_file, **values)
+                else:
+                    np.save(stored_file, values)
+
+            os.replace(file_path + ".tmp", file_path)
+
+    @staticmethod
+    def _segmentFile(path, segment, kind):
+        """
+        Returns the path of a segment file.
+
+        Args:
+            path (str): The directory of the stored indicator files.
+
+            segment (dict): The segment, its first input data row and its
+                number of input data rows.
+
+            kind (str): The stored data, ``input`` for the input data,
+                ``index`` for their index and ``ti`` for the indicator.
+
+        Returns:
+            str: The path of the segment file.
+        """
+
+        return os.path.join(
+            path,
+            "{}_{}_{}.npy".format(
+                kind, segment["input_start"], segment["input_start"] + segment["input_rows"]
+            ),
+        )
+
+    @staticmethod
+    def _stateFile(path, metadata):
+        """
+        Returns the path of the state file.
+
+        Args:
+            path (str): The directory of the stored indicator files.
+
+            metadata (dict): The metadata of the stored indicator.
+
+        Returns:
+            str: The path of the state file, it includes the number of the
+            stored input data rows.
+        """
+
+        return os.path.join(
+            path,
+            "state_{}.npz".format(sum(segment["input_rows"] for segment in metadata["segments"])),
+        )
+
+    @staticmethod
+    def _equalDigests(input_data, properties, digests):
+        """
+        Compares the input data with the digests of the stored input data,
+        one digest for each stored group of rows. Only the required input
+        data columns are used.
+
+        Args:
+            input_data (pandas.DataFrame): The input data already stored.
+
+            properties (dict): The properties of the technical indicator.
+
+            digests (list): The number of rows and the digest of each stored
+                group of rows.
+
+        Returns:
+            bool: True if the input data are the stored ones.
+        """
+
+        if sum(rows for rows, _ in digests) != len(input_data.index) or not set(
+            properties["required_input_data"]
+        ).issubset(input_data.columns):
+            return False
+
+        input_data = input_data[properties["required_input_data"]]
+
+        start = 0
+
+        for rows, digest in digests:
+            if ResultCache.fingerprint(input_data.iloc[start : start + rows]) != digest:
+                return False
+
+            start += rows
+
+        return True
@@ -6,8 +6,6 @@ File name: plot.py
 """
 
 import pandas as pd
-import matplotlib.pyplot as plt
-import matplotlib.dates as mdates
 import math
 
 
@@ -16,6 +14,10 @@ def linesGraph(data, y_label, title, lines_color, alpha_values, areas, x_label="
     Returns a lines graph of type matplotlib.pyplot. The graph can be either
     a figure with a single plot, or a figure containing two vertical subplots.
     """
+    # Imported on demand, so that matplotlib is loaded only when a graph is created
+    import matplotlib.pyplot as plt
+    import matplotlib.dates as mdates
+
     if type(data) != list:
         data = [data]
 
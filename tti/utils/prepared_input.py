@@ -0,0 +1,151 @@
+"""
+Trading-Technical-Indicators (tti) python library
+
+File name: prepared_input.py
+    Validated once input data implementation, defined under the tti.utils
+    package.
+"""
+
+import numpy as np
+
+from .data_validation import validateDataFrame, validateRequiredColumns
+from .data_preprocessing import fillMissingValues
+from .result_cache import ResultCache
+from .float_dtype import getFloatDtype
+
+
+class PreparedInput:
+    """
+    Input data which are validated once and can then be used by any number of
+    technical indicators, without being validated and preprocessed again for
+    each one of them.
+
+    Args:
+        input_data (pandas.DataFrame): The input data. The index is of type
+            ``pandas.DatetimeIndex``. The data are copied, so later changes to
+            the given dataframe do not affect the prepared input.
+
+    Attributes:
+        _input_data (pandas.DataFrame): The input data with lower case
+            columns, sorted on the date index.
+
+        _prepared_data (dict): The already prepared input data, for each
+            (required columns, fill missing values) pair.
+
+        _fingerprints (dict): The fingerprints of the already prepared input
+            data, for each (required columns, fill missing values) pair.
+
+        _features (dict): The intermediate calculations (features) of the
+            indicators created from the prepared input, for each (fill missing
+            values, floating point data type) pair.
+
+    Raises:
+        WrongTypeForInputParameter: Input argument has wrong type.
+        TypeError: Type error occurred when validating the ``input_data``.
+        ValueError: Value error occurred when validating the ``input_data``.
+    """
+
+    def __init__(self, input_data):
+        validateDataFrame(input_data)
+
+        # Make columns case insensitive, without modifying the given dataframe
+        self._input_data = input_data.rename(columns=lambda c: c.lower()).sort_index(ascending=True)
+
+        self._prepared_data = {}
+        self._fingerprints = {}
+        self._features = {}
+
+    def getInputData(self, required_columns, indicator_name, fill_missing_values=True):
+        """
+        Returns the input data of a technical indicator, as returned by the
+        ``validateInputData`` function for the same dataframe. The input data
+        are prepared only the first time they are requested.
+
+        Args:
+            required_columns ([str,]): The columns which should be contained in
+                the dataframe for the specific indicator.
+
+            indicator_name (str): The name of the indicator. To be used in case
+                an exception is raised.
+
+            fill_missing_values (bool, default=True): If True, missing values
+                are filled as described in the data_preprocessing.py module.
+
+        Returns:
+            pandas.DataFrame: The input data frame containing only the required
+            columns, sorted and with missing values filled (if requested). It
+            shares its values with the prepared input, so they should not be
+            modified in place.
+
+        Raises:
+            ValueError: Value error occurred when validating the ``input_data``.
+        """
+
+        validateRequiredColumns(self._input_data, required_columns, indicator_name)
+
+        columns = tuple(c for c in self._input_data.columns if c in required_columns)
+
+        if (columns, fill_missing_values) not in self._prepared_data:
+            input_data = self._input_data[list(columns)]
+
+            if fill_missing_values:
+                input_data = fillMissingValues(input_data)
+
+            self._prepared_data[(columns, fill_missing_values)] = input_data
+
+        # A shallow copy, so columns added by the indicator are not shared
+        return self._prepared_data[(columns, fill_missing_values)].copy(deep=False)
+
+    def getFingerprint(self, required_columns, fill_missing_values=True):
+        """
+        Returns the fingerprint of the input data of a technical indicator, as
+        used by the ``tti.utils.ResultCache``. The fingerprint is calculated
+        only the first time it is requested.
+
+        Args:
+            required_columns ([str,]): The columns which should be contained in
+                the dataframe for the specific indicator.
+
+            fill_missing_values (bool, default=True): If True, missing values
+                are filled as described in the data_preprocessing.py module.
+
+        Returns:
+            str: The fingerprint of the input data.
+        """
+
+        key = (
+            tuple(c for c in self._input_data.columns if c in required_columns),
+            fill_missing_values,
+        )
+
+        if key not in self._fingerprints:
+            self._fingerprints[key] = ResultCache.fingerprint(
+                self.getInputData(required_columns, "", fill_missing_values)
+            )
+
+        return self._fingerprints[key]
+
+    def getFeatures(self, fill_missing_values=True, float_dtype=None):
+        """
+        Returns the intermediate calculations (features) shared by the
+        indicators created from the prepared input. Features do not depend on
+        the required columns of an indicator, only on the filling of the
+        missing values and on the floating point data type of the
+        calculations.
+
+        Args:
+            fill_missing_values (bool, default=True): If True, the features
+                are calculated on input data with missing values filled.
+
+            float_dtype (str or numpy.dtype, default=None): The floating point data
+                type of the features. If None, it is the one set by
+                ``tti.utils.setFloatDtype``.
+
+        Returns:
+            dict: The features, keyed by their name.
+        """
+
+        if float_dtype is None:
+            float_dtype = getFloatDtype()
+
+        return self._features.setdefault((fill_missing_values, np.dtype(float_dtype).name), {})
@@ -0,0 +1,242 @@
+"""
+Trading-Technical-Indicators (tti) python library
+
+File name: result_cache.py
+    Cache of the calculated technical indicators implementation, defined
+    under the tti.utils package.
+"""
+
+import collections
+import hashlib
+import sys
+import numpy as np
+
+from .exceptions import WrongTypeForInputParameter, WrongValueForInputParameter
+
+# The result cache used by the technical indicators, None when disabled
+_result_cache = None
+
+
+class ResultCache:
+    """
+    Least recently used cache of calculated technical indicators. A result is
+    keyed by the indicator class, its input arguments and a fingerprint of
+    its prepared input data. When the memory used by the cached results
+    exceeds the maximum memory, the least recently used results are evicted.
+
+    Args:
+        max_memory (int, default=268435456): The maximum memory in bytes used
+            by the cached results.
+
+    Attributes:
+        _max_memory (int): The maximum memory in bytes used by the cached
+            results.
+
+        _memory (int): The memory in bytes used by the cached results.
+
+        _results (collections.OrderedDict): The cached results, from the least
+            to the most recently used. Values are (ti_data, state, memory)
+            tuples.
+
+        _hits (int): The number of results found in the cache.
+
+        _misses (int): The number of results not found in the cache.
+
+    Raises:
+        WrongTypeForInputParameter: Input argument has wrong type.
+        WrongValueForInputParameter: Unsupported value for input argument.
+    """
+
+    def __init__(self, max_memory=256 * 1024 * 1024):
+        if isinstance(max_memory, bool) or not isinstance(max_memory, int):
+            raise WrongTypeForInputParameter(type(max_memory), "max_memory", "int")
+
+        if max_memory <= 0:
+            raise WrongValueForInputParameter(max_memory, "max_memory", ">0")
+
+        self._max_memory = max_memory
+        self._memory = 0
+        self._results = collections.OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    @staticmethod
+    def fingerprint(input_data):
+        """
+        Calculates a fingerprint of the input data, a hash of their index,
+        columns and values.
+
+        Args:
+            input_data (pandas.DataFrame): The input data. The index is of type
+                ``pandas.DatetimeIndex``.
+
+        Returns:
+            str: The fingerprint of the input data.
+        """
+
+        fingerprint = hashlib.blake2b(digest_size=16)
+
+        fingerprint.update(repr(list(input_data.columns)).encode())
+        fingerprint.update(np.ascontiguousarray(input_data.index.asi8).data)
+
+        for column in input_data.columns:
+            fingerprint.update(str(input_data[column].dtype).encode())
+            fingerprint.update(np.ascontiguousarray(input_data[column].to_numpy()).data)
+
+        return fingerprint.hexdigest()
+
+    def get(self, key):
+        """
+        Returns a cached result and marks it as the most recently used.
+
+        Args:
+            key (tuple): The key of the result.
+
+        Returns:
+            (pandas.DataFrame, dict) or None: The calculated indicator and the
+            state of the indicator instance, or None if the result is not
+            cached.
+        """
+
+        if key not in self._results:
+            self._misses += 1
+            return None
+
+        self._hits += 1
+        self._results.move_to_end(key)
+
+        ti_data, state, _ = self._results[key]
+
+        return ti_data.copy(), state
+
+    def put(self, key, ti_data, state):
+        """
+        Caches a result, evicting the least recently used results if the
+        maximum memory is exceeded. Results larger than the maximum memory are
+        not cached.
+
+        Args:
+            key (tuple): The key of the result.
+
+            ti_data (pandas.DataFrame): The calculated indicator.
+
+            state (dict): The state of the indicator instance, set during the
+                calculation of the indicator.
+        """
+
+        memory = self._memoryUsage(ti_data) + self._memoryUsage(state)
+
+        if memory > self._max_memory:
+            return
+
+        self._remove(key)
+
+        self._results[key] = (ti_data.copy(), state, memory)
+        self._memory += memory
+
+        while self._memory > self._max_memory:
+            self._remove(next(iter(self._results)))
+
+    @staticmethod
+    def _memoryUsage(value):
+        """
+        Estimates the memory used by a cached value.
+
+        Args:
+            value (object): The value, a pandas object, a dictionary of values
+                or any other object.
+
+        Returns:
+            int: The memory in bytes used by the value.
+        """
+
+        if hasattr(value, "memory_usage"):
+            return int(np.sum(value.memory_usage(index=True, deep=True)))
+
+        if isinstance(value, dict):
+            return sys.getsizeof(value) + sum(ResultCache._memoryUsage(v) for v in value.values())
+
+        if isinstance(value, np.ndarray):
+            return value.nbytes
+
+        return sys.getsizeof(value)
+
+    def _remove(self, key):
+        """
+        Removes a result from the cache, if it is cached.
+
+        Args:
+            key (tuple): The key of the result.
+        """
+
+        if key in self._results:
+            self._memory -= self._results.pop(key)[2]
+
+    def invalidate(self, indicator=None):
+        """
+        Removes cached results.
+
+        Args:
+            indicator (str, default=None): The class name of the technical
+                indicator, for example ``'MovingAverage'``, whose results are
+                removed. If None, all the results are removed.
+
+        Returns:
+            int: The number of removed results.
+        """
+
+        keys = [key for key in self._results if indicator is None or key[0] == indicator]
+
+        for key in keys:
+            self._remove(key)
+
+        return len(keys)
+
+    def getStatistics(self):
+        """
+        Returns the statistics of the cache.
+
+        Returns:
+            dict: The number of ``hits`` and ``misses``, the number of cached
+            ``results`` and the ``memory`` in bytes used by them.
+        """
+
+        return {
+            "hits": self._hits,
+            "misses": self._misses,
+            "results": len(self._results),
+            "memory": self._memory,
+        }
+
+
+def setResultCache(result_cache):
+    """
+    Sets the result cache used when creating technical indicators. Caching is
+    disabled by default.
+
+    Args:
+        result_cache (tti.utils.ResultCache): The result cache, or None for
+            disabling the caching.
+
+    Raises:
+        WrongTypeForInputParameter: Input argument has wrong type.
+    """
+
+    global _result_cache
+
+    if result_cache is not None and not isinstance(result_cache, ResultCache):
+        raise WrongTypeForInputParameter(type(result_cache), "result_cache", "ResultCache")
+
+    _result_cache = result_cache
+
+
+def getResultCache():
+    """
+    Returns the result cache used when creating technical indicators.
+
+    Returns:
+        tti.utils.ResultCache: The result cache, or None if caching is
+        disabled.
+    """
+
+    return _result_cache
@@ -0,0 +1,237 @@
+"""
+Trading-Technical-Indicators (tti) python library
+
+File name: rolling_extrema.py
+    Rolling minimum and maximum implementation, for several periods at once
+    and for streaming values, defined under the tti.utils package.
+"""
+
+import collections
+import numpy as np
+
+from .exceptions import WrongTypeForInputParameter, WrongValueForInputParameter
+
+
+def _validatePeriods(periods, min_periods):
+    """
+    Validates the periods and the minimum periods of the rolling extrema.
+
+    Args:
+        periods ([int,]): The rolling window sizes.
+
+        min_periods (int): The minimum number of values in a window, or None.
+
+    Raises:
+        WrongTypeForInputParameter: Input argument has wrong type.
+        WrongValueForInputParameter: Unsupported value for input argument.
+    """
+
+    if not isinstance(periods, (list, tuple)) or not periods:
+        raise WrongTypeForInputParameter(type(periods), "periods", "non empty list of int")
+
+    for period in periods:
+        if isinstance(period, bool) or not isinstance(period, int):
+            raise WrongTypeForInputParameter(type(period), "periods", "non empty list of int")
+
+        if period <= 0:
+            raise WrongValueForInputParameter(period, "periods", ">0")
+
+    if min_periods is not None:
+        if isinstance(min_periods, bool) or not isinstance(min_periods, int):
+            raise WrongTypeForInputParameter(type(min_periods), "min_periods", "int")
+
+        if min_periods <= 0:
+            raise WrongValueForInputParameter(min_periods, "min_periods", ">0")
+
+
+def rollingExtrema(lows, highs, periods, min_periods=None):
+    """
+    Calculates the rolling minimum of the lows and the rolling maximum of the
+    highs together, for several periods at once. The extrema of windows of
+    1, 2, 4, ... values are calculated once (each from the previous one), and
+    the extrema of any period are the extrema of two overlapping such windows.
+    Missing values are ignored, as in ``pandas.Series.rolling``.
+
+    Args:
+        lows (numpy.ndarray or pandas.Series): The values for the rolling
+            minimum, for example the low prices.
+
+        highs (numpy.ndarray or pandas.Series): The values for the rolling
+            maximum, for example the high prices. Same length as the lows.
+
+        periods ([int,]): The rolling window sizes.
+
+        min_periods (int, default=None): The minimum number of not missing
+            values in a window, for calculating its extrema. If None, it is
+            the period of the window.
+
+    Returns:
+        dict: For each period, a (lowest, highest) tuple of numpy.ndarray
+        objects (dtype float64).
+
+    Raises:
+        WrongTypeForInputParameter: Input argument has wrong type.
+        WrongValueForInputParameter: Unsupported value for input argument.
+    """
+
+    _validatePeriods(periods, min_periods)
+
+    lows = np.asarray(lows, dtype=np.float64)
+    highs = np.asarray(highs, dtype=np.float64)
+
+    # Extrema of the windows of 2**k values ending at each row (the first
+    # rows have shorter windows)
+    levels = [(lows, highs)]
+
+    while 2 ** len(levels) <= max(periods):
+        width = 2 ** (len(levels) - 1)
+        level_lows, level_highs = levels[-1]
+
+        next_lows, next_highs = level_lows.copy(), level_highs.copy()
+        next_lows[width:] = np.fmin(level_lows[width:], level_lows[:-width])
+        next_highs[width:] = np.fmax(level_highs[width:], level_highs[:-width])
+
+        levels.append((next_lows, next_highs))
+
+    # Number of not missing values up to each row
+    low_counts = np.concatenate([[0], np.cumsum(~np.isnan(lows))])
+    high_counts = np.concatenate([[0], np.cumsum(~np.isnan(highs))])
+
+    extrema = {}
+
+    for period in periods:
+        level = int(np.log2(period))
+        level_lows, level_highs = levels[level]
+
+        # A window is covered by the windows ending at its last row and at
+        # its first row plus 2**level - 1
+        shift = period - 2**level
+
+        lowest, highest = level_lows.copy(), level_highs.copy()
+
+        # When there are not more rows than the shift, the windows ending at
+        # each row are covered by the first one
+        if shift < len(lows):
+            lowest[shift:] = np.fmin(level_lows[shift:], level_lows[: len(lows) - shift])
+            highest[shift:] = np.fmax(level_highs[shift:], level_highs[: len(highs) - shift])
+
+        required = period if min_periods is None else min_periods
+        first_rows = np.maximum(np.arange(len(lows)) + 1 - period, 0)
+
+        lowest[low_counts[1:] - low_counts[first_rows] < required] = np.nan
+        highest[high_counts[1:] - high_counts[first_rows] < required] = np.nan
+
+        extrema[period] = (lowest, highest)
+
+    return extrema
+
+
+class RollingExtrema:
+    """
+    Rolling minimum and maximum of streaming values, for several periods at
+    once. Each appended value takes amortized constant time, since for each
+    period only the values which can become an extremum of a later window are
+    kept (monotonic queues). Missing values are ignored.
+
+    Args:
+        periods ([int,]): The rolling window sizes.
+
+        min_periods (int, default=None): The minimum number of not missing
+            values in a window, for returning its extrema. If None, it is the
+            period of the window.
+
+    Attributes:
+        _periods ([int,]): The rolling window sizes.
+
+        _min_periods (int): The minimum number of not missing values in a
+            window, or None.
+
+        _rows (int): The number of appended values.
+
+        _lows (dict): For each period, the queue of the (row, low) pairs which
+            can become the minimum of a window, in increasing order.
+
+        _highs (dict): For each period, the queue of the (row, high) pairs
+            which can become the maximum of a window, in decreasing order.
+
+        _low_rows (dict): For each period, the rows of the not missing lows
+            in the window.
+
+        _high_rows (dict): For each period, the rows of the not missing highs
+            in the window.
+
+    Raises:
+        WrongTypeForInputParameter: Input argument has wrong type.
+        WrongValueForInputParameter: Unsupported value for input argument.
+    """
+
+    def __init__(self, periods, min_periods=None):
+        _validatePeriods(periods, min_periods)
+
+        self._periods = list(periods)
+        self._min_periods = min_periods
+        self._rows = 0
+
+        self._lows = {period: collections.deque() for period in self._periods}
+        self._highs = {period: collections.deque() for period in self._periods}
+
+        self._low_rows = {period: collections.deque() for period in self._periods}
+        self._high_rows = {period: collections.deque() for period in self._periods}
+
+    def append(self, low, high):
+        """
+        Appends a pair of values and returns the extrema of the windows ending
+        with them.
+
+        Args:
+            low (float): The value for the rolling minimum.
+
+            high (float): The value for the rolling maximum.
+
+        Returns:
+            dict: For each period, a (lowest, highest) tuple. An extremum is NaN
+            when the window contains less not missing values than the minimum
+            periods.
+        """
+
+        row = self._rows
+        self._rows += 1
+
+        extrema = {}
+
+        for period in self._periods:
+            lows, highs = self._lows[period], self._highs[period]
+            low_rows, high_rows = self._low_rows[period], self._high_rows[period]
+
+            # Values out of the window
+            for values in [lows, highs]:
+                while values and values[0][0] <= row - period:
+                    values.popleft()
+
+            for rows in [low_rows, high_rows]:
+                while rows and rows[0] <= row - period:
+                    rows.popleft()
+
+            # Values which can not be an extremum any more
+            if low == low:
+                while lows and lows[-1][1] >= low:
+                    lows.pop()
+
+                lows.append((row, low))
+                low_rows.append(row)
+
+            if high == high:
+                while highs and highs[-1][1] <= high:
+                    highs.pop()
+
+                highs.append((row, high))
+                high_rows.append(row)
+
+            required = period if self._min_periods is None else self._min_periods
+
+            extrema[period] = (
+                lows[0][1] if len(low_rows) >= required else np.nan,
+                highs[0][1] if len(high_rows) >= required else np.nan,
+            )
+
+        return extrema
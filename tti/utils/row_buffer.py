@@ -0,0 +1,144 @@
+"""
+Trading-Technical-Indicators (tti) python library
+
+File name: row_buffer.py
+    Preallocated storage of data frame rows implementation, for appending
+    rows, defined under the tti.utils package.
+"""
+
+import numpy as np
+import pandas as pd
+
+# The minimum number of rows the arrays grow by
+_MIN_GROWTH_ROWS = 1024
+
+
+class RowBuffer:
+    """
+    Storage of the rows of a data frame in preallocated arrays, for appending
+    rows without copying the already stored ones. When the arrays are full,
+    they grow by half of their rows (at least ``1024``), so the time needed
+    for appending rows does not depend on the number of the stored rows, on
+    average. The returned data frames are views of the arrays.
+
+    Only data frames with a ``pandas.DatetimeIndex`` and columns of the same
+    numeric data type are stored. The rows of other data frames are
+    concatenated.
+
+    Attributes:
+        _data (pandas.DataFrame): The last returned data frame, or None.
+
+        _columns (pandas.Index): The columns of the stored rows.
+
+        _values (numpy.ndarray): The values of the stored rows, followed by
+            the space for the next rows.
+
+        _index (pandas.arrays.DatetimeArray): The index of the stored rows,
+            followed by the space for the next rows.
+    """
+
+    def __init__(self):
+        self._data = None
+        self._columns = None
+        self._values = None
+        self._index = None
+
+    def append(self, data, rows):
+        """
+        Appends rows to a data frame.
+
+        Args:
+            data (pandas.DataFrame): The data frame. When it is not the last
+                returned one, its rows are stored first.
+
+            rows (pandas.DataFrame): The rows to be appended, with the same
+                columns.
+
+        Returns:
+            pandas.DataFrame: The data frame with the rows appended.
+        """
+
+        if not isinstance(data.index, pd.DatetimeIndex) or not isinstance(
+            rows.index, pd.DatetimeIndex
+        ):
+            return self._concatenate(data, rows)
+
+        stored = data is self._data and data.columns.equals(self._columns)
+
+        # The data type of the columns, when it is the same for all of them
+        if stored:
+            dtype = self._values.dtype
+        else:
+            dtypes = set(data.dtypes)
+            dtype = dtypes.pop() if len(dtypes) == 1 else None
+
+        values = rows.to_numpy()
+
+        if (
+            not isinstance(dtype, np.dtype)
+            or dtype.kind not in "biuf"
+            or not np.can_cast(values.dtype, dtype)
+            or not data.columns.equals(rows.columns)
+            or data.index.dtype != rows.index.dtype
+        ):
+            return self._concatenate(data, rows)
+
+        stored_rows = len(data.index)
+        total_rows = stored_rows + len(values)
+
+        if not stored or total_rows > len(self._index):
+            self._allocate(data, dtype, total_rows + max(total_rows // 2, _MIN_GROWTH_ROWS))
+
+        self._values[stored_rows:total_rows] = values
+        self._index[stored_rows:total_rows] = rows.index.array
+
+        self._data = pd.DataFrame(
+            self._values[:total_rows],
+            index=pd.DatetimeIndex(self._index[:total_rows], name=data.index.name, copy=False),
+            columns=self._columns,
+            copy=False,
+        )
+
+        return self._data
+
+    def _concatenate(self, data, rows):
+        """
+        Appends rows to a data frame which cannot be stored in the arrays.
+
+        Args:
+            data (pandas.DataFrame): The data frame.
+
+            rows (pandas.DataFrame): The rows to be appended.
+
+        Returns:
+            pandas.DataFrame: The data frame with the rows appended.
+        """
+
+        self._data = None
+
+        return pd.concat([data, rows])
+
+    def _allocate(self, data, dtype, capacity):
+        """
+        Allocates the arrays and stores the rows of a data frame.
+
+        Args:
+            data (pandas.DataFrame): The data frame.
+
+            dtype (numpy.dtype): The data type of the columns.
+
+            capacity (int): The number of rows of the arrays.
+        """
+
+        rows = len(data.index)
+
+        self._columns = data.columns.copy()
+
+        self._values = np.empty((capacity, len(data.columns)), dtype=dtype)
+        self._values[:rows] = data.to_numpy()
+
+        # The empty positions are missing timestamps
+        positions = np.arange(capacity)
+        positions[rows:] = -1
+
+        self._index = data.index.array.take(positions, allow_fill=True)
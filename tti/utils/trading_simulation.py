@@ -6,15 +6,28 @@ File name: trading_simulation.py
     package.
 """
 
+import heapq
 import pandas as pd
 import numpy as np
 from ..utils.data_validation import validateInputData
+from ..utils.constants import TRADE_SIGNALS
 from ..utils.exceptions import (
     WrongTypeForInputParameter,
     NotValidInputDataForSimulation,
     WrongValueForInputParameter,
 )
 
+# Columns of the simulation data
+SIMULATION_DATA_COLUMNS = [
+    "signal",
+    "open_trading_action",
+    "stock_value",
+    "exposure",
+    "portfolio_value",
+    "earnings",
+    "balance",
+]
+
 
 class TradingSimulation:
     """
@@ -71,21 +84,31 @@ class TradingSimulation:
             is used as security when a short position is opened. Values >=1.0
             are supported.
 
-        _portfolio (pandas.DataFrame): Simulation portfolio, keeps a track of
+        _portfolio (numpy.ndarray): Simulation portfolio, keeps a track of
             the entered positions during the simulation. Position: ``long``,
             ``short`` or ``none``. Status: ``open``, ``close`` or none.
             Exposure: ``stock_price`` when position is ``long``, and
             ``short_exposure_factor * stock_price`` when position is ``short``.
 
-        _simulation_data (pandas.DataFrame): Dataframe which holds details and
-            about the simulation. The index of the dataframe is the whole
-            trading period(DateTimeIndex). Columns are:
+        _open_long_positions (list): Heap of the currently opened ``long``
+            positions, as ``(exposure, i_index)`` pairs. The position with the
+            lowest exposure is the first one to be closed.
 
-            ``signal``: the signal produced at each day of the simulation
-            period.
+        _open_short_positions (list): Heap of the currently opened ``short``
+            positions, as ``(-exposure, i_index)`` pairs. The position with
+            the highest exposure is the first one to be closed.
+
+        _simulation_data (numpy.ndarray): Array which holds details about the
+            simulation, one row for each day of the whole trading period. Rows
+            of the not executed simulation rounds contain NaN. Columns are:
+
+            ``signal``: the numeric value of the signal produced at each day
+            of the simulation period (``buy`` is -1, ``hold`` is 0 and
+            ``sell`` is 1).
 
             ``open_trading_action``: the open trading action applied. Possible
-            values are ``long``, ``short`` and ``none``.
+            values are 2.0 for ``long``, 1.0 for ``short`` and 0.0 for
+            ``none``.
 
             ``stock_value``: The value of the stock during the simulation
             period.
@@ -176,22 +199,25 @@ class TradingSimulation:
         #   exposure: float indicating the exposure value
         self._portfolio = np.zeros(shape=(len(self._input_data_index), 3), dtype=np.float64)
 
+        # Index of the opened positions, sorted by the exposure. The positions
+        # which can be closed in a simulation round are always at the top of
+        # the heaps, so the portfolio does not need to be scanned.
+        self._open_long_positions = []
+        self._open_short_positions = []
+
         # Change type to numpy array for better performance
         self._close_values = self._close_values.to_numpy(dtype=np.float64, copy=True)
 
-        # Initialize simulation data structure (DataFrame)
-        self._simulation_data = pd.DataFrame(
-            index=self._input_data_index,
-            columns=[
-                "signal",
-                "open_trading_action",
-                "stock_value",
-                "exposure",
-                "portfolio_value",
-                "earnings",
-                "balance",
-            ],
-            data=None,
+        # Simulation data, one row for each simulation round. The pandas
+        # DataFrame is created only once, when the simulation is closed.
+        # Columns are:
+        #   signal: -1.0 is buy, 0.0 is hold, 1.0 is sell
+        #   open_trading_action: 0.0 is None, 1.0 is short, 2.0 is long
+        #   stock_value, exposure, portfolio_value, earnings, balance
+        self._simulation_data = np.full(
+            shape=(len(self._input_data_index), len(SIMULATION_DATA_COLUMNS)),
+            fill_value=np.nan,
+            dtype=np.float64,
         )
 
         # Initialize statistics data structure (dict)
@@ -285,54 +311,35 @@ class TradingSimulation:
         Calculate simulation statistics, at the end of the simulation.
         """
 
+        signals = self._simulation_data[:, 0]
+        actions = self._simulation_data[:, 1]
+
+        buy_signals = signals == TRADE_SIGNALS["buy"][1]
+        sell_signals = signals == TRADE_SIGNALS["sell"][1]
+
         # Simulation rounds which have been executed till now
-        executed_simulation_rounds = len(
-            self._simulation_data.dropna(subset=["signal"], inplace=False).index
-        )
+        executed_simulation_rounds = int(np.count_nonzero(~np.isnan(signals)))
+
+        # Values of the last executed simulation round
+        last_round = self._simulation_data[executed_simulation_rounds - 1, :]
 
         self._statistics = {
             "number_of_trading_days": executed_simulation_rounds,
-            "number_of_buy_signals": len(
-                self._simulation_data[self._simulation_data["signal"] == "buy"].index
-            ),
-            "number_of_ignored_buy_signals": len(
-                self._simulation_data[
-                    (self._simulation_data["signal"] == "buy")
-                    & (self._simulation_data["open_trading_action"] == "none")
-                ].index
-            ),
-            "number_of_sell_signals": len(
-                self._simulation_data[self._simulation_data["signal"] == "sell"].index
-            ),
-            "number_of_ignored_sell_signals": len(
-                self._simulation_data[
-                    (self._simulation_data["signal"] == "sell")
-                    & (self._simulation_data["open_trading_action"] == "none")
-                ].index
-            ),
-            "last_stock_value": 0.0
-            if executed_simulation_rounds == 0
-            else self._simulation_data["stock_value"].iat[executed_simulation_rounds - 1].round(2),
-            "last_exposure": 0.0
-            if executed_simulation_rounds == 0
-            else round(self._simulation_data["exposure"].iat[executed_simulation_rounds - 1], 2),
-            "last_open_long_positions": np.count_nonzero(
-                self._portfolio[(self._portfolio[:, 0] == 2.0) & (self._portfolio[:, 1] == 1.0), 0]
-            ),
-            "last_open_short_positions": np.count_nonzero(
-                self._portfolio[(self._portfolio[:, 0] == 1.0) & (self._portfolio[:, 1] == 1.0), 0]
+            "number_of_buy_signals": int(np.count_nonzero(buy_signals)),
+            "number_of_ignored_buy_signals": int(np.count_nonzero(buy_signals & (actions == 0.0))),
+            "number_of_sell_signals": int(np.count_nonzero(sell_signals)),
+            "number_of_ignored_sell_signals": int(
+                np.count_nonzero(sell_signals & (actions == 0.0))
             ),
+            "last_stock_value": 0.0 if executed_simulation_rounds == 0 else last_round[2].round(2),
+            "last_exposure": 0.0 if executed_simulation_rounds == 0 else round(last_round[3], 2),
+            "last_open_long_positions": len(self._open_long_positions),
+            "last_open_short_positions": len(self._open_short_positions),
             "last_portfolio_value": 0.0
             if executed_simulation_rounds == 0
-            else round(
-                self._simulation_data["portfolio_value"].iat[executed_simulation_rounds - 1], 2
-            ),
-            "last_earnings": 0.0
-            if executed_simulation_rounds == 0
-            else round(self._simulation_data["earnings"].iat[executed_simulation_rounds - 1], 2),
-            "final_balance": 0.0
-            if executed_simulation_rounds == 0
-            else round(self._simulation_data["balance"].iat[executed_simulation_rounds - 1], 2),
+            else round(last_round[4], 2),
+            "last_earnings": 0.0 if executed_simulation_rounds == 0 else round(last_round[5], 2),
+            "final_balance": 0.0 if executed_simulation_rounds == 0 else round(last_round[6], 2),
         }
 
     def _calculatePortfolioValue(self, i_index):
@@ -348,16 +355,10 @@ class TradingSimulation:
             float: The portfolio value.
         """
 
-        open_long_positions = np.count_nonzero(
-            self._portfolio[(self._portfolio[:, 0] == 2.0) & (self._portfolio[:, 1] == 1.0), 0]
-        )
-
-        open_short_positions = np.count_nonzero(
-            self._portfolio[(self._portfolio[:, 0] == 1.0) & (self._portfolio[:, 1] == 1.0), 0]
+        return self._close_values[i_index, 0] * (
+            len(self._open_long_positions) - len(self._open_short_positions)
         )
 
-        return self._close_values[i_index, 0] * (open_long_positions - open_short_positions)
-
     def _closeOpenPositions(self, i_index):
         """
         Closes the opened positions existing in portfolio.
@@ -373,87 +374,53 @@ class TradingSimulation:
             float: The closed exposure.
         """
 
-        # Close only positions that bring earnings
+        stock_value = self._close_values[i_index, 0]
 
-        long_to_be_closed = np.count_nonzero(
-            self._portfolio[
-                (self._portfolio[:, 1] == 1.0)
-                & (self._portfolio[:, 0] == 2.0)
-                & (self._portfolio[:, 2] < self._close_values[i_index, 0]),
-                0,
-            ]
-        )
+        # Close only positions that bring earnings. These are the long
+        # positions with exposure below the stock value and the short
+        # positions with exposure above the short_exposure_factor * stock
+        # value, found at the top of the heaps
+        long_to_be_closed = []
+        while self._open_long_positions and self._open_long_positions[0][0] < stock_value:
+            long_to_be_closed.append(heapq.heappop(self._open_long_positions)[1])
 
-        short_to_be_closed = np.count_nonzero(
-            self._portfolio[
-                (self._portfolio[:, 1] == 1.0)
-                & (self._portfolio[:, 0] == 1.0)
-                & (
-                    self._portfolio[:, 2]
-                    > (self._short_exposure_factor * self._close_values[i_index, 0])
-                ),
-                0,
-            ]
-        )
+        short_to_be_closed = []
+        while self._open_short_positions and -self._open_short_positions[0][0] > (
+            self._short_exposure_factor * stock_value
+        ):
+            short_to_be_closed.append(heapq.heappop(self._open_short_positions)[1])
 
-        long_closed_exposure = np.sum(
-            self._portfolio[
-                (self._portfolio[:, 1] == 1.0)
-                & (self._portfolio[:, 0] == 2.0)
-                & (self._portfolio[:, 2] < self._close_values[i_index, 0]),
-                2,
-            ]
+        # Sum the exposures in portfolio order, as when selecting them from
+        # the portfolio
+        long_to_be_closed.sort()
+        short_to_be_closed.sort()
+
+        long_closed = len(long_to_be_closed)
+        short_closed = len(short_to_be_closed)
+
+        long_closed_exposure = (
+            np.sum(self._portfolio[long_to_be_closed, 2]) if long_closed > 0 else 0.0
         )
 
-        short_closed_exposure = np.sum(
-            self._portfolio[
-                (self._portfolio[:, 1] == 1.0)
-                & (self._portfolio[:, 0] == 1.0)
-                & (
-                    self._portfolio[:, 2]
-                    > (self._short_exposure_factor * self._close_values[i_index, 0])
-                ),
-                2,
-            ]
+        short_closed_exposure = (
+            np.sum(self._portfolio[short_to_be_closed, 2]) if short_closed > 0 else 0.0
         )
 
         # Calculate earnings and closed_exposure
 
-        earnings = (long_to_be_closed * self._close_values[i_index, 0] - long_closed_exposure) + (
-            (short_closed_exposure / self._short_exposure_factor)
-            - short_to_be_closed * self._close_values[i_index, 0]
+        earnings = (long_closed * stock_value - long_closed_exposure) + (
+            (short_closed_exposure / self._short_exposure_factor) - short_closed * stock_value
         )
 
         closed_exposure = long_closed_exposure + short_closed_exposure
 
         # Register close actions
-        self._portfolio[
-            (self._portfolio[:, 1] == 1.0)
-            & (self._portfolio[:, 0] == 2.0)
-            & (self._portfolio[:, 2] < self._close_values[i_index, 0]),
-            1,
-        ] = 2.0
-
-        self._portfolio[
-            (self._portfolio[:, 1] == 1.0)
-            & (self._portfolio[:, 0] == 1.0)
-            & (
-                self._portfolio[:, 2]
-                > (self._short_exposure_factor * self._close_values[i_index, 0])
-            ),
-            1,
-        ] = 2.0
-
-        # create simulation data row, set only the 'exposure' and earnings.
-        # Use single-step .iat DataFrame assignment to avoid chained assignment
-        # warnings and remain compatible with pandas Copy-on-Write.
-        # Columns: ['signal', 'open_trading_action', 'stock_value',
-        #           'exposure', 'portfolio_value', 'earnings', 'balance']
-        self._simulation_data.iat[i_index, 3] = (
-            self._simulation_data.iat[i_index - 1, 3] - closed_exposure
-        )
+        self._portfolio[long_to_be_closed + short_to_be_closed, 1] = 2.0
 
-        self._simulation_data.iat[i_index, 5] = self._simulation_data.iat[i_index - 1, 5] + earnings
+        # Update only the 'exposure' and 'earnings' of the simulation data row
+        self._simulation_data[i_index, 3] = self._simulation_data[i_index - 1, 3] - closed_exposure
+
+        self._simulation_data[i_index, 5] = self._simulation_data[i_index - 1, 5] + earnings
 
         return earnings, closed_exposure
 
@@ -470,125 +437,61 @@ class TradingSimulation:
                 signal to be considered in this simulation round.
         """
 
-        if signal[0] == "hold":
-            # Add portfolio row, columns: 'position', 'status', 'exposure'
+        stock_value = self._close_values[i_index, 0]
+
+        # Note that 'earnings' and 'exposure' had been already updated in
+        # runSimulationRound
+        exposure = self._simulation_data[i_index, 3]
+        earnings = self._simulation_data[i_index, 5]
+
+        # Open long position, if maximum exposure is not reached
+        if signal[0] == "buy" and not (
+            self._max_exposure is not None and self._max_exposure < (exposure + stock_value)
+        ):
+            # Portfolio columns: 'position', 'status', 'exposure'
+            self._portfolio[i_index, :] = [2.0, 1.0, stock_value]
+            heapq.heappush(self._open_long_positions, (stock_value, i_index))
+
+            open_trading_action = 2.0
+            exposure += stock_value
+
+        # Open short position, if maximum exposure is not reached
+        elif signal[0] == "sell" and not (
+            self._max_exposure is not None
+            and self._max_exposure < (exposure + self._short_exposure_factor * stock_value)
+        ):
+            # Portfolio columns: 'position', 'status', 'exposure'
+            self._portfolio[i_index, :] = [
+                1.0,
+                1.0,
+                self._short_exposure_factor * stock_value,
+            ]
+            heapq.heappush(
+                self._open_short_positions, (-self._short_exposure_factor * stock_value, i_index)
+            )
+
+            open_trading_action = 1.0
+            exposure += self._short_exposure_factor * stock_value
+
+        # Hold signal or maximum exposure reached
+        else:
             self._portfolio[i_index, :] = [0.0, 0.0, 0.0]
 
-            portfolio_value = self._calculatePortfolioValue(i_index)
-
-            # Add simulation data row, columns: 'signal',
-            # 'open_trading_action', 'stock_value', 'exposure',
-            # 'portfolio_value', 'earnings', 'balance'. Note that 'earnings'
-            # and 'exposure' had been already updated in runSimulationRound
-            self._simulation_data.iloc[i_index, :] = [
-                "hold",
-                "none",
-                self._close_values[i_index, 0],
-                self._simulation_data["exposure"].iat[i_index],
-                portfolio_value,
-                self._simulation_data["earnings"].iat[i_index],
-                portfolio_value + self._simulation_data["earnings"].iat[i_index],
-            ]
+            open_trading_action = 0.0
+
+        portfolio_value = self._calculatePortfolioValue(i_index)
 
-        elif signal[0] == "buy":
-            # Maximum exposure reached
-            if self._max_exposure is not None and self._max_exposure < (
-                self._simulation_data["exposure"].iat[i_index] + self._close_values[i_index, 0]
-            ):
-                # Add portfolio row, columns: 'position', 'status', 'exposure'
-                self._portfolio[i_index, :] = [0.0, 0.0, 0.0]
-
-                portfolio_value = self._calculatePortfolioValue(i_index)
-
-                # Add simulation data row, columns: 'signal',
-                # 'open_trading_action', 'stock_value', 'exposure',
-                # 'portfolio_value', 'earnings', 'balance'. Note that
-                # 'earnings' and 'exposure' had been already updated in
-                # runSimulationRound
-                self._simulation_data.iloc[i_index, :] = [
-                    "buy",
-                    "none",
-                    self._close_values[i_index, 0],
-                    self._simulation_data["exposure"].iat[i_index],
-                    portfolio_value,
-                    self._simulation_data["earnings"].iat[i_index],
-                    portfolio_value + self._simulation_data["earnings"].iat[i_index],
-                ]
-
-            # Open long position
-            else:
-                # Add portfolio row, columns: 'position', 'status', 'exposure'
-                self._portfolio[i_index, :] = [2.0, 1.0, self._close_values[i_index, 0]]
-
-                portfolio_value = self._calculatePortfolioValue(i_index)
-
-                # Add simulation data row, columns: 'signal',
-                # 'open_trading_action', 'stock_value', 'exposure',
-                # 'portfolio_value', 'earnings', 'balance'. Note that
-                # 'earnings' and 'exposure' had been already updated in
-                # runSimulationRound
-                self._simulation_data.iloc[i_index, :] = [
-                    "buy",
-                    "long",
-                    self._close_values[i_index, 0],
-                    self._simulation_data["exposure"].iat[i_index] + self._close_values[i_index, 0],
-                    portfolio_value,
-                    self._simulation_data["earnings"].iat[i_index],
-                    portfolio_value + self._simulation_data["earnings"].iat[i_index],
-                ]
-
-        elif signal[0] == "sell":
-            # Maximum exposure reached
-            if self._max_exposure is not None and self._max_exposure < (
-                self._simulation_data["exposure"].iat[i_index]
-                + self._short_exposure_factor * self._close_values[i_index, 0]
-            ):
-                # Add portfolio row, columns: 'position', 'status', 'exposure'
-                self._portfolio[i_index, :] = [0.0, 0.0, 0.0]
-
-                portfolio_value = self._calculatePortfolioValue(i_index)
-
-                # Add simulation data row, columns: 'signal',
-                # 'open_trading_action', 'stock_value', 'exposure',
-                # 'portfolio_value', 'earnings', 'balance'. Note that
-                # 'earnings' and 'exposure' had been already updated in
-                # runSimulationRound
-                self._simulation_data.iloc[i_index, :] = [
-                    "sell",
-                    "none",
-                    self._close_values[i_index, 0],
-                    self._simulation_data["exposure"].iat[i_index],
-                    portfolio_value,
-                    self._simulation_data["earnings"].iat[i_index],
-                    portfolio_value + self._simulation_data["earnings"].iat[i_index],
-                ]
-
-            # Open short position
-            else:
-                # Add portfolio row, columns: 'position', 'status', 'exposure'
-                self._portfolio[i_index, :] = [
-                    1.0,
-                    1.0,
-                    self._short_exposure_factor * self._close_values[i_index, 0],
-                ]
-
-                portfolio_value = self._calculatePortfolioValue(i_index)
-
-                # Add simulation data row, columns: 'signal',
-                # 'open_trading_action', 'stock_value', 'exposure',
-                # 'portfolio_value', 'earnings', 'balance'. Note that
-                # 'earnings' and 'exposure' had been already updated in
-                # runSimulationRound
-                self._simulation_data.iloc[i_index, :] = [
-                    "sell",
-                    "short",
-                    self._close_values[i_index, 0],
-                    self._simulation_data["exposure"].iat[i_index]
-                    + self._short_exposure_factor * self._close_values[i_index, 0],
-                    portfolio_value,
-                    self._simulation_data["earnings"].iat[i_index],
-                    portfolio_value + self._simulation_data["earnings"].iat[i_index],
-                ]
+        # Simulation data columns: 'signal', 'open_trading_action',
+        # 'stock_value', 'exposure', 'portfolio_value', 'earnings', 'balance'
+        self._simulation_data[i_index, :] = [
+            signal[1],
+            open_trading_action,
+            stock_value,
+            exposure,
+            portfolio_value,
+            earnings,
+            portfolio_value + earnings,
+        ]
 
     def runSimulationRound(self, i_index, signal):
         """
@@ -607,9 +510,9 @@ class TradingSimulation:
         # Columns for the simulation data: 'signal', 'open_trading_action',
         # 'stock_value', 'exposure', 'portfolio_value', 'earnings', 'balance'
         if i_index == 0:
-            self._simulation_data.iloc[0, :] = [
-                signal[0],
-                "none",
+            self._simulation_data[0, :] = [
+                signal[1],
+                0.0,
                 self._close_values[0, 0],
                 0.0,
                 0.0,
@@ -626,6 +529,37 @@ class TradingSimulation:
 
             self._processSignal(i_index, signal)
 
+    def runSimulationRounds(self, signals):
+        """
+        Executes the simulation rounds for a sequence of precalculated
+        signals. The signal in position ``i`` is used in the simulation round
+        ``i``, starting from the first round of the simulation period. The
+        signals must have been calculated using only the data known up to the
+        relevant round.
+
+        Args:
+            signals (numpy.ndarray or list of int): The numeric value of the
+                signal (``buy`` is -1, ``hold`` is 0 and ``sell`` is 1) for
+                each simulation round.
+
+        Raises:
+            WrongValueForInputParameter: Unsupported value for input argument.
+        """
+
+        if len(signals) > len(self._input_data_index):
+            raise WrongValueForInputParameter(
+                len(signals), "signals length", "<=" + str(len(self._input_data_index))
+            )
+
+        # Map the numeric value of each signal to the trading signal
+        trade_signals = {signal[1]: signal for signal in TRADE_SIGNALS.values()}
+
+        for i_index, value in enumerate(signals):
+            if value not in trade_signals:
+                raise WrongValueForInputParameter(value, "signals", "-1, 0 or 1")
+
+            self.runSimulationRound(i_index=i_index, signal=trade_signals[value])
+
     def closeSimulation(self):
         """
         Closes this simulation and returns simulation data and statistics.
@@ -705,4 +639,19 @@ class TradingSimulation:
 
         self._calculateSimulationStatistics()
 
-        return self._simulation_data, self._statistics
+        simulation_data = pd.DataFrame(
+            index=self._input_data_index,
+            columns=SIMULATION_DATA_COLUMNS,
+            data=self._simulation_data,
+        )
+
+        # Replace the numeric codes with the signal and trading action names
+        simulation_data["signal"] = simulation_data["signal"].map(
+            {float(signal[1]): signal[0] for signal in TRADE_SIGNALS.values()}
+        )
+
+        simulation_data["open_trading_action"] = simulation_data["open_trading_action"].map(
+            {0.0: "none", 1.0: "short", 2.0: "long"}
+        )
+
+        return simulation_data, self._statistics